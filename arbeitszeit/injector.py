@@ -1,25 +1,37 @@
 from __future__ import annotations
 
 import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import (
     Any,
     Callable,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
+    MutableMapping,
     Optional,
     Protocol,
+    Tuple,
     Type,
     TypeVar,
     get_type_hints,
 )
+from weakref import WeakKeyDictionary
 
 T = TypeVar("T")
 T_cov = TypeVar("T_cov", covariant=True)
 CallableT = TypeVar("CallableT", bound=Callable)
 TypeT = TypeVar("TypeT", bound=Type)
 
+Dependencies = Tuple[Tuple[str, Type], ...]
+
+_request_scope: ContextVar[Optional[Dict[Type, Any]]] = ContextVar(
+    "_request_scope", default=None
+)
+
 
 class Injector:
     def __init__(self, modules: List[Module]) -> None:
@@ -53,15 +65,10 @@ class Injector:
             args = []
         if kwargs is None:
             kwargs = {}
-        signature = inspect.signature(f)
-        bound_arguments = signature.bind_partial(*args)
+        bound_arguments = get_signature(f).bind_partial(*args)
         dependencies = dict()
-        for key, value in get_type_hints(f).items():
-            if (
-                key != "return"
-                and key not in bound_arguments.arguments
-                and key not in kwargs
-            ):
+        for key, value in get_dependencies(f):
+            if key not in bound_arguments.arguments and key not in kwargs:
                 dependencies[key] = self.get(value)
         dependencies.update(kwargs)
         return f(*bound_arguments.arguments.values(), **dependencies)
@@ -140,28 +147,37 @@ class ClassProvider(Provider[T]):
         self.cls = cls
 
     def provide(self, binder: Binder) -> T:
-        if self.is_singleton:
-            instance = binder._instances.get(self.cls)
+        instances = self._get_instances(binder)
+        if instances is not None:
+            instance = instances.get(self.cls)
             if instance is not None:
                 return instance
-        args = get_type_hints(self.cls.__init__)
         kwargs = dict()
-        for name, annotation in args.items():
-            if name == "return":
-                continue
+        for name, annotation in get_dependencies(self.cls.__init__):
             kwargs[name] = binder.get(annotation).provide(binder)
         try:
             instance = self.cls(**kwargs)
         except TypeError as e:
             raise TypeError(f"Could not instance of class {self.cls}") from e
-        if self.is_singleton:
-            binder._instances[self.cls] = instance
+        if instances is not None:
+            instances[self.cls] = instance
         return instance
 
     @property
     def is_singleton(self) -> bool:
         return getattr(self.cls, "_injection_singleton", False)
 
+    @property
+    def is_request_scoped(self) -> bool:
+        return getattr(self.cls, "_injection_request_scoped", False)
+
+    def _get_instances(self, binder: Binder) -> Optional[Dict[Type, Any]]:
+        if self.is_singleton:
+            return binder._instances
+        if self.is_request_scoped:
+            return _request_scope.get()
+        return None
+
 
 class CallableProvider(Provider[T]):
     """Provide an instance by calling a function.  The arguments to
@@ -177,11 +193,8 @@ class CallableProvider(Provider[T]):
             instance = binder._instances.get(self.return_type)
             if instance:
                 return instance
-        args = get_type_hints(self.f)
         kwargs = dict()
-        for name, annotation in args.items():
-            if name == "return":
-                continue
+        for name, annotation in get_dependencies(self.f):
             kwargs[name] = binder.get(annotation).provide(binder)
         instance = self.f(**kwargs)
         if self._is_singleton:
@@ -190,8 +203,7 @@ class CallableProvider(Provider[T]):
 
     @property
     def return_type(self) -> Type:
-        hints = get_type_hints(self.f)
-        return hints["return"]
+        return _get_type_hints(self.f)["return"]
 
 
 class Module:
@@ -202,3 +214,77 @@ class Module:
 def singleton(cls: TypeT) -> TypeT:
     cls._injection_singleton = True
     return cls
+
+
+def request_scoped(cls: TypeT) -> TypeT:
+    """Share one instance of the class within every request scope, see
+    request_scope. Outside of a request scope a new instance
+    is created every time.
+    """
+    cls._injection_request_scoped = True
+    return cls
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """Instances of classes decorated with @request_scoped are shared
+    by everything that is injected while this context is active.
+    Scopes can be nested. The innermost scope is used.
+    """
+    token = _request_scope.set(dict())
+    try:
+        yield
+    finally:
+        _request_scope.reset(token)
+
+
+def in_request_scope() -> bool:
+    """Tell whether a request scope is active, see request_scope."""
+    return _request_scope.get() is not None
+
+
+_signatures: MutableMapping[Callable, inspect.Signature] = WeakKeyDictionary()
+_type_hints: MutableMapping[Callable, Dict[str, Any]] = WeakKeyDictionary()
+_dependencies: MutableMapping[Callable, Dependencies] = WeakKeyDictionary()
+
+
+def get_signature(f: Callable) -> inspect.Signature:
+    return _memoize(_signatures, f, inspect.signature)
+
+
+def get_dependencies(f: Callable) -> Dependencies:
+    """Return the names and types of the annotated parameters of f.
+    The result is computed only once for every callable.
+    """
+    return _memoize(
+        _dependencies,
+        f,
+        lambda f: tuple(
+            (name, annotation)
+            for name, annotation in _get_type_hints(f).items()
+            if name != "return"
+        ),
+    )
+
+
+def _get_type_hints(f: Callable) -> Dict[str, Any]:
+    return _memoize(_type_hints, f, get_type_hints)
+
+
+def _memoize(
+    cache: MutableMapping[Callable, T], f: Callable, compute: Callable[[Callable], T]
+) -> T:
+    # Callables that cannot be weakly referenced, e.g. methods of
+    # builtin types, are not cached.
+    try:
+        return cache[f]
+    except KeyError:
+        pass
+    except TypeError:
+        return compute(f)
+    value = compute(f)
+    try:
+        cache[f] = value
+    except TypeError:
+        pass
+    return value
@@ -4,7 +4,7 @@ from decimal import Decimal
 from typing import Iterable
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Plan
+from arbeitszeit.records import ActivePlanCosts, Plan, ProductionCosts
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -14,6 +14,14 @@ class PayoutFactorService:
     database_gateway: DatabaseGateway
 
     def calculate_payout_factor(self, timestamp: datetime) -> Decimal:
+        costs = self.database_gateway.get_active_plan_costs(timestamp)
+        return calculate_payout_factor_from_costs(costs)
+
+    def recalculate_payout_factor(self, timestamp: datetime) -> Decimal:
+        """Calculate the payout factor from the individual active plans
+        instead of their summed costs. This is slow and only meant to
+        verify the result of calculate_payout_factor.
+        """
         active_plans = (
             self.database_gateway.get_plans()
             .that_will_expire_after(timestamp)
@@ -27,17 +35,23 @@ class PayoutFactorService:
 
 
 def calculate_payout_factor(plans: Iterable[Plan]) -> Decimal:
-    # payout factor = (L − ( P_o + R_o )) / (L + L_o)
-    l: Decimal = Decimal(0)
-    l_o: Decimal = Decimal(0)
-    p_o_and_r_o = Decimal(0)
+    productive_costs = ProductionCosts.zero()
+    public_costs = ProductionCosts.zero()
     for plan in plans:
-        costs = plan.production_costs
         if plan.is_public_service:
-            l_o += costs.labour_cost
-            p_o_and_r_o += costs.means_cost + costs.resource_cost
+            public_costs += plan.production_costs
         else:
-            l += costs.labour_cost
+            productive_costs += plan.production_costs
+    return calculate_payout_factor_from_costs(
+        ActivePlanCosts(productive_plans=productive_costs, public_plans=public_costs)
+    )
+
+
+def calculate_payout_factor_from_costs(costs: ActivePlanCosts) -> Decimal:
+    # payout factor = (L − ( P_o + R_o )) / (L + L_o)
+    l: Decimal = costs.productive_plans.labour_cost
+    l_o: Decimal = costs.public_plans.labour_cost
+    p_o_and_r_o = costs.public_plans.means_cost + costs.public_plans.resource_cost
     if l + l_o:
         return (l - p_o_and_r_o) / (l + l_o)
     else:
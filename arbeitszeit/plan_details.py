@@ -46,7 +46,9 @@ class PlanDetailsService:
         if plan is None:
             return None
         if plan.is_active_as_of(now):
-            price_per_unit = self.price_calculator.calculate_cooperative_price(plan)
+            price_per_unit = self.price_calculator.calculate_cooperative_prices([plan])[
+                plan.id
+            ]
         else:
             price_per_unit = self.price_calculator.calculate_individual_price(plan)
         planner = self.database_gateway.get_companies().with_id(plan.planner).first()
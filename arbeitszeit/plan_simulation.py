@@ -0,0 +1,267 @@
+"""Simulate how the payout factor and the cooperative prices would
+develop if additional plans were approved.
+
+The plans are loaded into NumPy arrays once. The payout factor and the
+cooperative prices are then evaluated for all days of a period at once
+instead of querying and summing up the active plans of every day. The
+results are calculated with floating point numbers and are therefore
+only approximations of the figures calculated by the payout factor
+service and the price calculator.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from uuid import UUID
+
+import numpy as np
+import numpy.typing as npt
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.records import Plan
+from arbeitszeit.repositories import DatabaseGateway
+
+MICROSECONDS_PER_DAY = 24 * 60 * 60 * 1_000_000
+MAX_MATRIX_SIZE = 4_000_000
+
+
+@dataclass
+class SimulatedDay:
+    timestamp: datetime
+    payout_factor: Decimal
+    simulated_payout_factor: Decimal
+
+
+@dataclass
+class SimulatedCooperativePrices:
+    cooperation: UUID
+    prices: List[Optional[Decimal]]
+    simulated_prices: List[Optional[Decimal]]
+
+
+@dataclass
+class PlanApprovalSimulation:
+    days: List[SimulatedDay]
+    cooperations: List[SimulatedCooperativePrices]
+
+
+class PlanArrays:
+    """The costs, amounts and activation periods of a set of plans.
+
+    If an activation timestamp is given then all plans are treated as
+    if they had been approved at that timestamp. Pending plans are
+    treated as part of the cooperation they requested.
+    """
+
+    def __init__(
+        self, plans: Sequence[Plan], activation: Optional[datetime] = None
+    ) -> None:
+        activations = [activation or plan.activation_date for plan in plans]
+        assert all(activations), "Plans must be active or activated explicitly"
+        self.activation = _to_microseconds(activations)  # type: ignore
+        self.timeframe = np.array([plan.timeframe for plan in plans], dtype=np.float64)
+        self.expiration = self.activation + (
+            self.timeframe * MICROSECONDS_PER_DAY
+        ).astype(np.int64)
+        self.is_public_service = np.array(
+            [plan.is_public_service for plan in plans], dtype=bool
+        )
+        self.means_cost = _to_floats(plan.production_costs.means_cost for plan in plans)
+        self.resource_cost = _to_floats(
+            plan.production_costs.resource_cost for plan in plans
+        )
+        self.labour_cost = _to_floats(
+            plan.production_costs.labour_cost for plan in plans
+        )
+        self.amount = np.array([plan.prd_amount for plan in plans], dtype=np.float64)
+        self.cooperation: List[Optional[UUID]] = [
+            plan.cooperation or plan.requested_cooperation for plan in plans
+        ]
+
+    def __len__(self) -> int:
+        return len(self.activation)
+
+    def __add__(self, other: PlanArrays) -> PlanArrays:
+        combined = PlanArrays([])
+        for name in [
+            "activation",
+            "timeframe",
+            "expiration",
+            "is_public_service",
+            "means_cost",
+            "resource_cost",
+            "labour_cost",
+            "amount",
+        ]:
+            setattr(
+                combined,
+                name,
+                np.concatenate([getattr(self, name), getattr(other, name)]),
+            )
+        combined.cooperation = self.cooperation + other.cooperation
+        return combined
+
+    def payout_factors(
+        self, timestamps: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.float64]:
+        # payout factor = (L − ( P_o + R_o )) / (L + L_o)
+        weights = np.stack(
+            [
+                np.where(self.is_public_service, 0, self.labour_cost),
+                np.where(self.is_public_service, self.labour_cost, 0),
+                np.where(
+                    self.is_public_service, self.means_cost + self.resource_cost, 0
+                ),
+            ],
+            axis=1,
+        )
+        sums = np.zeros((len(timestamps), 3), dtype=np.float64)
+        plans = np.arange(len(self))
+        for rows, is_active in self._activity_by_chunk(timestamps, plans):
+            sums[rows] = is_active @ weights
+        l, l_o, p_o_and_r_o = sums[:, 0], sums[:, 1], sums[:, 2]
+        denominator = l + l_o
+        return np.divide(
+            l - p_o_and_r_o,
+            denominator,
+            out=np.ones_like(denominator),
+            where=denominator != 0,
+        )
+
+    def cooperative_prices(
+        self, timestamps: npt.NDArray[np.int64]
+    ) -> Dict[UUID, npt.NDArray[np.float64]]:
+        """Return the cooperative price of every cooperation for every
+        timestamp. The price is NaN while no plan of the cooperation is
+        active.
+        """
+        plans = np.array(
+            sorted(
+                (n for n, c in enumerate(self.cooperation) if c is not None),
+                key=lambda n: str(self.cooperation[n]),
+            ),
+            dtype=np.int64,
+        )
+        if not len(plans):
+            return dict()
+        cooperation_of_plan = [self.cooperation[n] for n in plans]
+        starts = np.flatnonzero(
+            [
+                n == 0 or cooperation_of_plan[n] != cooperation_of_plan[n - 1]
+                for n in range(len(plans))
+            ]
+        )
+        cost_by_time = (self.means_cost + self.resource_cost + self.labour_cost)[
+            plans
+        ] / self.timeframe[plans]
+        amount_by_time = self.amount[plans] / self.timeframe[plans]
+        shape = (len(timestamps), len(starts))
+        costs, amounts, active_plans = (
+            np.zeros(shape),
+            np.zeros(shape),
+            np.zeros(shape),
+        )
+        for rows, is_active in self._activity_by_chunk(timestamps, plans):
+            costs[rows] = np.add.reduceat(is_active * cost_by_time, starts, axis=1)
+            amounts[rows] = np.add.reduceat(is_active * amount_by_time, starts, axis=1)
+            active_plans[rows] = np.add.reduceat(is_active, starts, axis=1)
+        prices = np.divide(costs, amounts, out=np.zeros_like(costs), where=amounts != 0)
+        prices[active_plans == 0] = np.nan
+        return {
+            cooperation_of_plan[start]: prices[:, column]  # type: ignore
+            for column, start in enumerate(starts)
+        }
+
+    def _activity_by_chunk(
+        self, timestamps: npt.NDArray[np.int64], plans: npt.NDArray[np.int64]
+    ) -> Iterator[Tuple[slice, npt.NDArray[np.float64]]]:
+        """Yield which of the given plans are active at the timestamps
+        as a matrix with one row per timestamp and one column per plan.
+        The timestamps are split into chunks to limit the size of the
+        matrices.
+        """
+        activation = self.activation[plans]
+        expiration = self.expiration[plans]
+        chunk_size = max(1, MAX_MATRIX_SIZE // max(len(plans), 1))
+        for start in range(0, len(timestamps), chunk_size):
+            rows = slice(start, start + chunk_size)
+            chunk = timestamps[rows, np.newaxis]
+            is_active = (activation <= chunk) & (chunk < expiration)
+            yield rows, is_active.astype(np.float64)
+
+
+@dataclass
+class PlanApprovalSimulator:
+    database_gateway: DatabaseGateway
+    datetime_service: DatetimeService
+
+    def simulate(
+        self, pending_plans: Sequence[Plan], first_day: date, last_day: date
+    ) -> PlanApprovalSimulation:
+        """Compare the payout factor and the cooperative prices at the
+        start of every day from first_day to last_day with the figures
+        that would result from approving the pending plans now.
+        """
+        days = [
+            datetime.combine(first_day + timedelta(days=n), time())
+            for n in range((last_day - first_day).days + 1)
+        ]
+        if not days:
+            return PlanApprovalSimulation(days=[], cooperations=[])
+        timestamps = _to_microseconds(days)
+        approved_plans = PlanArrays(
+            list(
+                self.database_gateway.get_plans()
+                .that_were_activated_before(days[-1])
+                .that_will_expire_after(days[0])
+            )
+        )
+        simulated_plans = approved_plans + PlanArrays(
+            pending_plans, activation=self.datetime_service.now()
+        )
+        payout_factors = approved_plans.payout_factors(timestamps)
+        simulated_payout_factors = simulated_plans.payout_factors(timestamps)
+        prices = approved_plans.cooperative_prices(timestamps)
+        simulated_prices = simulated_plans.cooperative_prices(timestamps)
+        no_prices = np.full(len(days), np.nan)
+        return PlanApprovalSimulation(
+            days=[
+                SimulatedDay(
+                    timestamp=timestamp,
+                    payout_factor=_to_decimal(payout_factor),
+                    simulated_payout_factor=_to_decimal(simulated_payout_factor),
+                )
+                for timestamp, payout_factor, simulated_payout_factor in zip(
+                    days, payout_factors, simulated_payout_factors
+                )
+            ],
+            cooperations=[
+                SimulatedCooperativePrices(
+                    cooperation=cooperation,
+                    prices=_to_optional_decimals(prices.get(cooperation, no_prices)),
+                    simulated_prices=_to_optional_decimals(cooperation_prices),
+                )
+                for cooperation, cooperation_prices in simulated_prices.items()
+            ],
+        )
+
+
+def _to_microseconds(timestamps: Sequence[datetime]) -> npt.NDArray[np.int64]:
+    return np.array(timestamps, dtype="datetime64[us]").astype(np.int64)
+
+
+def _to_floats(values: Iterable[Decimal]) -> npt.NDArray[np.float64]:
+    return np.array([float(value) for value in values], dtype=np.float64)
+
+
+def _to_decimal(value: np.float64) -> Decimal:
+    return Decimal(str(value))
+
+
+def _to_optional_decimals(
+    values: npt.NDArray[np.float64],
+) -> List[Optional[Decimal]]:
+    return [None if np.isnan(value) else _to_decimal(value) for value in values]
@@ -1,6 +1,8 @@
+from collections import defaultdict
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
 
 from arbeitszeit import records
 from arbeitszeit.datetime_service import DatetimeService
@@ -12,23 +14,45 @@ class PriceCalculator:
     database_gateway: DatabaseGateway
     datetime_service: DatetimeService
 
-    def calculate_cooperative_price(self, plan: records.Plan) -> Decimal:
+    def calculate_cooperative_prices(
+        self, plans: Iterable[records.Plan]
+    ) -> Dict[UUID, Decimal]:
+        """Calculate the cooperative prices of all the given plans.
+        The plans of all cooperations involved are fetched with a
+        single query.
+        """
         now = self.datetime_service.now()
-        if plan.is_public_service:
-            return Decimal(0)
-        if plan.is_expired_as_of(now):
-            return self.calculate_individual_price(plan)
-        plans = list(
+        prices: Dict[UUID, Decimal] = dict()
+        cooperating_plans: List[records.Plan] = []
+        for plan in plans:
+            if plan.is_public_service:
+                prices[plan.id] = Decimal(0)
+            elif plan.is_expired_as_of(now) or not plan.cooperation:
+                prices[plan.id] = self.calculate_individual_price(plan)
+            else:
+                cooperating_plans.append(plan)
+        if not cooperating_plans:
+            return prices
+        members_by_cooperation: Dict[UUID, List[records.Plan]] = defaultdict(list)
+        for member in (
             self.database_gateway.get_plans()
-            .that_are_in_same_cooperation_as(plan.id)
+            .that_are_part_of_cooperation(
+                *{plan.cooperation for plan in cooperating_plans if plan.cooperation}
+            )
             .that_will_expire_after(now)
-        )
-        if not plans:
-            return self.calculate_individual_price(plan)
-        elif len(plans) == 1:
-            return self.calculate_individual_price(plans[0])
-        else:
-            return self._calculate_coop_price(plans)
+        ):
+            assert member.cooperation
+            members_by_cooperation[member.cooperation].append(member)
+        for plan in cooperating_plans:
+            assert plan.cooperation
+            members = members_by_cooperation[plan.cooperation]
+            if not members:
+                prices[plan.id] = self.calculate_individual_price(plan)
+            elif len(members) == 1:
+                prices[plan.id] = self.calculate_individual_price(members[0])
+            else:
+                prices[plan.id] = self._calculate_coop_price(members)
+        return prices
 
     def calculate_individual_price(self, plan: records.Plan) -> Decimal:
         return calculate_individual_price(plan)
@@ -45,12 +69,22 @@ def calculate_individual_price(plan: records.Plan) -> Decimal:
 
 
 def calculate_average_costs(plans: Iterable[records.PlanSummary]) -> Decimal:
+    cost_by_time, amount_by_time = calculate_cost_and_amount_by_time(plans)
+    if not amount_by_time:
+        return Decimal(0)
+    else:
+        return cost_by_time / amount_by_time
+
+
+def calculate_cost_and_amount_by_time(
+    plans: Iterable[records.PlanSummary],
+) -> Tuple[Decimal, Decimal]:
+    """Sum up the production costs and the produced amounts of the
+    plans per day of their duration.
+    """
     cost_by_time = Decimal(0)
     amount_by_time = Decimal(0)
     for plan in plans:
         cost_by_time += plan.production_costs / Decimal(plan.duration_in_days)
         amount_by_time += Decimal(plan.amount) / Decimal(plan.duration_in_days)
-    if not amount_by_time:
-        return Decimal(0)
-    else:
-        return cost_by_time / amount_by_time
+    return cost_by_time, amount_by_time
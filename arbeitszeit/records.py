@@ -310,6 +310,32 @@ class PlanningStatistics:
     total_planned_costs: ProductionCosts
 
 
+@dataclass
+class ActivePlanCosts:
+    productive_plans: ProductionCosts
+    public_plans: ProductionCosts
+
+
+@dataclass
+class PayoutFactorSnapshot:
+    timestamp: datetime
+    payout_factor: Decimal
+    planned_costs: ProductionCosts
+
+
+@dataclass
+class EconomicStatistics:
+    registered_companies_count: int
+    registered_members_count: int
+    cooperations_count: int
+    member_account_balance: Decimal
+    labour_account_balance: Decimal
+    product_account_balance: Decimal
+    active_plans_count: int
+    active_public_plans_count: int
+    active_plans_statistics: PlanningStatistics
+
+
 @dataclass(frozen=True)
 class PrivateConsumption:
     id: UUID
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Generic, Iterable, Iterator, List, Optional, Protocol, Tuple, TypeVar
 from uuid import UUID
@@ -49,7 +49,10 @@ class PlanResult(QueryResult[records.Plan], Protocol):
     def with_id_containing(self, query: str) -> Self:
         ...
 
-    def with_product_name_containing(self, query: str) -> Self:
+    def with_product_matching(self, query: str) -> Self:
+        ...
+
+    def ordered_by_relevance(self, query: str) -> Self:
         ...
 
     def that_are_approved(self) -> Self:
@@ -115,11 +118,32 @@ class PlanResult(QueryResult[records.Plan], Protocol):
         only contain plans that are not hidden.
         """
 
-    def joined_with_planner_and_cooperating_plans(
-        self, timestamp: datetime
-    ) -> QueryResult[Tuple[records.Plan, records.Company, List[records.PlanSummary]]]:
+    def joined_with_planner(self) -> QueryResult[Tuple[records.Plan, records.Company]]:
         ...
 
+    def joined_with_cooperation(
+        self,
+    ) -> QueryResult[Tuple[records.Plan, records.Cooperation]]:
+        """Plans that are not part of a cooperation are not part of the
+        result set.
+        """
+
+    def joined_with_planner_and_requested_cooperation(
+        self,
+    ) -> QueryResult[Tuple[records.Plan, records.Company, records.Cooperation]]:
+        """Plans that did not request a cooperation are not part of the
+        result set.
+        """
+
+    def joined_with_planner_and_cooperative_price(
+        self, timestamp: datetime
+    ) -> QueryResult[Tuple[records.Plan, records.Company, Optional[Decimal]]]:
+        """The cooperative price is calculated from the plans of the
+        cooperation of a plan that are active at the given timestamp.
+        It is None for plans that are not part of a cooperation with
+        active plans.
+        """
+
     def joined_with_provided_product_amount(
         self,
     ) -> QueryResult[Tuple[records.Plan, int]]:
@@ -232,6 +256,13 @@ class CooperationResult(QueryResult[records.Cooperation], Protocol):
     ) -> QueryResult[Tuple[records.Cooperation, records.Company]]:
         ...
 
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> QueryResult[Tuple[records.Cooperation, int]]:
+        """Yield every cooperation together with the number of its plans
+        that are active at the given timestamp.
+        """
+
 
 class CoordinationTenureResult(QueryResult[records.CoordinationTenure], Protocol):
     def with_id(self, id_: UUID) -> Self:
@@ -339,6 +370,12 @@ class ProductiveConsumptionResult(QueryResult[records.ProductiveConsumption], Pr
     ) -> QueryResult[Tuple[records.ProductiveConsumption, records.Transaction]]:
         ...
 
+    def grouped_by_provider(self) -> QueryResult[Tuple[records.Company, Decimal]]:
+        """Yield every providing company together with the total amount
+        sent for the consumptions in the current result set. Providers
+        are ordered by that volume, the largest volume first.
+        """
+
     def joined_with_transaction_and_plan_and_consumer(
         self,
     ) -> QueryResult[
@@ -404,11 +441,27 @@ class TransactionResult(QueryResult[records.Transaction], Protocol):
         ...
 
     def ordered_by_transaction_date(self, descending: bool = ...) -> Self:
-        ...
+        """Transactions with the same date are ordered by a fixed tie
+        breaker, e.g. their id, so that the ordering is total.
+        """
+
+    def that_precede(self, date: datetime, transaction: UUID) -> Self:
+        """Filter all transactions in the current result set such that
+        only those are kept that come before the specified transaction
+        when ordered by transaction date. The specified transaction
+        itself is excluded. Together with ordering by transaction date
+        in descending order this allows fetching a statement of
+        account page by page.
+        """
 
     def where_sender_is_social_accounting(self) -> Self:
         ...
 
+    def grouped_by_receiving_account(self) -> QueryResult[Tuple[UUID, Decimal]]:
+        """Yield every receiving account of the current result set
+        together with the total amount it received.
+        """
+
     def that_were_a_sale_for_plan(self, *plan: UUID) -> Self:
         """Filter all transactions in the current result set such that
         the new result set contains only those transactions that are
@@ -427,9 +480,17 @@ class TransactionResult(QueryResult[records.Transaction], Protocol):
     def joined_with_sender_and_receiver(
         self,
     ) -> QueryResult[
-        Tuple[records.Transaction, records.AccountOwner, records.AccountOwner]
+        Tuple[
+            records.Transaction,
+            records.AccountOwner,
+            records.AccountOwner,
+            records.AccountTypes,
+            records.AccountTypes,
+        ]
     ]:
-        ...
+        """The last two elements of the resulting tuples are the types
+        of the sending and the receiving account respectively.
+        """
 
 
 class AccountResult(QueryResult[records.Account], Protocol):
@@ -470,6 +531,11 @@ class CompanyWorkInviteResult(QueryResult[records.CompanyWorkInvite], Protocol):
     def with_id(self, id: UUID) -> Self:
         ...
 
+    def joined_with_company(
+        self,
+    ) -> QueryResult[Tuple[records.CompanyWorkInvite, records.Company]]:
+        ...
+
     def delete(self) -> None:
         ...
 
@@ -725,3 +791,35 @@ class DatabaseGateway(Protocol):
 
     def get_account_credentials(self) -> AccountCredentialsResult:
         ...
+
+    def get_economic_statistics(
+        self, timestamp: datetime
+    ) -> records.EconomicStatistics:
+        """Return economy wide statistics where all plan related
+        figures consider the plans active at the given timestamp.
+        """
+
+    def get_active_plan_costs(self, timestamp: datetime) -> records.ActivePlanCosts:
+        """Return the summed production costs of the productive and the
+        public plans active at the given timestamp.
+        """
+
+    def get_payout_factor_snapshots(
+        self, first_day: date, last_day: date
+    ) -> List[records.PayoutFactorSnapshot]:
+        """Return one snapshot for every day from first_day to last_day,
+        ordered by day. Each snapshot holds the payout factor and the
+        planned costs of the plans active at the start of its day.
+        """
+
+    def get_account_balance_history(
+        self, account: UUID, max_points: Optional[int] = None
+    ) -> List[Tuple[datetime, Decimal]]:
+        """Return the balance of the account right after each of its
+        transactions, ordered by transaction date.
+
+        If `max_points` is specified then the time between the first and
+        the last transaction is divided into that many intervals of
+        equal length and only the last point of every interval that
+        contains transactions is returned.
+        """
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from datetime import datetime
 from decimal import Decimal
-from typing import Iterable, Union
+from typing import Iterable, List, Optional, Set, Tuple, Union
 from uuid import UUID
 
 from arbeitszeit.records import AccountOwner, AccountTypes, Company, Member, Transaction
@@ -8,6 +9,10 @@ from arbeitszeit.repositories import DatabaseGateway
 
 from .transaction_type import TransactionTypes
 
+StatementTransaction = Tuple[
+    Transaction, AccountOwner, AccountOwner, AccountTypes, AccountTypes
+]
+
 
 @dataclass
 class AccountStatementRow:
@@ -18,6 +23,22 @@ class AccountStatementRow:
     peer: AccountOwner
 
 
+@dataclass
+class StatementCursor:
+    """Points to the last transaction of a statement of account page.
+    The next page starts right after this transaction.
+    """
+
+    date: datetime
+    transaction: UUID
+
+
+@dataclass
+class StatementOfAccountPage:
+    rows: List[AccountStatementRow]
+    next_cursor: Optional[StatementCursor]
+
+
 @dataclass
 class UserAccountingService:
     database_gateway: DatabaseGateway
@@ -31,25 +52,58 @@ class UserAccountingService:
             .where_account_is_sender_or_receiver(*accounts)
             .ordered_by_transaction_date(descending=True)
         )
+        return self._create_statement_rows(
+            accounts, transactions.joined_with_sender_and_receiver()
+        )
+
+    def get_statement_of_account_page(
+        self,
+        user: Union[Member, Company],
+        accounts: Iterable[UUID],
+        limit: Optional[int] = None,
+        after: Optional[StatementCursor] = None,
+    ) -> StatementOfAccountPage:
+        """Get at most `limit` rows of the statement of account,
+        starting right after the transaction that `after` points to. If
+        more rows are available the returned page contains a cursor to
+        the next page.
+        """
+        accounts = set(accounts) & set(user.accounts())
+        transactions = (
+            self.database_gateway.get_transactions()
+            .where_account_is_sender_or_receiver(*accounts)
+            .ordered_by_transaction_date(descending=True)
+        )
+        if after is not None:
+            transactions = transactions.that_precede(after.date, after.transaction)
+        joined_transactions = transactions.joined_with_sender_and_receiver()
+        if limit is not None:
+            joined_transactions = joined_transactions.limit(limit + 1)
+        rows = list(self._create_statement_rows(accounts, joined_transactions))
+        next_cursor: Optional[StatementCursor] = None
+        if limit is not None and len(rows) > limit:
+            del rows[limit:]
+            last_transaction = rows[-1].transaction
+            next_cursor = StatementCursor(
+                date=last_transaction.date, transaction=last_transaction.id
+            )
+        return StatementOfAccountPage(rows=rows, next_cursor=next_cursor)
+
+    def _create_statement_rows(
+        self, accounts: Set[UUID], transactions: Iterable[StatementTransaction]
+    ) -> Iterable[AccountStatementRow]:
         for (
             transaction,
             sender,
             receiver,
-        ) in transactions.joined_with_sender_and_receiver():
+            sending_account_type,
+            receiving_account_type,
+        ) in transactions:
             user_is_sender = transaction.sending_account in accounts
-            account_type = user.get_account_type(
-                transaction.sending_account
-                if user_is_sender
-                else transaction.receiving_account
+            account_type = (
+                sending_account_type if user_is_sender else receiving_account_type
             )
-            assert account_type
             peer = receiver if user_is_sender else sender
-            sending_account_type = sender.get_account_type(transaction.sending_account)
-            assert sending_account_type
-            receiving_account_type = receiver.get_account_type(
-                transaction.receiving_account
-            )
-            assert receiving_account_type
             yield AccountStatementRow(
                 transaction=transaction,
                 volume=-transaction.amount_sent
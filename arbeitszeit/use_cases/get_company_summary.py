@@ -1,13 +1,11 @@
-from collections import defaultdict
 from dataclasses import asdict, dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, Generator, Iterable, List, Optional, Tuple
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.decimal import decimal_sum
-from arbeitszeit.records import Company, Plan, SocialAccounting, Transaction
+from arbeitszeit.records import Company, Plan, SocialAccounting
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -66,7 +64,9 @@ class GetCompanySummary:
     database_gateway: DatabaseGateway
     datetime_service: DatetimeService
 
-    def __call__(self, company_id: UUID) -> GetCompanySummaryResponse:
+    def __call__(
+        self, company_id: UUID, max_suppliers: Optional[int] = None
+    ) -> GetCompanySummaryResponse:
         record = (
             self.database_gateway.get_companies()
             .with_id(company_id)
@@ -81,12 +81,7 @@ class GetCompanySummary:
             .planned_by(company.id)
             .ordered_by_creation_date(ascending=False)
         )
-        supply = self._get_suppliers_and_supply_volume(
-            (transaction, company)
-            for _, transaction, company in self.database_gateway.get_productive_consumptions()
-            .where_consumer_is_company(company=company_id)
-            .joined_with_transaction_and_provider()
-        )
+        suppliers = self._get_suppliers(company_id, max_suppliers)
         expectations = self._get_expectations(company)
         account_balances = self._get_account_balances(company)
         return GetCompanySummarySuccess(
@@ -107,9 +102,7 @@ class GetCompanySummary:
                 self._get_plan_details(plan=plan, provided_amount=provided_amount)
                 for plan, provided_amount in plans.joined_with_provided_product_amount()
             ],
-            suppliers_ordered_by_volume=list(
-                sorted(supply, key=lambda supplier: -supplier.volume_of_sales)
-            ),
+            suppliers_ordered_by_volume=suppliers,
         )
 
     def _get_plan_details(self, plan: Plan, provided_amount: int) -> PlanDetails:
@@ -133,30 +126,17 @@ class GetCompanySummary:
         )
 
     def _get_expectations(self, company: Company) -> Expectations:
-        credits = [
-            decimal_sum(
-                map(
-                    lambda t: t.amount_received,
-                    self.database_gateway.get_transactions()
-                    .where_account_is_sender_or_receiver(account)
-                    .where_sender_is_social_accounting(),
-                )
-            )
-            for account in company.accounts()[:3]
-        ]
-        expected_sales = decimal_sum(
-            map(
-                lambda t: t.amount_received,
-                self.database_gateway.get_transactions()
-                .where_account_is_sender_or_receiver(company.product_account)
-                .where_sender_is_social_accounting(),
-            )
+        credits: Dict[UUID, Decimal] = dict(
+            self.database_gateway.get_transactions()
+            .where_account_is_receiver(*company.accounts())
+            .where_sender_is_social_accounting()
+            .grouped_by_receiving_account()
         )
         return Expectations(
-            means=credits[0],
-            raw_material=credits[1],
-            work=credits[2],
-            product=expected_sales,
+            means=credits.get(company.means_account, Decimal(0)),
+            raw_material=credits.get(company.raw_material_account, Decimal(0)),
+            work=credits.get(company.work_account, Decimal(0)),
+            product=credits.get(company.product_account, Decimal(0)),
         )
 
     def _get_account_balances(self, company: Company) -> AccountBalances:
@@ -187,17 +167,21 @@ class GetCompanySummary:
         else:
             return abs(account_balance / expectation) * 100
 
-    def _get_suppliers_and_supply_volume(
-        self, supply: Iterable[Tuple[Transaction, Company]]
-    ) -> Generator[Supplier, None, None]:
-        volume_by_company_id: Dict[UUID, Decimal] = defaultdict(lambda: Decimal(0))
-        suppliers_by_id: Dict[UUID, Company] = dict()
-        for transaction, company in supply:
-            suppliers_by_id[company.id] = company
-            volume_by_company_id[company.id] += transaction.amount_sent
-        for company_id, volume in volume_by_company_id.items():
-            yield Supplier(
-                company_id=company_id,
-                company_name=suppliers_by_id[company_id].name,
+    def _get_suppliers(
+        self, company_id: UUID, max_suppliers: Optional[int]
+    ) -> List[Supplier]:
+        suppliers = (
+            self.database_gateway.get_productive_consumptions()
+            .where_consumer_is_company(company=company_id)
+            .grouped_by_provider()
+        )
+        if max_suppliers is not None:
+            suppliers = suppliers.limit(max_suppliers)
+        return [
+            Supplier(
+                company_id=supplier.id,
+                company_name=supplier.name,
                 volume_of_sales=volume,
             )
+            for supplier, volume in suppliers
+        ]
@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from arbeitszeit.records import AccountTypes
 from arbeitszeit.repositories import DatabaseGateway
-from arbeitszeit.transactions import TransactionTypes, UserAccountingService
+from arbeitszeit.transactions import (
+    StatementCursor,
+    TransactionTypes,
+    UserAccountingService,
+)
 
 
 @dataclass
@@ -21,6 +25,7 @@ class TransactionInfo:
 @dataclass
 class GetCompanyTransactionsResponse:
     transactions: List[TransactionInfo]
+    next_cursor: Optional[StatementCursor] = None
 
 
 @dataclass
@@ -28,9 +33,17 @@ class GetCompanyTransactions:
     accounting_service: UserAccountingService
     database_gateway: DatabaseGateway
 
-    def __call__(self, company_id: UUID) -> GetCompanyTransactionsResponse:
+    def __call__(
+        self,
+        company_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[StatementCursor] = None,
+    ) -> GetCompanyTransactionsResponse:
         company = self.database_gateway.get_companies().with_id(company_id).first()
         assert company
+        page = self.accounting_service.get_statement_of_account_page(
+            company, company.accounts(), limit=limit, after=after
+        )
         transactions = [
             TransactionInfo(
                 transaction_type=row.transaction_type,
@@ -39,8 +52,8 @@ class GetCompanyTransactions:
                 account_type=row.account_type,
                 purpose=row.transaction.purpose,
             )
-            for row in self.accounting_service.get_statement_of_account(
-                company, company.accounts()
-            )
+            for row in page.rows
         ]
-        return GetCompanyTransactionsResponse(transactions=transactions)
+        return GetCompanyTransactionsResponse(
+            transactions=transactions, next_cursor=page.next_cursor
+        )
@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.price_calculator import PriceCalculator, calculate_average_costs
-from arbeitszeit.records import Plan
+from arbeitszeit.records import Company, Plan
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -61,7 +61,7 @@ class GetCoopSummary:
             .that_are_part_of_cooperation(request.coop_id)
             .that_will_expire_after(now)
         )
-        plans = list(plan_result)
+        plans = list(plan_result.joined_with_planner())
         return GetCoopSummaryResponse(
             requester_is_coordinator=coordinator.id == request.requester_id,
             coop_id=coop.id,
@@ -69,15 +69,10 @@ class GetCoopSummary:
             coop_definition=coop.definition,
             current_coordinator=coordinator.id,
             current_coordinator_name=coordinator.name,
-            coop_price=self._get_cooperative_price(plans),
+            coop_price=self._get_cooperative_price([plan for plan, _ in plans]),
             plans=self._get_associated_plans(plans, request.requester_id),
         )
 
-    def _get_planner_name(self, planner_id: UUID) -> str:
-        planner = self.database_gateway.get_companies().with_id(planner_id).first()
-        assert planner
-        return planner.name
-
     def _get_cooperative_price(self, plans: list[Plan]) -> Optional[Decimal]:
         if not plans:
             return None
@@ -85,7 +80,7 @@ class GetCoopSummary:
         return coop_price
 
     def _get_associated_plans(
-        self, plans: list[Plan], requester: UUID
+        self, plans: list[Tuple[Plan, Company]], requester: UUID
     ) -> list[AssociatedPlan]:
         return [
             AssociatedPlan(
@@ -95,8 +90,8 @@ class GetCoopSummary:
                     plan
                 ),
                 planner_id=plan.planner,
-                planner_name=self._get_planner_name(plan.planner),
+                planner_name=planner.name,
                 requester_is_planner=plan.planner == requester,
             )
-            for plan in plans
+            for plan, planner in plans
         ]
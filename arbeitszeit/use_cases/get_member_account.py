@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from arbeitszeit.repositories import DatabaseGateway
-from arbeitszeit.transactions import TransactionTypes, UserAccountingService
+from arbeitszeit.transactions import (
+    StatementCursor,
+    TransactionTypes,
+    UserAccountingService,
+)
 
 
 @dataclass
@@ -21,6 +25,7 @@ class TransactionInfo:
 class GetMemberAccountResponse:
     transactions: List[TransactionInfo]
     balance: Decimal
+    next_cursor: Optional[StatementCursor] = None
 
 
 @dataclass
@@ -28,9 +33,17 @@ class GetMemberAccount:
     accounting_service: UserAccountingService
     database: DatabaseGateway
 
-    def __call__(self, member_id: UUID) -> GetMemberAccountResponse:
+    def __call__(
+        self,
+        member_id: UUID,
+        limit: Optional[int] = None,
+        after: Optional[StatementCursor] = None,
+    ) -> GetMemberAccountResponse:
         member = self.database.get_members().with_id(member_id).first()
         assert member
+        page = self.accounting_service.get_statement_of_account_page(
+            member, member.accounts(), limit=limit, after=after
+        )
         transaction_info = [
             TransactionInfo(
                 date=row.transaction.date,
@@ -39,9 +52,7 @@ class GetMemberAccount:
                 purpose=row.transaction.purpose,
                 type=row.transaction_type,
             )
-            for row in self.accounting_service.get_statement_of_account(
-                member, member.accounts()
-            )
+            for row in page.rows
         ]
         result = (
             self.database.get_accounts()
@@ -51,4 +62,8 @@ class GetMemberAccount:
         )
         assert result
         balance = result[1]
-        return GetMemberAccountResponse(transaction_info, balance)
+        return GetMemberAccountResponse(
+            transactions=transaction_info,
+            balance=balance,
+            next_cursor=page.next_cursor,
+        )
@@ -7,7 +7,7 @@ from typing import List
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import CompanyWorkInvite
+from arbeitszeit.records import Company, CompanyWorkInvite
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -62,10 +62,10 @@ class GetMemberDashboard:
             .joined_with_email_address()
         ]
         invites = [
-            self._render_company_work_invite(invite)
-            for invite in self.database_gateway.get_company_work_invites().addressing(
-                member
-            )
+            self._render_company_work_invite(invite, company)
+            for invite, company in self.database_gateway.get_company_work_invites()
+            .addressing(member)
+            .joined_with_company()
         ]
         return self.Response(
             workplaces=workplaces,
@@ -87,9 +87,9 @@ class GetMemberDashboard:
         assert result
         return result[1]
 
-    def _render_company_work_invite(self, invite: CompanyWorkInvite) -> WorkInvitation:
-        company = self.database_gateway.get_companies().with_id(invite.company).first()
-        assert company
+    def _render_company_work_invite(
+        self, invite: CompanyWorkInvite, company: Company
+    ) -> WorkInvitation:
         return self.WorkInvitation(
             invite_id=invite.id,
             company_id=invite.company,
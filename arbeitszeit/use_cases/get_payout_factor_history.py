@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import List
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.repositories import DatabaseGateway
+
+
+@dataclass
+class GetPayoutFactorHistoryUseCase:
+    """List the payout factor at the start of every day in the
+    requested period. Days after today are left out because their
+    payout factor may still change.
+    """
+
+    @dataclass
+    class Request:
+        first_day: date
+        last_day: date
+
+    @dataclass
+    class DailyPayoutFactor:
+        timestamp: datetime
+        payout_factor: Decimal
+        planned_labour: Decimal
+        planned_means: Decimal
+        planned_resources: Decimal
+
+    @dataclass
+    class Response:
+        days: List[GetPayoutFactorHistoryUseCase.DailyPayoutFactor]
+
+    database_gateway: DatabaseGateway
+    datetime_service: DatetimeService
+
+    def get_payout_factor_history(self, request: Request) -> Response:
+        last_day = min(request.last_day, self.datetime_service.today())
+        if request.first_day > last_day:
+            return self.Response(days=[])
+        snapshots = self.database_gateway.get_payout_factor_snapshots(
+            request.first_day, last_day
+        )
+        return self.Response(
+            days=[
+                self.DailyPayoutFactor(
+                    timestamp=snapshot.timestamp,
+                    payout_factor=snapshot.payout_factor,
+                    planned_labour=snapshot.planned_costs.labour_cost,
+                    planned_means=snapshot.planned_costs.means_cost,
+                    planned_resources=snapshot.planned_costs.resource_cost,
+                )
+                for snapshot in snapshots
+            ]
+        )
@@ -3,7 +3,7 @@ from decimal import Decimal
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.payout_factor import PayoutFactorService
-from arbeitszeit.repositories import AccountResult, DatabaseGateway
+from arbeitszeit.repositories import DatabaseGateway
 
 
 @dataclass
@@ -30,55 +30,20 @@ class GetStatistics:
 
     def __call__(self) -> StatisticsResponse:
         fic = self.fic_service.get_current_payout_factor()
-        certs_total = self._estimate_total_certificates(fic)
-        available_product = self._estimate_available_product()
-        now = self.datetime_service.now()
-        active_plans = (
-            self.database.get_plans()
-            .that_will_expire_after(now)
-            .that_were_activated_before(now)
-        )
-        planning_statistics = active_plans.get_statistics()
+        statistics = self.database.get_economic_statistics(self.datetime_service.now())
+        planning_statistics = statistics.active_plans_statistics
         return StatisticsResponse(
-            registered_companies_count=len(self.database.get_companies()),
-            registered_members_count=len(self.database.get_members()),
-            cooperations_count=len(self.database.get_cooperations()),
-            certificates_count=certs_total,
-            available_product=available_product,
-            active_plans_count=len(active_plans),
-            active_plans_public_count=len(active_plans.that_are_public()),
+            registered_companies_count=statistics.registered_companies_count,
+            registered_members_count=statistics.registered_members_count,
+            cooperations_count=statistics.cooperations_count,
+            certificates_count=statistics.member_account_balance
+            + statistics.labour_account_balance * fic,
+            available_product=statistics.product_account_balance * -1,
+            active_plans_count=statistics.active_plans_count,
+            active_plans_public_count=statistics.active_public_plans_count,
             avg_timeframe=planning_statistics.average_plan_duration_in_days,
             planned_work=planning_statistics.total_planned_costs.labour_cost,
             planned_resources=planning_statistics.total_planned_costs.resource_cost,
             planned_means=planning_statistics.total_planned_costs.means_cost,
             payout_factor=fic,
         )
-
-    def _estimate_total_certificates(self, fic: Decimal) -> Decimal:
-        return (
-            self._count_certs_in_member_accounts()
-            + _sum_account_balances(
-                self.database.get_accounts().that_are_labour_accounts()
-            )
-            * fic
-        )
-
-    def _estimate_available_product(self) -> Decimal:
-        return (
-            _sum_account_balances(
-                self.database.get_accounts().that_are_product_accounts()
-            )
-            * -1
-        )
-
-    def _count_certs_in_member_accounts(self) -> Decimal:
-        return _sum_account_balances(
-            self.database.get_accounts().that_are_member_accounts()
-        )
-
-
-def _sum_account_balances(accounts: AccountResult) -> Decimal:
-    return sum(
-        (balance for (_, balance) in accounts.joined_with_balance()),
-        Decimal(0),
-    )
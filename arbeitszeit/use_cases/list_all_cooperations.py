@@ -25,17 +25,16 @@ class ListAllCooperations:
     datetime_service: DatetimeService
 
     def __call__(self) -> ListAllCooperationsResponse:
-        all_cooperations = self.database_gateway.get_cooperations()
-        if not all_cooperations:
-            return ListAllCooperationsResponse(cooperations=[])
-        cooperations = [self._coop_to_response_model(coop) for coop in all_cooperations]
-        return ListAllCooperationsResponse(cooperations=cooperations)
-
-    def _coop_to_response_model(self, coop: Cooperation) -> ListedCooperation:
         now = self.datetime_service.now()
-        plan_count = len(
-            self.database_gateway.get_plans()
-            .that_are_part_of_cooperation(coop.id)
-            .that_will_expire_after(now)
+        cooperations = self.database_gateway.get_cooperations()
+        return ListAllCooperationsResponse(
+            cooperations=[
+                self._coop_to_response_model(coop, plan_count)
+                for coop, plan_count in cooperations.joined_with_active_plan_count(now)
+            ]
         )
+
+    def _coop_to_response_model(
+        self, coop: Cooperation, plan_count: int
+    ) -> ListedCooperation:
         return ListedCooperation(id=coop.id, name=coop.name, plan_count=plan_count)
@@ -43,15 +43,11 @@ class ListCoordinationsOfCompany:
                 creation_date=coop.creation_date,
                 name=coop.name,
                 definition=coop.definition,
-                count_plans_in_coop=len(
-                    self.database_gateway.get_plans()
-                    .that_are_part_of_cooperation(coop.id)
-                    .that_will_expire_after(now)
-                ),
-            )
-            for coop in self.database_gateway.get_cooperations().coordinated_by_company(
-                request.company
+                count_plans_in_coop=plan_count,
             )
+            for coop, plan_count in self.database_gateway.get_cooperations()
+            .coordinated_by_company(request.company)
+            .joined_with_active_plan_count(now)
         ]
 
         return ListCoordinationsOfCompanyResponse(coordinations=cooperations)
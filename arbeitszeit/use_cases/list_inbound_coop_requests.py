@@ -3,7 +3,7 @@ from typing import List
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Plan
+from arbeitszeit.records import Company, Cooperation, Plan
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -39,10 +39,11 @@ class ListInboundCoopRequests:
         if not self._coordinator_exists(request):
             return ListInboundCoopRequestsResponse(cooperation_requests=[])
         cooperation_requests = [
-            self._plan_to_response_model(plan)
-            for plan in self.database_gateway.get_plans()
+            self._plan_to_response_model(plan, planner, requested_cooperation)
+            for plan, planner, requested_cooperation in self.database_gateway.get_plans()
             .that_request_cooperation_with_coordinator(request.coordinator_id)
             .that_will_expire_after(now)
+            .joined_with_planner_and_requested_cooperation()
         ]
         return ListInboundCoopRequestsResponse(
             cooperation_requests=cooperation_requests
@@ -53,18 +54,11 @@ class ListInboundCoopRequests:
             self.database_gateway.get_companies().with_id(request.coordinator_id)
         )
 
-    def _plan_to_response_model(self, plan: Plan) -> ListedInboundCoopRequest:
-        assert plan.requested_cooperation
-        requested_cooperation = (
-            self.database_gateway.get_cooperations()
-            .with_id(plan.requested_cooperation)
-            .first()
-        )
-        assert requested_cooperation
-        planner = self.database_gateway.get_companies().with_id(plan.planner).first()
-        assert planner
+    def _plan_to_response_model(
+        self, plan: Plan, planner: Company, requested_cooperation: Cooperation
+    ) -> ListedInboundCoopRequest:
         return ListedInboundCoopRequest(
-            coop_id=plan.requested_cooperation,
+            coop_id=requested_cooperation.id,
             coop_name=requested_cooperation.name,
             plan_id=plan.id,
             plan_name=plan.prd_name,
@@ -5,7 +5,7 @@ from typing import List
 from uuid import UUID
 
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.records import Plan
+from arbeitszeit.records import Cooperation, Plan
 from arbeitszeit.repositories import DatabaseGateway
 
 
@@ -41,21 +41,21 @@ class ListMyCooperatingPlansUseCase:
             .that_will_expire_after(now)
             .that_were_activated_before(now)
             .planned_by(request.company)
-            .that_are_cooperating()
+            .joined_with_cooperation()
         )
         return self.Response(
-            cooperating_plans=[self._create_plan_object(plan) for plan in plans]
+            cooperating_plans=[
+                self._create_plan_object(plan, cooperation)
+                for plan, cooperation in plans
+            ]
         )
 
-    def _create_plan_object(self, plan: Plan) -> CooperatingPlan:
-        assert plan.cooperation
-        cooperation = (
-            self.database_gateway.get_cooperations().with_id(plan.cooperation).first()
-        )
-        assert cooperation
+    def _create_plan_object(
+        self, plan: Plan, cooperation: Cooperation
+    ) -> CooperatingPlan:
         return self.CooperatingPlan(
             plan_id=plan.id,
             plan_name=plan.prd_name,
-            coop_id=plan.cooperation,
+            coop_id=cooperation.id,
             coop_name=cooperation.name,
         )
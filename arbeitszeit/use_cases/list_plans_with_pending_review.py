@@ -29,16 +29,16 @@ class ListPlansWithPendingReviewUseCase:
     def list_plans_with_pending_review(self, request: Request) -> Response:
         return self.Response(
             plans=[
-                self._get_info_for_plan(plan)
-                for plan in self.database_gateway.get_plans().without_completed_review()
+                self._get_info_for_plan(plan, planner)
+                for plan, planner in self.database_gateway.get_plans()
+                .without_completed_review()
+                .joined_with_planner()
             ]
         )
 
-    def _get_info_for_plan(self, plan_model: records.Plan) -> Plan:
-        planner = (
-            self.database_gateway.get_companies().with_id(plan_model.planner).first()
-        )
-        assert planner
+    def _get_info_for_plan(
+        self, plan_model: records.Plan, planner: records.Company
+    ) -> Plan:
         return self.Plan(
             id=plan_model.id,
             product_name=plan_model.prd_name,
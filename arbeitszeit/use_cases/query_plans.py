@@ -9,10 +9,7 @@ from uuid import UUID
 
 from arbeitszeit import records
 from arbeitszeit.datetime_service import DatetimeService
-from arbeitszeit.price_calculator import (
-    calculate_average_costs,
-    calculate_individual_price,
-)
+from arbeitszeit.price_calculator import calculate_individual_price
 from arbeitszeit.repositories import DatabaseGateway, PlanResult
 
 
@@ -24,6 +21,7 @@ class PlanFilter(enum.Enum):
 class PlanSorting(enum.Enum):
     by_activation = enum.auto()
     by_company_name = enum.auto()
+    by_relevance = enum.auto()
 
 
 @dataclass
@@ -70,15 +68,15 @@ class QueryPlans:
         )
         total_results = len(plans)
         plans = self._apply_filter(plans, request.query_string, request.filter_category)
-        plans = self._apply_sorting(plans, request.sorting_category)
-        planning_info = plans.joined_with_planner_and_cooperating_plans(now)
+        plans = self._apply_sorting(plans, request)
+        planning_info = plans.joined_with_planner_and_cooperative_price(now)
         if request.offset is not None:
             planning_info = planning_info.offset(n=request.offset)
         if request.limit is not None:
             planning_info = planning_info.limit(n=request.limit)
         results = [
-            self._plan_to_response_model(plan, planner, cooperating_plans)
-            for plan, planner, cooperating_plans in planning_info
+            self._plan_to_response_model(plan, planner, cooperative_price)
+            for plan, planner, cooperative_price in planning_info
         ]
         return PlanQueryResponse(
             results=results, total_results=total_results, request=request
@@ -92,12 +90,21 @@ class QueryPlans:
         elif filter_by == PlanFilter.by_plan_id:
             plans = plans.with_id_containing(query)
         else:
-            plans = plans.with_product_name_containing(query)
+            plans = plans.with_product_matching(query)
         return plans
 
-    def _apply_sorting(self, plans: PlanResult, sort_by: PlanSorting) -> PlanResult:
+    def _apply_sorting(
+        self, plans: PlanResult, request: QueryPlansRequest
+    ) -> PlanResult:
+        sort_by = request.sorting_category
         if sort_by == PlanSorting.by_company_name:
             plans = plans.ordered_by_planner_name()
+        elif (
+            sort_by == PlanSorting.by_relevance
+            and request.query_string
+            and request.filter_category == PlanFilter.by_product_name
+        ):
+            plans = plans.ordered_by_relevance(request.query_string)
         else:
             plans = plans.ordered_by_activation_date(ascending=False)
         return plans
@@ -106,10 +113,10 @@ class QueryPlans:
         self,
         plan: records.Plan,
         planner: records.Company,
-        cooperating_plans: List[records.PlanSummary],
+        cooperative_price: Optional[Decimal],
     ) -> QueriedPlan:
-        if cooperating_plans:
-            price_per_unit = calculate_average_costs(cooperating_plans)
+        if cooperative_price is not None:
+            price_per_unit = cooperative_price
         else:
             price_per_unit = calculate_individual_price(plan)
         assert plan.activation_date
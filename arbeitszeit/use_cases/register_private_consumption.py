@@ -64,7 +64,9 @@ class RegisterPrivateConsumption:
             return RegisterPrivateConsumptionResponse(
                 rejection_reason=RejectionReason.consumer_does_not_exist
             )
-        coop_price_per_unit = self.price_calculator.calculate_cooperative_price(plan)
+        coop_price_per_unit = self.price_calculator.calculate_cooperative_prices(
+            [plan]
+        )[plan.id]
         individual_price_per_unit = self.price_calculator.calculate_individual_price(
             plan
         )
@@ -105,7 +105,9 @@ class RegisterProductiveConsumption:
         consumer: Company,
         plan: Plan,
     ) -> None:
-        coop_price = amount * self.price_calculator.calculate_cooperative_price(plan)
+        coop_price = (
+            amount * self.price_calculator.calculate_cooperative_prices([plan])[plan.id]
+        )
         individual_price = amount * self.price_calculator.calculate_individual_price(
             plan
         )
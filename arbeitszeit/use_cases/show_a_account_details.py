@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
 from typing import List
 from uuid import UUID
 
@@ -50,10 +49,7 @@ class ShowAAccountDetailsUseCase:
             )
         ]
         account_balance = self._get_account_balance(company.work_account)
-        plot = self.PlotDetails(
-            timestamps=self._get_plot_dates(transactions),
-            accumulated_volumes=self._get_plot_volumes(transactions),
-        )
+        plot = self._get_plot_details(company.work_account)
         return self.Response(
             company_id=company_id,
             transactions=transactions,
@@ -68,13 +64,9 @@ class ShowAAccountDetailsUseCase:
         assert result
         return result[1]
 
-    def _get_plot_dates(self, transactions: List[TransactionInfo]) -> List[datetime]:
-        timestamps = [t.date for t in transactions]
-        timestamps.reverse()
-        return timestamps
-
-    def _get_plot_volumes(self, transactions: List[TransactionInfo]) -> List[Decimal]:
-        volumes = [t.transaction_volume for t in transactions]
-        volumes.reverse()
-        volumes_cumsum = list(accumulate(volumes))
-        return volumes_cumsum
+    def _get_plot_details(self, account: UUID) -> PlotDetails:
+        history = self.database.get_account_balance_history(account)
+        return self.PlotDetails(
+            timestamps=[timestamp for timestamp, _ in history],
+            accumulated_volumes=[balance for _, balance in history],
+        )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional
+from uuid import UUID
+
+from arbeitszeit.records import AccountTypes
+from arbeitszeit.repositories import DatabaseGateway
+
+
+@dataclass
+class ShowAccountBalanceHistoryUseCase:
+    @dataclass
+    class Request:
+        company: UUID
+        account_type: AccountTypes
+        max_points: Optional[int] = None
+
+    @dataclass
+    class Response:
+        timestamps: List[datetime]
+        balances: List[Decimal]
+
+    @dataclass(frozen=True)
+    class Revision:
+        account: UUID
+        latest_transaction: Optional[UUID]
+
+    database: DatabaseGateway
+
+    def show_balance_history(self, request: Request) -> Response:
+        account = self._get_account(request)
+        if account is None:
+            return self.Response(timestamps=[], balances=[])
+        history = self.database.get_account_balance_history(
+            account, max_points=request.max_points
+        )
+        return self.Response(
+            timestamps=[timestamp for timestamp, _ in history],
+            balances=[balance for _, balance in history],
+        )
+
+    def get_revision(self, request: Request) -> Optional[Revision]:
+        """Identify the current state of the requested balance history
+        without calculating it. The revision changes whenever a
+        transaction is recorded for the account.
+        """
+        account = self._get_account(request)
+        if account is None:
+            return None
+        latest_transaction = (
+            self.database.get_transactions()
+            .where_account_is_sender_or_receiver(account)
+            .ordered_by_transaction_date(descending=True)
+            .first()
+        )
+        return self.Revision(
+            account=account,
+            latest_transaction=latest_transaction.id if latest_transaction else None,
+        )
+
+    def _get_account(self, request: Request) -> Optional[UUID]:
+        company = self.database.get_companies().with_id(request.company).first()
+        return company.get_account_by_type(request.account_type) if company else None
@@ -60,8 +60,11 @@ class ShowMyPlansUseCase:
         )
         drafts.sort(key=lambda x: x.plan_creation_date, reverse=True)
         count_all_plans = len(all_plans_of_company) + len(drafts)
+        prices = self.price_calculator.calculate_cooperative_prices(
+            all_plans_of_company
+        )
         non_active_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if (
                 not plan.is_approved
@@ -70,7 +73,7 @@ class ShowMyPlansUseCase:
             )
         ]
         active_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if (
                 plan.is_approved
@@ -79,7 +82,7 @@ class ShowMyPlansUseCase:
             )
         ]
         expired_plans = [
-            self._create_plan_info_from_plan(plan)
+            self._create_plan_info_from_plan(plan, prices[plan.id])
             for plan in all_plans_of_company
             if plan.is_expired_as_of(now)
         ]
@@ -91,11 +94,13 @@ class ShowMyPlansUseCase:
             drafts=drafts,
         )
 
-    def _create_plan_info_from_plan(self, plan: Plan) -> PlanInfo:
+    def _create_plan_info_from_plan(
+        self, plan: Plan, price_per_unit: Decimal
+    ) -> PlanInfo:
         return PlanInfo(
             id=plan.id,
             prd_name=plan.prd_name,
-            price_per_unit=self.price_calculator.calculate_cooperative_price(plan),
+            price_per_unit=price_per_unit,
             is_public_service=plan.is_public_service,
             plan_creation_date=plan.plan_creation_date,
             activation_date=plan.activation_date,
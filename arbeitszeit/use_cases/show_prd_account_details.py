@@ -3,7 +3,6 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from itertools import accumulate
 from typing import List, Optional
 from uuid import UUID
 
@@ -58,13 +57,8 @@ class ShowPRDAccountDetailsUseCase:
                 company, [company.product_account]
             )
         ]
-        transactions_ascending = transactions.copy()
-        transactions_ascending.reverse()
         account_balance = self._get_account_balance(company.product_account)
-        plot = self.PlotDetails(
-            timestamps=self._get_plot_dates(transactions_ascending),
-            accumulated_volumes=self._get_plot_volumes(transactions_ascending),
-        )
+        plot = self._get_plot_details(company.product_account)
         return self.Response(
             company_id=company_id,
             transactions=transactions,
@@ -79,13 +73,12 @@ class ShowPRDAccountDetailsUseCase:
         assert result
         return result[1]
 
-    def _get_plot_dates(self, transactions: List[TransactionInfo]) -> List[datetime]:
-        timestamps = [t.date for t in transactions]
-        return timestamps
-
-    def _get_plot_volumes(self, transactions: List[TransactionInfo]) -> List[Decimal]:
-        volumes_cumsum = list(accumulate(t.transaction_volume for t in transactions))
-        return volumes_cumsum
+    def _get_plot_details(self, account: UUID) -> PlotDetails:
+        history = self.database.get_account_balance_history(account)
+        return self.PlotDetails(
+            timestamps=[timestamp for timestamp, _ in history],
+            accumulated_volumes=[balance for _, balance in history],
+        )
 
     def _create_buyer_info(
         self, buyer: AccountOwner
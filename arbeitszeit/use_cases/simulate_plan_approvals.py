@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date
+from enum import Enum, auto
+from typing import List, Optional
+from uuid import UUID
+
+from arbeitszeit.plan_simulation import PlanApprovalSimulation, PlanApprovalSimulator
+from arbeitszeit.repositories import DatabaseGateway
+
+
+@dataclass
+class SimulatePlanApprovalsUseCase:
+    """Let accountants see how the payout factor and the cooperative
+    prices would develop if a set of pending plans were approved now.
+    """
+
+    @dataclass
+    class Request:
+        accountant: UUID
+        plans: List[UUID]
+        first_day: date
+        last_day: date
+
+    @dataclass
+    class Response:
+        class RejectionReason(Exception, Enum):
+            requester_is_not_accountant = auto()
+            plan_not_found = auto()
+            plan_is_already_approved = auto()
+
+        rejection_reason: Optional[RejectionReason]
+        simulation: Optional[PlanApprovalSimulation]
+
+        @property
+        def is_rejected(self) -> bool:
+            return self.rejection_reason is not None
+
+    database_gateway: DatabaseGateway
+    simulator: PlanApprovalSimulator
+
+    def simulate_plan_approvals(self, request: Request) -> Response:
+        try:
+            self._validate_request(request)
+        except self.Response.RejectionReason as reason:
+            return self.Response(rejection_reason=reason, simulation=None)
+        pending_plans = list(self.database_gateway.get_plans().with_id(*request.plans))
+        return self.Response(
+            rejection_reason=None,
+            simulation=self.simulator.simulate(
+                pending_plans, request.first_day, request.last_day
+            ),
+        )
+
+    def _validate_request(self, request: Request) -> None:
+        if not self.database_gateway.get_accountants().with_id(request.accountant):
+            raise self.Response.RejectionReason.requester_is_not_accountant
+        plans = self.database_gateway.get_plans().with_id(*request.plans)
+        if len(plans) != len(set(request.plans)):
+            raise self.Response.RejectionReason.plan_not_found
+        if plans.that_are_approved():
+            raise self.Response.RejectionReason.plan_is_already_approved
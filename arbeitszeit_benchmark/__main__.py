@@ -7,6 +7,10 @@ from typing import Dict, Optional
 
 from typing_extensions import Self
 
+from .class_based_view_injection_benchmark import (
+    PerRequestInjectorBenchmark,
+    SharedInjectorBenchmark,
+)
 from .get_company_summary_benchmark import GetCompanySummaryBenchmark
 from .get_company_transactions import GetCompanyTransactionsBenchmark
 from .get_statistics import GetStatisticsBenchmark
@@ -38,6 +42,14 @@ def main() -> None:
         name="query_plans_sorted_by_activation_date",
         benchmark_class=QueryPlansSortedByActivationDateBenchmark,
     )
+    catalog.register_benchmark(
+        name="class_based_view_injection_per_request",
+        benchmark_class=PerRequestInjectorBenchmark,
+    )
+    catalog.register_benchmark(
+        name="class_based_view_injection_shared",
+        benchmark_class=SharedInjectorBenchmark,
+    )
     for name, benchmark_class in catalog.get_all_benchmarks():
         if (configuration.include_filter or "") not in name:
             continue
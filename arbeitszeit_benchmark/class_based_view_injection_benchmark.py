@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from flask import Flask
+
+from arbeitszeit.injector import Injector, request_scope
+from arbeitszeit_flask.dependency_injection import (
+    create_dependency_injector,
+    get_shared_dependency_injector,
+)
+from arbeitszeit_flask.views.get_statistics_view import GetStatisticsView
+from tests.flask_integration.dependency_injection import get_dependency_injector
+
+REQUESTS_PER_RUN = 100
+
+
+class PerRequestInjectorBenchmark:
+    """This benchmark measures the time it takes to build the object
+    graph of a class based view for 100 requests when a new injector
+    is created for every request.
+    """
+
+    def __init__(self) -> None:
+        app = get_dependency_injector().get(Flask)
+        self.request_context = app.test_request_context()
+        self.request_context.push()
+
+    def tear_down(self) -> None:
+        self.request_context.pop()
+
+    def run(self) -> None:
+        for _ in range(REQUESTS_PER_RUN):
+            with request_scope():
+                self.get_injector().get(GetStatisticsView)
+
+    def get_injector(self) -> Injector:
+        return create_dependency_injector()
+
+
+class SharedInjectorBenchmark(PerRequestInjectorBenchmark):
+    """This benchmark measures the time it takes to build the object
+    graph of a class based view for 100 requests with the injector
+    that is shared by all requests.
+    """
+
+    def get_injector(self) -> Injector:
+        return get_shared_dependency_injector()
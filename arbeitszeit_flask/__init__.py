@@ -1,5 +1,6 @@
 import os
 from typing import Any, Optional
+from uuid import UUID
 
 from flask import Flask, session
 from flask_migrate import upgrade
@@ -9,6 +10,7 @@ from jinja2 import StrictUndefined
 import arbeitszeit_flask.extensions
 from arbeitszeit_flask.babel import initialize_babel
 from arbeitszeit_flask.datetime import RealtimeDatetimeService
+from arbeitszeit_flask.dependency_injection import initialize_request_scope
 from arbeitszeit_flask.extensions import csrf_protect, login_manager, mail
 from arbeitszeit_flask.profiling import (  # type: ignore
     initialize_flask_profiler,
@@ -77,14 +79,33 @@ def create_app(config: Any = None, db: Any = None, template_folder: Any = None)
     initialize_migrations(app=app, db=db)
     mail.init_app(app)
     initialize_babel(app)
+    initialize_request_scope(app)
 
     # Setup template filter
     app.template_filter()(RealtimeDatetimeService().format_datetime)
 
     with app.app_context():
-        from arbeitszeit_flask.commands import invite_accountant
+        from arbeitszeit_flask.commands import (
+            backfill_payout_factor_snapshots,
+            check_account_balances,
+            check_economic_aggregates,
+            check_payout_factor,
+            explain_queries,
+            invite_accountant,
+            simulate_plan_approvals,
+            sweep_expired_plans,
+        )
 
         app.cli.command("invite-accountant")(invite_accountant)
+        app.cli.command("check-account-balances")(check_account_balances)
+        app.cli.command("check-economic-aggregates")(check_economic_aggregates)
+        app.cli.command("check-payout-factor")(check_payout_factor)
+        app.cli.command("sweep-expired-plans")(sweep_expired_plans)
+        app.cli.command("backfill-payout-factor-snapshots")(
+            backfill_payout_factor_snapshots
+        )
+        app.cli.command("simulate-plan-approvals")(simulate_plan_approvals)
+        app.cli.command("explain-queries")(explain_queries)
 
         from .database.models import Accountant, Company, Member
 
@@ -94,14 +115,18 @@ def create_app(config: Any = None, db: Any = None, template_folder: Any = None)
             This callback is used to reload the user object from the user ID
             stored in the session.
             """
+            try:
+                user_uuid = UUID(user_id)
+            except ValueError:
+                return None
             if "user_type" in session:
                 user_type = session["user_type"]
                 if user_type == "member":
-                    return Member.query.get(user_id)
+                    return Member.query.get(user_uuid)
                 elif user_type == "company":
-                    return Company.query.get(user_id)
+                    return Company.query.get(user_uuid)
                 elif user_type == "accountant":
-                    return Accountant.query.get(user_id)
+                    return Accountant.query.get(user_uuid)
 
         # register blueprints
         from . import accountant, company, member, user
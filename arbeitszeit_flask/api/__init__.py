@@ -6,6 +6,7 @@ from arbeitszeit_flask.extensions import csrf_protect
 from .auth import namespace as auth_ns
 from .companies import namespace as companies_ns
 from .plans import namespace as plans_ns
+from .statistics import namespace as statistics_ns
 
 blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
 
@@ -31,3 +32,4 @@ api_extension = Api(
 api_extension.add_namespace(plans_ns)
 api_extension.add_namespace(companies_ns)
 api_extension.add_namespace(auth_ns)
+api_extension.add_namespace(statistics_ns)
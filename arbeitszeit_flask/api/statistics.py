@@ -0,0 +1,49 @@
+from flask_restx import Namespace, Resource
+
+from arbeitszeit.use_cases.get_payout_factor_history import (
+    GetPayoutFactorHistoryUseCase,
+)
+from arbeitszeit_flask.api.authentication import authentication_check
+from arbeitszeit_flask.api.input_documentation import generate_input_documentation
+from arbeitszeit_flask.api.response_handling import error_response_handling
+from arbeitszeit_flask.api.schema_converter import SchemaConverter
+from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_web.api.controllers.get_payout_factor_history_api_controller import (
+    GetPayoutFactorHistoryApiController,
+)
+from arbeitszeit_web.api.presenters.get_payout_factor_history_api_presenter import (
+    GetPayoutFactorHistoryApiPresenter,
+)
+from arbeitszeit_web.api.response_errors import BadRequest, Unauthorized
+
+namespace = Namespace("statistics", "Economy wide statistics.")
+
+payout_factor_history_input_documentation = generate_input_documentation(
+    GetPayoutFactorHistoryApiController.create_expected_inputs()
+)
+
+payout_factor_history_model = SchemaConverter(namespace).json_schema_to_flaskx(
+    schema=GetPayoutFactorHistoryApiPresenter().get_schema()
+)
+
+
+@namespace.route("/payout_factor_history")
+class PayoutFactorHistory(Resource):
+    @namespace.expect(payout_factor_history_input_documentation)
+    @namespace.marshal_with(payout_factor_history_model)
+    @error_response_handling(
+        error_responses=[BadRequest, Unauthorized], namespace=namespace
+    )
+    @authentication_check
+    @with_injection()
+    def get(
+        self,
+        controller: GetPayoutFactorHistoryApiController,
+        use_case: GetPayoutFactorHistoryUseCase,
+        presenter: GetPayoutFactorHistoryApiPresenter,
+    ):
+        """List the payout factor at the start of every day of a period."""
+        use_case_request = controller.create_request()
+        use_case_response = use_case.get_payout_factor_history(use_case_request)
+        view_model = presenter.create_view_model(use_case_response)
+        return view_model
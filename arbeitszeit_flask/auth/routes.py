@@ -1,5 +1,3 @@
-from uuid import UUID
-
 from flask import Blueprint, flash, redirect, render_template, request, session, url_for
 from flask_login import current_user, login_required
 
@@ -133,7 +131,7 @@ def login_member(
 @with_injection()
 @login_required
 def resend_confirmation_member(use_case: ResendConfirmationMailUseCase):
-    request = use_case.Request(user=UUID(current_user.id))
+    request = use_case.Request(user=current_user.id)
     response = use_case.resend_confirmation_mail(request)
     if response.is_token_sent:
         flash("Eine neue Bestätigungsmail wurde gesendet.")
@@ -218,7 +216,7 @@ def confirm_email_company(
 @with_injection()
 @login_required
 def resend_confirmation_company(use_case: ResendConfirmationMailUseCase):
-    request = use_case.Request(user=UUID(current_user.id))
+    request = use_case.Request(user=current_user.id)
     response = use_case.resend_confirmation_mail(request)
     if response.is_token_sent:
         flash("Eine neue Bestätigungsmail wurde gesendet.")
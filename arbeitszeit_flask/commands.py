@@ -1,10 +1,24 @@
+from dataclasses import fields
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Optional, Tuple
+from uuid import UUID
+
 import click
 from flask_babel import force_locale
 
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.payout_factor import PayoutFactorService
 from arbeitszeit.use_cases.send_accountant_registration_token import (
     SendAccountantRegistrationTokenUseCase,
 )
+from arbeitszeit.use_cases.simulate_plan_approvals import SimulatePlanApprovalsUseCase
 from arbeitszeit_flask.database import commit_changes
+from arbeitszeit_flask.database.account_balances import AccountBalanceMaintenance
+from arbeitszeit_flask.database.cooperation_prices import CooperationPriceStore
+from arbeitszeit_flask.database.economic_aggregates import EconomicAggregateStore
+from arbeitszeit_flask.database.payout_factor_snapshots import PayoutFactorSnapshotStore
+from arbeitszeit_flask.database.query_plans import QueryPlanAdvisor
 from arbeitszeit_flask.dependency_injection import with_injection
 
 
@@ -18,3 +32,212 @@ def invite_accountant(
         use_case.send_accountant_registration_token(
             SendAccountantRegistrationTokenUseCase.Request(email=email_address)
         )
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    help="Recalculate all account balances from the transaction ledger.",
+)
+@commit_changes
+@with_injection()
+def check_account_balances(
+    repair: bool, maintenance: AccountBalanceMaintenance
+) -> None:
+    deviations = maintenance.find_deviations()
+    for deviation in deviations:
+        click.echo(
+            f"Account {deviation.account}: stored balance "
+            f"{deviation.stored_balance}, calculated balance "
+            f"{deviation.calculated_balance}"
+        )
+    if repair:
+        maintenance.recalculate_balances()
+        click.echo("Recalculated all account balances.")
+    elif deviations:
+        raise click.ClickException(
+            f"Found {len(deviations)} inconsistent account balance(s)."
+        )
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    help="Recalculate the economic aggregates from scratch.",
+)
+@commit_changes
+@with_injection()
+def check_economic_aggregates(
+    repair: bool,
+    aggregates: EconomicAggregateStore,
+    datetime_service: DatetimeService,
+) -> None:
+    now = datetime_service.now()
+    stored = aggregates.get_statistics(now)
+    calculated = aggregates.calculate_statistics(now)
+    deviating_fields = [
+        field.name
+        for field in fields(stored)
+        if getattr(stored, field.name) != getattr(calculated, field.name)
+    ]
+    for name in deviating_fields:
+        click.echo(
+            f"{name}: stored {getattr(stored, name)}, "
+            f"calculated {getattr(calculated, name)}"
+        )
+    if repair:
+        aggregates.recalculate(now)
+        click.echo("Recalculated the economic aggregates.")
+    elif deviating_fields:
+        raise click.ClickException(
+            f"Found {len(deviating_fields)} inconsistent economic aggregate(s)."
+        )
+
+
+@click.option(
+    "--repair",
+    is_flag=True,
+    help="Recalculate the economic aggregates from scratch.",
+)
+@commit_changes
+@with_injection()
+def check_payout_factor(
+    repair: bool,
+    service: PayoutFactorService,
+    aggregates: EconomicAggregateStore,
+    datetime_service: DatetimeService,
+) -> None:
+    now = datetime_service.now()
+    stored = service.calculate_payout_factor(now)
+    calculated = service.recalculate_payout_factor(now)
+    click.echo(f"payout factor: stored {stored}, calculated {calculated}")
+    if repair:
+        aggregates.recalculate(now)
+        click.echo("Recalculated the economic aggregates.")
+    elif stored != calculated:
+        raise click.ClickException("Found an inconsistent payout factor.")
+
+
+@commit_changes
+@with_injection()
+def sweep_expired_plans(
+    aggregates: EconomicAggregateStore,
+    cooperation_prices: CooperationPriceStore,
+    payout_factor_snapshots: PayoutFactorSnapshotStore,
+    datetime_service: DatetimeService,
+) -> None:
+    now = datetime_service.now()
+    aggregates.advance_active_plans(now)
+    cooperation_prices.refresh(now)
+    payout_factor_snapshots.store_missing_snapshots(datetime_service.today())
+
+
+@click.option(
+    "--first-day",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    required=True,
+    help="The first day to store a payout factor snapshot for.",
+)
+@click.option(
+    "--last-day",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="The last day to store a payout factor snapshot for. Defaults to today.",
+)
+@commit_changes
+@with_injection()
+def backfill_payout_factor_snapshots(
+    first_day: datetime,
+    last_day: Optional[datetime],
+    snapshots: PayoutFactorSnapshotStore,
+    datetime_service: DatetimeService,
+) -> None:
+    count = snapshots.store_snapshots(
+        first_day.date(),
+        last_day.date() if last_day else datetime_service.today(),
+    )
+    click.echo(f"Stored {count} payout factor snapshot(s).")
+
+
+@click.argument("accountant", type=click.UUID)
+@click.argument("plans", nargs=-1, type=click.UUID)
+@click.option(
+    "--first-day",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="The first day of the simulation. Defaults to today.",
+)
+@click.option(
+    "--last-day",
+    type=click.DateTime(formats=["%Y-%m-%d"]),
+    help="The last day of the simulation. Defaults to 30 days after the first day.",
+)
+@with_injection()
+def simulate_plan_approvals(
+    accountant: UUID,
+    plans: Tuple[UUID, ...],
+    first_day: Optional[datetime],
+    last_day: Optional[datetime],
+    use_case: SimulatePlanApprovalsUseCase,
+    datetime_service: DatetimeService,
+) -> None:
+    start = first_day.date() if first_day else datetime_service.today()
+    end = last_day.date() if last_day else start + timedelta(days=30)
+    response = use_case.simulate_plan_approvals(
+        SimulatePlanApprovalsUseCase.Request(
+            accountant=accountant, plans=list(plans), first_day=start, last_day=end
+        )
+    )
+    if response.rejection_reason:
+        raise click.ClickException(
+            _SIMULATION_REJECTION_MESSAGES[response.rejection_reason]
+        )
+    simulation = response.simulation
+    assert simulation
+    click.echo("day         payout factor  simulated")
+    for day in simulation.days:
+        click.echo(
+            f"{day.timestamp.date()}  {day.payout_factor:>13.4f}  "
+            f"{day.simulated_payout_factor:>9.4f}"
+        )
+    for cooperation in simulation.cooperations:
+        click.echo(f"\ncooperation {cooperation.cooperation}")
+        click.echo("day         cooperative price  simulated")
+        for day, price, simulated_price in zip(
+            simulation.days, cooperation.prices, cooperation.simulated_prices
+        ):
+            click.echo(
+                f"{day.timestamp.date()}  {_format_price(price):>17}  "
+                f"{_format_price(simulated_price):>9}"
+            )
+
+
+@click.option(
+    "--min-rows",
+    type=int,
+    default=10000,
+    show_default=True,
+    help="Only report sequential scans on tables with at least this many rows.",
+)
+@with_injection()
+def explain_queries(min_rows: int, advisor: QueryPlanAdvisor) -> None:
+    scans = advisor.find_sequential_scans(min_rows)
+    for scan in scans:
+        click.echo(
+            f"{scan.query}: sequential scan on {scan.table} "
+            f"(about {scan.estimated_rows} rows)"
+        )
+    if scans:
+        raise click.ClickException(
+            f"Found {len(scans)} sequential scan(s) on large tables."
+        )
+
+
+_SimulationRejection = SimulatePlanApprovalsUseCase.Response.RejectionReason
+_SIMULATION_REJECTION_MESSAGES = {
+    _SimulationRejection.requester_is_not_accountant: "There is no accountant with this id.",
+    _SimulationRejection.plan_not_found: "Some of the plans do not exist.",
+    _SimulationRejection.plan_is_already_approved: "Some of the plans are already approved.",
+}
+
+
+def _format_price(price: Optional[Decimal]) -> str:
+    return "-" if price is None else f"{price:.4f}"
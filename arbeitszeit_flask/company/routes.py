@@ -86,6 +86,9 @@ from arbeitszeit_web.www.controllers.file_plan_with_accounting_controller import
 from arbeitszeit_web.www.controllers.revoke_plan_filing_controller import (
     RevokePlanFilingController,
 )
+from arbeitszeit_web.www.controllers.statement_of_account_controller import (
+    StatementOfAccountController,
+)
 from arbeitszeit_web.www.presenters.company_consumptions_presenter import (
     CompanyConsumptionsPresenter,
 )
@@ -140,7 +143,7 @@ def my_consumptions(
     query_consumptions: QueryCompanyConsumptions,
     presenter: CompanyConsumptionsPresenter,
 ):
-    response = query_consumptions(UUID(current_user.id))
+    response = query_consumptions(current_user.id)
     view_model = presenter.present(response)
     return FlaskResponse(
         render_template(
@@ -232,7 +235,7 @@ def my_plans(
     show_my_plans_use_case: ShowMyPlansUseCase,
     show_my_plans_presenter: ShowMyPlansPresenter,
 ):
-    request = ShowMyPlansRequest(company_id=UUID(current_user.id))
+    request = ShowMyPlansRequest(company_id=current_user.id)
     response = show_my_plans_use_case.show_company_plans(request)
     view_model = show_my_plans_presenter.present(response)
     return render_template(
@@ -258,7 +261,7 @@ def revoke_plan_filing(
 @CompanyRoute("/company/toggle_availability/<uuid:plan_id>", methods=["GET"])
 @commit_changes
 def toggle_availability(plan_id: UUID, toggle_availability: ToggleProductAvailability):
-    toggle_availability(UUID(current_user.id), plan_id)
+    toggle_availability(current_user.id, plan_id)
     return redirect(url_for("main_company.plan_details", plan_id=plan_id))
 
 
@@ -279,13 +282,19 @@ class my_accounts(ShowMyAccountsView):
 @CompanyRoute("/company/my_accounts/all_transactions")
 def list_all_transactions(
     get_company_transactions: use_cases.get_company_transactions.GetCompanyTransactions,
+    controller: StatementOfAccountController,
     presenter: GetCompanyTransactionsPresenter,
 ):
-    response = get_company_transactions(UUID(current_user.id))
+    response = get_company_transactions(
+        current_user.id,
+        limit=controller.get_page_size(),
+        after=controller.get_cursor(),
+    )
     view_model = presenter.present(response)
     return render_template(
         "company/list_all_transactions.html",
         all_transactions=view_model.transactions,
+        next_page_url=view_model.next_page_url,
     )
 
 
@@ -294,7 +303,7 @@ def account_p(
     show_p_account_details: use_cases.show_p_account_details.ShowPAccountDetailsUseCase,
     presenter: ShowPAccountDetailsPresenter,
 ):
-    response = show_p_account_details(UUID(current_user.id))
+    response = show_p_account_details(current_user.id)
     view_model = presenter.present(response)
     return render_template(
         "company/account_p.html",
@@ -307,7 +316,7 @@ def account_r(
     show_r_account_details: use_cases.show_r_account_details.ShowRAccountDetailsUseCase,
     presenter: ShowRAccountDetailsPresenter,
 ):
-    response = show_r_account_details(UUID(current_user.id))
+    response = show_r_account_details(current_user.id)
     view_model = presenter.present(response)
     return render_template(
         "company/account_r.html",
@@ -320,7 +329,7 @@ def account_a(
     show_a_account_details: use_cases.show_a_account_details.ShowAAccountDetailsUseCase,
     presenter: ShowAAccountDetailsPresenter,
 ):
-    response = show_a_account_details(UUID(current_user.id))
+    response = show_a_account_details(current_user.id)
     view_model = presenter.present(response)
     return render_template(
         "company/account_a.html",
@@ -333,7 +342,7 @@ def account_prd(
     show_prd_account_details: use_cases.show_prd_account_details.ShowPRDAccountDetailsUseCase,
     presenter: ShowPRDAccountDetailsPresenter,
 ):
-    response = show_prd_account_details(UUID(current_user.id))
+    response = show_prd_account_details(current_user.id)
     view_model = presenter.present(response)
     return render_template(
         "company/account_prd.html",
@@ -418,33 +427,33 @@ def my_cooperations(
                 UUID(id.strip()) for id in request.form["accept"].split(",")
             ]
             accept_cooperation_response = accept_cooperation(
-                AcceptCooperationRequest(UUID(current_user.id), plan_id, coop_id)
+                AcceptCooperationRequest(current_user.id, plan_id, coop_id)
             )
         elif request.form.get("deny"):
             coop_id, plan_id = [
                 UUID(id.strip()) for id in request.form["deny"].split(",")
             ]
             deny_cooperation_response = deny_cooperation(
-                DenyCooperationRequest(UUID(current_user.id), plan_id, coop_id)
+                DenyCooperationRequest(current_user.id, plan_id, coop_id)
             )
         elif request.form.get("cancel"):
             plan_id = UUID(request.form["cancel"])
-            requester_id = UUID(current_user.id)
+            requester_id = current_user.id
             cancel_cooperation_solicitation_response = cancel_cooperation_solicitation(
                 CancelCooperationSolicitationRequest(requester_id, plan_id)
             )
 
     list_coord_response = list_coordinations(
-        ListCoordinationsOfCompanyRequest(UUID(current_user.id))
+        ListCoordinationsOfCompanyRequest(current_user.id)
     )
     list_inbound_coop_requests_response = list_inbound_coop_requests(
-        ListInboundCoopRequestsRequest(UUID(current_user.id))
+        ListInboundCoopRequestsRequest(current_user.id)
     )
     list_outbound_coop_requests_response = list_outbound_coop_requests(
-        ListOutboundCoopRequestsRequest(UUID(current_user.id))
+        ListOutboundCoopRequestsRequest(current_user.id)
     )
     list_my_coop_plans_response = list_my_cooperating_plans.list_cooperations(
-        ListMyCooperatingPlansUseCase.Request(company=UUID(current_user.id))
+        ListMyCooperatingPlansUseCase.Request(company=current_user.id)
     )
 
     view_model = presenter.present(
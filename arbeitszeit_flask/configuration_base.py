@@ -18,6 +18,18 @@ PREFERRED_URL_SCHEME = "https"
 ALLOWED_OVERDRAW_MEMBER = "0"
 ACCEPTABLE_RELATIVE_ACCOUNT_DEVIATION = "33"
 
+# rendered plots
+PLOT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+PLOT_CACHE_DISK_DIRECTORY = None
+PLOT_CACHE_DISK_MAX_BYTES = 256 * 1024 * 1024
+PLOT_CACHE_MAX_AGE = 3600
+PLOT_RENDERER = "process_pool"
+PLOT_RENDERER_PROCESSES = 2
+PLOT_RENDERER_MAX_PENDING = 8
+PLOT_RENDERER_TIMEOUT = 10
+PLOT_DOWNSAMPLER = "lttb"
+PLOT_DOWNSAMPLER_POINTS = 1000
+
 FLASK_PROFILER = {
     "enabled": False,
 }
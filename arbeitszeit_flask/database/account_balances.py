@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, List, Optional
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import delete, insert, select, text, union_all
+from sqlalchemy.sql.expression import func
+
+from arbeitszeit_flask.database import models
+
+
+@dataclass
+class BalanceDeviation:
+    account: UUID
+    stored_balance: Optional[Decimal]
+    calculated_balance: Decimal
+
+
+@dataclass
+class AccountBalanceMaintenance:
+    """Verify and rebuild the materialized account balances from the
+    transaction ledger.
+    """
+
+    db: SQLAlchemy
+
+    def find_deviations(self) -> List[BalanceDeviation]:
+        ledger = self._ledger_balances()
+        calculated_balance = func.coalesce(ledger.c.balance, Decimal(0))
+        query = (
+            select(
+                models.Account.id,
+                models.AccountBalance.balance,
+                calculated_balance,
+            )
+            .outerjoin(
+                models.AccountBalance,
+                models.AccountBalance.account_id == models.Account.id,
+            )
+            .outerjoin(ledger, ledger.c.account == models.Account.id)
+            .where(models.AccountBalance.balance.is_distinct_from(calculated_balance))
+            .order_by(models.Account.id)
+        )
+        return [
+            BalanceDeviation(
+                account=account,
+                stored_balance=stored_balance,
+                calculated_balance=calculated_balance,
+            )
+            for account, stored_balance, calculated_balance in self.db.session.execute(
+                query
+            )
+        ]
+
+    def recalculate_balances(self) -> None:
+        # The table is locked so that transactions created concurrently
+        # are applied on top of the recalculated balances instead of
+        # being overwritten by them.
+        self.db.session.execute(text("LOCK TABLE account_balance IN EXCLUSIVE MODE"))
+        ledger = self._ledger_balances()
+        self.db.session.execute(delete(models.AccountBalance))
+        self.db.session.execute(
+            insert(models.AccountBalance).from_select(
+                ["account_id", "balance"],
+                select(
+                    models.Account.id,
+                    func.coalesce(ledger.c.balance, Decimal(0)),
+                ).outerjoin(ledger, ledger.c.account == models.Account.id),
+            )
+        )
+
+    def _ledger_balances(self) -> Any:
+        received = select(
+            models.Transaction.receiving_account.label("account"),
+            models.Transaction.amount_received.label("amount"),
+        )
+        sent = select(
+            models.Transaction.sending_account.label("account"),
+            (-models.Transaction.amount_sent).label("amount"),
+        )
+        movements = union_all(received, sent).subquery()
+        return (
+            select(
+                movements.c.account,
+                func.sum(movements.c.amount).label("balance"),
+            )
+            .group_by(movements.c.account)
+            .subquery()
+        )
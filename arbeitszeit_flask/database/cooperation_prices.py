@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, List, Optional
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import DateTime, case, func, literal, select, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.expression import and_, or_
+
+from arbeitszeit_flask.database import models
+
+
+@dataclass
+class CooperationPriceStore:
+    """Maintain the cooperation_price table.
+
+    A row holds the figures that the cooperative price is calculated
+    from. It is valid from its as_of timestamp until the next plan of
+    its cooperation is activated or expires. Changes to the plans of a
+    cooperation calculate its row again, and refresh calculates rows
+    that are missing or outdated. Queries that find no valid row
+    calculate the figures inline without storing them.
+    """
+
+    db: SQLAlchemy
+
+    def cooperations_of_plans(self, plans: List[UUID]) -> List[UUID]:
+        return [
+            cooperation
+            for cooperation, in self.db.session.execute(
+                select(models.Plan.cooperation)
+                .where(
+                    models.Plan.id.in_(plans),
+                    models.Plan.cooperation.isnot(None),
+                )
+                .distinct()
+            )
+        ]
+
+    def recalculate(
+        self,
+        cooperations: Iterable[Optional[UUID]],
+        timestamp: Optional[datetime] = None,
+    ) -> None:
+        """Calculate the rows of the given cooperations at the
+        timestamp. Without a timestamp only the existing rows are
+        calculated again, each at its own as_of timestamp.
+        """
+        cooperation_ids = sorted({c for c in cooperations if c is not None})
+        if not cooperation_ids:
+            return
+        price = models.CooperationPrice
+        if timestamp is None:
+            targets = select(price.cooperation_id, price.as_of).where(
+                price.cooperation_id.in_(cooperation_ids)
+            )
+        else:
+            targets = select(models.Cooperation.id, literal(timestamp, DateTime)).where(
+                models.Cooperation.id.in_(cooperation_ids)
+            )
+        self._store(targets)
+
+    def refresh(self, timestamp: datetime) -> None:
+        """Calculate the rows of all cooperations that have no row yet
+        or whose row is not valid at the given timestamp.
+        """
+        price = models.CooperationPrice
+        self._store(
+            select(models.Cooperation.id, literal(timestamp, DateTime))
+            .outerjoin(price, price.cooperation_id == models.Cooperation.id)
+            .where(
+                or_(
+                    price.cooperation_id.is_(None),
+                    price.as_of > timestamp,
+                    price.valid_until <= timestamp,
+                )
+            )
+        )
+
+    def is_valid_at(self, timestamp: datetime) -> Any:
+        price = models.CooperationPrice
+        return and_(
+            price.as_of <= timestamp,
+            or_(price.valid_until.is_(None), price.valid_until > timestamp),
+        )
+
+    def calculate_figures(self, cooperation: Any, timestamp: Any) -> Select:
+        """Select the number of active plans, the production costs and
+        amounts per day and the end of validity of the figures for a
+        cooperation at a timestamp. Both may be columns of an
+        enclosing query.
+        """
+        plan = aliased(models.Plan)
+        is_active = and_(
+            plan.activation_date <= timestamp, plan.expiration_date > timestamp
+        )
+        return select(
+            func.count().filter(is_active).label("plans_count"),
+            func.coalesce(
+                func.sum(
+                    (plan.costs_p + plan.costs_r + plan.costs_a) / plan.timeframe
+                ).filter(is_active),
+                0,
+            ).label("cost_per_day"),
+            func.coalesce(
+                func.sum(plan.prd_amount / plan.timeframe).filter(is_active), 0
+            ).label("amount_per_day"),
+            func.min(
+                case((is_active, plan.expiration_date), else_=plan.activation_date)
+            )
+            .filter(or_(is_active, plan.activation_date > timestamp))
+            .label("valid_until"),
+        ).where(plan.cooperation == cooperation, plan.activation_date.isnot(None))
+
+    def _store(self, targets: Select) -> None:
+        # The rows are written in the order of their cooperation ids so
+        # that concurrent transactions lock them in the same order.
+        price = models.CooperationPrice
+        target = targets.subquery()
+        cooperation, as_of = target.c
+        figures = self.calculate_figures(cooperation, as_of).lateral()
+        statement = insert(price).from_select(
+            [
+                price.cooperation_id,
+                price.as_of,
+                price.valid_until,
+                price.plans_count,
+                price.cost_per_day,
+                price.amount_per_day,
+            ],
+            select(
+                cooperation,
+                as_of,
+                figures.c.valid_until,
+                figures.c.plans_count,
+                figures.c.cost_per_day,
+                figures.c.amount_per_day,
+            )
+            .select_from(target.join(figures, true()))
+            .order_by(cooperation),
+        )
+        self.db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[price.cooperation_id],
+                set_={
+                    column: getattr(statement.excluded, column)
+                    for column in [
+                        "as_of",
+                        "valid_until",
+                        "plans_count",
+                        "cost_per_day",
+                        "amount_per_day",
+                    ]
+                },
+            )
+        )
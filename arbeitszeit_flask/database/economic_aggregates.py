@@ -0,0 +1,459 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from dataclasses import dataclass, fields
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import delete, exists, select, text, true, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.expression import and_, case, func, or_
+
+from arbeitszeit import records
+from arbeitszeit_flask.database import models
+
+AGGREGATE_ID = 1
+
+# The number of rows in the economic_aggregate_delta table. Reading the
+# figures sums at most this many rows.
+CHANGE_SLOTS = 16
+
+SUMMED_COLUMNS = [
+    "companies_count",
+    "members_count",
+    "cooperations_count",
+    "member_account_balance",
+    "labour_account_balance",
+    "product_account_balance",
+]
+
+
+@dataclass
+class ActivePlanFigures:
+    plans_count: Decimal
+    public_plans_count: Decimal
+    timeframe: Decimal
+    means_cost: Decimal
+    resource_cost: Decimal
+    labour_cost: Decimal
+    public_means_cost: Decimal
+    public_resource_cost: Decimal
+    public_labour_cost: Decimal
+
+    def __add__(self, other: ActivePlanFigures) -> ActivePlanFigures:
+        return ActivePlanFigures(
+            *(
+                getattr(self, field.name) + getattr(other, field.name)
+                for field in fields(self)
+            )
+        )
+
+    def __sub__(self, other: ActivePlanFigures) -> ActivePlanFigures:
+        return ActivePlanFigures(
+            *(
+                getattr(self, field.name) - getattr(other, field.name)
+                for field in fields(self)
+            )
+        )
+
+
+@dataclass
+class EconomicAggregateStore:
+    """Maintain the single row of the economic_aggregate table.
+
+    Whenever members, companies, cooperations and transactions are
+    created, the changes to the counters and account balance sums are
+    added to one of the CHANGE_SLOTS rows of the economic_aggregate_delta
+    table. Every database connection writes to its own slot, so that
+    concurrent writers rarely wait for each other's row locks. Reading
+    the figures adds the slots to the row. The figures about active
+    plans are stored in the row itself as of a point in time, which
+    advance_active_plans moves forward. Reading them for any other
+    point in time only considers the plans that were activated or
+    expired in between.
+    """
+
+    db: SQLAlchemy
+
+    def register_member(self, account: UUID) -> None:
+        self._record_change(
+            members_count=1,
+            member_account_balance=_balance_of(account),
+        )
+
+    def register_company(self, labour_account: UUID, products_account: UUID) -> None:
+        self._record_change(
+            companies_count=1,
+            labour_account_balance=_balance_of(labour_account),
+            product_account_balance=_balance_of(products_account),
+        )
+
+    def register_cooperation(self) -> None:
+        self._record_change(cooperations_count=1)
+
+    def record_transaction(
+        self,
+        sending_account: UUID,
+        receiving_account: UUID,
+        amount_sent: Decimal,
+        amount_received: Decimal,
+    ) -> None:
+        def balance_change(account_type: models.AccountTypes) -> Any:
+            return case(
+                (_is_account_of_type(receiving_account, account_type), amount_received),
+                else_=Decimal(0),
+            ) - case(
+                (_is_account_of_type(sending_account, account_type), amount_sent),
+                else_=Decimal(0),
+            )
+
+        self._record_change(
+            member_account_balance=balance_change(models.AccountTypes.member),
+            labour_account_balance=balance_change(models.AccountTypes.a),
+            product_account_balance=balance_change(models.AccountTypes.prd),
+        )
+
+    @contextmanager
+    def updating_plans(self, plans: List[UUID]) -> Iterator[None]:
+        """Wrap all changes to plans that might affect whether they are
+        active, e.g. changes to their activation date or deletion.
+        """
+        # Changes to plans are rare compared to transactions, so they
+        # are added to the row directly while holding its lock. Reading
+        # the active plan figures then only needs the row.
+        row = self._get_row(lock_for_update=True)
+        if row is None or row.active_plans_as_of is None:
+            yield
+            return
+        condition = models.Plan.id.in_(plans)
+        figures_before = self._active_plan_figures(row.active_plans_as_of, condition)
+        yield
+        figures_after = self._active_plan_figures(row.active_plans_as_of, condition)
+        self._add_to_stored_figures(figures_after - figures_before)
+
+    def advance_active_plans(self, timestamp: datetime) -> None:
+        """Move the point in time for which the active plan figures are
+        stored forward to the given timestamp. Earlier timestamps are
+        ignored.
+        """
+        row = self._get_row(lock_for_update=True)
+        if row is None:
+            return
+        if row.active_plans_as_of is None:
+            self._store_active_plan_figures(
+                timestamp, self._active_plan_figures(timestamp)
+            )
+        elif timestamp > row.active_plans_as_of:
+            self._add_to_stored_figures(
+                self._active_plan_figures_change(row.active_plans_as_of, timestamp),
+                active_plans_as_of=timestamp,
+            )
+
+    def get_statistics(self, timestamp: datetime) -> records.EconomicStatistics:
+        row = self._get_totals()
+        if row is None:
+            return self.calculate_statistics(timestamp)
+        figures = self._active_plan_figures_from_row(row, timestamp)
+        return records.EconomicStatistics(
+            registered_companies_count=row.companies_count,
+            registered_members_count=row.members_count,
+            cooperations_count=row.cooperations_count,
+            member_account_balance=row.member_account_balance,
+            labour_account_balance=row.labour_account_balance,
+            product_account_balance=row.product_account_balance,
+            active_plans_count=int(figures.plans_count),
+            active_public_plans_count=int(figures.public_plans_count),
+            active_plans_statistics=_planning_statistics(figures),
+        )
+
+    def get_active_plan_costs(self, timestamp: datetime) -> records.ActivePlanCosts:
+        row = self._get_row()
+        if row is None:
+            return self.calculate_active_plan_costs(timestamp)
+        return _active_plan_costs(self._active_plan_figures_from_row(row, timestamp))
+
+    def calculate_active_plan_costs(
+        self, timestamp: datetime
+    ) -> records.ActivePlanCosts:
+        """Calculate the costs of the active plans from scratch without
+        using the stored aggregates.
+        """
+        return _active_plan_costs(self._active_plan_figures(timestamp))
+
+    def calculate_statistics(self, timestamp: datetime) -> records.EconomicStatistics:
+        """Calculate the statistics from scratch without using the
+        stored aggregates.
+        """
+        figures = self._active_plan_figures(timestamp)
+        return records.EconomicStatistics(
+            registered_companies_count=self._count(models.Company.id),
+            registered_members_count=self._count(models.Member.id),
+            cooperations_count=self._count(models.Cooperation.id),
+            member_account_balance=self._sum_balances(models.AccountTypes.member),
+            labour_account_balance=self._sum_balances(models.AccountTypes.a),
+            product_account_balance=self._sum_balances(models.AccountTypes.prd),
+            active_plans_count=int(figures.plans_count),
+            active_public_plans_count=int(figures.public_plans_count),
+            active_plans_statistics=_planning_statistics(figures),
+        )
+
+    def recalculate(self, timestamp: datetime) -> None:
+        row = self._get_row(lock_for_update=True)
+        if row is None:
+            self.db.session.execute(
+                models.EconomicAggregate.__table__.insert().values(id=AGGREGATE_ID)
+            )
+        # Writers wait until the recalculated figures are committed, so
+        # that no change is counted twice or lost.
+        self.db.session.execute(
+            text("LOCK TABLE economic_aggregate_delta IN EXCLUSIVE MODE")
+        )
+        self.db.session.execute(
+            delete(models.EconomicAggregateDelta).execution_options(
+                synchronize_session=False
+            )
+        )
+        self._update_row(
+            companies_count=self._count(models.Company.id),
+            members_count=self._count(models.Member.id),
+            cooperations_count=self._count(models.Cooperation.id),
+            member_account_balance=self._sum_balances(models.AccountTypes.member),
+            labour_account_balance=self._sum_balances(models.AccountTypes.a),
+            product_account_balance=self._sum_balances(models.AccountTypes.prd),
+        )
+        self._store_active_plan_figures(timestamp, self._active_plan_figures(timestamp))
+
+    def _get_row(self, lock_for_update: bool = False) -> Optional[Any]:
+        query = select(models.EconomicAggregate.__table__).where(
+            models.EconomicAggregate.id == AGGREGATE_ID
+        )
+        if lock_for_update:
+            query = query.with_for_update()
+        return self.db.session.execute(query).first()
+
+    def _get_totals(self) -> Optional[Any]:
+        """The figures of the economic_aggregate row with all recorded
+        changes added.
+        """
+        aggregate = models.EconomicAggregate.__table__
+        delta = models.EconomicAggregateDelta
+        changes = select(
+            *(
+                func.coalesce(func.sum(getattr(delta, column)), 0).label(column)
+                for column in SUMMED_COLUMNS
+            )
+        ).subquery()
+        query = (
+            select(
+                *(
+                    (column + changes.c[column.name]).label(column.name)
+                    if column.name in SUMMED_COLUMNS
+                    else column
+                    for column in aggregate.c
+                )
+            )
+            .join(changes, true())
+            .where(aggregate.c.id == AGGREGATE_ID)
+        )
+        return self.db.session.execute(query).first()
+
+    def _record_change(self, **values: Any) -> None:
+        # A transaction always writes to the slot of its connection and
+        # therefore cannot deadlock with others over the slot rows.
+        delta = models.EconomicAggregateDelta
+        statement = insert(delta).values(
+            id=func.pg_backend_pid() % CHANGE_SLOTS, **values
+        )
+        self.db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[delta.id],
+                set_={
+                    column: getattr(delta, column) + getattr(statement.excluded, column)
+                    for column in values
+                },
+            )
+        )
+
+    def _update_row(self, **values: Any) -> None:
+        self.db.session.execute(
+            update(models.EconomicAggregate)
+            .where(models.EconomicAggregate.id == AGGREGATE_ID)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    def _add_to_stored_figures(self, change: ActivePlanFigures, **values: Any) -> None:
+        self._update_row(
+            **values,
+            **{
+                column: getattr(models.EconomicAggregate, column) + value
+                for column, value in _figure_values(change).items()
+            },
+        )
+
+    def _store_active_plan_figures(
+        self, timestamp: datetime, figures: ActivePlanFigures
+    ) -> None:
+        self._update_row(active_plans_as_of=timestamp, **_figure_values(figures))
+
+    def _active_plan_figures_from_row(
+        self, row: Any, timestamp: datetime
+    ) -> ActivePlanFigures:
+        if row.active_plans_as_of is None:
+            return self._active_plan_figures(timestamp)
+        return _stored_figures(row) + self._active_plan_figures_change(
+            row.active_plans_as_of, timestamp
+        )
+
+    def _active_plan_figures(
+        self, timestamp: datetime, *conditions: Any
+    ) -> ActivePlanFigures:
+        return self._sum_plan_figures(_is_active_as_of(timestamp), *conditions)
+
+    def _active_plan_figures_change(
+        self, start: datetime, end: datetime
+    ) -> ActivePlanFigures:
+        """Calculate how the active plan figures change from start to
+        end. Only plans that were activated or that expired in the
+        time between are considered.
+        """
+        if start == end:
+            return _zero_figures()
+        lower, upper = min(start, end), max(start, end)
+        return self._sum_plan_figures(
+            _is_active_as_of(end) - _is_active_as_of(start),
+            or_(
+                and_(
+                    models.Plan.activation_date > lower,
+                    models.Plan.activation_date <= upper,
+                ),
+                and_(
+                    models.Plan.expiration_date > lower,
+                    models.Plan.expiration_date <= upper,
+                ),
+            ),
+        )
+
+    def _sum_plan_figures(self, weight: Any, *conditions: Any) -> ActivePlanFigures:
+        public_weight = case((models.Plan.is_public_service, weight), else_=0)
+        query = select(
+            func.sum(weight),
+            func.sum(public_weight),
+            func.sum(weight * models.Plan.timeframe),
+            func.sum(weight * models.Plan.costs_p),
+            func.sum(weight * models.Plan.costs_r),
+            func.sum(weight * models.Plan.costs_a),
+            func.sum(public_weight * models.Plan.costs_p),
+            func.sum(public_weight * models.Plan.costs_r),
+            func.sum(public_weight * models.Plan.costs_a),
+        ).where(*conditions)
+        result = self.db.session.execute(query).one()
+        return ActivePlanFigures(*(Decimal(value or 0) for value in result))
+
+    def _count(self, column: Any) -> int:
+        return self.db.session.execute(select(func.count(column))).scalar_one()
+
+    def _sum_balances(self, account_type: models.AccountTypes) -> Decimal:
+        query = (
+            select(func.sum(models.AccountBalance.balance))
+            .join(
+                models.AccountOwner,
+                models.AccountOwner.account_id == models.AccountBalance.account_id,
+            )
+            .where(models.AccountOwner.account_type == account_type)
+        )
+        return self.db.session.execute(query).scalar_one() or Decimal(0)
+
+
+def _is_active_as_of(timestamp: datetime) -> Any:
+    return case(
+        (
+            and_(
+                models.Plan.activation_date <= timestamp,
+                models.Plan.expiration_date > timestamp,
+            ),
+            1,
+        ),
+        else_=0,
+    )
+
+
+def _is_account_of_type(account: UUID, account_type: models.AccountTypes) -> Any:
+    return exists().where(
+        models.AccountOwner.account_id == account,
+        models.AccountOwner.account_type == account_type,
+    )
+
+
+def _balance_of(account: UUID) -> Any:
+    return func.coalesce(
+        select(models.AccountBalance.balance)
+        .where(models.AccountBalance.account_id == account)
+        .scalar_subquery(),
+        Decimal(0),
+    )
+
+
+def _stored_figures(row: Any) -> ActivePlanFigures:
+    return ActivePlanFigures(
+        plans_count=Decimal(row.active_plans_count),
+        public_plans_count=Decimal(row.active_public_plans_count),
+        timeframe=row.active_plans_timeframe,
+        means_cost=row.active_plans_means_cost,
+        resource_cost=row.active_plans_resource_cost,
+        labour_cost=row.active_plans_labour_cost,
+        public_means_cost=row.active_public_plans_means_cost,
+        public_resource_cost=row.active_public_plans_resource_cost,
+        public_labour_cost=row.active_public_plans_labour_cost,
+    )
+
+
+def _figure_values(figures: ActivePlanFigures) -> Dict[str, Any]:
+    return dict(
+        active_plans_count=int(figures.plans_count),
+        active_public_plans_count=int(figures.public_plans_count),
+        active_plans_timeframe=figures.timeframe,
+        active_plans_means_cost=figures.means_cost,
+        active_plans_resource_cost=figures.resource_cost,
+        active_plans_labour_cost=figures.labour_cost,
+        active_public_plans_means_cost=figures.public_means_cost,
+        active_public_plans_resource_cost=figures.public_resource_cost,
+        active_public_plans_labour_cost=figures.public_labour_cost,
+    )
+
+
+def _zero_figures() -> ActivePlanFigures:
+    return ActivePlanFigures(*(Decimal(0) for _ in fields(ActivePlanFigures)))
+
+
+def _planning_statistics(figures: ActivePlanFigures) -> records.PlanningStatistics:
+    return records.PlanningStatistics(
+        average_plan_duration_in_days=(
+            figures.timeframe / figures.plans_count
+            if figures.plans_count
+            else Decimal(0)
+        ),
+        total_planned_costs=records.ProductionCosts(
+            means_cost=figures.means_cost,
+            resource_cost=figures.resource_cost,
+            labour_cost=figures.labour_cost,
+        ),
+    )
+
+
+def _active_plan_costs(figures: ActivePlanFigures) -> records.ActivePlanCosts:
+    return records.ActivePlanCosts(
+        productive_plans=records.ProductionCosts(
+            means_cost=figures.means_cost - figures.public_means_cost,
+            resource_cost=figures.resource_cost - figures.public_resource_cost,
+            labour_cost=figures.labour_cost - figures.public_labour_cost,
+        ),
+        public_plans=records.ProductionCosts(
+            means_cost=figures.public_means_cost,
+            resource_cost=figures.public_resource_cost,
+            labour_cost=figures.public_labour_cost,
+        ),
+    )
@@ -0,0 +1,77 @@
+"""Use cases look up the same plans and companies by id several times
+while a single request is handled, e.g. a plan and then its planner.
+The identity map keeps the records that were looked up by id for the
+rest of the request so that every record is queried at most once.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+)
+from uuid import UUID
+
+from arbeitszeit import records
+from arbeitszeit.injector import in_request_scope, request_scoped
+
+T = TypeVar("T")
+
+
+class RecordLoader(Generic[T]):
+    """Memoize records by their id.
+
+    Ids that are announced with prefetch are not queried right away.
+    They are queried together with the ids of the next lookup that
+    misses the memoized records, so that several lookups cost only
+    one query.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[UUID, T] = dict()
+        self._pending: Set[UUID] = set()
+
+    def prefetch(self, ids: Iterable[UUID]) -> None:
+        self._pending.update(id_ for id_ in ids if id_ not in self._records)
+
+    def load(
+        self,
+        ids: Sequence[UUID],
+        fetch: Callable[[List[UUID]], Iterable[Tuple[UUID, T]]],
+    ) -> List[T]:
+        """Return the records with the given ids in the order of the
+        ids. Ids without a record are skipped.
+        """
+        missing = [id_ for id_ in ids if id_ not in self._records]
+        if missing:
+            self._pending.update(missing)
+            pending = list(self._pending)
+            self._pending.clear()
+            self._records.update(fetch(pending))
+        return [
+            self._records[id_] for id_ in dict.fromkeys(ids) if id_ in self._records
+        ]
+
+    def invalidate(self) -> None:
+        self._records.clear()
+
+
+@request_scoped
+class IdentityMap:
+    """Keep the plans and companies that were looked up by id within
+    a request scope. Outside of a request scope there is no point in
+    time after which the records would have to be considered stale, so
+    the identity map is disabled there.
+    """
+
+    def __init__(self) -> None:
+        self.is_enabled = in_request_scope()
+        self.plans: RecordLoader[records.Plan] = RecordLoader()
+        self.companies: RecordLoader[records.Company] = RecordLoader()
@@ -4,18 +4,53 @@ Definition of database tables.
 
 import uuid
 from enum import Enum
+from typing import Any, Optional
 
 from flask_login import UserMixin
+from sqlalchemy import event, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.types import TypeDecorator
 
 from arbeitszeit_flask.extensions import db
 
 
-def generate_uuid() -> str:
-    return str(uuid.uuid4())
+def generate_uuid() -> uuid.UUID:
+    return uuid.uuid4()
+
+
+class Id(TypeDecorator):
+    """The type of id and foreign key columns.
+
+    The columns are created as uuid columns, but ids are bound as text
+    without a cast and converted by postgres to the type of the column.
+    This way the application works with the varchar id columns that are
+    in place until revision 7d3a5c9e2b61 swaps them, as well as with the
+    uuid columns afterwards.
+    """
+
+    impl = db.String
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[str]:
+        if value is None:
+            return None
+        return str(value)
+
+    def process_result_value(self, value: Any, dialect: Any) -> Any:
+        # Uuid columns are returned as uuid.UUID objects already.
+        if isinstance(value, str):
+            return uuid.UUID(value)
+        return value
+
+
+@compiles(Id)
+def compile_id(type_: Id, compiler: Any, **kwargs: Any) -> str:
+    return "UUID"
 
 
 class User(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     password = db.Column(db.String(300), nullable=False)
     email_address = db.Column(
         db.ForeignKey("email.address"), nullable=False, unique=True
@@ -31,24 +66,26 @@ class Email(db.Model):
 
 
 class SocialAccounting(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     account = db.Column(db.ForeignKey("account.id"), nullable=False)
 
 
 # Association table Company - Member
 jobs = db.Table(
     "jobs",
-    db.Column("member_id", db.String, db.ForeignKey("member.id")),
-    db.Column("company_id", db.String, db.ForeignKey("company.id")),
+    db.Column("member_id", Id, db.ForeignKey("member.id")),
+    db.Column("company_id", Id, db.ForeignKey("company.id")),
+    db.Index("ix_jobs_member_id_company_id", "member_id", "company_id"),
+    db.Index("ix_jobs_company_id", "company_id"),
 )
 
 
 class Member(UserMixin, db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     user_id = db.Column(db.ForeignKey("user.id"), nullable=False, unique=True)
     name = db.Column(db.String(1000), nullable=False)
     registered_on = db.Column(db.DateTime, nullable=False)
-    account = db.Column(db.ForeignKey("account.id"), nullable=False)
+    account = db.Column(db.ForeignKey("account.id"), nullable=False, index=True)
 
     workplaces = db.relationship(
         "Company",
@@ -59,29 +96,29 @@ class Member(UserMixin, db.Model):
 
 
 class Company(UserMixin, db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     user_id = db.Column(db.ForeignKey("user.id"), nullable=False, unique=True)
     name = db.Column(db.String(1000), nullable=False)
     registered_on = db.Column(db.DateTime, nullable=False)
     p_account = db.Column(db.ForeignKey("account.id"), nullable=False)
     r_account = db.Column(db.ForeignKey("account.id"), nullable=False)
-    a_account = db.Column(db.ForeignKey("account.id"), nullable=False)
-    prd_account = db.Column(db.ForeignKey("account.id"), nullable=False)
+    a_account = db.Column(db.ForeignKey("account.id"), nullable=False, index=True)
+    prd_account = db.Column(db.ForeignKey("account.id"), nullable=False, index=True)
 
     def __repr__(self):
         return "<Company(name='%s')>" % (self.name,)
 
 
 class Accountant(UserMixin, db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     user_id = db.Column(db.ForeignKey("user.id"), nullable=False, unique=True)
     name = db.Column(db.String(1000), nullable=False)
 
 
 class PlanDraft(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     plan_creation_date = db.Column(db.DateTime, nullable=False)
-    planner = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    planner = db.Column(Id, db.ForeignKey("company.id"), nullable=False, index=True)
     costs_p = db.Column(db.Numeric(), nullable=False)
     costs_r = db.Column(db.Numeric(), nullable=False)
     costs_a = db.Column(db.Numeric(), nullable=False)
@@ -94,9 +131,9 @@ class PlanDraft(db.Model):
 
 
 class Plan(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     plan_creation_date = db.Column(db.DateTime, nullable=False)
-    planner = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    planner = db.Column(Id, db.ForeignKey("company.id"), nullable=False, index=True)
     costs_p = db.Column(db.Numeric(), nullable=False)
     costs_r = db.Column(db.Numeric(), nullable=False)
     costs_a = db.Column(db.Numeric(), nullable=False)
@@ -107,21 +144,64 @@ class Plan(db.Model):
     timeframe = db.Column(db.Numeric(), nullable=False)
     is_public_service = db.Column(db.Boolean, nullable=False, default=False)
     activation_date = db.Column(db.DateTime, nullable=True)
+    expiration_date = db.Column(db.DateTime, nullable=True, index=True)
     is_available = db.Column(db.Boolean, nullable=False, default=True)
     requested_cooperation = db.Column(
-        db.String, db.ForeignKey("cooperation.id"), nullable=True
+        Id, db.ForeignKey("cooperation.id"), nullable=True, index=True
+    )
+    cooperation = db.Column(
+        Id, db.ForeignKey("cooperation.id"), nullable=True, index=True
     )
-    cooperation = db.Column(db.String, db.ForeignKey("cooperation.id"), nullable=True)
     hidden_by_user = db.Column(db.Boolean, nullable=False, default=False)
+    # The sum of the amounts of all productive and private consumptions
+    # of the plan. It is increased whenever a consumption is created.
+    provided_amount = db.Column(db.Integer, nullable=False, default=0)
+    # The product name and description prepared for full text search.
+    # Plans are written in German or English, therefore the words are
+    # stemmed for both languages.
+    search_vector = db.Column(
+        TSVECTOR,
+        db.Computed(
+            "setweight(to_tsvector('german', prd_name), 'A') || "
+            "setweight(to_tsvector('english', prd_name), 'A') || "
+            "setweight(to_tsvector('german', description), 'B') || "
+            "setweight(to_tsvector('english', description), 'B')",
+            persisted=True,
+        ),
+    )
 
     review = db.relationship("PlanReview", uselist=False, back_populates="plan")
 
+    __table_args__ = (
+        db.Index(
+            "ix_plan_activation_date_expiration_date",
+            "activation_date",
+            "expiration_date",
+        ),
+        db.Index("ix_plan_search_vector", "search_vector", postgresql_using="gin"),
+        # Supports searching product names for substrings.
+        db.Index(
+            "ix_plan_prd_name_trgm",
+            "prd_name",
+            postgresql_using="gin",
+            postgresql_ops={"prd_name": "gin_trgm_ops"},
+        ),
+    )
+
+
+@event.listens_for(Plan.__table__, "before_create")
+def create_trigram_extension(target, connection, **kwargs) -> None:
+    connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
 
 class PlanReview(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     approval_date = db.Column(db.DateTime, nullable=True, default=None)
     plan_id = db.Column(
-        db.String, db.ForeignKey("plan.id", ondelete="CASCADE"), nullable=False
+        Id,
+        db.ForeignKey("plan.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
 
     plan = db.relationship("Plan", back_populates="review")
@@ -139,8 +219,14 @@ class AccountTypes(Enum):
     accounting = "accounting"
 
 
+class AccountOwnerKinds(Enum):
+    member = "member"
+    company = "company"
+    social_accounting = "social_accounting"
+
+
 class Account(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
 
     transactions_sent = db.relationship(
         "Transaction",
@@ -156,17 +242,49 @@ class Account(db.Model):
     )
 
 
+class AccountBalance(db.Model):
+    # The balance of every account is maintained incrementally by the
+    # database gateway whenever a transaction is created. It must
+    # always equal the sum of all received amounts minus the sum of
+    # all sent amounts of the respective account.
+    account_id = db.Column(Id, db.ForeignKey("account.id"), primary_key=True)
+    balance = db.Column(db.Numeric(), nullable=False)
+
+
+class AccountOwner(db.Model):
+    account_id = db.Column(Id, db.ForeignKey("account.id"), primary_key=True)
+    owner_kind = db.Column(
+        db.Enum(AccountOwnerKinds, native_enum=False), nullable=False
+    )
+    owner_id = db.Column(Id, nullable=False, index=True)
+    account_type = db.Column(db.Enum(AccountTypes, native_enum=False), nullable=False)
+
+
 class Transaction(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     date = db.Column(db.DateTime, nullable=False)
-    sending_account = db.Column(db.String, db.ForeignKey("account.id"), nullable=False)
-    receiving_account = db.Column(
-        db.String, db.ForeignKey("account.id"), nullable=False
-    )
+    sending_account = db.Column(Id, db.ForeignKey("account.id"), nullable=False)
+    receiving_account = db.Column(Id, db.ForeignKey("account.id"), nullable=False)
     amount_sent = db.Column(db.Numeric(), nullable=False)
     amount_received = db.Column(db.Numeric(), nullable=False)
     purpose = db.Column(db.String(1000), nullable=True)  # Verwendungszweck
 
+    __table_args__ = (
+        db.Index(
+            "ix_transaction_sending_account_date_id",
+            "sending_account",
+            "date",
+            "id",
+        ),
+        db.Index(
+            "ix_transaction_receiving_account_date_id",
+            "receiving_account",
+            "date",
+            "id",
+        ),
+        db.Index("ix_transaction_date_id", "date", "id"),
+    )
+
     def __repr__(self) -> str:
         fields = ", ".join(
             [
@@ -183,47 +301,124 @@ class Transaction(db.Model):
 
 
 class PrivateConsumption(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=False)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
+    plan_id = db.Column(Id, db.ForeignKey("plan.id"), nullable=False, index=True)
     transaction_id = db.Column(
-        db.String, db.ForeignKey("transaction.id"), nullable=True
+        Id, db.ForeignKey("transaction.id"), nullable=True, index=True
     )
     amount = db.Column(db.Integer, nullable=False)
 
 
 class ProductiveConsumption(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    plan_id = db.Column(db.String, db.ForeignKey("plan.id"), nullable=False)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
+    plan_id = db.Column(Id, db.ForeignKey("plan.id"), nullable=False, index=True)
     transaction_id = db.Column(
-        db.String, db.ForeignKey("transaction.id"), nullable=True
+        Id, db.ForeignKey("transaction.id"), nullable=True, index=True
     )
     amount = db.Column(db.Integer, nullable=False)
 
 
 class CompanyWorkInvite(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    company = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
-    member = db.Column(db.String, db.ForeignKey("member.id"), nullable=False)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
+    company = db.Column(Id, db.ForeignKey("company.id"), nullable=False, index=True)
+    member = db.Column(Id, db.ForeignKey("member.id"), nullable=False, index=True)
 
 
 class Cooperation(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     creation_date = db.Column(db.DateTime, nullable=False)
     name = db.Column(db.String(100), nullable=False)
     definition = db.Column(db.String(5000), nullable=False)
 
 
 class CoordinationTenure(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
-    company = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
-    cooperation = db.Column(db.String, db.ForeignKey("cooperation.id"), nullable=False)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
+    company = db.Column(Id, db.ForeignKey("company.id"), nullable=False, index=True)
+    cooperation = db.Column(Id, db.ForeignKey("cooperation.id"), nullable=False)
     start_date = db.Column(db.DateTime, nullable=False)
 
+    __table_args__ = (
+        db.Index(
+            "ix_coordination_tenure_cooperation_start_date",
+            "cooperation",
+            "start_date",
+        ),
+    )
+
 
 class CoordinationTransferRequest(db.Model):
-    id = db.Column(db.String, primary_key=True, default=generate_uuid)
+    id = db.Column(Id, primary_key=True, default=generate_uuid)
     requesting_coordination_tenure = db.Column(
-        db.String, db.ForeignKey("coordination_tenure.id"), nullable=False
+        Id, db.ForeignKey("coordination_tenure.id"), nullable=False, index=True
     )
-    candidate = db.Column(db.String, db.ForeignKey("company.id"), nullable=False)
+    candidate = db.Column(Id, db.ForeignKey("company.id"), nullable=False)
     request_date = db.Column(db.DateTime, nullable=False)
+
+
+class EconomicAggregate(db.Model):
+    # This table holds exactly one row with economy wide counters and
+    # running sums. Together with the rows of economic_aggregate_delta
+    # they add up to the current figures. The figures about active
+    # plans are valid as of active_plans_as_of.
+    id = db.Column(db.Integer, primary_key=True)
+    companies_count = db.Column(db.Integer, nullable=False, default=0)
+    members_count = db.Column(db.Integer, nullable=False, default=0)
+    cooperations_count = db.Column(db.Integer, nullable=False, default=0)
+    member_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+    labour_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+    product_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+    active_plans_as_of = db.Column(db.DateTime, nullable=True)
+    active_plans_count = db.Column(db.Integer, nullable=False, default=0)
+    active_public_plans_count = db.Column(db.Integer, nullable=False, default=0)
+    active_plans_timeframe = db.Column(db.Numeric(), nullable=False, default=0)
+    active_plans_means_cost = db.Column(db.Numeric(), nullable=False, default=0)
+    active_plans_resource_cost = db.Column(db.Numeric(), nullable=False, default=0)
+    active_plans_labour_cost = db.Column(db.Numeric(), nullable=False, default=0)
+    active_public_plans_means_cost = db.Column(db.Numeric(), nullable=False, default=0)
+    active_public_plans_resource_cost = db.Column(
+        db.Numeric(), nullable=False, default=0
+    )
+    active_public_plans_labour_cost = db.Column(db.Numeric(), nullable=False, default=0)
+
+
+@event.listens_for(EconomicAggregate.__table__, "after_create")
+def insert_economic_aggregate_row(target, connection, **kwargs) -> None:
+    connection.execute(target.insert().values(id=1))
+
+
+class EconomicAggregateDelta(db.Model):
+    # Changes to the counters and balances of the economic_aggregate
+    # row are added to a fixed number of slot rows instead of that row,
+    # so that concurrent writers rarely wait for each other. The
+    # figures are the sum of the economic_aggregate row and all slots.
+    id = db.Column(db.BigInteger, primary_key=True)
+    companies_count = db.Column(db.Integer, nullable=False, default=0)
+    members_count = db.Column(db.Integer, nullable=False, default=0)
+    cooperations_count = db.Column(db.Integer, nullable=False, default=0)
+    member_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+    labour_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+    product_account_balance = db.Column(db.Numeric(), nullable=False, default=0)
+
+
+class CooperationPrice(db.Model):
+    # The production costs and amounts per day summed over the plans of
+    # a cooperation that are active from as_of until valid_until. Rows
+    # are calculated again whenever the plans of their cooperation
+    # change and by the sweep-expired-plans command.
+    cooperation_id = db.Column(Id, db.ForeignKey("cooperation.id"), primary_key=True)
+    as_of = db.Column(db.DateTime, nullable=False)
+    valid_until = db.Column(db.DateTime, nullable=True, index=True)
+    plans_count = db.Column(db.Integer, nullable=False)
+    cost_per_day = db.Column(db.Numeric(), nullable=False)
+    amount_per_day = db.Column(db.Numeric(), nullable=False)
+
+
+class PayoutFactorSnapshot(db.Model):
+    # The payout factor and the planned costs of the plans that are
+    # active at the start of a day. Rows are written by the
+    # backfill-payout-factor-snapshots and sweep-expired-plans commands.
+    day = db.Column(db.Date, primary_key=True)
+    payout_factor = db.Column(db.Numeric(), nullable=False)
+    means_cost = db.Column(db.Numeric(), nullable=False)
+    resource_cost = db.Column(db.Numeric(), nullable=False)
+    labour_cost = db.Column(db.Numeric(), nullable=False)
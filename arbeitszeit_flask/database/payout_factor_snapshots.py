@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Tuple
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from arbeitszeit import records
+from arbeitszeit.payout_factor import calculate_payout_factor_from_costs
+from arbeitszeit_flask.database import models
+
+
+@dataclass
+class PayoutFactorSnapshotStore:
+    """Maintain the payout_factor_snapshot table.
+
+    Snapshots are calculated for a whole period at once. All plans that
+    are active during the period are loaded in a single query and their
+    activations and expirations are applied in chronological order
+    while moving from one day to the next.
+    """
+
+    db: SQLAlchemy
+
+    def get_snapshots(
+        self, first_day: date, last_day: date
+    ) -> List[records.PayoutFactorSnapshot]:
+        """Return the stored snapshots of the given period. Snapshots of
+        days that were not stored yet are calculated but not stored.
+        """
+        stored = {
+            row.day: _snapshot_from_row(row)
+            for row in self.db.session.execute(
+                select(models.PayoutFactorSnapshot.__table__).where(
+                    models.PayoutFactorSnapshot.day >= first_day,
+                    models.PayoutFactorSnapshot.day <= last_day,
+                )
+            )
+        }
+        days = _days(first_day, last_day)
+        missing_days = [day for day in days if day not in stored]
+        if missing_days:
+            for snapshot in self.calculate_snapshots(missing_days[0], missing_days[-1]):
+                stored.setdefault(snapshot.timestamp.date(), snapshot)
+        return [stored[day] for day in days]
+
+    def store_snapshots(self, first_day: date, last_day: date) -> int:
+        """Calculate the snapshots of the given period and replace the
+        stored ones. Return the number of stored snapshots.
+        """
+        snapshots = self.calculate_snapshots(first_day, last_day)
+        if not snapshots:
+            return 0
+        snapshot_table = models.PayoutFactorSnapshot
+        statement = insert(snapshot_table).values(
+            [_row_from_snapshot(snapshot) for snapshot in snapshots]
+        )
+        self.db.session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[snapshot_table.day],
+                set_=dict(
+                    payout_factor=statement.excluded.payout_factor,
+                    means_cost=statement.excluded.means_cost,
+                    resource_cost=statement.excluded.resource_cost,
+                    labour_cost=statement.excluded.labour_cost,
+                ),
+            )
+        )
+        return len(snapshots)
+
+    def store_missing_snapshots(self, last_day: date) -> int:
+        """Store the snapshots of all days after the latest stored
+        snapshot up to last_day. If no snapshot was stored yet only the
+        snapshot of last_day is stored.
+        """
+        latest_day = self.db.session.execute(
+            select(func.max(models.PayoutFactorSnapshot.day))
+        ).scalar_one()
+        first_day = latest_day + timedelta(days=1) if latest_day else last_day
+        return self.store_snapshots(first_day, last_day)
+
+    def calculate_snapshots(
+        self, first_day: date, last_day: date
+    ) -> List[records.PayoutFactorSnapshot]:
+        days = _days(first_day, last_day)
+        if not days:
+            return []
+        events = self._plan_events(
+            datetime.combine(days[0], time()), datetime.combine(days[-1], time())
+        )
+        costs: Dict[bool, records.ProductionCosts] = {
+            False: records.ProductionCosts.zero(),
+            True: records.ProductionCosts.zero(),
+        }
+        snapshots = []
+        next_event = 0
+        for day in days:
+            timestamp = datetime.combine(day, time())
+            while next_event < len(events) and events[next_event][0] <= timestamp:
+                _, is_public_service, cost_change = events[next_event]
+                costs[is_public_service] += cost_change
+                next_event += 1
+            active_plan_costs = records.ActivePlanCosts(
+                productive_plans=costs[False], public_plans=costs[True]
+            )
+            snapshots.append(
+                records.PayoutFactorSnapshot(
+                    timestamp=timestamp,
+                    payout_factor=calculate_payout_factor_from_costs(active_plan_costs),
+                    planned_costs=costs[False] + costs[True],
+                )
+            )
+        return snapshots
+
+    def _plan_events(
+        self, start: datetime, end: datetime
+    ) -> List[Tuple[datetime, bool, records.ProductionCosts]]:
+        """Return the activations and expirations of all plans that are
+        active at some point between start and end, ordered by their
+        timestamp. Activations add the costs of the plan, expirations
+        subtract them.
+        """
+        events = []
+        for plan in self.db.session.execute(
+            select(
+                models.Plan.activation_date,
+                models.Plan.expiration_date,
+                models.Plan.is_public_service,
+                models.Plan.costs_p,
+                models.Plan.costs_r,
+                models.Plan.costs_a,
+            ).where(
+                models.Plan.activation_date <= end,
+                models.Plan.expiration_date > start,
+            )
+        ):
+            costs = records.ProductionCosts(
+                means_cost=plan.costs_p,
+                resource_cost=plan.costs_r,
+                labour_cost=plan.costs_a,
+            )
+            events.append((plan.activation_date, plan.is_public_service, costs))
+            events.append(
+                (plan.expiration_date, plan.is_public_service, _negated(costs))
+            )
+        events.sort(key=lambda event: event[0])
+        return events
+
+
+def _days(first_day: date, last_day: date) -> List[date]:
+    return [
+        first_day + timedelta(days=n) for n in range((last_day - first_day).days + 1)
+    ]
+
+
+def _negated(costs: records.ProductionCosts) -> records.ProductionCosts:
+    return records.ProductionCosts(
+        means_cost=-costs.means_cost,
+        resource_cost=-costs.resource_cost,
+        labour_cost=-costs.labour_cost,
+    )
+
+
+def _snapshot_from_row(row: Any) -> records.PayoutFactorSnapshot:
+    return records.PayoutFactorSnapshot(
+        timestamp=datetime.combine(row.day, time()),
+        payout_factor=row.payout_factor,
+        planned_costs=records.ProductionCosts(
+            means_cost=row.means_cost,
+            resource_cost=row.resource_cost,
+            labour_cost=row.labour_cost,
+        ),
+    )
+
+
+def _row_from_snapshot(snapshot: records.PayoutFactorSnapshot) -> Dict[str, Any]:
+    return dict(
+        day=snapshot.timestamp.date(),
+        payout_factor=snapshot.payout_factor,
+        means_cost=snapshot.planned_costs.means_cost,
+        resource_cost=snapshot.planned_costs.resource_cost,
+        labour_cost=snapshot.planned_costs.labour_cost,
+    )
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Tuple
+from uuid import uuid4
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.expression import ClauseElement
+
+from arbeitszeit_flask.database.repositories import (
+    DatabaseGatewayImpl,
+    FlaskQueryResult,
+)
+
+
+@dataclass
+class SequentialScan:
+    query: str
+    table: str
+    estimated_rows: int
+
+
+@dataclass
+class QueryPlanAdvisor:
+    """Explain the queries that the database gateway runs most often
+    and find sequential scans on large tables, which usually point to
+    a missing index.
+    """
+
+    db: SQLAlchemy
+    database_gateway: DatabaseGatewayImpl
+
+    def find_sequential_scans(self, min_rows: int) -> List[SequentialScan]:
+        estimated_rows = self._estimate_row_counts()
+        scans: List[SequentialScan] = []
+        for name, result in self._canonical_queries():
+            for table in sorted(set(self._sequentially_scanned_tables(result))):
+                rows = estimated_rows.get(table, 0)
+                if rows >= min_rows:
+                    scans.append(
+                        SequentialScan(query=name, table=table, estimated_rows=rows)
+                    )
+        return scans
+
+    def _canonical_queries(self) -> List[Tuple[str, FlaskQueryResult[Any]]]:
+        # The ids do not need to exist. The query planner bases its
+        # decisions on the table statistics only.
+        gateway = self.database_gateway
+        account, company, member, plan = uuid4(), uuid4(), uuid4(), uuid4()
+        cooperation, tenure = uuid4(), uuid4()
+        return [
+            (
+                "account statement",
+                gateway.get_transactions()
+                .where_account_is_sender_or_receiver(account)
+                .that_precede(datetime.min, uuid4())
+                .ordered_by_transaction_date(descending=True)
+                .limit(20),
+            ),
+            (
+                "latest transactions",
+                gateway.get_transactions()
+                .ordered_by_transaction_date(descending=True)
+                .limit(20),
+            ),
+            (
+                "sales of a plan",
+                gateway.get_transactions().that_were_a_sale_for_plan(plan),
+            ),
+            ("plan by id", gateway.get_plans().with_id(plan)),
+            (
+                "product search",
+                gateway.get_plans()
+                .with_product_matching("apple juice")
+                .ordered_by_relevance("apple juice"),
+            ),
+            ("plans of a company", gateway.get_plans().planned_by(company)),
+            ("plan drafts of a company", gateway.get_plan_drafts().planned_by(company)),
+            (
+                "plans of a cooperation",
+                gateway.get_plans().that_are_part_of_cooperation(cooperation),
+            ),
+            (
+                "cooperation requests",
+                gateway.get_plans().with_open_cooperation_request(
+                    cooperation=cooperation
+                ),
+            ),
+            (
+                "cooperation requests to a coordinator",
+                gateway.get_plans().that_request_cooperation_with_coordinator(company),
+            ),
+            (
+                "private consumptions of a member",
+                gateway.get_private_consumptions()
+                .where_consumer_is_member(member)
+                .joined_with_transactions_and_plan(),
+            ),
+            (
+                "productive consumptions of a company",
+                gateway.get_productive_consumptions()
+                .where_consumer_is_company(company)
+                .joined_with_transactions_and_plan(),
+            ),
+            (
+                "consumptions of the products of a company",
+                gateway.get_productive_consumptions().where_provider_is_company(
+                    company
+                ),
+            ),
+            (
+                "coordinator of a cooperation",
+                gateway.get_coordination_tenures()
+                .of_cooperation(cooperation)
+                .ordered_by_start_date(ascending=False)
+                .limit(1),
+            ),
+            (
+                "cooperations of a coordinator",
+                gateway.get_cooperations().coordinated_by_company(company),
+            ),
+            (
+                "transfer requests of a coordination tenure",
+                gateway.get_coordination_transfer_requests().requested_by(tenure),
+            ),
+            ("workers of a company", gateway.get_members().working_at_company(company)),
+            (
+                "workplaces of a member",
+                gateway.get_companies().that_are_workplace_of_member(member),
+            ),
+            (
+                "work invites of a member",
+                gateway.get_company_work_invites().addressing(member),
+            ),
+            ("accounts of a company", gateway.get_accounts().owned_by_company(company)),
+        ]
+
+    def _sequentially_scanned_tables(self, result: FlaskQueryResult[Any]) -> List[str]:
+        plan = self.db.session.execute(Explain(result.statement())).scalar_one()
+        return [
+            node["Relation Name"]
+            for node in _plan_nodes(plan[0]["Plan"])
+            if node["Node Type"] == "Seq Scan"
+        ]
+
+    def _estimate_row_counts(self) -> Dict[str, int]:
+        # reltuples is the estimate that the query planner uses itself.
+        # It is negative for tables that were never analyzed.
+        rows = self.db.session.execute(
+            text(
+                "SELECT relname, reltuples FROM pg_class "
+                "WHERE relkind = 'r' AND pg_table_is_visible(oid)"
+            )
+        )
+        return {table: max(int(count), 0) for table, count in rows}
+
+
+class Explain(Executable, ClauseElement):
+    """The query plan of a statement in JSON format."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any) -> None:
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: Any, **kwargs: Any) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kwargs)
+
+
+def _plan_nodes(node: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield node
+    for child in node.get("Plans", []):
+        yield from _plan_nodes(child)
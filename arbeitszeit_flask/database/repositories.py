@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field, replace
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from typing import (
     Any,
@@ -17,14 +17,31 @@ from typing import (
 from uuid import UUID, uuid4
 
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import String
 from sqlalchemy.dialects.postgresql import INTERVAL
 from sqlalchemy.orm import aliased
-from sqlalchemy.sql.expression import and_, case, func, or_, update
+from sqlalchemy.sql.expression import (
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    true,
+    tuple_,
+    union_all,
+    update,
+)
 from sqlalchemy.sql.functions import concat
 from typing_extensions import Self
 
 from arbeitszeit import records
-from arbeitszeit_flask.database import models
+from arbeitszeit.injector import request_scoped
+from arbeitszeit_flask.database import models, rows
+from arbeitszeit_flask.database.cooperation_prices import CooperationPriceStore
+from arbeitszeit_flask.database.economic_aggregates import EconomicAggregateStore
+from arbeitszeit_flask.database.identity_map import IdentityMap
 from arbeitszeit_flask.database.models import (
     Account,
     Company,
@@ -33,37 +50,99 @@ from arbeitszeit_flask.database.models import (
     SocialAccounting,
     Transaction,
 )
+from arbeitszeit_flask.database.payout_factor_snapshots import PayoutFactorSnapshotStore
 
 T = TypeVar("T", covariant=True)
 
 
 class FlaskQueryResult(Generic[T]):
-    def __init__(self, query: Any, mapper: Callable[[Any], T], db: SQLAlchemy) -> None:
+    """A result set of records.
+
+    If columns are given then the query is only used to filter and to
+    update the result set. The elements are read by selecting just the
+    columns, which are passed to the mapper as a row.
+    """
+
+    def __init__(
+        self,
+        query: Any,
+        mapper: Callable[[Any], T],
+        db: SQLAlchemy,
+        identity_map: Optional[IdentityMap] = None,
+        columns: Optional[List[Any]] = None,
+    ) -> None:
         self.query = query
         self.mapper = mapper
         self.db = db
+        self.columns = columns
+        self.identity_map = identity_map
+        self.is_unfiltered = True
+        self._lookup: Optional[Callable[[IdentityMap], List[T]]] = None
 
     def limit(self, n: int) -> Self:
-        return type(self)(query=self.query.limit(n), mapper=self.mapper, db=self.db)
+        return self._copy(self.query.limit(n))
 
     def offset(self, n: int) -> Self:
-        return type(self)(query=self.query.offset(n), mapper=self.mapper, db=self.db)
+        return self._copy(self.query.offset(n))
 
     def first(self) -> Optional[T]:
-        element = self.query.first()
+        if self._lookup is not None and self.identity_map is not None:
+            found = self._lookup(self.identity_map)
+            return found[0] if found else None
+        element = self._rows().first()
         if element is None:
             return None
         return self.mapper(element)
 
+    def statement(self) -> Any:
+        """The select statement that reads the elements of the result."""
+        return self._rows().statement
+
+    def _rows(self) -> Any:
+        if self.columns is None:
+            return self.query
+        return self.query.with_entities(*self.columns)
+
     def _with_modified_query(self, modification: Callable[[Any], Any]) -> Self:
-        return type(self)(
-            query=modification(self.query), mapper=self.mapper, db=self.db
+        return self._copy(modification(self.query))
+
+    def _with_lookup(
+        self,
+        modification: Callable[[Any], Any],
+        lookup: Callable[[IdentityMap], List[T]],
+    ) -> Self:
+        """Filter the result set like _with_modified_query. If the
+        result set was not filtered before then the records are looked
+        up with `lookup` in the identity map instead.
+        """
+        result = self._with_modified_query(modification)
+        if (
+            self.is_unfiltered
+            and self.identity_map is not None
+            and self.identity_map.is_enabled
+        ):
+            result._lookup = lookup
+        return result
+
+    def _copy(self, query: Any) -> Self:
+        result = type(self)(
+            query=query,
+            mapper=self.mapper,
+            db=self.db,
+            identity_map=self.identity_map,
+            columns=self.columns,
         )
+        result.is_unfiltered = False
+        return result
 
     def __iter__(self) -> Iterator[T]:
-        return (self.mapper(item) for item in self.query)
+        if self._lookup is not None and self.identity_map is not None:
+            return iter(self._lookup(self.identity_map))
+        return (self.mapper(item) for item in self._rows())
 
     def __len__(self) -> int:
+        if self._lookup is not None and self.identity_map is not None:
+            return len(self._lookup(self.identity_map))
         return self.query.count()
 
 
@@ -89,15 +168,60 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
         )
 
     def with_id_containing(self, query: str) -> Self:
+        if self._is_complete_id(query):
+            # A complete id is only contained in the id that equals it,
+            # which can be looked up by the primary key.
+            return self._with_modified_query(
+                lambda db_query: db_query.filter(models.Plan.id == UUID(query))
+            )
+        return self._with_modified_query(
+            lambda db_query: db_query.filter(
+                cast(models.Plan.id, String).contains(query)
+            )
+        )
+
+    def with_product_matching(self, query: str) -> Self:
+        # The product name is also searched for the query as a
+        # substring, which finds parts of words that full text search
+        # does not. A trigram index supports this search. A query that
+        # consists of stop words only matches every plan.
+        search_query = self._text_search_query(query)
         return self._with_modified_query(
-            lambda db_query: db_query.filter(models.Plan.id.contains(query))
+            lambda db_query: db_query.filter(
+                or_(
+                    func.numnode(search_query) == 0,
+                    models.Plan.search_vector.op("@@")(search_query),
+                    models.Plan.prd_name.ilike(f"%{query}%"),
+                )
+            )
         )
 
-    def with_product_name_containing(self, query: str) -> Self:
+    def ordered_by_relevance(self, query: str) -> Self:
         return self._with_modified_query(
-            lambda db_query: db_query.filter(models.Plan.prd_name.ilike(f"%{query}%"))
+            lambda db_query: db_query.order_by(
+                func.ts_rank(
+                    models.Plan.search_vector, self._text_search_query(query)
+                ).desc()
+            )
         )
 
+    @classmethod
+    def _text_search_query(cls, query: str) -> Any:
+        """A text search query that matches every word of the query.
+        The words may be stemmed either in German or in English, like
+        the words of the search vector of a plan.
+        """
+        return func.websearch_to_tsquery("german", query).op("||")(
+            func.websearch_to_tsquery("english", query)
+        )
+
+    @classmethod
+    def _is_complete_id(cls, query: str) -> bool:
+        try:
+            return str(UUID(query)) == query
+        except ValueError:
+            return False
+
     def that_are_approved(self) -> Self:
         return self._with_modified_query(
             lambda query: self.query.join(models.PlanReview).filter(
@@ -111,21 +235,13 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
         )
 
     def that_will_expire_after(self, timestamp: datetime) -> Self:
-        expiration_date = (
-            func.cast(concat(models.Plan.timeframe, "days"), INTERVAL)
-            + models.Plan.activation_date
-        )
         return self._with_modified_query(
-            lambda query: query.filter(expiration_date > timestamp)
+            lambda query: query.filter(models.Plan.expiration_date > timestamp)
         )
 
     def that_are_expired_as_of(self, timestamp: datetime) -> Self:
-        expiration_date = (
-            func.cast(concat(models.Plan.timeframe, "days"), INTERVAL)
-            + models.Plan.activation_date
-        )
         return self._with_modified_query(
-            lambda query: query.filter(expiration_date <= timestamp)
+            lambda query: query.filter(models.Plan.expiration_date <= timestamp)
         )
 
     def that_are_productive(self) -> Self:
@@ -144,17 +260,31 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
         )
 
     def planned_by(self, *company: UUID) -> Self:
-        companies = list(map(str, company))
+        companies = list(company)
         return self._with_modified_query(
             lambda query: query.filter(models.Plan.planner.in_(companies))
         )
 
     def with_id(self, *id_: UUID) -> Self:
-        ids = list(map(str, id_))
-        return self._with_modified_query(
-            lambda query: query.filter(models.Plan.id.in_(ids))
+        ids = list(id_)
+        return self._with_lookup(
+            lambda query: query.filter(models.Plan.id.in_(ids)),
+            lambda identity_map: identity_map.plans.load(id_, self._fetch_plans),
         )
 
+    def _fetch_plans(self, ids: List[UUID]) -> List[Tuple[UUID, records.Plan]]:
+        plans = [
+            rows.PLAN.build(row)
+            for row in self.db.session.execute(
+                select(*rows.PLAN.columns(models.Plan)).where(models.Plan.id.in_(ids))
+            )
+        ]
+        if self.identity_map is not None:
+            # The planner of a plan is usually looked up right after
+            # the plan itself.
+            self.identity_map.companies.prefetch(plan.planner for plan in plans)
+        return [(plan.id, plan) for plan in plans]
+
     def without_completed_review(self) -> Self:
         return self._with_modified_query(
             lambda query: self.query.join(models.PlanReview).filter(
@@ -167,7 +297,7 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
     ) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.Plan.requested_cooperation == str(cooperation)
+                models.Plan.requested_cooperation == cooperation
                 if cooperation
                 else models.Plan.requested_cooperation != None
             )
@@ -177,12 +307,12 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
         return self._with_modified_query(
             lambda query: query.filter(
                 or_(
-                    models.Plan.id == str(plan),
+                    models.Plan.id == plan,
                     and_(
                         models.Plan.cooperation != None,
                         models.Plan.cooperation.in_(
                             models.Plan.query.filter(
-                                models.Plan.id == str(plan)
+                                models.Plan.id == plan
                             ).with_entities(models.Plan.cooperation)
                         ),
                     ),
@@ -191,7 +321,7 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
         )
 
     def that_are_part_of_cooperation(self, *cooperation: UUID) -> Self:
-        cooperations = list(map(str, cooperation))
+        cooperations = list(cooperation)
         if not cooperation:
             return self._with_modified_query(
                 lambda query: query.filter(models.Plan.cooperation != None)
@@ -202,7 +332,7 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
             )
 
     def that_request_cooperation_with_coordinator(self, *company: UUID) -> Self:
-        companies = list(map(str, company))
+        companies = list(company)
 
         cooperation = aliased(models.Cooperation)
         most_recent_tenure_holder = (
@@ -247,140 +377,181 @@ class PlanQueryResult(FlaskQueryResult[records.Plan]):
             lambda query: query.filter(models.Plan.hidden_by_user == False)
         )
 
-    def joined_with_planner_and_cooperating_plans(
+    def joined_with_planner(
+        self,
+    ) -> FlaskQueryResult[Tuple[records.Plan, records.Company]]:
+        planner = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN, models.Plan)
+            .record(rows.COMPANY, planner)
+        )
+        return FlaskQueryResult(
+            db=self.db,
+            mapper=row,
+            query=self.query.join(
+                planner, planner.id == models.Plan.planner
+            ).with_entities(*row.columns),
+        )
+
+    def joined_with_cooperation(
+        self,
+    ) -> FlaskQueryResult[Tuple[records.Plan, records.Cooperation]]:
+        cooperation = aliased(models.Cooperation)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN, models.Plan)
+            .record(rows.COOPERATION, cooperation)
+        )
+        return FlaskQueryResult(
+            db=self.db,
+            mapper=row,
+            query=self.query.join(
+                cooperation, cooperation.id == models.Plan.cooperation
+            ).with_entities(*row.columns),
+        )
+
+    def joined_with_planner_and_requested_cooperation(
+        self,
+    ) -> FlaskQueryResult[Tuple[records.Plan, records.Company, records.Cooperation]]:
+        planner = aliased(models.Company)
+        cooperation = aliased(models.Cooperation)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN, models.Plan)
+            .record(rows.COMPANY, planner)
+            .record(rows.COOPERATION, cooperation)
+        )
+        return FlaskQueryResult(
+            db=self.db,
+            mapper=row,
+            query=self.query.join(planner, planner.id == models.Plan.planner)
+            .join(cooperation, cooperation.id == models.Plan.requested_cooperation)
+            .with_entities(*row.columns),
+        )
+
+    def joined_with_planner_and_cooperative_price(
         self, timestamp: datetime
-    ) -> FlaskQueryResult[
-        Tuple[records.Plan, records.Company, List[records.PlanSummary]]
-    ]:
+    ) -> FlaskQueryResult[Tuple[records.Plan, records.Company, Optional[Decimal]]]:
+        cooperation_prices = CooperationPriceStore(db=self.db)
+        price = models.CooperationPrice
         planner = aliased(models.Company)
-        cooperating_plan = aliased(models.Plan)
-        expiration_date = (
-            func.cast(concat(cooperating_plan.timeframe, "days"), INTERVAL)
-            + cooperating_plan.activation_date
+        # Cooperations without a row that is valid at the timestamp get
+        # their figures calculated inline. Nothing is written here.
+        figures = (
+            cooperation_prices.calculate_figures(models.Plan.cooperation, timestamp)
+            .where(price.cooperation_id.is_(None))
+            .lateral()
+        )
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN, models.Plan)
+            .record(rows.COMPANY, planner)
+            .value(func.coalesce(price.plans_count, figures.c.plans_count))
+            .value(func.coalesce(price.cost_per_day, figures.c.cost_per_day))
+            .value(func.coalesce(price.amount_per_day, figures.c.amount_per_day))
         )
         query = (
             self.query.join(planner, planner.id == models.Plan.planner)
-            .join(
-                cooperating_plan,
-                cooperating_plan.cooperation == models.Plan.cooperation,
-                isouter=True,
-            )
-            .filter(
-                or_(
-                    cooperating_plan.id == None,
-                    and_(
-                        expiration_date > timestamp,
-                        cooperating_plan.activation_date <= timestamp,
-                    ),
-                )
-            )
-            .group_by(models.Plan, planner)
-            .with_entities(
-                models.Plan,
-                planner,
-                func.array_agg(cooperating_plan.timeframe),
-                func.array_agg(
-                    cooperating_plan.costs_p
-                    + cooperating_plan.costs_r
-                    + cooperating_plan.costs_a
+            .outerjoin(
+                price,
+                and_(
+                    price.cooperation_id == models.Plan.cooperation,
+                    cooperation_prices.is_valid_at(timestamp),
                 ),
-                func.array_agg(cooperating_plan.prd_amount),
             )
+            .outerjoin(figures, true())
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             db=self.db,
-            mapper=self._map_result_with_plan_and_company_and_cooperating_plans,
+            mapper=lambda values: self._map_result_with_plan_and_company_and_cooperative_price(
+                row(values)
+            ),
             query=query,
         )
 
     def joined_with_provided_product_amount(
         self,
     ) -> FlaskQueryResult[Tuple[records.Plan, int]]:
-        productive_consumptions = (
-            models.ProductiveConsumption.query.filter(
-                models.ProductiveConsumption.plan_id == models.Plan.id
-            )
-            .with_entities(func.sum(models.ProductiveConsumption.amount))
-            .scalar_subquery()
-        )
-        private_consumptions = (
-            models.PrivateConsumption.query.filter(
-                models.PrivateConsumption.plan_id == models.Plan.id
-            )
-            .with_entities(func.sum(models.PrivateConsumption.amount))
-            .scalar_subquery()
-        )
-        query = self.query.with_entities(
-            models.Plan,
-            func.coalesce(productive_consumptions, 0)
-            + func.coalesce(private_consumptions, 0),
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN, models.Plan)
+            .value(models.Plan.provided_amount)
         )
         return FlaskQueryResult(
-            query=query,
+            query=self.query.with_entities(*row.columns),
             db=self.db,
-            mapper=lambda orm: (
-                DatabaseGatewayImpl.plan_from_orm(orm[0]),
-                orm[1],
-            ),
+            mapper=row,
         )
 
     def delete(self) -> None:
-        self.query.delete()
+        plans = [plan_id for plan_id, in self.query.with_entities(models.Plan.id)]
+        cooperation_prices = CooperationPriceStore(db=self.db)
+        cooperations = cooperation_prices.cooperations_of_plans(plans)
+        if self.identity_map is not None:
+            self.identity_map.plans.invalidate()
+        with EconomicAggregateStore(db=self.db).updating_plans(plans):
+            self.query.delete()
+        cooperation_prices.recalculate(cooperations)
 
     def update(self) -> PlanUpdate:
         return PlanUpdate(
             query=self.query,
             db=self.db,
+            identity_map=self.identity_map,
         )
 
     @classmethod
-    def _map_result_with_plan_and_company_and_cooperating_plans(
-        self, orm: Any
-    ) -> Tuple[records.Plan, records.Company, List[records.PlanSummary]]:
-        if any(orm[2]):
-            cooperating_plans = list(
-                records.PlanSummary(
-                    production_costs=cost,
-                    duration_in_days=duration,
-                    amount=amount,
-                )
-                for duration, cost, amount in zip(
-                    orm[2],
-                    orm[3],
-                    orm[4],
-                )
-            )
+    def _map_result_with_plan_and_company_and_cooperative_price(
+        cls, row: Tuple[Any, ...]
+    ) -> Tuple[records.Plan, records.Company, Optional[Decimal]]:
+        plan, planner, plans_count, cost_per_day, amount_per_day = row
+        if not plans_count:
+            cooperative_price = None
+        elif not amount_per_day:
+            cooperative_price = Decimal(0)
         else:
-            cooperating_plans = []
-        return (
-            DatabaseGatewayImpl.plan_from_orm(orm[0]),
-            DatabaseGatewayImpl.company_from_orm(orm[1]),
-            cooperating_plans,
-        )
+            cooperative_price = cost_per_day / amount_per_day
+        return plan, planner, cooperative_price
 
 
 @dataclass
 class PlanUpdate:
     query: Any
     db: SQLAlchemy
+    identity_map: Optional[IdentityMap] = None
     plan_update_values: Dict[str, Any] = field(default_factory=dict)
     review_update_values: Dict[str, Any] = field(default_factory=dict)
 
     def perform(self) -> int:
         row_count = 0
-        if self.plan_update_values:
-            sql_statement = (
-                update(models.Plan)
-                .where(
-                    models.Plan.id.in_(
-                        self.query.with_entities(models.Plan.id).scalar_subquery()
-                    )
+        if self.identity_map is not None:
+            self.identity_map.plans.invalidate()
+        cooperation_prices = CooperationPriceStore(db=self.db)
+        if self._affects_cooperative_prices():
+            plans = [plan_id for plan_id, in self.query.with_entities(models.Plan.id)]
+            cooperations = cooperation_prices.cooperations_of_plans(plans) + [
+                self.plan_update_values.get("cooperation")
+            ]
+        if "activation_date" in self.plan_update_values:
+            plans = [plan_id for plan_id, in self.query.with_entities(models.Plan.id)]
+            with EconomicAggregateStore(db=self.db).updating_plans(plans):
+                row_count = self._update_plans(models.Plan.id.in_(plans))
+        elif self.plan_update_values:
+            row_count = self._update_plans(
+                models.Plan.id.in_(
+                    self.query.with_entities(models.Plan.id).scalar_subquery()
                 )
-                .values(**self.plan_update_values)
-                .execution_options(synchronize_session="fetch")
             )
-            result = self.db.session.execute(sql_statement)
-            row_count = result.rowcount  # type: ignore
+        if self._affects_cooperative_prices():
+            # Activating plans changes the figures from the activation
+            # on. Moving plans between cooperations changes them for
+            # every timestamp, so the existing rows are calculated again
+            # at their own as_of timestamps.
+            cooperation_prices.recalculate(
+                cooperations, self.plan_update_values.get("activation_date")
+            )
         if self.review_update_values:
             sql_statement = (
                 update(models.PlanReview)
@@ -396,12 +567,28 @@ class PlanUpdate:
             row_count = max(row_count, result.rowcount)  # type: ignore
         return row_count
 
+    def _affects_cooperative_prices(self) -> bool:
+        return (
+            "cooperation" in self.plan_update_values
+            or "activation_date" in self.plan_update_values
+        )
+
+    def _update_plans(self, condition: Any) -> int:
+        sql_statement = (
+            update(models.Plan)
+            .where(condition)
+            .values(**self.plan_update_values)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = self.db.session.execute(sql_statement)
+        return result.rowcount  # type: ignore
+
     def set_cooperation(self, cooperation: Optional[UUID]) -> Self:
         return replace(
             self,
             plan_update_values=dict(
                 self.plan_update_values,
-                cooperation=str(cooperation) if cooperation else None,
+                cooperation=cooperation,
             ),
         )
 
@@ -410,7 +597,7 @@ class PlanUpdate:
             self,
             plan_update_values=dict(
                 self.plan_update_values,
-                requested_cooperation=str(cooperation) if cooperation else None,
+                requested_cooperation=cooperation,
             ),
         )
 
@@ -430,6 +617,12 @@ class PlanUpdate:
             plan_update_values=dict(
                 self.plan_update_values,
                 activation_date=activation_timestamp,
+                expiration_date=(
+                    None
+                    if activation_timestamp is None
+                    else func.cast(concat(models.Plan.timeframe, "days"), INTERVAL)
+                    + activation_timestamp
+                ),
             ),
         )
 
@@ -455,14 +648,12 @@ class PlanUpdate:
 class PlanDraftResult(FlaskQueryResult[records.PlanDraft]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.PlanDraft.id == str(id_))
+            lambda query: query.filter(models.PlanDraft.id == id_)
         )
 
     def planned_by(self, *company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(
-                models.PlanDraft.planner.in_([str(i) for i in company])
-            )
+            lambda query: query.filter(models.PlanDraft.planner.in_(list(company)))
         )
 
     def delete(self) -> int:
@@ -476,27 +667,24 @@ class PlanDraftResult(FlaskQueryResult[records.PlanDraft]):
     ) -> FlaskQueryResult[
         tuple[records.PlanDraft, records.Company, records.EmailAddress]
     ]:
-        def mapper(
-            row: Any,
-        ) -> tuple[records.PlanDraft, records.Company, records.EmailAddress]:
-            return (
-                DatabaseGatewayImpl.plan_draft_from_orm(row[0]),
-                DatabaseGatewayImpl.company_from_orm(row[1]),
-                DatabaseGatewayImpl.email_address_from_orm(row[2]),
-            )
-
         company = aliased(models.Company)
         user = aliased(models.User)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PLAN_DRAFT, models.PlanDraft)
+            .record(rows.COMPANY, company)
+            .record(rows.EMAIL_ADDRESS, email)
+        )
         query = (
             self.query.join(company, models.PlanDraft.planner == company.id)
             .join(user, company.user_id == user.id)
             .join(email, user.email_address == email.address)
-            .with_entities(models.PlanDraft, company, email)
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=query,
         )
 
@@ -556,12 +744,12 @@ class PlanDraftUpdate:
 class MemberQueryResult(FlaskQueryResult[records.Member]):
     def working_at_company(self, company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Member.workplaces.any(id=str(company)))
+            lambda query: query.filter(models.Member.workplaces.any(id=company))
         )
 
     def with_id(self, member: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Member.id == str(member))
+            lambda query: query.filter(models.Member.id == member)
         )
 
     def with_email_address(self, email: str) -> Self:
@@ -575,30 +763,42 @@ class MemberQueryResult(FlaskQueryResult[records.Member]):
     def joined_with_email_address(
         self,
     ) -> FlaskQueryResult[Tuple[records.Member, records.EmailAddress]]:
-        def mapper(row):
-            member_orm, email_orm = row
-            return (
-                DatabaseGatewayImpl.member_from_orm(member_orm),
-                DatabaseGatewayImpl.email_address_from_orm(email_orm),
-            )
-
         user = aliased(models.User)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.MEMBER, models.Member)
+            .record(rows.EMAIL_ADDRESS, email)
+        )
         return FlaskQueryResult(
-            mapper=mapper,
+            mapper=row,
             db=self.db,
             query=self.query.join(user, user.id == models.Member.user_id)
             .join(email, email.address == user.email_address)
-            .with_entities(models.Member, email),
+            .with_entities(*row.columns),
         )
 
 
 class CompanyQueryResult(FlaskQueryResult[records.Company]):
     def with_id(self, id_: UUID) -> Self:
-        return self._with_modified_query(
-            lambda query: query.filter(models.Company.id == str(id_))
+        return self._with_lookup(
+            lambda query: query.filter(models.Company.id == id_),
+            lambda identity_map: identity_map.companies.load(
+                [id_], self._fetch_companies
+            ),
         )
 
+    def _fetch_companies(self, ids: List[UUID]) -> List[Tuple[UUID, records.Company]]:
+        companies = [
+            rows.COMPANY.build(row)
+            for row in self.db.session.execute(
+                select(*rows.COMPANY.columns(models.Company)).where(
+                    models.Company.id.in_(ids)
+                )
+            )
+        ]
+        return [(company.id, company) for company in companies]
+
     def with_email_address(self, email: str) -> Self:
         return self._with_modified_query(
             lambda query: query.join(models.User).filter(
@@ -609,7 +809,7 @@ class CompanyQueryResult(FlaskQueryResult[records.Company]):
     def that_are_workplace_of_member(self, member: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.Company.workers.any(models.Member.id == str(member))
+                models.Company.workers.any(models.Member.id == member)
             )
         )
 
@@ -627,12 +827,12 @@ class CompanyQueryResult(FlaskQueryResult[records.Company]):
         return self._with_modified_query(
             lambda query: query.join(
                 coop, most_recent_tenure_holder == models.Company.id
-            ).filter(coop.id == str(cooperation))
+            ).filter(coop.id == cooperation)
         )
 
     def add_worker(self, member: UUID) -> int:
         companies_changed = 0
-        member = models.Member.query.filter(models.Member.id == str(member)).first()
+        member = models.Member.query.filter(models.Member.id == member).first()
         assert member
         for company in self.query:
             companies_changed += 1
@@ -654,21 +854,19 @@ class CompanyQueryResult(FlaskQueryResult[records.Company]):
     def joined_with_email_address(
         self,
     ) -> FlaskQueryResult[Tuple[records.Company, records.EmailAddress]]:
-        def mapper(row):
-            company_orm, email_orm = row
-            return (
-                DatabaseGatewayImpl.company_from_orm(company_orm),
-                DatabaseGatewayImpl.email_address_from_orm(email_orm),
-            )
-
         user = aliased(models.User)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.COMPANY, models.Company)
+            .record(rows.EMAIL_ADDRESS, email)
+        )
         return FlaskQueryResult(
-            mapper=mapper,
+            mapper=row,
             db=self.db,
             query=self.query.join(user, user.id == models.Company.user_id)
             .join(email, email.address == user.email_address)
-            .with_entities(models.Company, email),
+            .with_entities(*row.columns),
         )
 
 
@@ -683,36 +881,35 @@ class AccountantResult(FlaskQueryResult[records.Accountant]):
 
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Accountant.id == str(id_))
+            lambda query: query.filter(models.Accountant.id == id_)
         )
 
     def joined_with_email_address(
         self,
     ) -> FlaskQueryResult[Tuple[records.Accountant, records.EmailAddress]]:
-        def mapper(orm: Any) -> Tuple[records.Accountant, records.EmailAddress]:
-            return (
-                DatabaseGatewayImpl.accountant_from_orm(orm[0]),
-                DatabaseGatewayImpl.email_address_from_orm(orm[1]),
-            )
-
         user = aliased(models.User)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNTANT, models.Accountant)
+            .record(rows.EMAIL_ADDRESS, email)
+        )
         query = (
             self.query.join(user, user.id == models.Accountant.user_id)
             .join(email, email.address == user.email_address)
-            .with_entities(models.Accountant, email)
+            .with_entities(*row.columns)
         )
 
         return FlaskQueryResult(
             db=self.db,
             query=query,
-            mapper=mapper,
+            mapper=row,
         )
 
 
 class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
     def where_account_is_sender_or_receiver(self, *account: UUID) -> Self:
-        accounts = list(map(str, account))
+        accounts = list(account)
         return self._with_modified_query(
             lambda query: query.filter(
                 or_(
@@ -723,7 +920,7 @@ class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
         )
 
     def where_account_is_sender(self, *account: UUID) -> Self:
-        accounts = map(str, account)
+        accounts = list(account)
         return self._with_modified_query(
             lambda query: query.filter(
                 models.Transaction.sending_account.in_(accounts),
@@ -731,7 +928,7 @@ class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
         )
 
     def where_account_is_receiver(self, *account: UUID) -> Self:
-        accounts = map(str, account)
+        accounts = list(account)
         return self._with_modified_query(
             lambda query: query.filter(
                 models.Transaction.receiving_account.in_(accounts),
@@ -739,10 +936,20 @@ class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
         )
 
     def ordered_by_transaction_date(self, descending: bool = False) -> Self:
-        ordering = models.Transaction.date
+        orderings = [models.Transaction.date, models.Transaction.id]
         if descending:
-            ordering = ordering.desc()
-        return self._with_modified_query(lambda query: self.query.order_by(ordering))
+            orderings = [ordering.desc() for ordering in orderings]
+        return self._with_modified_query(lambda query: self.query.order_by(*orderings))
+
+    def that_precede(self, date: datetime, transaction: UUID) -> Self:
+        return self._with_modified_query(
+            lambda query: query.filter(
+                tuple_(models.Transaction.date, models.Transaction.id)
+                < tuple_(
+                    literal(date), literal(transaction, models.Transaction.id.type)
+                )
+            )
+        )
 
     def where_sender_is_social_accounting(self) -> Self:
         return self._with_modified_query(
@@ -752,32 +959,41 @@ class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
             )
         )
 
+    def grouped_by_receiving_account(self) -> FlaskQueryResult[Tuple[UUID, Decimal]]:
+        query = (
+            self.query.order_by(None)
+            .group_by(models.Transaction.receiving_account)
+            .with_entities(
+                models.Transaction.receiving_account,
+                func.sum(models.Transaction.amount_received),
+            )
+        )
+        return FlaskQueryResult(
+            query=query,
+            db=self.db,
+            mapper=lambda orm: (orm[0], orm[1]),
+        )
+
     def that_were_a_sale_for_plan(self, *plan: UUID) -> Self:
-        plan_ids = [str(p) for p in plan]
+        plan_ids = list(plan)
         private_consumption = aliased(models.PrivateConsumption)
         productive_consumption = aliased(models.ProductiveConsumption)
-        valid_private_consumption = private_consumption.query
-        valid_productive_consumption = productive_consumption.query
+        valid_private_consumption = select(private_consumption.transaction_id)
+        valid_productive_consumption = select(productive_consumption.transaction_id)
         if plan:
-            valid_productive_consumption = valid_productive_consumption.filter(
+            valid_productive_consumption = valid_productive_consumption.where(
                 productive_consumption.plan_id.in_(plan_ids)
             )
-            valid_private_consumption = valid_private_consumption.filter(
+            valid_private_consumption = valid_private_consumption.where(
                 private_consumption.plan_id.in_(plan_ids)
             )
+        # A single IN over the union of both consumption tables lets
+        # the transactions be looked up by their primary key instead
+        # of filtering every transaction against both subqueries.
         return self._with_modified_query(
             lambda query: query.filter(
-                or_(
-                    models.Transaction.id.in_(
-                        valid_private_consumption.with_entities(
-                            private_consumption.transaction_id
-                        ).scalar_subquery()
-                    ),
-                    models.Transaction.id.in_(
-                        valid_productive_consumption.with_entities(
-                            productive_consumption.transaction_id
-                        ).scalar_subquery()
-                    ),
+                models.Transaction.id.in_(
+                    union_all(valid_private_consumption, valid_productive_consumption)
                 )
             )
         )
@@ -785,218 +1001,182 @@ class TransactionQueryResult(FlaskQueryResult[records.Transaction]):
     def joined_with_sender_and_receiver(
         self,
     ) -> FlaskQueryResult[
-        Tuple[records.Transaction, records.AccountOwner, records.AccountOwner]
+        Tuple[
+            records.Transaction,
+            records.AccountOwner,
+            records.AccountOwner,
+            records.AccountTypes,
+            records.AccountTypes,
+        ]
     ]:
+        sender = aliased(models.AccountOwner)
         sender_member = aliased(models.Member)
         sender_company = aliased(models.Company)
         sender_social_accounting = aliased(models.SocialAccounting)
+        receiver = aliased(models.AccountOwner)
         receiver_member = aliased(models.Member)
         receiver_company = aliased(models.Company)
         receiver_social_accounting = aliased(models.SocialAccounting)
+        row = (
+            rows.JoinedRow()
+            .record(rows.TRANSACTION, models.Transaction)
+            .record(rows.MEMBER, sender_member, optional=True)
+            .record(rows.COMPANY, sender_company, optional=True)
+            .record(rows.SOCIAL_ACCOUNTING, sender_social_accounting, optional=True)
+            .value(sender.account_type)
+            .record(rows.MEMBER, receiver_member, optional=True)
+            .record(rows.COMPANY, receiver_company, optional=True)
+            .record(rows.SOCIAL_ACCOUNTING, receiver_social_accounting, optional=True)
+            .value(receiver.account_type)
+        )
         return FlaskQueryResult(
             query=self.query.join(
-                sender_member,
-                sender_member.account == models.Transaction.sending_account,
+                sender,
+                sender.account_id == models.Transaction.sending_account,
                 isouter=True,
             )
+            .join(sender_member, sender_member.id == sender.owner_id, isouter=True)
+            .join(sender_company, sender_company.id == sender.owner_id, isouter=True)
             .join(
-                sender_company,
-                or_(
-                    sender_company.r_account == models.Transaction.sending_account,
-                    sender_company.p_account == models.Transaction.sending_account,
-                    sender_company.a_account == models.Transaction.sending_account,
-                    sender_company.prd_account == models.Transaction.sending_account,
-                ),
+                sender_social_accounting,
+                sender_social_accounting.id == sender.owner_id,
                 isouter=True,
             )
             .join(
-                sender_social_accounting,
-                sender_social_accounting.account == models.Transaction.sending_account,
+                receiver,
+                receiver.account_id == models.Transaction.receiving_account,
                 isouter=True,
             )
             .join(
-                receiver_member,
-                receiver_member.account == models.Transaction.receiving_account,
-                isouter=True,
+                receiver_member, receiver_member.id == receiver.owner_id, isouter=True
             )
             .join(
                 receiver_company,
-                or_(
-                    receiver_company.r_account == models.Transaction.receiving_account,
-                    receiver_company.p_account == models.Transaction.receiving_account,
-                    receiver_company.a_account == models.Transaction.receiving_account,
-                    receiver_company.prd_account
-                    == models.Transaction.receiving_account,
-                ),
+                receiver_company.id == receiver.owner_id,
                 isouter=True,
             )
             .join(
                 receiver_social_accounting,
-                receiver_social_accounting.account
-                == models.Transaction.receiving_account,
+                receiver_social_accounting.id == receiver.owner_id,
                 isouter=True,
             )
-            .with_entities(
-                models.Transaction,
-                sender_member,
-                sender_company,
-                sender_social_accounting,
-                receiver_member,
-                receiver_company,
-                receiver_social_accounting,
+            .with_entities(*row.columns),
+            mapper=lambda values: self.map_transaction_and_sender_and_receiver(
+                row(values)
             ),
-            mapper=self.map_transaction_and_sender_and_receiver,
             db=self.db,
         )
 
     @classmethod
     def map_transaction_and_sender_and_receiver(
-        cls, orm: Any
-    ) -> Tuple[records.Transaction, records.AccountOwner, records.AccountOwner]:
+        cls, row: Tuple[Any, ...]
+    ) -> Tuple[
+        records.Transaction,
+        records.AccountOwner,
+        records.AccountOwner,
+        records.AccountTypes,
+        records.AccountTypes,
+    ]:
         (
             transaction,
             sending_member,
             sending_company,
             sender_social_accounting,
+            sending_account_type,
             receiver_member,
             receiver_company,
             receiver_social_accounting,
-        ) = orm
-        sender: records.AccountOwner
-        receiver: records.AccountOwner
-        if sending_member:
-            sender = DatabaseGatewayImpl.member_from_orm(sending_member)
-        elif sending_company:
-            sender = DatabaseGatewayImpl.company_from_orm(sending_company)
-        else:
-            sender = AccountingRepository.social_accounting_from_orm(
-                sender_social_accounting
-            )
-        if receiver_member:
-            receiver = DatabaseGatewayImpl.member_from_orm(receiver_member)
-        elif receiver_company:
-            receiver = DatabaseGatewayImpl.company_from_orm(receiver_company)
-        else:
-            receiver = AccountingRepository.social_accounting_from_orm(
-                receiver_social_accounting
-            )
+            receiving_account_type,
+        ) = row
         return (
-            DatabaseGatewayImpl.transaction_from_orm(transaction),
-            sender,
-            receiver,
+            transaction,
+            DatabaseGatewayImpl.account_owner_from_records(
+                sending_member, sending_company, sender_social_accounting
+            ),
+            DatabaseGatewayImpl.account_owner_from_records(
+                receiver_member, receiver_company, receiver_social_accounting
+            ),
+            DatabaseGatewayImpl.account_type_from_orm(sending_account_type),
+            DatabaseGatewayImpl.account_type_from_orm(receiving_account_type),
         )
 
 
 class AccountQueryResult(FlaskQueryResult[records.Account]):
     def with_id(self, *id_: UUID) -> Self:
-        ids = list(map(str, id_))
+        ids = list(id_)
         return self._with_modified_query(
             lambda query: query.filter(models.Account.id.in_(ids))
         )
 
     def owned_by_member(self, *members: UUID) -> Self:
-        member = aliased(models.Member)
-        return self._with_modified_query(
-            lambda query: query.join(
-                member, member.account == models.Account.id
-            ).filter(member.id.in_([str(m) for m in members]))
-        )
+        return self._owned_by(models.AccountOwnerKinds.member, list(members))
 
     def owned_by_company(self, *companies: UUID) -> Self:
-        company = aliased(models.Company)
-        return self._with_modified_query(
-            lambda query: query.join(
-                company,
-                or_(
-                    company.p_account == models.Account.id,
-                    company.r_account == models.Account.id,
-                    company.a_account == models.Account.id,
-                    company.prd_account == models.Account.id,
-                ),
-            ).filter(company.id.in_([str(c) for c in companies]))
-        )
+        return self._owned_by(models.AccountOwnerKinds.company, list(companies))
 
     def that_are_member_accounts(self) -> Self:
-        member = aliased(models.Member)
-        return self._with_modified_query(
-            lambda query: query.join(member, member.account == models.Account.id)
-        )
+        return self._of_type(models.AccountTypes.member)
 
     def that_are_product_accounts(self) -> Self:
-        company = aliased(models.Company)
+        return self._of_type(models.AccountTypes.prd)
+
+    def that_are_labour_accounts(self) -> Self:
+        return self._of_type(models.AccountTypes.a)
+
+    def _owned_by(self, kind: models.AccountOwnerKinds, owners: List[UUID]) -> Self:
+        owner = aliased(models.AccountOwner)
         return self._with_modified_query(
-            lambda query: query.join(company, company.prd_account == models.Account.id)
+            lambda query: query.join(owner, owner.account_id == models.Account.id)
+            .filter(owner.owner_kind == kind)
+            .filter(owner.owner_id.in_(owners))
         )
 
-    def that_are_labour_accounts(self) -> Self:
-        company = aliased(models.Company)
+    def _of_type(self, account_type: models.AccountTypes) -> Self:
+        owner = aliased(models.AccountOwner)
         return self._with_modified_query(
-            lambda query: query.join(company, company.a_account == models.Account.id)
+            lambda query: query.join(
+                owner, owner.account_id == models.Account.id
+            ).filter(owner.account_type == account_type)
         )
 
     def joined_with_owner(
         self,
     ) -> FlaskQueryResult[Tuple[records.Account, records.AccountOwner]]:
+        owner = aliased(models.AccountOwner)
         member = aliased(models.Member)
         company = aliased(models.Company)
         social_accounting = aliased(models.SocialAccounting)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT, models.Account)
+            .record(rows.MEMBER, member, optional=True)
+            .record(rows.COMPANY, company, optional=True)
+            .record(rows.SOCIAL_ACCOUNTING, social_accounting, optional=True)
+        )
         query = (
-            self.query.join(member, member.account == models.Account.id, isouter=True)
-            .join(
-                company,
-                or_(
-                    company.p_account == models.Account.id,
-                    company.r_account == models.Account.id,
-                    company.a_account == models.Account.id,
-                    company.prd_account == models.Account.id,
-                ),
-                isouter=True,
-            )
+            self.query.join(owner, owner.account_id == models.Account.id, isouter=True)
+            .join(member, member.id == owner.owner_id, isouter=True)
+            .join(company, company.id == owner.owner_id, isouter=True)
             .join(
                 social_accounting,
-                models.Account.id == social_accounting.account,
+                social_accounting.id == owner.owner_id,
                 isouter=True,
             )
-            .with_entities(models.Account, member, company, social_accounting)
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             query=query,
-            mapper=self.map_account_and_owner,
+            mapper=lambda values: self.map_account_and_owner(row(values)),
             db=self.db,
         )
 
     def joined_with_balance(self) -> FlaskQueryResult[Tuple[records.Account, Decimal]]:
-        transaction = aliased(models.Transaction)
-        query = (
-            self.query.join(
-                transaction,
-                or_(
-                    transaction.sending_account == models.Account.id,
-                    transaction.receiving_account == models.Account.id,
-                ),
-                isouter=True,
-            )
-            .group_by(models.Account)
-            .with_entities(
-                models.Account,
-                func.sum(
-                    case(
-                        (
-                            transaction.receiving_account == models.Account.id,
-                            transaction.amount_received,
-                        ),
-                        else_=Decimal(0),
-                    )
-                    - case(
-                        (
-                            transaction.sending_account == models.Account.id,
-                            transaction.amount_sent,
-                        ),
-                        else_=Decimal(0),
-                    )
-                ),
-            )
-        )
+        account_balance = aliased(models.AccountBalance)
+        query = self.query.join(
+            account_balance,
+            account_balance.account_id == models.Account.id,
+            isouter=True,
+        ).with_entities(models.Account.id, account_balance.balance)
         return FlaskQueryResult(
             query=query,
             db=self.db,
@@ -1004,57 +1184,45 @@ class AccountQueryResult(FlaskQueryResult[records.Account]):
         )
 
     @classmethod
-    def map_account_and_balance(cls, orm: Any) -> Tuple[records.Account, Decimal]:
-        return DatabaseGatewayImpl.account_from_orm(orm[0]), orm[1] or Decimal(0)
+    def map_account_and_balance(cls, row: Any) -> Tuple[records.Account, Decimal]:
+        return rows.ACCOUNT.build(row[:1]), row[1] or Decimal(0)
 
     @classmethod
     def map_account_and_owner(
-        cls, orm: Any
+        cls, row: Tuple[Any, ...]
     ) -> Tuple[records.Account, records.AccountOwner]:
-        owner: records.AccountOwner
-        account, member, company, social_accounting = orm
-        if member:
-            owner = DatabaseGatewayImpl.member_from_orm(member)
-        elif company:
-            owner = DatabaseGatewayImpl.company_from_orm(company)
-        else:
-            owner = AccountingRepository.social_accounting_from_orm(social_accounting)
+        account, member, company, social_accounting = row
         return (
-            DatabaseGatewayImpl.account_from_orm(account),
-            owner,
+            account,
+            DatabaseGatewayImpl.account_owner_from_records(
+                member, company, social_accounting
+            ),
         )
 
 
 class ProductiveConsumptionResult(FlaskQueryResult[records.ProductiveConsumption]):
     def where_consumer_is_company(self, company: UUID) -> Self:
         transaction = aliased(models.Transaction)
-        account = aliased(models.Account)
-        consuming_company = aliased(models.Company)
+        consumer = aliased(models.AccountOwner)
         return self._with_modified_query(
             lambda query: query.join(transaction)
-            .join(account, transaction.sending_account == account.id)
-            .join(
-                consuming_company,
-                or_(
-                    account.id == consuming_company.p_account,
-                    account.id == consuming_company.r_account,
-                ),
+            .join(consumer, transaction.sending_account == consumer.account_id)
+            .filter(
+                consumer.account_type.in_(
+                    [models.AccountTypes.p, models.AccountTypes.r]
+                )
             )
-            .filter(consuming_company.id == str(company))
+            .filter(consumer.owner_id == company)
         )
 
     def where_provider_is_company(self, company: UUID) -> Self:
         transaction = aliased(models.Transaction)
-        account = aliased(models.Account)
-        providing_company = aliased(models.Company)
+        provider = aliased(models.AccountOwner)
         return self._with_modified_query(
             lambda query: query.join(transaction)
-            .join(account, transaction.receiving_account == account.id)
-            .join(
-                providing_company,
-                account.id == providing_company.prd_account,
-            )
-            .filter(providing_company.id == str(company))
+            .join(provider, transaction.receiving_account == provider.account_id)
+            .filter(provider.account_type == models.AccountTypes.prd)
+            .filter(provider.owner_id == company)
         )
 
     def ordered_by_creation_date(self, *, ascending: bool = True) -> Self:
@@ -1074,49 +1242,41 @@ class ProductiveConsumptionResult(FlaskQueryResult[records.ProductiveConsumption
     ) -> FlaskQueryResult[
         Tuple[records.ProductiveConsumption, records.Transaction, records.Plan]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.ProductiveConsumption, records.Transaction, records.Plan]:
-            consumption_orm, transaction_orm, plan_orm = orm
-            return (
-                DatabaseGatewayImpl.productive_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-            )
-
         transaction = aliased(models.Transaction)
         plan = aliased(models.Plan)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRODUCTIVE_CONSUMPTION, models.ProductiveConsumption)
+            .record(rows.TRANSACTION, transaction)
+            .record(rows.PLAN, plan)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction,
                 models.ProductiveConsumption.transaction_id == transaction.id,
             )
             .join(plan, models.ProductiveConsumption.plan_id == plan.id)
-            .with_entities(models.ProductiveConsumption, transaction, plan),
+            .with_entities(*row.columns),
         )
 
     def joined_with_transaction(
         self,
     ) -> FlaskQueryResult[Tuple[records.ProductiveConsumption, records.Transaction]]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.ProductiveConsumption, records.Transaction]:
-            consumption_orm, transaction_orm = orm
-            return (
-                DatabaseGatewayImpl.productive_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-            )
-
         transaction = aliased(models.Transaction)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRODUCTIVE_CONSUMPTION, models.ProductiveConsumption)
+            .record(rows.TRANSACTION, transaction)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction,
                 models.ProductiveConsumption.transaction_id == transaction.id,
-            ).with_entities(models.ProductiveConsumption, transaction),
+            ).with_entities(*row.columns),
         )
 
     def joined_with_transaction_and_provider(
@@ -1124,31 +1284,49 @@ class ProductiveConsumptionResult(FlaskQueryResult[records.ProductiveConsumption
     ) -> FlaskQueryResult[
         Tuple[records.ProductiveConsumption, records.Transaction, records.Company]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.ProductiveConsumption, records.Transaction, records.Company]:
-            consumption_orm, transaction_orm, provider_orm = orm
-            return (
-                DatabaseGatewayImpl.productive_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-                DatabaseGatewayImpl.company_from_orm(provider_orm),
-            )
-
         transaction = aliased(models.Transaction)
         provider = aliased(models.Company)
         plan = aliased(models.Plan)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRODUCTIVE_CONSUMPTION, models.ProductiveConsumption)
+            .record(rows.TRANSACTION, transaction)
+            .record(rows.COMPANY, provider)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction,
                 models.ProductiveConsumption.transaction_id == transaction.id,
             )
             .join(plan, models.ProductiveConsumption.plan_id == plan.id)
             .join(provider, provider.id == plan.planner)
-            .with_entities(models.ProductiveConsumption, transaction, provider),
+            .with_entities(*row.columns),
         )
 
+    def grouped_by_provider(
+        self,
+    ) -> FlaskQueryResult[Tuple[records.Company, Decimal]]:
+        transaction = aliased(models.Transaction)
+        plan = aliased(models.Plan)
+        provider = aliased(models.Company)
+        volume = func.sum(transaction.amount_sent)
+        row = rows.JoinedRow().record(rows.COMPANY, provider).value(volume)
+        query = (
+            self.query.order_by(None)
+            .join(
+                transaction,
+                models.ProductiveConsumption.transaction_id == transaction.id,
+            )
+            .join(plan, models.ProductiveConsumption.plan_id == plan.id)
+            .join(provider, provider.id == plan.planner)
+            .group_by(provider.id)
+            .with_entities(*row.columns)
+            .order_by(volume.desc(), provider.id)
+        )
+        return FlaskQueryResult(query=query, db=self.db, mapper=row)
+
     def joined_with_transaction_and_plan_and_consumer(
         self,
     ) -> FlaskQueryResult[
@@ -1159,43 +1337,36 @@ class ProductiveConsumptionResult(FlaskQueryResult[records.ProductiveConsumption
             records.Company,
         ]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[
-            records.ProductiveConsumption,
-            records.Transaction,
-            records.Plan,
-            records.Company,
-        ]:
-            consumption_orm, transaction_orm, plan_orm, company_orm = orm
-            return (
-                DatabaseGatewayImpl.productive_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-                DatabaseGatewayImpl.company_from_orm(company_orm),
-            )
-
         transaction = aliased(models.Transaction)
-        account = aliased(models.Account)
+        consumer = aliased(models.AccountOwner)
         plan = aliased(models.Plan)
         company = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRODUCTIVE_CONSUMPTION, models.ProductiveConsumption)
+            .record(rows.TRANSACTION, transaction)
+            .record(rows.PLAN, plan)
+            .record(rows.COMPANY, company)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction,
                 models.ProductiveConsumption.transaction_id == transaction.id,
             )
-            .join(account, transaction.sending_account == account.id)
             .join(
-                company,
-                or_(
-                    company.p_account == account.id,
-                    company.r_account == account.id,
+                consumer,
+                and_(
+                    consumer.account_id == transaction.sending_account,
+                    consumer.account_type.in_(
+                        [models.AccountTypes.p, models.AccountTypes.r]
+                    ),
                 ),
             )
+            .join(company, company.id == consumer.owner_id)
             .join(plan, models.ProductiveConsumption.plan_id == plan.id)
-            .with_entities(models.ProductiveConsumption, transaction, plan, company),
+            .with_entities(*row.columns),
         )
 
 
@@ -1211,7 +1382,7 @@ class PrivateConsumptionResult(FlaskQueryResult[records.PrivateConsumption]):
                 consuming_member,
                 account.id == consuming_member.account,
             )
-            .filter(consuming_member.id == str(member))
+            .filter(consuming_member.id == member)
         )
 
     def ordered_by_creation_date(self, *, ascending: bool = True) -> Self:
@@ -1236,7 +1407,7 @@ class PrivateConsumptionResult(FlaskQueryResult[records.PrivateConsumption]):
                 providing_company,
                 account.id == providing_company.prd_account,
             )
-            .filter(providing_company.id == str(company))
+            .filter(providing_company.id == company)
         )
 
     def joined_with_transactions_and_plan(
@@ -1244,26 +1415,22 @@ class PrivateConsumptionResult(FlaskQueryResult[records.PrivateConsumption]):
     ) -> FlaskQueryResult[
         Tuple[records.PrivateConsumption, records.Transaction, records.Plan]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.PrivateConsumption, records.Transaction, records.Plan]:
-            consumption_orm, transaction_orm, plan_orm = orm
-            return (
-                DatabaseGatewayImpl.private_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-            )
-
         transaction = aliased(models.Transaction)
         plan = aliased(models.Plan)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRIVATE_CONSUMPTION, models.PrivateConsumption)
+            .record(rows.TRANSACTION, transaction)
+            .record(rows.PLAN, plan)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction, models.PrivateConsumption.transaction_id == transaction.id
             )
             .join(plan, models.PrivateConsumption.plan_id == plan.id)
-            .with_entities(models.PrivateConsumption, transaction, plan),
+            .with_entities(*row.columns),
         )
 
     def joined_with_transaction_and_plan_and_consumer(
@@ -1276,29 +1443,20 @@ class PrivateConsumptionResult(FlaskQueryResult[records.PrivateConsumption]):
             records.Member,
         ]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[
-            records.PrivateConsumption,
-            records.Transaction,
-            records.Plan,
-            records.Member,
-        ]:
-            consumption_orm, transaction_orm, plan_orm, member_orm = orm
-            return (
-                DatabaseGatewayImpl.private_consumption_from_orm(consumption_orm),
-                DatabaseGatewayImpl.transaction_from_orm(transaction_orm),
-                DatabaseGatewayImpl.plan_from_orm(plan_orm),
-                DatabaseGatewayImpl.member_from_orm(member_orm),
-            )
-
         transaction = aliased(models.Transaction)
         account = aliased(models.Account)
         plan = aliased(models.Plan)
         member = aliased(models.Member)
+        row = (
+            rows.JoinedRow()
+            .record(rows.PRIVATE_CONSUMPTION, models.PrivateConsumption)
+            .record(rows.TRANSACTION, transaction)
+            .record(rows.PLAN, plan)
+            .record(rows.MEMBER, member)
+        )
         return FlaskQueryResult(
             db=self.db,
-            mapper=mapper,
+            mapper=row,
             query=self.query.join(
                 transaction, models.PrivateConsumption.transaction_id == transaction.id
             )
@@ -1308,14 +1466,14 @@ class PrivateConsumptionResult(FlaskQueryResult[records.PrivateConsumption]):
                 account.id == member.account,
             )
             .join(plan, models.PrivateConsumption.plan_id == plan.id)
-            .with_entities(models.PrivateConsumption, transaction, plan, member),
+            .with_entities(*row.columns),
         )
 
 
 class CooperationResult(FlaskQueryResult[records.Cooperation]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.Cooperation.id == str(id_))
+            lambda query: query.filter(models.Cooperation.id == id_)
         )
 
     def with_name_ignoring_case(self, name: str) -> Self:
@@ -1335,21 +1493,21 @@ class CooperationResult(FlaskQueryResult[records.Cooperation]):
             .limit(1)
             .scalar_subquery()
         )
-        query = self.query.filter(most_recent_tenure_holder == str(company_id))
+        # Restricting the cooperations to those that the company has
+        # ever coordinated lets the tenures of the company be found by
+        # index before the most recent tenure of each is checked.
+        tenures_of_company = select(models.CoordinationTenure.cooperation).where(
+            models.CoordinationTenure.company == company_id
+        )
+        query = self.query.filter(
+            models.Cooperation.id.in_(tenures_of_company),
+            most_recent_tenure_holder == company_id,
+        )
         return self._with_modified_query(lambda _: query)
 
     def joined_with_current_coordinator(
         self,
     ) -> FlaskQueryResult[Tuple[records.Cooperation, records.Company]]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.Cooperation, records.Company]:
-            cooperation_orm, company_orm = orm
-            return (
-                DatabaseGatewayImpl.cooperation_from_orm(cooperation_orm),
-                DatabaseGatewayImpl.company_from_orm(company_orm),
-            )
-
         company = aliased(models.Company)
         most_recent_tenure_holder = (
             models.CoordinationTenure.query.filter(
@@ -1361,51 +1519,78 @@ class CooperationResult(FlaskQueryResult[records.Cooperation]):
             .scalar_subquery()
         )
 
+        row = (
+            rows.JoinedRow()
+            .record(rows.COOPERATION, models.Cooperation)
+            .record(rows.COMPANY, company)
+        )
         query = self.query.join(
             company, most_recent_tenure_holder == company.id
-        ).with_entities(models.Cooperation, company)
+        ).with_entities(*row.columns)
 
         return FlaskQueryResult(
             db=self.db,
             query=query,
-            mapper=mapper,
+            mapper=row,
+        )
+
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> FlaskQueryResult[Tuple[records.Cooperation, int]]:
+        plan_counts = (
+            select(
+                models.Plan.cooperation.label("cooperation"),
+                func.count().label("plans_count"),
+            )
+            .where(
+                models.Plan.cooperation.isnot(None),
+                models.Plan.activation_date <= timestamp,
+                models.Plan.expiration_date > timestamp,
+            )
+            .group_by(models.Plan.cooperation)
+            .subquery()
         )
+        row = (
+            rows.JoinedRow()
+            .record(rows.COOPERATION, models.Cooperation)
+            .value(func.coalesce(plan_counts.c.plans_count, 0))
+        )
+        query = self.query.outerjoin(
+            plan_counts, plan_counts.c.cooperation == models.Cooperation.id
+        ).with_entities(*row.columns)
+        return FlaskQueryResult(db=self.db, query=query, mapper=row)
 
 
 class CoordinationTenureResult(FlaskQueryResult[records.CoordinationTenure]):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CoordinationTenure.id == str(id_))
+            lambda query: query.filter(models.CoordinationTenure.id == id_)
         )
 
     def of_cooperation(self, cooperation_id: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
-                models.CoordinationTenure.cooperation == str(cooperation_id)
+                models.CoordinationTenure.cooperation == cooperation_id
             )
         )
 
     def joined_with_coordinator(
         self,
     ) -> FlaskQueryResult[Tuple[records.CoordinationTenure, records.Company]]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.CoordinationTenure, records.Company]:
-            tenure_orm, company_orm = orm
-            return (
-                DatabaseGatewayImpl.coordination_tenure_from_orm(tenure_orm),
-                DatabaseGatewayImpl.company_from_orm(company_orm),
-            )
-
         company = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.COORDINATION_TENURE, models.CoordinationTenure)
+            .record(rows.COMPANY, company)
+        )
         query = self.query.join(
             company, models.CoordinationTenure.company == company.id
-        ).with_entities(models.CoordinationTenure, company)
+        ).with_entities(*row.columns)
 
         return FlaskQueryResult(
             db=self.db,
             query=query,
-            mapper=mapper,
+            mapper=row,
         )
 
     def ordered_by_start_date(self, *, ascending: bool = True) -> Self:
@@ -1420,16 +1605,14 @@ class CoordinationTransferRequestResult(
 ):
     def with_id(self, id_: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(
-                models.CoordinationTransferRequest.id == str(id_)
-            )
+            lambda query: query.filter(models.CoordinationTransferRequest.id == id_)
         )
 
     def requested_by(self, coordination_tenure: UUID) -> Self:
         return self._with_modified_query(
             lambda query: query.filter(
                 models.CoordinationTransferRequest.requesting_coordination_tenure
-                == str(coordination_tenure)
+                == coordination_tenure
             )
         )
 
@@ -1438,17 +1621,15 @@ class CoordinationTransferRequestResult(
     ) -> FlaskQueryResult[
         Tuple[records.CoordinationTransferRequest, records.Cooperation]
     ]:
-        def mapper(
-            orm,
-        ) -> Tuple[records.CoordinationTransferRequest, records.Cooperation]:
-            request_orm, cooperation_orm = orm
-            return (
-                DatabaseGatewayImpl.coordination_transfer_request_from_orm(request_orm),
-                DatabaseGatewayImpl.cooperation_from_orm(cooperation_orm),
-            )
-
         cooperation = aliased(models.Cooperation)
         coordination_tenure = aliased(models.CoordinationTenure)
+        row = (
+            rows.JoinedRow()
+            .record(
+                rows.COORDINATION_TRANSFER_REQUEST, models.CoordinationTransferRequest
+            )
+            .record(rows.COOPERATION, cooperation)
+        )
         query = (
             self.query.join(
                 coordination_tenure,
@@ -1456,30 +1637,47 @@ class CoordinationTransferRequestResult(
                 == models.CoordinationTransferRequest.requesting_coordination_tenure,
             )
             .join(cooperation, cooperation.id == coordination_tenure.cooperation)
-            .with_entities(models.CoordinationTransferRequest, cooperation)
+            .with_entities(*row.columns)
         )
 
         return FlaskQueryResult(
             db=self.db,
             query=query,
-            mapper=mapper,
+            mapper=row,
         )
 
 
 class CompanyWorkInviteResult(FlaskQueryResult[records.CompanyWorkInvite]):
     def with_id(self, id: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.id == str(id))
+            lambda query: query.filter(models.CompanyWorkInvite.id == id)
         )
 
     def issued_by(self, company: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.company == str(company))
+            lambda query: query.filter(models.CompanyWorkInvite.company == company)
         )
 
     def addressing(self, member: UUID) -> Self:
         return self._with_modified_query(
-            lambda query: query.filter(models.CompanyWorkInvite.member == str(member))
+            lambda query: query.filter(models.CompanyWorkInvite.member == member)
+        )
+
+    def joined_with_company(
+        self,
+    ) -> FlaskQueryResult[Tuple[records.CompanyWorkInvite, records.Company]]:
+        company = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.COMPANY_WORK_INVITE, models.CompanyWorkInvite)
+            .record(rows.COMPANY, company)
+        )
+        return FlaskQueryResult(
+            db=self.db,
+            mapper=row,
+            query=self.query.join(
+                company, company.id == models.CompanyWorkInvite.company
+            ).with_entities(*row.columns),
         )
 
     def delete(self) -> None:
@@ -1498,7 +1696,7 @@ class EmailAddressResult(FlaskQueryResult[records.EmailAddress]):
         return self._with_modified_query(
             lambda query: query.join(user, user.email_address == models.Email.address)
             .join(members, members.user_id == user.id)
-            .filter(members.id == str(member))
+            .filter(members.id == member)
         )
 
     def that_belong_to_company(self, company: UUID) -> Self:
@@ -1507,7 +1705,7 @@ class EmailAddressResult(FlaskQueryResult[records.EmailAddress]):
         return self._with_modified_query(
             lambda query: query.join(user, user.email_address == models.Email.address)
             .join(companies, companies.user_id == user.id)
-            .filter(companies.id == str(company))
+            .filter(companies.id == company)
         )
 
     def update(self) -> EmailAddressUpdate:
@@ -1541,7 +1739,6 @@ class EmailAddressUpdate:
 
 class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
     def for_user_account_with_id(self, user_id: UUID) -> Self:
-        id_ = str(user_id)
         member = aliased(models.Member)
         company = aliased(models.Company)
         accountant = aliased(models.Accountant)
@@ -1551,7 +1748,13 @@ class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
             )
             .join(company, company.user_id == models.User.id, isouter=True)
             .join(accountant, accountant.user_id == models.User.id, isouter=True)
-            .filter(or_(member.id == id_, company.id == id_, accountant.id == id_))
+            .filter(
+                or_(
+                    member.id == user_id,
+                    company.id == user_id,
+                    accountant.id == user_id,
+                )
+            )
         )
 
     def with_email_address(self, address: str) -> Self:
@@ -1566,22 +1769,19 @@ class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
     ) -> FlaskQueryResult[
         Tuple[records.AccountCredentials, Optional[records.Accountant]]
     ]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[records.AccountCredentials, Optional[records.Accountant]]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.accountant_from_orm(orm[1]) if orm[1] else None,
-            )
-
         accountant = aliased(models.Accountant)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.ACCOUNTANT, accountant, optional=True)
+        )
         query = self.query.join(
             accountant, accountant.user_id == models.User.id, isouter=True
-        ).with_entities(models.User, accountant)
+        ).with_entities(*row.columns)
         return FlaskQueryResult(
             query=query,
             db=self.db,
-            mapper=mapper,
+            mapper=row,
         )
 
     def joined_with_email_address_and_accountant(
@@ -1593,51 +1793,41 @@ class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
             Optional[records.Accountant],
         ]
     ]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[
-            records.AccountCredentials,
-            records.EmailAddress,
-            Optional[records.Accountant],
-        ]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.email_address_from_orm(orm[1]),
-                DatabaseGatewayImpl.accountant_from_orm(orm[2]) if orm[2] else None,
-            )
-
         accountant = aliased(models.Accountant)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.EMAIL_ADDRESS, email)
+            .record(rows.ACCOUNTANT, accountant, optional=True)
+        )
         query = (
             self.query.join(email, email.address == models.User.email_address)
             .join(accountant, accountant.user_id == models.User.id, isouter=True)
-            .with_entities(models.User, email, accountant)
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             query=query,
             db=self.db,
-            mapper=mapper,
+            mapper=row,
         )
 
     def joined_with_member(
         self,
     ) -> FlaskQueryResult[Tuple[records.AccountCredentials, Optional[records.Member]]]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[records.AccountCredentials, Optional[records.Member]]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.member_from_orm(orm[1]) if orm[1] else None,
-            )
-
         member = aliased(models.Member)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.MEMBER, member, optional=True)
+        )
         query = self.query.join(
             member, member.user_id == models.User.id, isouter=True
-        ).with_entities(models.User, member)
+        ).with_entities(*row.columns)
         return FlaskQueryResult(
             query=query,
             db=self.db,
-            mapper=mapper,
+            mapper=row,
         )
 
     def joined_with_email_address_and_member(
@@ -1647,49 +1837,41 @@ class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
             records.AccountCredentials, records.EmailAddress, Optional[records.Member]
         ]
     ]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[
-            records.AccountCredentials, records.EmailAddress, Optional[records.Member]
-        ]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.email_address_from_orm(orm[1]),
-                DatabaseGatewayImpl.member_from_orm(orm[2]) if orm[2] else None,
-            )
-
         member = aliased(models.Member)
         email = aliased(models.Email)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.EMAIL_ADDRESS, email)
+            .record(rows.MEMBER, member, optional=True)
+        )
         query = (
             self.query.join(email, email.address == models.User.email_address)
             .join(member, member.user_id == models.User.id, isouter=True)
-            .with_entities(models.User, email, member)
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             query=query,
             db=self.db,
-            mapper=mapper,
+            mapper=row,
         )
 
     def joined_with_company(
         self,
     ) -> FlaskQueryResult[Tuple[records.AccountCredentials, Optional[records.Company]]]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[records.AccountCredentials, Optional[records.Company]]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.company_from_orm(orm[1]) if orm[1] else None,
-            )
-
         company = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.COMPANY, company, optional=True)
+        )
         query = self.query.join(
             company, company.user_id == models.User.id, isouter=True
-        ).with_entities(models.User, company)
+        ).with_entities(*row.columns)
         return FlaskQueryResult(
             query=query,
             db=self.db,
-            mapper=mapper,
+            mapper=row,
         )
 
     def joined_with_email_address_and_company(
@@ -1701,28 +1883,23 @@ class AccountCredentialsResult(FlaskQueryResult[records.AccountCredentials]):
             Optional[records.Company],
         ]
     ]:
-        def mapper(
-            orm: Any,
-        ) -> Tuple[
-            records.AccountCredentials, records.EmailAddress, Optional[records.Company]
-        ]:
-            return (
-                DatabaseGatewayImpl.account_credentials_from_orm(orm[0]),
-                DatabaseGatewayImpl.email_address_from_orm(orm[1]),
-                DatabaseGatewayImpl.company_from_orm(orm[2]) if orm[2] else None,
-            )
-
         email = aliased(models.Email)
         company = aliased(models.Company)
+        row = (
+            rows.JoinedRow()
+            .record(rows.ACCOUNT_CREDENTIALS, models.User)
+            .record(rows.EMAIL_ADDRESS, email)
+            .record(rows.COMPANY, company, optional=True)
+        )
         query = (
             self.query.join(email, email.address == models.User.email_address)
             .join(company, company.user_id == models.User.id, isouter=True)
-            .with_entities(models.User, email, company)
+            .with_entities(*row.columns)
         )
         return FlaskQueryResult(
             db=self.db,
             query=query,
-            mapper=mapper,
+            mapper=row,
         )
 
     def update(self) -> AccountCredentialsUpdate:
@@ -1777,8 +1954,8 @@ class AccountingRepository:
         cls, accounting_orm: SocialAccounting
     ) -> records.SocialAccounting:
         return records.SocialAccounting(
-            account=UUID(accounting_orm.account),
-            id=UUID(accounting_orm.id),
+            account=accounting_orm.account,
+            id=accounting_orm.id,
         )
 
     def get_or_create_social_accounting(self) -> records.SocialAccounting:
@@ -1790,40 +1967,52 @@ class AccountingRepository:
         social_accounting = models.SocialAccounting.query.first()
         if not social_accounting:
             social_accounting = SocialAccounting(
-                id=str(uuid4()),
+                id=uuid4(),
             )
             account = self.database_gateway.create_account()
-            social_accounting.account = str(account.id)
+            social_accounting.account = account.id
             self.db.session.add(social_accounting)
+            self.db.session.add(
+                models.AccountOwner(
+                    account_id=social_accounting.account,
+                    owner_kind=models.AccountOwnerKinds.social_accounting,
+                    owner_id=social_accounting.id,
+                    account_type=models.AccountTypes.accounting,
+                )
+            )
         return social_accounting
 
     def get_by_id(self, id: UUID) -> Optional[records.SocialAccounting]:
-        accounting_orm = SocialAccounting.query.filter_by(id=str(id)).first()
+        accounting_orm = SocialAccounting.query.filter_by(id=id).first()
         if accounting_orm is None:
             return None
         return self.social_accounting_from_orm(accounting_orm)
 
 
+@request_scoped
 @dataclass
 class DatabaseGatewayImpl:
     db: SQLAlchemy
+    identity_map: IdentityMap
 
     def create_productive_consumption(
         self, transaction: UUID, amount: int, plan: UUID
     ) -> records.ProductiveConsumption:
         orm = models.ProductiveConsumption(
-            plan_id=str(plan),
-            transaction_id=str(transaction),
+            plan_id=plan,
+            transaction_id=transaction,
             amount=amount,
         )
         self.db.session.add(orm)
         self.db.session.flush()
+        self._increase_provided_amount(plan, amount)
         return self.productive_consumption_from_orm(orm)
 
     def get_productive_consumptions(self) -> ProductiveConsumptionResult:
         return ProductiveConsumptionResult(
             query=models.ProductiveConsumption.query,
-            mapper=self.productive_consumption_from_orm,
+            mapper=rows.PRODUCTIVE_CONSUMPTION.build,
+            columns=rows.PRODUCTIVE_CONSUMPTION.columns(models.ProductiveConsumption),
             db=self.db,
         )
 
@@ -1833,8 +2022,8 @@ class DatabaseGatewayImpl:
     ) -> records.ProductiveConsumption:
         return records.ProductiveConsumption(
             id=orm.id,
-            plan_id=UUID(orm.plan_id),
-            transaction_id=UUID(orm.transaction_id),
+            plan_id=orm.plan_id,
+            transaction_id=orm.transaction_id,
             amount=orm.amount,
         )
 
@@ -1842,20 +2031,30 @@ class DatabaseGatewayImpl:
         self, transaction: UUID, amount: int, plan: UUID
     ) -> records.PrivateConsumption:
         orm = models.PrivateConsumption(
-            id=str(uuid4()),
+            id=uuid4(),
             amount=amount,
-            plan_id=str(plan),
-            transaction_id=str(transaction),
+            plan_id=plan,
+            transaction_id=transaction,
         )
         self.db.session.add(orm)
         self.db.session.flush()
+        self._increase_provided_amount(plan, amount)
         return self.private_consumption_from_orm(orm)
 
     def get_private_consumptions(self) -> PrivateConsumptionResult:
         return PrivateConsumptionResult(
             db=self.db,
             query=models.PrivateConsumption.query,
-            mapper=self.private_consumption_from_orm,
+            mapper=rows.PRIVATE_CONSUMPTION.build,
+            columns=rows.PRIVATE_CONSUMPTION.columns(models.PrivateConsumption),
+        )
+
+    def _increase_provided_amount(self, plan: UUID, amount: int) -> None:
+        self.db.session.execute(
+            update(models.Plan)
+            .where(models.Plan.id == plan)
+            .values(provided_amount=models.Plan.provided_amount + amount)
+            .execution_options(synchronize_session=False)
         )
 
     @classmethod
@@ -1863,17 +2062,19 @@ class DatabaseGatewayImpl:
         self, orm: models.PrivateConsumption
     ) -> records.PrivateConsumption:
         return records.PrivateConsumption(
-            id=UUID(orm.id),
+            id=orm.id,
             amount=orm.amount,
-            plan_id=UUID(orm.plan_id),
-            transaction_id=UUID(orm.transaction_id),
+            plan_id=orm.plan_id,
+            transaction_id=orm.transaction_id,
         )
 
     def get_plans(self) -> PlanQueryResult:
         return PlanQueryResult(
             query=models.Plan.query,
-            mapper=self.plan_from_orm,
+            mapper=rows.PLAN.build,
+            columns=rows.PLAN.columns(models.Plan),
             db=self.db,
+            identity_map=self.identity_map,
         )
 
     def create_plan(
@@ -1889,9 +2090,9 @@ class DatabaseGatewayImpl:
         is_public_service: bool,
     ) -> records.Plan:
         plan = models.Plan(
-            id=str(uuid4()),
+            id=uuid4(),
             plan_creation_date=creation_timestamp,
-            planner=str(planner),
+            planner=planner,
             costs_p=production_costs.means_cost,
             costs_r=production_costs.resource_cost,
             costs_a=production_costs.labour_cost,
@@ -1915,9 +2116,9 @@ class DatabaseGatewayImpl:
             means_cost=plan.costs_p,
         )
         return records.Plan(
-            id=UUID(plan.id),
+            id=plan.id,
             plan_creation_date=plan.plan_creation_date,
-            planner=UUID(plan.planner),
+            planner=plan.planner,
             production_costs=production_costs,
             prd_name=plan.prd_name,
             prd_unit=plan.prd_unit,
@@ -1927,10 +2128,8 @@ class DatabaseGatewayImpl:
             is_public_service=plan.is_public_service,
             approval_date=plan.review.approval_date,
             activation_date=plan.activation_date,
-            requested_cooperation=UUID(plan.requested_cooperation)
-            if plan.requested_cooperation
-            else None,
-            cooperation=UUID(plan.cooperation) if plan.cooperation else None,
+            requested_cooperation=plan.requested_cooperation,
+            cooperation=plan.cooperation,
             is_available=plan.is_available,
             hidden_by_user=plan.hidden_by_user,
         )
@@ -1948,11 +2147,13 @@ class DatabaseGatewayImpl:
         )
         self.db.session.add(cooperation)
         self.db.session.flush()
+        EconomicAggregateStore(db=self.db).register_cooperation()
         return self.cooperation_from_orm(cooperation)
 
     def get_cooperations(self) -> CooperationResult:
         return CooperationResult(
-            mapper=self.cooperation_from_orm,
+            mapper=rows.COOPERATION.build,
+            columns=rows.COOPERATION.columns(models.Cooperation),
             query=models.Cooperation.query,
             db=self.db,
         )
@@ -1960,7 +2161,7 @@ class DatabaseGatewayImpl:
     @classmethod
     def cooperation_from_orm(self, orm: models.Cooperation) -> records.Cooperation:
         return records.Cooperation(
-            id=UUID(orm.id),
+            id=orm.id,
             creation_date=orm.creation_date,
             name=orm.name,
             definition=orm.definition,
@@ -1970,7 +2171,7 @@ class DatabaseGatewayImpl:
         self, company: UUID, cooperation: UUID, start_date: datetime
     ) -> records.CoordinationTenure:
         coordination = models.CoordinationTenure(
-            company=str(company), cooperation=str(cooperation), start_date=start_date
+            company=company, cooperation=cooperation, start_date=start_date
         )
         self.db.session.add(coordination)
         self.db.session.flush()
@@ -1978,7 +2179,8 @@ class DatabaseGatewayImpl:
 
     def get_coordination_tenures(self) -> CoordinationTenureResult:
         return CoordinationTenureResult(
-            mapper=self.coordination_tenure_from_orm,
+            mapper=rows.COORDINATION_TENURE.build,
+            columns=rows.COORDINATION_TENURE.columns(models.CoordinationTenure),
             query=models.CoordinationTenure.query,
             db=self.db,
         )
@@ -1988,9 +2190,9 @@ class DatabaseGatewayImpl:
         self, orm: models.CoordinationTenure
     ) -> records.CoordinationTenure:
         return records.CoordinationTenure(
-            id=UUID(orm.id),
-            company=UUID(orm.company),
-            cooperation=UUID(orm.cooperation),
+            id=orm.id,
+            company=orm.company,
+            cooperation=orm.cooperation,
             start_date=orm.start_date,
         )
 
@@ -2001,9 +2203,9 @@ class DatabaseGatewayImpl:
         request_date: datetime,
     ) -> records.CoordinationTransferRequest:
         orm = models.CoordinationTransferRequest(
-            id=str(uuid4()),
-            requesting_coordination_tenure=str(requesting_coordination_tenure),
-            candidate=str(candidate),
+            id=uuid4(),
+            requesting_coordination_tenure=requesting_coordination_tenure,
+            candidate=candidate,
             request_date=request_date,
         )
         self.db.session.add(orm)
@@ -2012,7 +2214,10 @@ class DatabaseGatewayImpl:
 
     def get_coordination_transfer_requests(self) -> CoordinationTransferRequestResult:
         return CoordinationTransferRequestResult(
-            mapper=self.coordination_transfer_request_from_orm,
+            mapper=rows.COORDINATION_TRANSFER_REQUEST.build,
+            columns=rows.COORDINATION_TRANSFER_REQUEST.columns(
+                models.CoordinationTransferRequest
+            ),
             query=models.CoordinationTransferRequest.query,
             db=self.db,
         )
@@ -2022,21 +2227,19 @@ class DatabaseGatewayImpl:
         cls, coordination_transfer_request: models.CoordinationTransferRequest
     ) -> records.CoordinationTransferRequest:
         return records.CoordinationTransferRequest(
-            id=UUID(coordination_transfer_request.id),
-            requesting_coordination_tenure=UUID(
-                coordination_transfer_request.requesting_coordination_tenure
-            ),
-            candidate=UUID(coordination_transfer_request.candidate),
+            id=coordination_transfer_request.id,
+            requesting_coordination_tenure=coordination_transfer_request.requesting_coordination_tenure,
+            candidate=coordination_transfer_request.candidate,
             request_date=coordination_transfer_request.request_date,
         )
 
     @classmethod
     def transaction_from_orm(cls, transaction: Transaction) -> records.Transaction:
         return records.Transaction(
-            id=UUID(transaction.id),
+            id=transaction.id,
             date=transaction.date,
-            sending_account=UUID(transaction.sending_account),
-            receiving_account=UUID(transaction.receiving_account),
+            sending_account=transaction.sending_account,
+            receiving_account=transaction.receiving_account,
             amount_sent=Decimal(transaction.amount_sent),
             amount_received=Decimal(transaction.amount_received),
             purpose=transaction.purpose,
@@ -2052,22 +2255,56 @@ class DatabaseGatewayImpl:
         purpose: str,
     ) -> records.Transaction:
         transaction = Transaction(
-            id=str(uuid4()),
+            id=uuid4(),
             date=date,
-            sending_account=str(sending_account),
-            receiving_account=str(receiving_account),
+            sending_account=sending_account,
+            receiving_account=receiving_account,
             amount_sent=amount_sent,
             amount_received=amount_received,
             purpose=purpose,
         )
         self.db.session.add(transaction)
         self.db.session.flush()
+        self.db.session.execute(
+            update(models.AccountBalance)
+            .where(
+                models.AccountBalance.account_id.in_(
+                    [transaction.sending_account, transaction.receiving_account]
+                )
+            )
+            .values(
+                balance=models.AccountBalance.balance
+                + case(
+                    (
+                        models.AccountBalance.account_id
+                        == transaction.receiving_account,
+                        amount_received,
+                    ),
+                    else_=Decimal(0),
+                )
+                - case(
+                    (
+                        models.AccountBalance.account_id == transaction.sending_account,
+                        amount_sent,
+                    ),
+                    else_=Decimal(0),
+                )
+            )
+            .execution_options(synchronize_session=False)
+        )
+        EconomicAggregateStore(db=self.db).record_transaction(
+            sending_account=transaction.sending_account,
+            receiving_account=transaction.receiving_account,
+            amount_sent=amount_sent,
+            amount_received=amount_received,
+        )
         return self.transaction_from_orm(transaction)
 
     def get_transactions(self) -> TransactionQueryResult:
         return TransactionQueryResult(
             query=models.Transaction.query,
-            mapper=self.transaction_from_orm,
+            mapper=rows.TRANSACTION.build,
+            columns=rows.TRANSACTION.columns(models.Transaction),
             db=self.db,
         )
 
@@ -2075,16 +2312,17 @@ class DatabaseGatewayImpl:
         return CompanyWorkInviteResult(
             query=models.CompanyWorkInvite.query,
             db=self.db,
-            mapper=self.company_work_invite_from_orm,
+            mapper=rows.COMPANY_WORK_INVITE.build,
+            columns=rows.COMPANY_WORK_INVITE.columns(models.CompanyWorkInvite),
         )
 
     def create_company_work_invite(
         self, company: UUID, member: UUID
     ) -> records.CompanyWorkInvite:
         orm = models.CompanyWorkInvite(
-            id=str(uuid4()),
-            company=str(company),
-            member=str(member),
+            id=uuid4(),
+            company=company,
+            member=member,
         )
         self.db.session.add(orm)
         return self.company_work_invite_from_orm(orm)
@@ -2094,17 +2332,17 @@ class DatabaseGatewayImpl:
         cls, orm: models.CompanyWorkInvite
     ) -> records.CompanyWorkInvite:
         return records.CompanyWorkInvite(
-            id=UUID(orm.id),
-            member=UUID(orm.member),
-            company=UUID(orm.company),
+            id=orm.id,
+            member=orm.member,
+            company=orm.company,
         )
 
     @classmethod
     def member_from_orm(cls, orm_object: Member) -> records.Member:
         return records.Member(
-            id=UUID(orm_object.id),
+            id=orm_object.id,
             name=orm_object.name,
-            account=UUID(orm_object.account),
+            account=orm_object.account,
             registered_on=orm_object.registered_on,
         )
 
@@ -2117,31 +2355,61 @@ class DatabaseGatewayImpl:
         registered_on: datetime,
     ) -> records.Member:
         orm_member = Member(
-            id=str(uuid4()),
-            user_id=str(account_credentials),
+            id=uuid4(),
+            user_id=account_credentials,
             name=name,
-            account=str(account.id),
+            account=account.id,
             registered_on=registered_on,
         )
         self.db.session.add(orm_member)
+        self.db.session.add(
+            models.AccountOwner(
+                account_id=orm_member.account,
+                owner_kind=models.AccountOwnerKinds.member,
+                owner_id=orm_member.id,
+                account_type=models.AccountTypes.member,
+            )
+        )
+        EconomicAggregateStore(db=self.db).register_member(account=account.id)
         return self.member_from_orm(orm_member)
 
     def get_members(self) -> MemberQueryResult:
         return MemberQueryResult(
-            mapper=self.member_from_orm,
+            mapper=rows.MEMBER.build,
+            columns=rows.MEMBER.columns(models.Member),
             query=Member.query,
             db=self.db,
         )
 
+    @classmethod
+    def account_owner_from_records(
+        cls,
+        member: Optional[records.Member],
+        company: Optional[records.Company],
+        social_accounting: Optional[records.SocialAccounting],
+    ) -> records.AccountOwner:
+        if member:
+            return member
+        elif company:
+            return company
+        assert social_accounting
+        return social_accounting
+
+    @classmethod
+    def account_type_from_orm(
+        cls, account_type: models.AccountTypes
+    ) -> records.AccountTypes:
+        return records.AccountTypes(account_type.value)
+
     @classmethod
     def company_from_orm(cls, company_orm: Company) -> records.Company:
         return records.Company(
-            id=UUID(company_orm.id),
+            id=company_orm.id,
             name=company_orm.name,
-            means_account=UUID(company_orm.p_account),
-            raw_material_account=UUID(company_orm.r_account),
-            work_account=UUID(company_orm.a_account),
-            product_account=UUID(company_orm.prd_account),
+            means_account=company_orm.p_account,
+            raw_material_account=company_orm.r_account,
+            work_account=company_orm.a_account,
+            product_account=company_orm.prd_account,
             registered_on=company_orm.registered_on,
         )
 
@@ -2156,32 +2424,51 @@ class DatabaseGatewayImpl:
         registered_on: datetime,
     ) -> records.Company:
         company = models.Company(
-            id=str(uuid4()),
+            id=uuid4(),
             name=name,
             registered_on=registered_on,
-            user_id=str(account_credentials),
-            p_account=str(means_account.id),
-            r_account=str(resource_account.id),
-            a_account=str(labour_account.id),
-            prd_account=str(products_account.id),
+            user_id=account_credentials,
+            p_account=means_account.id,
+            r_account=resource_account.id,
+            a_account=labour_account.id,
+            prd_account=products_account.id,
         )
         self.db.session.add(company)
+        self.db.session.add_all(
+            models.AccountOwner(
+                account_id=account,
+                owner_kind=models.AccountOwnerKinds.company,
+                owner_id=company.id,
+                account_type=account_type,
+            )
+            for account, account_type in [
+                (company.p_account, models.AccountTypes.p),
+                (company.r_account, models.AccountTypes.r),
+                (company.a_account, models.AccountTypes.a),
+                (company.prd_account, models.AccountTypes.prd),
+            ]
+        )
+        EconomicAggregateStore(db=self.db).register_company(
+            labour_account=labour_account.id, products_account=products_account.id
+        )
         return self.company_from_orm(company)
 
     def get_companies(self) -> CompanyQueryResult:
         return CompanyQueryResult(
             query=Company.query,
-            mapper=self.company_from_orm,
+            mapper=rows.COMPANY.build,
+            columns=rows.COMPANY.columns(models.Company),
             db=self.db,
+            identity_map=self.identity_map,
         )
 
     def create_accountant(
         self, account_credentials: UUID, name: str
     ) -> records.Accountant:
         accountant = models.Accountant(
-            id=str(uuid4()),
+            id=uuid4(),
             name=name,
-            user_id=str(account_credentials),
+            user_id=account_credentials,
         )
         self.db.session.add(accountant)
         return self.accountant_from_orm(accountant)
@@ -2189,7 +2476,8 @@ class DatabaseGatewayImpl:
     def get_accountants(self) -> AccountantResult:
         return AccountantResult(
             query=models.Accountant.query,
-            mapper=self.accountant_from_orm,
+            mapper=rows.ACCOUNTANT.build,
+            columns=rows.ACCOUNTANT.columns(models.Accountant),
             db=self.db,
         )
 
@@ -2197,7 +2485,7 @@ class DatabaseGatewayImpl:
     def accountant_from_orm(self, orm: models.Accountant) -> records.Accountant:
         return records.Accountant(
             name=orm.name,
-            id=UUID(orm.id),
+            id=orm.id,
         )
 
     @classmethod
@@ -2210,7 +2498,8 @@ class DatabaseGatewayImpl:
     def get_email_addresses(self) -> EmailAddressResult:
         return EmailAddressResult(
             query=models.Email.query,
-            mapper=self.email_address_from_orm,
+            mapper=rows.EMAIL_ADDRESS.build,
+            columns=rows.EMAIL_ADDRESS.columns(models.Email),
             db=self.db,
         )
 
@@ -2241,9 +2530,9 @@ class DatabaseGatewayImpl:
         creation_timestamp: datetime,
     ) -> records.PlanDraft:
         orm = PlanDraft(
-            id=str(uuid4()),
+            id=uuid4(),
             plan_creation_date=creation_timestamp,
-            planner=str(planner),
+            planner=planner,
             costs_p=costs.means_cost,
             costs_r=costs.resource_cost,
             costs_a=costs.labour_cost,
@@ -2261,7 +2550,8 @@ class DatabaseGatewayImpl:
         return PlanDraftResult(
             db=self.db,
             query=models.PlanDraft.query,
-            mapper=self.plan_draft_from_orm,
+            mapper=rows.PLAN_DRAFT.build,
+            columns=rows.PLAN_DRAFT.columns(models.PlanDraft),
         )
 
     @classmethod
@@ -2269,7 +2559,7 @@ class DatabaseGatewayImpl:
         return records.PlanDraft(
             id=orm.id,
             creation_date=orm.plan_creation_date,
-            planner=UUID(orm.planner),
+            planner=orm.planner,
             production_costs=records.ProductionCosts(
                 labour_cost=orm.costs_a,
                 resource_cost=orm.costs_r,
@@ -2286,18 +2576,22 @@ class DatabaseGatewayImpl:
     @classmethod
     def account_from_orm(cls, account_orm: Account) -> records.Account:
         return records.Account(
-            id=UUID(account_orm.id),
+            id=account_orm.id,
         )
 
     def create_account(self) -> records.Account:
-        account = Account(id=str(uuid4()))
+        account = Account(id=uuid4())
         self.db.session.add(account)
+        self.db.session.add(
+            models.AccountBalance(account_id=account.id, balance=Decimal(0))
+        )
         return self.account_from_orm(account)
 
     def get_accounts(self) -> AccountQueryResult:
         return AccountQueryResult(
             db=self.db,
-            mapper=self.account_from_orm,
+            mapper=rows.ACCOUNT.build,
+            columns=rows.ACCOUNT.columns(models.Account),
             query=models.Account.query,
         )
 
@@ -2305,7 +2599,7 @@ class DatabaseGatewayImpl:
         self, email_address: str, password_hash: str
     ) -> records.AccountCredentials:
         orm = models.User(
-            id=str(uuid4()),
+            id=uuid4(),
             password=password_hash,
             email_address=email_address,
         )
@@ -2317,13 +2611,94 @@ class DatabaseGatewayImpl:
         return AccountCredentialsResult(
             db=self.db,
             query=models.User.query,
-            mapper=self.account_credentials_from_orm,
+            mapper=rows.ACCOUNT_CREDENTIALS.build,
+            columns=rows.ACCOUNT_CREDENTIALS.columns(models.User),
         )
 
+    def get_economic_statistics(
+        self, timestamp: datetime
+    ) -> records.EconomicStatistics:
+        return EconomicAggregateStore(db=self.db).get_statistics(timestamp)
+
+    def get_active_plan_costs(self, timestamp: datetime) -> records.ActivePlanCosts:
+        return EconomicAggregateStore(db=self.db).get_active_plan_costs(timestamp)
+
+    def get_payout_factor_snapshots(
+        self, first_day: date, last_day: date
+    ) -> List[records.PayoutFactorSnapshot]:
+        return PayoutFactorSnapshotStore(db=self.db).get_snapshots(first_day, last_day)
+
+    def get_account_balance_history(
+        self, account: UUID, max_points: Optional[int] = None
+    ) -> List[Tuple[datetime, Decimal]]:
+        transaction = models.Transaction
+        balance_change = case(
+            (transaction.receiving_account == account, transaction.amount_received),
+            else_=0,
+        ) - case(
+            (transaction.sending_account == account, transaction.amount_sent),
+            else_=0,
+        )
+        series = (
+            select(
+                transaction.date.label("date"),
+                transaction.id.label("id"),
+                func.sum(balance_change)
+                .over(order_by=(transaction.date, transaction.id), rows=(None, 0))
+                .label("balance"),
+            )
+            .where(
+                or_(
+                    transaction.sending_account == account,
+                    transaction.receiving_account == account,
+                )
+            )
+            .subquery()
+        )
+        if max_points is None:
+            query = select(series.c.date, series.c.balance).order_by(
+                series.c.date, series.c.id
+            )
+        else:
+            epoch = func.extract("epoch", series.c.date)
+            first_epoch = func.min(epoch).over()
+            time_span = func.nullif(func.max(epoch).over() - first_epoch, 0)
+            bucket = func.least(
+                func.coalesce(
+                    func.floor((epoch - first_epoch) * max_points / time_span), 0
+                ),
+                max_points - 1,
+            )
+            bucketed = select(
+                series.c.date,
+                series.c.id,
+                series.c.balance,
+                bucket.label("bucket"),
+            ).subquery()
+            last_in_bucket = select(
+                bucketed.c.date,
+                bucketed.c.id,
+                bucketed.c.balance,
+                func.row_number()
+                .over(
+                    partition_by=bucketed.c.bucket,
+                    order_by=(bucketed.c.date.desc(), bucketed.c.id.desc()),
+                )
+                .label("position"),
+            ).subquery()
+            query = (
+                select(last_in_bucket.c.date, last_in_bucket.c.balance)
+                .where(last_in_bucket.c.position == 1)
+                .order_by(last_in_bucket.c.date, last_in_bucket.c.id)
+            )
+        return [
+            (date, Decimal(balance)) for date, balance in self.db.session.execute(query)
+        ]
+
     @classmethod
     def account_credentials_from_orm(self, orm: Any) -> records.AccountCredentials:
         return records.AccountCredentials(
-            id=UUID(orm.id),
+            id=orm.id,
             email_address=orm.email_address,
             password_hash=orm.password,
         )
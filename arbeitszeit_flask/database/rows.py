@@ -0,0 +1,460 @@
+"""Build records from rows of plain columns.
+
+Loading ORM instances only to copy them into records afterwards is
+costly for large result sets because every instance is registered in
+the session. The row mappers in this module select only the columns
+that a record is built from and build the record directly from the
+resulting row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable, Generic, List, Sequence, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+
+from arbeitszeit import records
+from arbeitszeit_flask.database import models
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RowMapper(Generic[T]):
+    """The columns of a model (or of an alias of it) that a record is
+    built from and the function that builds the record from a row of
+    these columns.
+    """
+
+    columns: Callable[[Any], List[Any]]
+    build: Callable[[Sequence[Any]], T]
+
+
+class JoinedRow:
+    """Select the columns of several records and additional values in
+    a single row and split such rows up into tuples again.
+    """
+
+    def __init__(self) -> None:
+        self.columns: List[Any] = []
+        self._parts: List[Callable[[Sequence[Any]], Any]] = []
+
+    def record(
+        self, mapper: RowMapper[Any], entity: Any, *, optional: bool = False
+    ) -> JoinedRow:
+        """Add the columns of a record. Optional records, e.g. from an
+        outer join, are None if their first column is NULL.
+        """
+        start = len(self.columns)
+        self.columns.extend(mapper.columns(entity))
+        end = len(self.columns)
+        if optional:
+            self._parts.append(
+                lambda row: None if row[start] is None else mapper.build(row[start:end])
+            )
+        else:
+            self._parts.append(lambda row: mapper.build(row[start:end]))
+        return self
+
+    def value(self, column: Any) -> JoinedRow:
+        index = len(self.columns)
+        self.columns.append(column)
+        self._parts.append(lambda row: row[index])
+        return self
+
+    def __call__(self, row: Sequence[Any]) -> Any:
+        # The tuple is typed as Any so that a JoinedRow can be used as
+        # the mapper of results with any tuple type.
+        return tuple(part(row) for part in self._parts)
+
+
+def _plan_columns(plan: Any) -> List[Any]:
+    review = aliased(models.PlanReview)
+    return [
+        plan.id,
+        plan.plan_creation_date,
+        plan.planner,
+        plan.costs_a,
+        plan.costs_r,
+        plan.costs_p,
+        plan.prd_name,
+        plan.prd_unit,
+        plan.prd_amount,
+        plan.description,
+        plan.timeframe,
+        plan.is_public_service,
+        # This subquery runs once per plan row and relies on the index
+        # on plan_review.plan_id.
+        select(review.approval_date)
+        .where(review.plan_id == plan.id)
+        .correlate_except(review)
+        .scalar_subquery(),
+        plan.activation_date,
+        plan.requested_cooperation,
+        plan.cooperation,
+        plan.is_available,
+        plan.hidden_by_user,
+    ]
+
+
+def _plan_from_row(row: Sequence[Any]) -> records.Plan:
+    (
+        id_,
+        creation_date,
+        planner,
+        labour_cost,
+        resource_cost,
+        means_cost,
+        name,
+        unit,
+        amount,
+        description,
+        timeframe,
+        is_public_service,
+        approval_date,
+        activation_date,
+        requested_cooperation,
+        cooperation,
+        is_available,
+        hidden_by_user,
+    ) = row
+    return records.Plan(
+        id=id_,
+        plan_creation_date=creation_date,
+        planner=planner,
+        production_costs=records.ProductionCosts(
+            labour_cost=labour_cost,
+            resource_cost=resource_cost,
+            means_cost=means_cost,
+        ),
+        prd_name=name,
+        prd_unit=unit,
+        prd_amount=amount,
+        description=description,
+        timeframe=int(timeframe),
+        is_public_service=is_public_service,
+        approval_date=approval_date,
+        activation_date=activation_date,
+        requested_cooperation=requested_cooperation,
+        cooperation=cooperation,
+        is_available=is_available,
+        hidden_by_user=hidden_by_user,
+    )
+
+
+PLAN = RowMapper(columns=_plan_columns, build=_plan_from_row)
+
+
+def _plan_draft_columns(draft: Any) -> List[Any]:
+    return [
+        draft.id,
+        draft.plan_creation_date,
+        draft.planner,
+        draft.costs_a,
+        draft.costs_r,
+        draft.costs_p,
+        draft.prd_name,
+        draft.prd_unit,
+        draft.prd_amount,
+        draft.description,
+        draft.timeframe,
+        draft.is_public_service,
+    ]
+
+
+def _plan_draft_from_row(row: Sequence[Any]) -> records.PlanDraft:
+    (
+        id_,
+        creation_date,
+        planner,
+        labour_cost,
+        resource_cost,
+        means_cost,
+        name,
+        unit,
+        amount,
+        description,
+        timeframe,
+        is_public_service,
+    ) = row
+    return records.PlanDraft(
+        id=id_,
+        creation_date=creation_date,
+        planner=planner,
+        production_costs=records.ProductionCosts(
+            labour_cost=labour_cost,
+            resource_cost=resource_cost,
+            means_cost=means_cost,
+        ),
+        product_name=name,
+        unit_of_distribution=unit,
+        amount_produced=amount,
+        description=description,
+        timeframe=int(timeframe),
+        is_public_service=is_public_service,
+    )
+
+
+PLAN_DRAFT = RowMapper(columns=_plan_draft_columns, build=_plan_draft_from_row)
+
+
+def _company_from_row(row: Sequence[Any]) -> records.Company:
+    id_, name, means, raw_material, work, product, registered_on = row
+    return records.Company(
+        id=id_,
+        name=name,
+        means_account=means,
+        raw_material_account=raw_material,
+        work_account=work,
+        product_account=product,
+        registered_on=registered_on,
+    )
+
+
+COMPANY = RowMapper(
+    columns=lambda company: [
+        company.id,
+        company.name,
+        company.p_account,
+        company.r_account,
+        company.a_account,
+        company.prd_account,
+        company.registered_on,
+    ],
+    build=_company_from_row,
+)
+
+
+def _member_from_row(row: Sequence[Any]) -> records.Member:
+    id_, name, account, registered_on = row
+    return records.Member(
+        id=id_,
+        name=name,
+        account=account,
+        registered_on=registered_on,
+    )
+
+
+MEMBER = RowMapper(
+    columns=lambda member: [
+        member.id,
+        member.name,
+        member.account,
+        member.registered_on,
+    ],
+    build=_member_from_row,
+)
+
+
+def _accountant_from_row(row: Sequence[Any]) -> records.Accountant:
+    id_, name = row
+    return records.Accountant(name=name, id=id_)
+
+
+ACCOUNTANT = RowMapper(
+    columns=lambda accountant: [accountant.id, accountant.name],
+    build=_accountant_from_row,
+)
+
+
+def _social_accounting_from_row(row: Sequence[Any]) -> records.SocialAccounting:
+    id_, account = row
+    return records.SocialAccounting(account=account, id=id_)
+
+
+SOCIAL_ACCOUNTING = RowMapper(
+    columns=lambda social_accounting: [
+        social_accounting.id,
+        social_accounting.account,
+    ],
+    build=_social_accounting_from_row,
+)
+
+
+ACCOUNT = RowMapper(
+    columns=lambda account: [account.id],
+    build=lambda row: records.Account(id=row[0]),
+)
+
+
+def _account_credentials_from_row(row: Sequence[Any]) -> records.AccountCredentials:
+    id_, email_address, password_hash = row
+    return records.AccountCredentials(
+        id=id_,
+        email_address=email_address,
+        password_hash=password_hash,
+    )
+
+
+ACCOUNT_CREDENTIALS = RowMapper(
+    columns=lambda user: [user.id, user.email_address, user.password],
+    build=_account_credentials_from_row,
+)
+
+
+EMAIL_ADDRESS = RowMapper(
+    columns=lambda email: [email.address, email.confirmed_on],
+    build=lambda row: records.EmailAddress(row[0], confirmed_on=row[1]),
+)
+
+
+def _cooperation_from_row(row: Sequence[Any]) -> records.Cooperation:
+    id_, creation_date, name, definition = row
+    return records.Cooperation(
+        id=id_,
+        creation_date=creation_date,
+        name=name,
+        definition=definition,
+    )
+
+
+COOPERATION = RowMapper(
+    columns=lambda cooperation: [
+        cooperation.id,
+        cooperation.creation_date,
+        cooperation.name,
+        cooperation.definition,
+    ],
+    build=_cooperation_from_row,
+)
+
+
+def _coordination_tenure_from_row(row: Sequence[Any]) -> records.CoordinationTenure:
+    id_, company, cooperation, start_date = row
+    return records.CoordinationTenure(
+        id=id_,
+        company=company,
+        cooperation=cooperation,
+        start_date=start_date,
+    )
+
+
+COORDINATION_TENURE = RowMapper(
+    columns=lambda tenure: [
+        tenure.id,
+        tenure.company,
+        tenure.cooperation,
+        tenure.start_date,
+    ],
+    build=_coordination_tenure_from_row,
+)
+
+
+def _coordination_transfer_request_from_row(
+    row: Sequence[Any],
+) -> records.CoordinationTransferRequest:
+    id_, requesting_coordination_tenure, candidate, request_date = row
+    return records.CoordinationTransferRequest(
+        id=id_,
+        requesting_coordination_tenure=requesting_coordination_tenure,
+        candidate=candidate,
+        request_date=request_date,
+    )
+
+
+COORDINATION_TRANSFER_REQUEST = RowMapper(
+    columns=lambda request: [
+        request.id,
+        request.requesting_coordination_tenure,
+        request.candidate,
+        request.request_date,
+    ],
+    build=_coordination_transfer_request_from_row,
+)
+
+
+def _company_work_invite_from_row(row: Sequence[Any]) -> records.CompanyWorkInvite:
+    id_, member, company = row
+    return records.CompanyWorkInvite(
+        id=id_,
+        member=member,
+        company=company,
+    )
+
+
+COMPANY_WORK_INVITE = RowMapper(
+    columns=lambda invite: [invite.id, invite.member, invite.company],
+    build=_company_work_invite_from_row,
+)
+
+
+def _transaction_from_row(row: Sequence[Any]) -> records.Transaction:
+    (
+        id_,
+        date,
+        sending_account,
+        receiving_account,
+        amount_sent,
+        amount_received,
+        purpose,
+    ) = row
+    return records.Transaction(
+        id=id_,
+        date=date,
+        sending_account=sending_account,
+        receiving_account=receiving_account,
+        amount_sent=Decimal(amount_sent),
+        amount_received=Decimal(amount_received),
+        purpose=purpose,
+    )
+
+
+TRANSACTION = RowMapper(
+    columns=lambda transaction: [
+        transaction.id,
+        transaction.date,
+        transaction.sending_account,
+        transaction.receiving_account,
+        transaction.amount_sent,
+        transaction.amount_received,
+        transaction.purpose,
+    ],
+    build=_transaction_from_row,
+)
+
+
+def _productive_consumption_from_row(
+    row: Sequence[Any],
+) -> records.ProductiveConsumption:
+    id_, plan_id, transaction_id, amount = row
+    return records.ProductiveConsumption(
+        id=id_,
+        plan_id=plan_id,
+        transaction_id=transaction_id,
+        amount=amount,
+    )
+
+
+PRODUCTIVE_CONSUMPTION = RowMapper(
+    columns=lambda consumption: [
+        consumption.id,
+        consumption.plan_id,
+        consumption.transaction_id,
+        consumption.amount,
+    ],
+    build=_productive_consumption_from_row,
+)
+
+
+def _private_consumption_from_row(row: Sequence[Any]) -> records.PrivateConsumption:
+    id_, plan_id, transaction_id, amount = row
+    return records.PrivateConsumption(
+        id=id_,
+        amount=amount,
+        plan_id=plan_id,
+        transaction_id=transaction_id,
+    )
+
+
+PRIVATE_CONSUMPTION = RowMapper(
+    columns=lambda consumption: [
+        consumption.id,
+        consumption.plan_id,
+        consumption.transaction_id,
+        consumption.amount,
+    ],
+    build=_private_consumption_from_row,
+)
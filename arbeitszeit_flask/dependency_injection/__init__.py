@@ -1,6 +1,8 @@
-from functools import wraps
-from typing import List, Optional
+from contextlib import ExitStack
+from functools import lru_cache, wraps
+from typing import Any, List, Optional
 
+from flask import Flask, g
 from flask_sqlalchemy import SQLAlchemy
 
 from arbeitszeit import records
@@ -14,6 +16,7 @@ from arbeitszeit.injector import (
     CallableProvider,
     Injector,
     Module,
+    request_scope,
 )
 from arbeitszeit.password_hasher import PasswordHasher
 from arbeitszeit_flask.control_thresholds import ControlThresholdsFlask
@@ -22,7 +25,6 @@ from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
 from arbeitszeit_flask.datetime import RealtimeDatetimeService
 from arbeitszeit_flask.extensions import db
 from arbeitszeit_flask.flask_colors import FlaskColors
-from arbeitszeit_flask.flask_plotter import FlaskPlotter
 from arbeitszeit_flask.flask_request import FlaskRequest
 from arbeitszeit_flask.flask_session import FlaskSession
 from arbeitszeit_flask.language_repository import LanguageRepositoryImpl
@@ -33,6 +35,9 @@ from arbeitszeit_flask.mail_service import (
 )
 from arbeitszeit_flask.notifications import FlaskFlashNotifier
 from arbeitszeit_flask.password_hasher import provide_password_hasher
+from arbeitszeit_flask.plots.cache import PlotCache, get_plot_cache
+from arbeitszeit_flask.plots.downsampling import Downsampler, get_downsampler
+from arbeitszeit_flask.plots.rendering import get_plotter
 from arbeitszeit_flask.text_renderer import TextRendererImpl
 from arbeitszeit_flask.token import FlaskTokenService
 from arbeitszeit_flask.translator import FlaskTranslator
@@ -86,7 +91,9 @@ class FlaskModule(Module):
         binder[Notifier] = AliasProvider(FlaskFlashNotifier)
         binder[MailService] = CallableProvider(get_mail_service)
         binder[Translator] = AliasProvider(FlaskTranslator)
-        binder[Plotter] = AliasProvider(FlaskPlotter)
+        binder[Plotter] = CallableProvider(get_plotter)
+        binder[PlotCache] = CallableProvider(get_plot_cache)
+        binder[Downsampler] = CallableProvider(get_downsampler)
         binder[Colors] = AliasProvider(FlaskColors)
         binder[ControlThresholds] = AliasProvider(ControlThresholdsFlask)
         binder.bind(
@@ -140,3 +147,30 @@ def create_dependency_injector(
     return Injector(
         [FlaskModule()] + (additional_modules if additional_modules else [])
     )
+
+
+@lru_cache(maxsize=None)
+def get_shared_dependency_injector() -> Injector:
+    """Return an injector that is shared by all requests handled by
+    this process. Everything it injects must either be stateless or
+    be @request_scoped since the injector outlives every request.
+    """
+    return create_dependency_injector()
+
+
+def initialize_request_scope(app: Flask) -> None:
+    """Open a new request scope of the dependency injector for every
+    request handled by the app.
+    """
+
+    @app.before_request
+    def enter_request_scope() -> None:
+        scope = ExitStack()
+        scope.enter_context(request_scope())
+        g.injection_request_scope = scope
+
+    @app.teardown_request
+    def exit_request_scope(exception: Optional[BaseException]) -> Any:
+        scope = g.pop("injection_request_scope", None)
+        if scope is not None:
+            scope.close()
@@ -5,6 +5,8 @@ from typing import Dict, Iterable, Optional, Tuple
 
 from flask import request
 
+from arbeitszeit.injector import request_scoped
+
 
 @dataclass
 class QueryStringImpl:
@@ -17,6 +19,7 @@ class QueryStringImpl:
         return self.args.items()
 
 
+@request_scoped
 class FlaskRequest:
     def query_string(self) -> QueryStringImpl:
         return QueryStringImpl(
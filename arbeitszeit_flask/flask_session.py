@@ -6,10 +6,12 @@ from flask import request, session
 from flask_login import current_user, login_user, logout_user
 from is_safe_url import is_safe_url
 
+from arbeitszeit.injector import request_scoped
 from arbeitszeit_flask.database import models
 from arbeitszeit_web.session import UserRole
 
 
+@request_scoped
 class FlaskSession:
     ROLES = {
         "member": UserRole.member,
@@ -31,25 +33,25 @@ class FlaskSession:
 
     def get_current_user(self) -> Optional[UUID]:
         try:
-            return UUID(current_user.id)
+            return current_user.id
         except AttributeError:
             return None
 
     def login_member(self, member: UUID, remember: bool = False) -> None:
-        member = models.Member.query.filter(models.Member.id == (str(member))).first()
+        member = models.Member.query.filter(models.Member.id == member).first()
         assert member
         login_user(member, remember=remember)
         session["user_type"] = "member"
 
     def login_company(self, company: UUID, remember: bool = False) -> None:
-        company = models.Company.query.filter(models.Company.id == str(company)).first()
+        company = models.Company.query.filter(models.Company.id == company).first()
         assert company
         login_user(company, remember=remember)
         session["user_type"] = "company"
 
     def login_accountant(self, accountant: UUID, remember: bool = False) -> None:
         accountant = models.Accountant.query.filter(
-            models.Accountant.id == str(accountant)
+            models.Accountant.id == accountant
         ).first()
         assert accountant
         login_user(accountant, remember=remember)
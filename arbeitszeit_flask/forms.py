@@ -83,6 +83,7 @@ class PlanSearchForm(Form):
     choices_radio = [
         ("activation", trans.lazy_gettext("Newest")),
         ("company_name", trans.lazy_gettext("Company name")),
+        ("relevance", trans.lazy_gettext("Relevance")),
     ]
     radio = RadioField(
         choices=choices_radio,
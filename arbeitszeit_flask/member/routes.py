@@ -17,6 +17,9 @@ from arbeitszeit_flask.views.http_error_view import http_404
 from arbeitszeit_flask.views.query_private_consumptions import (
     QueryPrivateConsumptionsView,
 )
+from arbeitszeit_web.www.controllers.statement_of_account_controller import (
+    StatementOfAccountController,
+)
 from arbeitszeit_web.www.presenters.get_member_account_presenter import (
     GetMemberAccountPresenter,
 )
@@ -50,7 +53,7 @@ class dashboard:
     presenter: GetMemberDashboardPresenter
 
     def GET(self) -> Response:
-        response = self.get_member_dashboard(UUID(current_user.id))
+        response = self.get_member_dashboard(current_user.id)
         view_model = self.presenter.present(response)
         return FlaskResponse(
             render_template(
@@ -65,10 +68,15 @@ class dashboard:
 @dataclass
 class my_account:
     get_member_account: use_cases.get_member_account.GetMemberAccount
+    controller: StatementOfAccountController
     presenter: GetMemberAccountPresenter
 
     def GET(self) -> Response:
-        response = self.get_member_account(UUID(current_user.id))
+        response = self.get_member_account(
+            current_user.id,
+            limit=self.controller.get_page_size(),
+            after=self.controller.get_cursor(),
+        )
         view_model = self.presenter.present_member_account(response)
         return FlaskResponse(
             render_template(
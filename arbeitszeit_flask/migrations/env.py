@@ -46,7 +46,10 @@ def run_migrations_offline():
     """
     url = config.get_main_option("sqlalchemy.url")
     context.configure(
-        url=url, target_metadata=target_metadata, literal_binds=True
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        transaction_per_migration=True,
     )
 
     with context.begin_transaction():
@@ -78,6 +81,9 @@ def run_migrations_online():
             connection=connection,
             target_metadata=target_metadata,
             process_revision_directives=process_revision_directives,
+            # Commit every revision on its own, so that no lock taken by
+            # one revision is held while the following ones run.
+            transaction_per_migration=True,
             **current_app.extensions['migrate'].configure_args
         )
 
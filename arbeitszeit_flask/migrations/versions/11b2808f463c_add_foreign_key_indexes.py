@@ -0,0 +1,72 @@
+"""Add indexes on foreign keys of ledger, plan and cooperation tables
+
+Revision ID: 11b2808f463c
+Revises: c52f8a3b9e16
+Create Date: 2026-10-18 23:05:12.408615
+"""
+from alembic import op
+
+revision = "11b2808f463c"
+down_revision = "c52f8a3b9e16"
+branch_labels = None
+depends_on = None
+
+INDEXES = {
+    "transaction": {
+        "ix_transaction_date_id": ["date", "id"],
+    },
+    "plan_review": {
+        "ix_plan_review_plan_id": ["plan_id"],
+    },
+    "plan": {
+        "ix_plan_planner": ["planner"],
+        "ix_plan_requested_cooperation": ["requested_cooperation"],
+    },
+    "plan_draft": {
+        "ix_plan_draft_planner": ["planner"],
+    },
+    "private_consumption": {
+        "ix_private_consumption_plan_id": ["plan_id"],
+        "ix_private_consumption_transaction_id": ["transaction_id"],
+    },
+    "productive_consumption": {
+        "ix_productive_consumption_plan_id": ["plan_id"],
+        "ix_productive_consumption_transaction_id": ["transaction_id"],
+    },
+    "coordination_tenure": {
+        "ix_coordination_tenure_cooperation_start_date": [
+            "cooperation",
+            "start_date",
+        ],
+        "ix_coordination_tenure_company": ["company"],
+    },
+    "coordination_transfer_request": {
+        "ix_coordination_transfer_request_requesting_coordination_tenure": [
+            "requesting_coordination_tenure"
+        ],
+    },
+    "company_work_invite": {
+        "ix_company_work_invite_company": ["company"],
+        "ix_company_work_invite_member": ["member"],
+    },
+    "jobs": {
+        "ix_jobs_member_id_company_id": ["member_id", "company_id"],
+        "ix_jobs_company_id": ["company_id"],
+    },
+}
+
+
+def upgrade():
+    # The indexes are built without blocking writes to the tables. Each
+    # statement runs outside of the migration transaction.
+    with op.get_context().autocommit_block():
+        for table, indexes in INDEXES.items():
+            for name, columns in indexes.items():
+                op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for table, indexes in INDEXES.items():
+            for name in indexes:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,67 @@
+"""Fill cooperation_price table
+
+Search queries no longer calculate missing rows of the cooperation_price
+table. This revision calculates the rows of all cooperations as of the
+time of the migration, so that queries do not have to fall back to
+calculating the prices inline until the next sweep.
+
+Revision ID: 2f8c4a6e1d93
+Revises: e050af627b1a
+Create Date: 2026-10-19 10:12:53.804611
+"""
+from datetime import datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "2f8c4a6e1d93"
+down_revision = "e050af627b1a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The application stores local timestamps without a time zone.
+    op.get_bind().execute(
+        sa.text(
+            """
+            INSERT INTO cooperation_price (
+                cooperation_id, as_of, valid_until, plans_count,
+                cost_per_day, amount_per_day
+            )
+            SELECT cooperation.id, :now, figures.*
+            FROM cooperation CROSS JOIN LATERAL (
+                SELECT
+                    min(CASE WHEN is_active THEN expiration_date
+                        ELSE activation_date END)
+                        FILTER (WHERE is_active OR activation_date > :now),
+                    count(*) FILTER (WHERE is_active),
+                    coalesce(sum((costs_p + costs_r + costs_a) / timeframe)
+                        FILTER (WHERE is_active), 0),
+                    coalesce(sum(prd_amount / timeframe)
+                        FILTER (WHERE is_active), 0)
+                FROM (
+                    SELECT *, (
+                        activation_date <= :now AND expiration_date > :now
+                    ) AS is_active
+                    FROM plan
+                    WHERE plan.cooperation = cooperation.id
+                    AND plan.activation_date IS NOT NULL
+                ) AS plans
+            ) AS figures
+            ORDER BY cooperation.id
+            ON CONFLICT (cooperation_id) DO UPDATE SET
+                as_of = excluded.as_of,
+                valid_until = excluded.valid_until,
+                plans_count = excluded.plans_count,
+                cost_per_day = excluded.cost_per_day,
+                amount_per_day = excluded.amount_per_day
+            """
+        ),
+        dict(now=datetime.now()),
+    )
+
+
+def downgrade():
+    # The rows are valid in the older revisions as well.
+    pass
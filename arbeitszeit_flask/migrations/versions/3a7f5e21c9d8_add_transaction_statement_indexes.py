@@ -0,0 +1,30 @@
+"""Add indexes for paginated account statements
+
+Revision ID: 3a7f5e21c9d8
+Revises: 9b1d2c7e4f30
+Create Date: 2026-10-18 14:02:17.554093
+"""
+from alembic import op
+
+revision = "3a7f5e21c9d8"
+down_revision = "9b1d2c7e4f30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("transaction", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_transaction_sending_account_date_id",
+            ["sending_account", "date", "id"],
+        )
+        batch_op.create_index(
+            "ix_transaction_receiving_account_date_id",
+            ["receiving_account", "date", "id"],
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("transaction", schema=None) as batch_op:
+        batch_op.drop_index("ix_transaction_receiving_account_date_id")
+        batch_op.drop_index("ix_transaction_sending_account_date_id")
@@ -0,0 +1,237 @@
+"""Add uuid columns for ids
+
+The id columns are moved to the uuid type without rewriting whole
+tables under an exclusive lock. This revision adds a uuid column next
+to every id column. A trigger keeps the new column in sync while the
+application still writes the old one. Existing rows are filled in
+small batches. Indexes are then built concurrently, and foreign keys
+and not null checks are added as NOT VALID and validated afterwards.
+Revision 7d3a5c9e2b61 swaps the columns.
+
+The application works with the columns of both revisions. Upgrade to
+this revision with ``flask db upgrade 4b9e2d6f1a83`` while the previous
+release keeps serving requests, deploy the new release, and run the
+swap with ``flask db upgrade`` afterwards, for example at a quiet time.
+
+Revision ID: 4b9e2d6f1a83
+Revises: 5d1f7b3e9a24
+Create Date: 2026-10-18 22:41:09.517320
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "4b9e2d6f1a83"
+down_revision = "5d1f7b3e9a24"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "user": ["id"],
+    "social_accounting": ["id", "account"],
+    "jobs": ["member_id", "company_id"],
+    "member": ["id", "user_id", "account"],
+    "company": ["id", "user_id", "p_account", "r_account", "a_account", "prd_account"],
+    "accountant": ["id", "user_id"],
+    "plan_draft": ["id", "planner"],
+    "plan": ["id", "planner", "requested_cooperation", "cooperation"],
+    "plan_review": ["id", "plan_id"],
+    "account": ["id"],
+    "account_balance": ["account_id"],
+    "account_owner": ["account_id", "owner_id"],
+    "transaction": ["id", "sending_account", "receiving_account"],
+    "private_consumption": ["id", "plan_id", "transaction_id"],
+    "productive_consumption": ["id", "plan_id", "transaction_id"],
+    "company_work_invite": ["id", "company", "member"],
+    "cooperation": ["id"],
+    "coordination_tenure": ["id", "company", "cooperation"],
+    "coordination_transfer_request": [
+        "id",
+        "requesting_coordination_tenure",
+        "candidate",
+    ],
+    "cooperation_price": ["cooperation_id"],
+}
+
+BATCH_SIZE = 5000
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    indexes = {table: _id_indexes(inspector, table) for table in UUID_COLUMNS}
+    not_null_columns = {
+        table: _not_null_id_columns(inspector, table) for table in UUID_COLUMNS
+    }
+    primary_keys = {
+        table: inspector.get_pk_constraint(table)["constrained_columns"]
+        for table in UUID_COLUMNS
+    }
+    foreign_keys = _id_foreign_keys(inspector)
+    for table, columns in UUID_COLUMNS.items():
+        additions = ", ".join(
+            f'ADD COLUMN "{_shadow(column)}" uuid' for column in columns
+        )
+        op.execute(f'ALTER TABLE "{table}" {additions}')
+        _create_sync_trigger(table, columns)
+    # Every statement in this block is committed on its own, so that no
+    # lock is held longer than a single batch or constraint needs it.
+    with op.get_context().autocommit_block():
+        for table, columns in UUID_COLUMNS.items():
+            _fill_in_batches(table, columns, primary_keys[table])
+        for table, table_indexes in indexes.items():
+            for _, unique, name, columns in table_indexes:
+                op.execute(
+                    f'CREATE {"UNIQUE " if unique else ""}INDEX CONCURRENTLY '
+                    f'"{_shadow_name(name)}" ON "{table}" '
+                    f"({_column_list(table, columns)})"
+                )
+        for table, columns in not_null_columns.items():
+            for column in columns:
+                name = _not_null_check(column)
+                op.execute(
+                    f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" '
+                    f'CHECK ("{_shadow(column)}" IS NOT NULL) NOT VALID'
+                )
+                op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{name}"')
+        for table, foreign_key in foreign_keys:
+            name = _shadow_name(foreign_key["name"])
+            op.execute(
+                f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" '
+                f"{_shadow_foreign_key(table, foreign_key)} NOT VALID"
+            )
+            op.execute(f'ALTER TABLE "{table}" VALIDATE CONSTRAINT "{name}"')
+
+
+def downgrade():
+    inspector = sa.inspect(op.get_bind())
+    for table in UUID_COLUMNS:
+        for foreign_key in inspector.get_foreign_keys(table):
+            if foreign_key["name"].startswith("uuid_"):
+                op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(f'DROP TRIGGER "{_sync_trigger(table)}" ON "{table}"')
+        op.execute(f'DROP FUNCTION "{_sync_trigger(table)}"()')
+        # Indexes and checks on the uuid columns are dropped with them.
+        removals = ", ".join(f'DROP COLUMN "{_shadow(column)}"' for column in columns)
+        op.execute(f'ALTER TABLE "{table}" {removals}')
+
+
+def _create_sync_trigger(table, columns):
+    assignments = " ".join(
+        f'NEW."{_shadow(column)}" := NEW."{column}"::uuid;' for column in columns
+    )
+    op.execute(
+        f'CREATE FUNCTION "{_sync_trigger(table)}"() RETURNS trigger '
+        f"LANGUAGE plpgsql AS $$ BEGIN {assignments} RETURN NEW; END $$"
+    )
+    op.execute(
+        f'CREATE TRIGGER "{_sync_trigger(table)}" BEFORE INSERT OR UPDATE '
+        f'ON "{table}" FOR EACH ROW EXECUTE FUNCTION "{_sync_trigger(table)}"()'
+    )
+
+
+def _fill_in_batches(table, columns, primary_key):
+    assignments = ", ".join(
+        f'"{_shadow(column)}" = "{table}"."{column}"::uuid' for column in columns
+    )
+    if len(primary_key) != 1:
+        # Only the jobs table has no primary key. It holds one row per
+        # employment and is small enough to be filled at once.
+        op.execute(f'UPDATE "{table}" SET {assignments}')
+        return
+    (key,) = primary_key
+    statement = sa.text(
+        f'WITH batch AS (SELECT "{key}" FROM "{table}" WHERE "{key}" > :last '
+        f'ORDER BY "{key}" LIMIT :size), updated AS (UPDATE "{table}" '
+        f'SET {assignments} FROM batch WHERE "{table}"."{key}" = batch."{key}" '
+        f'RETURNING "{table}"."{key}") SELECT max("{key}") FROM updated'
+    )
+    last = ""
+    while last is not None:
+        last = (
+            op.get_bind()
+            .execute(statement, dict(last=last, size=BATCH_SIZE))
+            .scalar_one()
+        )
+
+
+def _id_indexes(inspector, table):
+    """The primary key, unique constraints and indexes of the table that
+    cover id columns, as (constraint type, unique, name, columns).
+    """
+    id_columns = set(UUID_COLUMNS[table])
+    found = []
+    primary_key = inspector.get_pk_constraint(table)
+    if id_columns & set(primary_key["constrained_columns"]):
+        found.append(
+            (
+                "PRIMARY KEY",
+                True,
+                primary_key["name"],
+                primary_key["constrained_columns"],
+            )
+        )
+    for constraint in inspector.get_unique_constraints(table):
+        if id_columns & set(constraint["column_names"]):
+            found.append(
+                ("UNIQUE", True, constraint["name"], constraint["column_names"])
+            )
+    for index in inspector.get_indexes(table):
+        if "duplicates_constraint" in index:
+            continue
+        if id_columns & set(index["column_names"]):
+            found.append((None, index["unique"], index["name"], index["column_names"]))
+    return found
+
+
+def _not_null_id_columns(inspector, table):
+    return [
+        column["name"]
+        for column in inspector.get_columns(table)
+        if column["name"] in UUID_COLUMNS[table] and not column["nullable"]
+    ]
+
+
+def _id_foreign_keys(inspector):
+    return [
+        (table, foreign_key)
+        for table in UUID_COLUMNS
+        for foreign_key in inspector.get_foreign_keys(table)
+        if set(foreign_key["constrained_columns"]) <= set(UUID_COLUMNS[table])
+    ]
+
+
+def _shadow_foreign_key(table, foreign_key):
+    referred_table = foreign_key["referred_table"]
+    definition = (
+        f"FOREIGN KEY ({_column_list(table, foreign_key['constrained_columns'])}) "
+        f'REFERENCES "{referred_table}" '
+        f"({_column_list(referred_table, foreign_key['referred_columns'])})"
+    )
+    if foreign_key["options"].get("ondelete"):
+        definition += f" ON DELETE {foreign_key['options']['ondelete']}"
+    return definition
+
+
+def _column_list(table, columns):
+    return ", ".join(
+        f'"{_shadow(column) if column in UUID_COLUMNS[table] else column}"'
+        for column in columns
+    )
+
+
+def _shadow(column):
+    return f"{column}_uuid"
+
+
+def _shadow_name(name):
+    # Postgres truncates names to 63 characters. A prefix keeps the
+    # truncated names of long constraints apart from the original ones.
+    return f"uuid_{name}"[:63]
+
+
+def _not_null_check(column):
+    return f"uuid_{column}_not_null"
+
+
+def _sync_trigger(table):
+    return f"{table}_sync_uuid_ids"
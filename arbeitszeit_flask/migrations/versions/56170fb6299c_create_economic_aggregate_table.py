@@ -0,0 +1,80 @@
+"""Create economic_aggregate table
+
+Revision ID: 56170fb6299c
+Revises: e1ee4247ca55
+Create Date: 2026-10-18 10:41:05.118230
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "56170fb6299c"
+down_revision = "e1ee4247ca55"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "economic_aggregate",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("companies_count", sa.Integer(), nullable=False),
+        sa.Column("members_count", sa.Integer(), nullable=False),
+        sa.Column("cooperations_count", sa.Integer(), nullable=False),
+        sa.Column("member_account_balance", sa.Numeric(), nullable=False),
+        sa.Column("labour_account_balance", sa.Numeric(), nullable=False),
+        sa.Column("product_account_balance", sa.Numeric(), nullable=False),
+        sa.Column("active_plans_as_of", sa.DateTime(), nullable=True),
+        sa.Column("active_plans_count", sa.Integer(), nullable=False),
+        sa.Column("active_public_plans_count", sa.Integer(), nullable=False),
+        sa.Column("active_plans_timeframe", sa.Numeric(), nullable=False),
+        sa.Column("active_plans_means_cost", sa.Numeric(), nullable=False),
+        sa.Column("active_plans_resource_cost", sa.Numeric(), nullable=False),
+        sa.Column("active_plans_labour_cost", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_member_account", "member", ["account"])
+    op.create_index("ix_company_a_account", "company", ["a_account"])
+    op.create_index("ix_company_prd_account", "company", ["prd_account"])
+    op.execute(
+        """
+        INSERT INTO economic_aggregate
+        SELECT
+            1,
+            (SELECT COUNT(*) FROM company),
+            (SELECT COUNT(*) FROM member),
+            (SELECT COUNT(*) FROM cooperation),
+            (
+                SELECT COALESCE(SUM(balance), 0) FROM account_balance
+                JOIN member ON member.account = account_balance.account_id
+            ),
+            (
+                SELECT COALESCE(SUM(balance), 0) FROM account_balance
+                JOIN company ON company.a_account = account_balance.account_id
+            ),
+            (
+                SELECT COALESCE(SUM(balance), 0) FROM account_balance
+                JOIN company ON company.prd_account = account_balance.account_id
+            ),
+            active_plans.as_of,
+            COUNT(plan.id),
+            COUNT(plan.id) FILTER (WHERE plan.is_public_service),
+            COALESCE(SUM(plan.timeframe), 0),
+            COALESCE(SUM(plan.costs_p), 0),
+            COALESCE(SUM(plan.costs_r), 0),
+            COALESCE(SUM(plan.costs_a), 0)
+        FROM (SELECT LOCALTIMESTAMP AS as_of) AS active_plans
+        LEFT OUTER JOIN plan
+            ON plan.activation_date <= active_plans.as_of
+            AND plan.activation_date
+                + CAST(CONCAT(plan.timeframe, 'days') AS INTERVAL)
+                > active_plans.as_of
+        GROUP BY active_plans.as_of
+        """
+    )
+
+
+def downgrade():
+    op.drop_index("ix_company_prd_account", table_name="company")
+    op.drop_index("ix_company_a_account", table_name="company")
+    op.drop_index("ix_member_account", table_name="member")
+    op.drop_table("economic_aggregate")
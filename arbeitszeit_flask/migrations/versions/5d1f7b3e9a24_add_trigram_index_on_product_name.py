@@ -0,0 +1,39 @@
+"""Add trigram index on product name
+
+Plan searches look for the query as a substring of the product name.
+The trigram index lets postgres answer these searches without scanning
+the plan table.
+
+Revision ID: 5d1f7b3e9a24
+Revises: 9e4b7c2a5f18
+Create Date: 2026-10-19 14:26:51.730284
+"""
+from alembic import op
+
+revision = "5d1f7b3e9a24"
+down_revision = "9e4b7c2a5f18"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_plan_prd_name_trgm",
+            "plan",
+            ["prd_name"],
+            postgresql_using="gin",
+            postgresql_ops={"prd_name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    # The extension is kept, other database objects may use it as well.
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_plan_prd_name_trgm",
+            table_name="plan",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,37 @@
+"""Create cooperation_price table
+
+Revision ID: 6d2b8e0f4a17
+Revises: 3a7f5e21c9d8
+Create Date: 2026-10-18 15:20:44.318207
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "6d2b8e0f4a17"
+down_revision = "3a7f5e21c9d8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "cooperation_price",
+        sa.Column("cooperation_id", sa.String(), nullable=False),
+        sa.Column("as_of", sa.DateTime(), nullable=False),
+        sa.Column("valid_until", sa.DateTime(), nullable=True),
+        sa.Column("plans_count", sa.Integer(), nullable=False),
+        sa.Column("cost_per_day", sa.Numeric(), nullable=False),
+        sa.Column("amount_per_day", sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(["cooperation_id"], ["cooperation.id"]),
+        sa.PrimaryKeyConstraint("cooperation_id"),
+    )
+    op.create_index(
+        "ix_cooperation_price_valid_until", "cooperation_price", ["valid_until"]
+    )
+    op.create_index("ix_plan_cooperation", "plan", ["cooperation"])
+
+
+def downgrade():
+    op.drop_index("ix_plan_cooperation", table_name="plan")
+    op.drop_index("ix_cooperation_price_valid_until", table_name="cooperation_price")
+    op.drop_table("cooperation_price")
@@ -0,0 +1,245 @@
+"""Swap uuid columns for ids
+
+The uuid columns that revision 4b9e2d6f1a83 added, filled and indexed
+replace the old id columns. No table is rewritten or scanned: the old
+columns are dropped, the new ones take over their names, and the
+prepared indexes become the primary keys and unique constraints. The
+validated checks let the columns become NOT NULL without a scan.
+
+Revision ID: 7d3a5c9e2b61
+Revises: 4b9e2d6f1a83
+Create Date: 2026-10-18 22:52:37.604118
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "7d3a5c9e2b61"
+down_revision = "4b9e2d6f1a83"
+branch_labels = None
+depends_on = None
+
+UUID_COLUMNS = {
+    "user": ["id"],
+    "social_accounting": ["id", "account"],
+    "jobs": ["member_id", "company_id"],
+    "member": ["id", "user_id", "account"],
+    "company": ["id", "user_id", "p_account", "r_account", "a_account", "prd_account"],
+    "accountant": ["id", "user_id"],
+    "plan_draft": ["id", "planner"],
+    "plan": ["id", "planner", "requested_cooperation", "cooperation"],
+    "plan_review": ["id", "plan_id"],
+    "account": ["id"],
+    "account_balance": ["account_id"],
+    "account_owner": ["account_id", "owner_id"],
+    "transaction": ["id", "sending_account", "receiving_account"],
+    "private_consumption": ["id", "plan_id", "transaction_id"],
+    "productive_consumption": ["id", "plan_id", "transaction_id"],
+    "company_work_invite": ["id", "company", "member"],
+    "cooperation": ["id"],
+    "coordination_tenure": ["id", "company", "cooperation"],
+    "coordination_transfer_request": [
+        "id",
+        "requesting_coordination_tenure",
+        "candidate",
+    ],
+    "cooperation_price": ["cooperation_id"],
+}
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    indexes = {table: _id_indexes(inspector, table) for table in UUID_COLUMNS}
+    not_null_columns = {
+        table: _not_null_id_columns(inspector, table) for table in UUID_COLUMNS
+    }
+    foreign_keys = _id_foreign_keys(inspector)
+    # Every table is locked exclusively until the end of the migration.
+    # Give up instead of queueing all other queries behind a long
+    # running transaction.
+    op.execute("SET LOCAL lock_timeout = '10s'")
+    for table, foreign_key in foreign_keys:
+        op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+    for table, columns in UUID_COLUMNS.items():
+        op.execute(f'DROP TRIGGER "{_sync_trigger(table)}" ON "{table}"')
+        op.execute(f'DROP FUNCTION "{_sync_trigger(table)}"()')
+        removals = ", ".join(f'DROP COLUMN "{column}"' for column in columns)
+        op.execute(f'ALTER TABLE "{table}" {removals}')
+        for column in columns:
+            op.alter_column(table, _shadow(column), new_column_name=column)
+        for column in not_null_columns[table]:
+            op.alter_column(table, column, nullable=False)
+            op.drop_constraint(_not_null_check(column), table, type_="check")
+        for constraint, _, name, _ in indexes[table]:
+            if constraint:
+                op.execute(
+                    f'ALTER TABLE "{table}" ADD CONSTRAINT "{name}" '
+                    f'{constraint} USING INDEX "{_shadow_name(name)}"'
+                )
+            else:
+                op.execute(f'ALTER INDEX "{_shadow_name(name)}" RENAME TO "{name}"')
+    for table, foreign_key in foreign_keys:
+        op.execute(
+            f'ALTER TABLE "{table}" RENAME CONSTRAINT '
+            f'"{_shadow_name(foreign_key["name"])}" TO "{foreign_key["name"]}"'
+        )
+
+
+def downgrade():
+    # Going back rewrites every table to fill the varchar columns. This
+    # restores the state after revision 4b9e2d6f1a83 and is not meant
+    # to run while the application serves requests.
+    inspector = sa.inspect(op.get_bind())
+    indexes = {table: _id_indexes(inspector, table) for table in UUID_COLUMNS}
+    not_null_columns = {
+        table: _not_null_id_columns(inspector, table) for table in UUID_COLUMNS
+    }
+    foreign_keys = _id_foreign_keys(inspector)
+    for table, foreign_key in foreign_keys:
+        op.drop_constraint(foreign_key["name"], table, type_="foreignkey")
+    for table, columns in UUID_COLUMNS.items():
+        for constraint, _, name, _ in indexes[table]:
+            if constraint == "PRIMARY KEY":
+                op.drop_constraint(name, table, type_="primary")
+            elif constraint == "UNIQUE":
+                op.drop_constraint(name, table, type_="unique")
+            else:
+                op.drop_index(name, table_name=table)
+        for column in columns:
+            op.alter_column(table, column, new_column_name=_shadow(column))
+        for column in not_null_columns[table]:
+            op.alter_column(table, _shadow(column), nullable=True)
+        additions = ", ".join(f'ADD COLUMN "{column}" varchar' for column in columns)
+        op.execute(f'ALTER TABLE "{table}" {additions}')
+        assignments = ", ".join(
+            f'"{column}" = "{_shadow(column)}"::varchar' for column in columns
+        )
+        op.execute(f'UPDATE "{table}" SET {assignments}')
+        for column in not_null_columns[table]:
+            op.alter_column(table, column, nullable=False)
+            op.create_check_constraint(
+                _not_null_check(column),
+                table,
+                f'"{_shadow(column)}" IS NOT NULL',
+            )
+        for constraint, unique, name, columns in indexes[table]:
+            if constraint == "PRIMARY KEY":
+                op.create_primary_key(name, table, columns)
+            elif constraint == "UNIQUE":
+                op.create_unique_constraint(name, table, columns)
+            else:
+                op.create_index(name, table, columns, unique=unique)
+            op.execute(
+                f'CREATE {"UNIQUE " if unique else ""}INDEX '
+                f'"{_shadow_name(name)}" ON "{table}" '
+                f"({_column_list(table, columns)})"
+            )
+        _create_sync_trigger(table, UUID_COLUMNS[table])
+    for table, foreign_key in foreign_keys:
+        op.create_foreign_key(
+            foreign_key["name"],
+            table,
+            foreign_key["referred_table"],
+            foreign_key["constrained_columns"],
+            foreign_key["referred_columns"],
+            **foreign_key["options"],
+        )
+        op.execute(
+            f'ALTER TABLE "{table}" ADD CONSTRAINT '
+            f'"{_shadow_name(foreign_key["name"])}" '
+            f"{_shadow_foreign_key(table, foreign_key)}"
+        )
+
+
+def _create_sync_trigger(table, columns):
+    assignments = " ".join(
+        f'NEW."{_shadow(column)}" := NEW."{column}"::uuid;' for column in columns
+    )
+    op.execute(
+        f'CREATE FUNCTION "{_sync_trigger(table)}"() RETURNS trigger '
+        f"LANGUAGE plpgsql AS $$ BEGIN {assignments} RETURN NEW; END $$"
+    )
+    op.execute(
+        f'CREATE TRIGGER "{_sync_trigger(table)}" BEFORE INSERT OR UPDATE '
+        f'ON "{table}" FOR EACH ROW EXECUTE FUNCTION "{_sync_trigger(table)}"()'
+    )
+
+
+def _id_indexes(inspector, table):
+    """The primary key, unique constraints and indexes of the table that
+    cover id columns, as (constraint type, unique, name, columns).
+    """
+    id_columns = set(UUID_COLUMNS[table])
+    found = []
+    primary_key = inspector.get_pk_constraint(table)
+    if id_columns & set(primary_key["constrained_columns"]):
+        found.append(
+            (
+                "PRIMARY KEY",
+                True,
+                primary_key["name"],
+                primary_key["constrained_columns"],
+            )
+        )
+    for constraint in inspector.get_unique_constraints(table):
+        if id_columns & set(constraint["column_names"]):
+            found.append(
+                ("UNIQUE", True, constraint["name"], constraint["column_names"])
+            )
+    for index in inspector.get_indexes(table):
+        if "duplicates_constraint" in index:
+            continue
+        if id_columns & set(index["column_names"]):
+            found.append((None, index["unique"], index["name"], index["column_names"]))
+    return found
+
+
+def _not_null_id_columns(inspector, table):
+    return [
+        column["name"]
+        for column in inspector.get_columns(table)
+        if column["name"] in UUID_COLUMNS[table] and not column["nullable"]
+    ]
+
+
+def _id_foreign_keys(inspector):
+    return [
+        (table, foreign_key)
+        for table in UUID_COLUMNS
+        for foreign_key in inspector.get_foreign_keys(table)
+        if set(foreign_key["constrained_columns"]) <= set(UUID_COLUMNS[table])
+    ]
+
+
+def _shadow_foreign_key(table, foreign_key):
+    referred_table = foreign_key["referred_table"]
+    definition = (
+        f"FOREIGN KEY ({_column_list(table, foreign_key['constrained_columns'])}) "
+        f'REFERENCES "{referred_table}" '
+        f"({_column_list(referred_table, foreign_key['referred_columns'])})"
+    )
+    if foreign_key["options"].get("ondelete"):
+        definition += f" ON DELETE {foreign_key['options']['ondelete']}"
+    return definition
+
+
+def _column_list(table, columns):
+    return ", ".join(
+        f'"{_shadow(column) if column in UUID_COLUMNS[table] else column}"'
+        for column in columns
+    )
+
+
+def _shadow(column):
+    return f"{column}_uuid"
+
+
+def _shadow_name(name):
+    return f"uuid_{name}"[:63]
+
+
+def _not_null_check(column):
+    return f"uuid_{column}_not_null"
+
+
+def _sync_trigger(table):
+    return f"{table}_sync_uuid_ids"
@@ -0,0 +1,50 @@
+"""Create account_owner table
+
+Revision ID: 9b1d2c7e4f30
+Revises: c545da02866f
+Create Date: 2026-10-18 13:20:41.306118
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "9b1d2c7e4f30"
+down_revision = "c545da02866f"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "account_owner",
+        sa.Column("account_id", sa.String(), nullable=False),
+        sa.Column("owner_kind", sa.String(length=17), nullable=False),
+        sa.Column("owner_id", sa.String(), nullable=False),
+        sa.Column("account_type", sa.String(length=10), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["account.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+    op.create_index("ix_account_owner_owner_id", "account_owner", ["owner_id"])
+    op.execute(
+        """
+        INSERT INTO account_owner (account_id, owner_kind, owner_id, account_type)
+        SELECT account, 'member', id, 'member' FROM member
+        UNION ALL
+        SELECT p_account, 'company', id, 'p' FROM company
+        UNION ALL
+        SELECT r_account, 'company', id, 'r' FROM company
+        UNION ALL
+        SELECT a_account, 'company', id, 'a' FROM company
+        UNION ALL
+        SELECT prd_account, 'company', id, 'prd' FROM company
+        UNION ALL
+        SELECT account, 'social_accounting', id, 'accounting' FROM social_accounting
+        """
+    )
+
+
+def downgrade():
+    op.drop_index("ix_account_owner_owner_id", table_name="account_owner")
+    op.drop_table("account_owner")
@@ -0,0 +1,52 @@
+"""Create economic_aggregate_delta table
+
+Revision ID: 9e4b7c2a5f18
+Revises: 2f8c4a6e1d93
+Create Date: 2026-10-19 11:37:20.451896
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "9e4b7c2a5f18"
+down_revision = "2f8c4a6e1d93"
+branch_labels = None
+depends_on = None
+
+SUMMED_COLUMNS = [
+    "companies_count",
+    "members_count",
+    "cooperations_count",
+    "member_account_balance",
+    "labour_account_balance",
+    "product_account_balance",
+]
+
+
+def upgrade():
+    op.create_table(
+        "economic_aggregate_delta",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column("companies_count", sa.Integer(), nullable=False),
+        sa.Column("members_count", sa.Integer(), nullable=False),
+        sa.Column("cooperations_count", sa.Integer(), nullable=False),
+        sa.Column("member_account_balance", sa.Numeric(), nullable=False),
+        sa.Column("labour_account_balance", sa.Numeric(), nullable=False),
+        sa.Column("product_account_balance", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade():
+    # Move the recorded changes into the economic_aggregate row before
+    # the table is dropped.
+    totals = ", ".join(f"SUM({column}) AS {column}" for column in SUMMED_COLUMNS)
+    assignments = ", ".join(
+        f"{column} = economic_aggregate.{column} + totals.{column}"
+        for column in SUMMED_COLUMNS
+    )
+    op.execute(
+        f"UPDATE economic_aggregate SET {assignments} "
+        f"FROM (SELECT {totals} FROM economic_aggregate_delta) AS totals "
+        "WHERE economic_aggregate.id = 1 AND totals.companies_count IS NOT NULL"
+    )
+    op.drop_table("economic_aggregate_delta")
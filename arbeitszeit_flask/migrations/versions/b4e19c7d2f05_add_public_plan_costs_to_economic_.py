@@ -0,0 +1,49 @@
+"""Add public plan costs to economic_aggregate
+
+Revision ID: b4e19c7d2f05
+Revises: 6d2b8e0f4a17
+Create Date: 2026-10-18 16:05:12.904731
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "b4e19c7d2f05"
+down_revision = "6d2b8e0f4a17"
+branch_labels = None
+depends_on = None
+
+COLUMNS = [
+    ("active_public_plans_means_cost", "costs_p"),
+    ("active_public_plans_resource_cost", "costs_r"),
+    ("active_public_plans_labour_cost", "costs_a"),
+]
+
+
+def upgrade():
+    with op.batch_alter_table("economic_aggregate", schema=None) as batch_op:
+        for column, _ in COLUMNS:
+            batch_op.add_column(
+                sa.Column(column, sa.Numeric(), nullable=False, server_default="0")
+            )
+    for column, plan_column in COLUMNS:
+        op.execute(
+            f"""
+            UPDATE economic_aggregate
+            SET {column} = (
+                SELECT COALESCE(SUM(plan.{plan_column}), 0) FROM plan
+                WHERE plan.is_public_service
+                AND plan.activation_date <= economic_aggregate.active_plans_as_of
+                AND plan.expiration_date > economic_aggregate.active_plans_as_of
+            )
+            WHERE active_plans_as_of IS NOT NULL
+            """
+        )
+    with op.batch_alter_table("economic_aggregate", schema=None) as batch_op:
+        for column, _ in COLUMNS:
+            batch_op.alter_column(column, server_default=None)
+
+
+def downgrade():
+    with op.batch_alter_table("economic_aggregate", schema=None) as batch_op:
+        for column, _ in reversed(COLUMNS):
+            batch_op.drop_column(column)
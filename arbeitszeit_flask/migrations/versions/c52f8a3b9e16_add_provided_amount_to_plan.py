@@ -0,0 +1,44 @@
+"""Add provided_amount to plan
+
+Revision ID: c52f8a3b9e16
+Revises: e7a3d1f96b42
+Create Date: 2026-10-18 19:42:37.218604
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c52f8a3b9e16"
+down_revision = "e7a3d1f96b42"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "provided_amount", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+    op.execute(
+        """
+        UPDATE plan
+        SET provided_amount = consumptions.amount
+        FROM (
+            SELECT plan_id, SUM(amount) AS amount FROM (
+                SELECT plan_id, amount FROM productive_consumption
+                UNION ALL
+                SELECT plan_id, amount FROM private_consumption
+            ) AS all_consumptions
+            GROUP BY plan_id
+        ) AS consumptions
+        WHERE plan.id = consumptions.plan_id
+        """
+    )
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.alter_column("provided_amount", server_default=None)
+
+
+def downgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.drop_column("provided_amount")
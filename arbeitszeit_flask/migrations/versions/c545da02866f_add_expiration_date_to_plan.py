@@ -0,0 +1,39 @@
+"""Add expiration_date to plan
+
+Revision ID: c545da02866f
+Revises: 56170fb6299c
+Create Date: 2026-10-18 12:03:52.660451
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c545da02866f"
+down_revision = "56170fb6299c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("expiration_date", sa.DateTime(), nullable=True))
+    op.execute(
+        """
+        UPDATE plan
+        SET expiration_date =
+            activation_date + CAST(CONCAT(timeframe, 'days') AS INTERVAL)
+        WHERE activation_date IS NOT NULL
+        """
+    )
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_plan_activation_date_expiration_date",
+            ["activation_date", "expiration_date"],
+        )
+        batch_op.create_index("ix_plan_expiration_date", ["expiration_date"])
+
+
+def downgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.drop_index("ix_plan_expiration_date")
+        batch_op.drop_index("ix_plan_activation_date_expiration_date")
+        batch_op.drop_column("expiration_date")
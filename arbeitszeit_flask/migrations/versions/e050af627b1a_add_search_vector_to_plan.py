@@ -0,0 +1,41 @@
+"""Add search_vector to plan
+
+Revision ID: e050af627b1a
+Revises: 11b2808f463c
+Create Date: 2026-10-18 23:48:36.120947
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "e050af627b1a"
+down_revision = "11b2808f463c"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(
+                    "setweight(to_tsvector('german', prd_name), 'A') || "
+                    "setweight(to_tsvector('english', prd_name), 'A') || "
+                    "setweight(to_tsvector('german', description), 'B') || "
+                    "setweight(to_tsvector('english', description), 'B')",
+                    persisted=True,
+                ),
+                nullable=True,
+            )
+        )
+        batch_op.create_index(
+            "ix_plan_search_vector", ["search_vector"], postgresql_using="gin"
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("plan", schema=None) as batch_op:
+        batch_op.drop_index("ix_plan_search_vector", postgresql_using="gin")
+        batch_op.drop_column("search_vector")
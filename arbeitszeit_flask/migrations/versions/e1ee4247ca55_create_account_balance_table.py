@@ -0,0 +1,48 @@
+"""Create account_balance table
+
+Revision ID: e1ee4247ca55
+Revises: 5f80baed0e16
+Create Date: 2026-10-18 09:12:31.402117
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e1ee4247ca55"
+down_revision = "5f80baed0e16"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "account_balance",
+        sa.Column("account_id", sa.String(), nullable=False),
+        sa.Column("balance", sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["account_id"],
+            ["account.id"],
+        ),
+        sa.PrimaryKeyConstraint("account_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO account_balance (account_id, balance)
+        SELECT account.id, COALESCE(ledger.balance, 0)
+        FROM account
+        LEFT OUTER JOIN (
+            SELECT movements.account, SUM(movements.amount) AS balance
+            FROM (
+                SELECT receiving_account AS account, amount_received AS amount
+                FROM transaction
+                UNION ALL
+                SELECT sending_account AS account, -amount_sent AS amount
+                FROM transaction
+            ) AS movements
+            GROUP BY movements.account
+        ) AS ledger ON ledger.account = account.id
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("account_balance")
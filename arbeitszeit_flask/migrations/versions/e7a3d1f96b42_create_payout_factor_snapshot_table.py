@@ -0,0 +1,29 @@
+"""Create payout_factor_snapshot table
+
+Revision ID: e7a3d1f96b42
+Revises: b4e19c7d2f05
+Create Date: 2026-10-18 17:11:38.470215
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e7a3d1f96b42"
+down_revision = "b4e19c7d2f05"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "payout_factor_snapshot",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("payout_factor", sa.Numeric(), nullable=False),
+        sa.Column("means_cost", sa.Numeric(), nullable=False),
+        sa.Column("resource_cost", sa.Numeric(), nullable=False),
+        sa.Column("labour_cost", sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint("day"),
+    )
+
+
+def downgrade():
+    op.drop_table("payout_factor_snapshot")
@@ -0,0 +1,172 @@
+"""Rendering a plot with matplotlib takes much longer than looking up
+the resulting image. The plot routes therefore keep the PNG images
+they render in a cache that is shared by all requests of a Flask
+application. Optionally the images are stored in a directory as well,
+which is shared by all worker processes and survives restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from flask import current_app
+
+EXTENSION_NAME = "arbeitszeit_plot_cache"
+
+
+@dataclass(frozen=True)
+class CachedPlot:
+    png: bytes
+    etag: str
+
+
+class PlotCache:
+    """Keep rendered plots in memory until the total size of the cached
+    images exceeds `max_bytes`. Then the least recently used plots are
+    evicted. Images that are larger than `max_bytes` are never cached.
+    Plots that are not in memory are looked up in the `disk` cache
+    before they are rendered.
+    """
+
+    def __init__(self, max_bytes: int, disk: Optional[PlotDiskCache] = None) -> None:
+        self.max_bytes = max_bytes
+        self.disk = disk
+        self._plots: OrderedDict[Hashable, CachedPlot] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    def get_or_render(self, key: Hashable, render: Callable[[], bytes]) -> CachedPlot:
+        with self._lock:
+            plot = self._plots.get(key)
+            if plot is not None:
+                self._plots.move_to_end(key)
+                return plot
+        png = self.disk.get(key) if self.disk is not None else None
+        if png is None:
+            png = render()
+            if self.disk is not None:
+                self.disk.put(key, png)
+        plot = CachedPlot(png=png, etag=hashlib.sha1(png).hexdigest())
+        self._store(key, plot)
+        return plot
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._plots)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._plots
+
+    def _store(self, key: Hashable, plot: CachedPlot) -> None:
+        if len(plot.png) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._plots.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.png)
+            self._plots[key] = plot
+            self._size += len(plot.png)
+            while self._size > self.max_bytes:
+                _, evicted = self._plots.popitem(last=False)
+                self._size -= len(evicted.png)
+
+
+class PlotDiskCache:
+    """Keep rendered plots as files in `directory` until their total
+    size exceeds `max_bytes`. Then the files that were least recently
+    used are deleted. Several processes may share the directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(size for _, _, size in self._files())
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                png = file.read()
+            # The modification time marks when a plot was used last.
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return png
+
+    def put(self, key: Hashable, png: bytes) -> None:
+        if len(png) > self.max_bytes:
+            return
+        # Other processes only ever see complete files.
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(png)
+        os.replace(temporary_path, self._path(key))
+        with self._lock:
+            self._size += len(png)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._size
+
+    def _evict(self) -> None:
+        # Other processes write to the same directory, so the size is
+        # taken from the files themselves before anything is deleted.
+        files = sorted(self._files())
+        self._size = sum(size for _, _, size in files)
+        for _, path, size in files:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def _files(self) -> List[Tuple[float, str, int]]:
+        files = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".png"):
+                    continue
+                try:
+                    status = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((status.st_mtime, entry.path, status.st_size))
+        return files
+
+    def _path(self, key: Hashable) -> str:
+        name = hashlib.sha256(repr(key).encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.png")
+
+
+def get_plot_cache() -> PlotCache:
+    cache = current_app.extensions.get(EXTENSION_NAME)
+    if cache is None:
+        directory = current_app.config["PLOT_CACHE_DISK_DIRECTORY"]
+        cache = PlotCache(
+            max_bytes=int(current_app.config["PLOT_CACHE_MAX_BYTES"]),
+            disk=(
+                PlotDiskCache(
+                    directory=directory,
+                    max_bytes=int(current_app.config["PLOT_CACHE_DISK_MAX_BYTES"]),
+                )
+                if directory
+                else None
+            ),
+        )
+        current_app.extensions[EXTENSION_NAME] = cache
+    return cache
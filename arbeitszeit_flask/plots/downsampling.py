@@ -0,0 +1,136 @@
+"""Line plots are rendered into images that are only a few hundred
+pixels wide, so drawing every point of a long time series only makes
+rendering slow. The downsamplers in this module pick a subset of the
+points that preserves the shape of the series. They expect the points
+to be ordered by their timestamps.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Protocol, Tuple
+
+import numpy as np
+import numpy.typing as npt
+from flask import current_app
+
+Series = Tuple[List[datetime], List[Decimal]]
+
+
+class Downsampler(Protocol):
+    def downsample(self, x: List[datetime], y: List[Decimal]) -> Series:
+        ...
+
+
+@dataclass
+class MinMaxDownsampling:
+    """Divide the time span of the series into `buckets` intervals of
+    equal length and keep the points with the lowest and the highest
+    value of every interval as well as the first and the last point of
+    the series.
+    """
+
+    buckets: int
+
+    def downsample(self, x: List[datetime], y: List[Decimal]) -> Series:
+        if len(x) <= 2 * self.buckets:
+            return x, y
+        timestamps, values = _to_arrays(x, y)
+        indices = self._select_indices(timestamps, values)
+        return _select(x, y, indices)
+
+    def _select_indices(
+        self, timestamps: npt.NDArray[np.float64], values: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.int64]:
+        count = len(timestamps)
+        buckets = _bucket_numbers(timestamps, self.buckets)
+        order = np.lexsort((values, buckets))
+        sorted_buckets = buckets[order]
+        starts = np.flatnonzero(
+            np.concatenate(([True], sorted_buckets[1:] != sorted_buckets[:-1]))
+        )
+        ends = np.append(starts[1:], count) - 1
+        return np.union1d(
+            np.union1d(order[starts], order[ends]),
+            np.array([0, count - 1], dtype=np.int64),
+        )
+
+
+@dataclass
+class LargestTriangleThreeBuckets:
+    """Keep `threshold` points of the series chosen by the "largest
+    triangle three buckets" algorithm from Sveinn Steinarsson's thesis
+    "Downsampling Time Series for Visual Representation". The first
+    and the last point are always kept.
+    """
+
+    threshold: int
+
+    def downsample(self, x: List[datetime], y: List[Decimal]) -> Series:
+        if self.threshold < 3 or len(x) <= self.threshold:
+            return x, y
+        timestamps, values = _to_arrays(x, y)
+        indices = self._select_indices(timestamps, values)
+        return _select(x, y, indices)
+
+    def _select_indices(
+        self, timestamps: npt.NDArray[np.float64], values: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.int64]:
+        count = len(timestamps)
+        edges = np.linspace(1, count - 1, self.threshold - 1).astype(np.int64)
+        selected = np.empty(self.threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = count - 1
+        previous = 0
+        for bucket in range(self.threshold - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            next_end = edges[bucket + 2] if bucket + 2 < len(edges) else count
+            average_timestamp = timestamps[end:next_end].mean()
+            average_value = values[end:next_end].mean()
+            areas = np.abs(
+                (timestamps[previous] - average_timestamp)
+                * (values[start:end] - values[previous])
+                - (timestamps[previous] - timestamps[start:end])
+                * (average_value - values[previous])
+            )
+            previous = start + int(np.argmax(areas))
+            selected[bucket + 1] = previous
+        return selected
+
+
+def get_downsampler() -> Downsampler:
+    """Return the downsampler configured by PLOT_DOWNSAMPLER. "lttb"
+    keeps the points that preserve the visual shape of the series best,
+    "min_max" keeps the extreme values of every interval. Both reduce
+    the series to about PLOT_DOWNSAMPLER_POINTS points.
+    """
+    config = current_app.config
+    points = int(config["PLOT_DOWNSAMPLER_POINTS"])
+    if config["PLOT_DOWNSAMPLER"] == "min_max":
+        return MinMaxDownsampling(buckets=max(points // 2, 1))
+    return LargestTriangleThreeBuckets(threshold=points)
+
+
+def _to_arrays(
+    x: List[datetime], y: List[Decimal]
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    timestamps = np.array(x, dtype="datetime64[us]").astype(np.int64)
+    return timestamps.astype(np.float64), np.array(y, dtype=np.float64)
+
+
+def _bucket_numbers(
+    timestamps: npt.NDArray[np.float64], buckets: int
+) -> npt.NDArray[np.int64]:
+    offsets = timestamps - timestamps[0]
+    time_span = offsets[-1]
+    if not time_span:
+        return np.zeros(len(timestamps), dtype=np.int64)
+    return np.minimum(offsets * buckets // time_span, buckets - 1).astype(np.int64)
+
+
+def _select(
+    x: List[datetime], y: List[Decimal], indices: npt.NDArray[np.int64]
+) -> Series:
+    return [x[i] for i in indices], [y[i] for i in indices]
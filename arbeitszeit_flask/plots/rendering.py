@@ -0,0 +1,134 @@
+"""Rendering plots with matplotlib is CPU bound and holds the GIL for
+its whole duration. In production the plots are therefore rendered in
+a pool of worker processes so that a slow plot does not stall the other
+requests handled by the same web worker.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import struct
+import zlib
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from threading import BoundedSemaphore
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+from flask import current_app
+
+from arbeitszeit_flask.flask_plotter import FlaskPlotter
+from arbeitszeit_web.plotter import Plotter, PlotterUnavailable
+
+EXTENSION_NAME = "arbeitszeit_plot_renderer"
+
+
+class ProcessPoolPlotter:
+    """Submit plots to `executor` and wait at most `timeout` seconds
+    for them to be rendered. At most `max_pending` plots are rendered
+    or waiting to be rendered at the same time. Further plots are
+    rejected right away. Rejected plots and plots that time out raise
+    PlotterUnavailable.
+    """
+
+    def __init__(self, executor: Executor, max_pending: int, timeout: float) -> None:
+        self.executor = executor
+        self.timeout = timeout
+        self._pending_slots = BoundedSemaphore(max_pending)
+
+    def create_line_plot(
+        self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
+    ) -> bytes:
+        return self._render(_render_line_plot, x, y, fig_size)
+
+    def create_bar_plot(
+        self,
+        x_coordinates: List[Union[int, str]],
+        height_of_bars: List[Decimal],
+        colors_of_bars: List[str],
+        fig_size: Tuple[int, int],
+        y_label: Optional[str],
+    ) -> bytes:
+        return self._render(
+            _render_bar_plot,
+            x_coordinates,
+            height_of_bars,
+            colors_of_bars,
+            fig_size,
+            y_label,
+        )
+
+    def _render(self, function: Callable[..., bytes], *args: Any) -> bytes:
+        if not self._pending_slots.acquire(blocking=False):
+            raise PlotterUnavailable("Too many plots are waiting to be rendered")
+        try:
+            future = self.executor.submit(function, *args)
+        except BaseException:
+            self._pending_slots.release()
+            raise
+        future.add_done_callback(self._release_slot)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise PlotterUnavailable("Rendering the plot timed out")
+
+    def _release_slot(self, future: Future[bytes]) -> None:
+        self._pending_slots.release()
+
+
+def get_plotter() -> Plotter:
+    """Return the plotter configured by PLOT_RENDERER. "process_pool"
+    renders plots in worker processes shared by all requests of the
+    application, "inline" renders them in the thread that handles the
+    request.
+    """
+    config = current_app.config
+    if config["PLOT_RENDERER"] == "inline":
+        return FlaskPlotter()
+    plotter = current_app.extensions.get(EXTENSION_NAME)
+    if plotter is None:
+        plotter = ProcessPoolPlotter(
+            executor=ProcessPoolExecutor(
+                max_workers=int(config["PLOT_RENDERER_PROCESSES"]),
+                mp_context=multiprocessing.get_context("spawn"),
+            ),
+            max_pending=int(config["PLOT_RENDERER_MAX_PENDING"]),
+            timeout=float(config["PLOT_RENDERER_TIMEOUT"]),
+        )
+        current_app.extensions[EXTENSION_NAME] = plotter
+    return plotter
+
+
+@lru_cache(maxsize=None)
+def placeholder_png() -> bytes:
+    """A plain light gray image that is shown in place of plots that
+    could not be rendered.
+    """
+    width, height = 500, 400
+    row = b"\x00" + b"\xee\xee\xee" * width
+    return b"".join(
+        [
+            b"\x89PNG\r\n\x1a\n",
+            _png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)),
+            _png_chunk(b"IDAT", zlib.compress(row * height)),
+            _png_chunk(b"IEND", b""),
+        ]
+    )
+
+
+def _png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    checksum = zlib.crc32(chunk_type + data)
+    return (
+        struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", checksum)
+    )
+
+
+def _render_line_plot(*args: Any) -> bytes:
+    return FlaskPlotter().create_line_plot(*args)
+
+
+def _render_bar_plot(*args: Any) -> bytes:
+    return FlaskPlotter().create_bar_plot(*args)
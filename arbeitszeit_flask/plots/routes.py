@@ -1,16 +1,21 @@
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from typing import Callable, Hashable, Optional, Tuple
 from uuid import UUID
 
-from flask import Blueprint, Response, request
+from flask import Blueprint, Response, abort, current_app, request
+from flask_babel import get_locale
 from flask_login import login_required
 
-from arbeitszeit.use_cases.show_a_account_details import ShowAAccountDetailsUseCase
-from arbeitszeit.use_cases.show_p_account_details import ShowPAccountDetailsUseCase
-from arbeitszeit.use_cases.show_prd_account_details import ShowPRDAccountDetailsUseCase
-from arbeitszeit.use_cases.show_r_account_details import ShowRAccountDetailsUseCase
+from arbeitszeit.records import AccountTypes
+from arbeitszeit.use_cases.show_account_balance_history import (
+    ShowAccountBalanceHistoryUseCase,
+)
 from arbeitszeit_flask.dependency_injection import with_injection
+from arbeitszeit_flask.plots.cache import PlotCache
+from arbeitszeit_flask.plots.downsampling import Downsampler
+from arbeitszeit_flask.plots.rendering import placeholder_png
 from arbeitszeit_web.colors import Colors
-from arbeitszeit_web.plotter import Plotter
+from arbeitszeit_web.plotter import Plotter, PlotterUnavailable
 from arbeitszeit_web.translator import Translator
 
 plots = Blueprint("plots", __name__)
@@ -20,74 +25,90 @@ plots = Blueprint("plots", __name__)
 @with_injection()
 @login_required
 def global_barplot_for_certificates(
-    plotter: Plotter, translator: Translator, colors: Colors
+    plotter: Plotter, translator: Translator, colors: Colors, plot_cache: PlotCache
 ):
-    certificates_count = Decimal(request.args["certificates_count"])
-    available_product = Decimal(request.args["available_product"])
-    png = plotter.create_bar_plot(
-        x_coordinates=[
-            translator.gettext("Work certificates"),
-            translator.gettext("Available product"),
-        ],
-        height_of_bars=[
-            certificates_count,
-            available_product,
-        ],
-        colors_of_bars=[colors.primary, colors.info],
-        fig_size=(5, 4),
-        y_label=translator.gettext("Hours"),
+    certificates_count = _bar_height("certificates_count")
+    available_product = _bar_height("available_product")
+    return _create_bar_plot(
+        plot_cache,
+        parameters=(certificates_count, available_product),
+        render=lambda: plotter.create_bar_plot(
+            x_coordinates=[
+                translator.gettext("Work certificates"),
+                translator.gettext("Available product"),
+            ],
+            height_of_bars=[
+                certificates_count,
+                available_product,
+            ],
+            colors_of_bars=[colors.primary, colors.info],
+            fig_size=(5, 4),
+            y_label=translator.gettext("Hours"),
+        ),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/global_barplot_for_means_of_production")
 @with_injection()
 @login_required
 def global_barplot_for_means_of_production(
-    plotter: Plotter, translator: Translator, colors: Colors
+    plotter: Plotter, translator: Translator, colors: Colors, plot_cache: PlotCache
 ):
-    planned_means = Decimal(request.args["planned_means"])
-    planned_resources = Decimal(request.args["planned_resources"])
-    planned_work = Decimal(request.args["planned_work"])
-    png = plotter.create_bar_plot(
-        x_coordinates=[
-            translator.pgettext("Text should be short", "Fixed means"),
-            translator.pgettext("Text should be short", "Liquid means"),
-            translator.gettext("Work"),
-        ],
-        height_of_bars=[
-            planned_means,
-            planned_resources,
-            planned_work,
-        ],
-        colors_of_bars=[
-            colors.primary,
-            colors.info,
-            colors.danger,
-        ],
-        fig_size=(5, 4),
-        y_label=translator.gettext("Hours"),
+    planned_means = _bar_height("planned_means")
+    planned_resources = _bar_height("planned_resources")
+    planned_work = _bar_height("planned_work")
+    return _create_bar_plot(
+        plot_cache,
+        parameters=(planned_means, planned_resources, planned_work),
+        render=lambda: plotter.create_bar_plot(
+            x_coordinates=[
+                translator.pgettext("Text should be short", "Fixed means"),
+                translator.pgettext("Text should be short", "Liquid means"),
+                translator.gettext("Work"),
+            ],
+            height_of_bars=[
+                planned_means,
+                planned_resources,
+                planned_work,
+            ],
+            colors_of_bars=[
+                colors.primary,
+                colors.info,
+                colors.danger,
+            ],
+            fig_size=(5, 4),
+            y_label=translator.gettext("Hours"),
+        ),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/global_barplot_for_plans")
 @with_injection()
 @login_required
-def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: Colors):
-    productive_plans = Decimal(request.args["productive_plans"])
-    public_plans = Decimal(request.args["public_plans"])
-    png = plotter.create_bar_plot(
-        x_coordinates=[
-            translator.gettext("Productive plans"),
-            translator.gettext("Public plans"),
-        ],
-        height_of_bars=[productive_plans, public_plans],
-        colors_of_bars=list(colors.get_all_defined_colors().values()),
-        fig_size=(5, 4),
-        y_label=translator.gettext("Amount"),
+def global_barplot_for_plans(
+    plotter: Plotter, translator: Translator, colors: Colors, plot_cache: PlotCache
+):
+    productive_plans = _bar_height("productive_plans")
+    public_plans = _bar_height("public_plans")
+    return _create_bar_plot(
+        plot_cache,
+        parameters=(productive_plans, public_plans),
+        render=lambda: plotter.create_bar_plot(
+            x_coordinates=[
+                translator.gettext("Productive plans"),
+                translator.gettext("Public plans"),
+            ],
+            height_of_bars=[productive_plans, public_plans],
+            colors_of_bars=list(colors.get_all_defined_colors().values()),
+            fig_size=(5, 4),
+            y_label=translator.gettext("Amount"),
+        ),
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+
+
+MAX_POINTS_FETCHED_FOR_LINE_PLOT = 20000
+"""Account balance histories are reduced to at most this many points by
+the database before they are downsampled for plotting."""
 
 
 @plots.route("/plots/line_plot_of_company_prd_account")
@@ -95,15 +116,13 @@ def global_barplot_for_plans(plotter: Plotter, translator: Translator, colors: C
 @login_required
 def line_plot_of_company_prd_account(
     plotter: Plotter,
-    use_case: ShowPRDAccountDetailsUseCase,
+    use_case: ShowAccountBalanceHistoryUseCase,
+    plot_cache: PlotCache,
+    downsampler: Downsampler,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _create_balance_history_plot(
+        plotter, use_case, plot_cache, downsampler, AccountTypes.prd
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_r_account")
@@ -111,15 +130,13 @@ def line_plot_of_company_prd_account(
 @login_required
 def line_plot_of_company_r_account(
     plotter: Plotter,
-    use_case: ShowRAccountDetailsUseCase,
+    use_case: ShowAccountBalanceHistoryUseCase,
+    plot_cache: PlotCache,
+    downsampler: Downsampler,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _create_balance_history_plot(
+        plotter, use_case, plot_cache, downsampler, AccountTypes.r
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_p_account")
@@ -127,15 +144,13 @@ def line_plot_of_company_r_account(
 @login_required
 def line_plot_of_company_p_account(
     plotter: Plotter,
-    use_case: ShowPAccountDetailsUseCase,
+    use_case: ShowAccountBalanceHistoryUseCase,
+    plot_cache: PlotCache,
+    downsampler: Downsampler,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _create_balance_history_plot(
+        plotter, use_case, plot_cache, downsampler, AccountTypes.p
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
 
 
 @plots.route("/plots/line_plot_of_company_a_account")
@@ -143,12 +158,100 @@ def line_plot_of_company_p_account(
 @login_required
 def line_plot_of_company_a_account(
     plotter: Plotter,
-    use_case: ShowAAccountDetailsUseCase,
+    use_case: ShowAccountBalanceHistoryUseCase,
+    plot_cache: PlotCache,
+    downsampler: Downsampler,
 ):
-    company_id = UUID(request.args["company_id"])
-    use_case_response = use_case(company_id)
-    png = plotter.create_line_plot(
-        x=use_case_response.plot.timestamps,
-        y=use_case_response.plot.accumulated_volumes,
+    return _create_balance_history_plot(
+        plotter, use_case, plot_cache, downsampler, AccountTypes.a
+    )
+
+
+def _create_balance_history_plot(
+    plotter: Plotter,
+    use_case: ShowAccountBalanceHistoryUseCase,
+    plot_cache: PlotCache,
+    downsampler: Downsampler,
+    account_type: AccountTypes,
+) -> Response:
+    use_case_request = ShowAccountBalanceHistoryUseCase.Request(
+        company=UUID(request.args["company_id"]),
+        account_type=account_type,
+        max_points=MAX_POINTS_FETCHED_FOR_LINE_PLOT,
+    )
+
+    def render() -> bytes:
+        use_case_response = use_case.show_balance_history(use_case_request)
+        x, y = downsampler.downsample(
+            use_case_response.timestamps, use_case_response.balances
+        )
+        return plotter.create_line_plot(x=x, y=y)
+
+    return _create_png_response(
+        plot_cache,
+        key=(request.endpoint, use_case.get_revision(use_case_request)),
+        render=render,
+        max_age=None,
     )
-    return Response(png, mimetype="image/png", direct_passthrough=True)
+
+
+BAR_HEIGHT_PRECISION = Decimal("0.01")
+"""Bar heights are rounded to this precision, which is finer than a bar
+plot can show."""
+
+
+def _bar_height(parameter: str) -> Decimal:
+    """Requests for bar plots whose heights only differ in notation or
+    in digits that the plot cannot show get the same cache key. Numbers
+    that cannot be plotted are rejected.
+    """
+    try:
+        height = Decimal(request.args[parameter]).quantize(BAR_HEIGHT_PRECISION)
+    except InvalidOperation:
+        abort(400)
+    if not height.is_finite():
+        abort(400)
+    return height
+
+
+def _create_bar_plot(
+    plot_cache: PlotCache,
+    parameters: Tuple[Decimal, ...],
+    render: Callable[[], bytes],
+) -> Response:
+    """Bar plots are completely determined by the parameters passed in
+    the query string and the language of their labels.
+    """
+    return _create_png_response(
+        plot_cache,
+        key=(request.endpoint, str(get_locale()), parameters),
+        render=render,
+        max_age=int(current_app.config["PLOT_CACHE_MAX_AGE"]),
+    )
+
+
+def _create_png_response(
+    plot_cache: PlotCache,
+    key: Hashable,
+    render: Callable[[], bytes],
+    max_age: Optional[int],
+) -> Response:
+    """Browsers may reuse the plot for `max_age` seconds or have to
+    revalidate it every time if `max_age` is None. A placeholder is
+    sent if the plot cannot be rendered right now.
+    """
+    try:
+        plot = plot_cache.get_or_render(key, render)
+    except PlotterUnavailable:
+        response = Response(placeholder_png(), mimetype="image/png")
+        response.cache_control.no_store = True
+        return response
+    response = Response(plot.png, mimetype="image/png")
+    response.set_etag(plot.etag)
+    response.cache_control.private = True
+    if max_age is None:
+        response.cache_control.no_cache = True
+    else:
+        response.cache_control.max_age = max_age
+    response.make_conditional(request)
+    return response
@@ -4,10 +4,10 @@ from typing import Optional
 from flask import current_app
 from itsdangerous import BadSignature, URLSafeTimedSerializer
 
-from arbeitszeit.injector import singleton
+from arbeitszeit.injector import request_scoped
 
 
-@singleton
+@request_scoped
 class FlaskTokenService:
     def __init__(self) -> None:
         self.serializer = URLSafeTimedSerializer(current_app.config["SECRET_KEY"])
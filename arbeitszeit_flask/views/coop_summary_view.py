@@ -19,7 +19,7 @@ class CoopSummaryView:
 
     def GET(self, coop_id: UUID) -> Response:
         use_case_response = self.get_coop_summary(
-            GetCoopSummaryRequest(UUID(current_user.id), coop_id)
+            GetCoopSummaryRequest(current_user.id, coop_id)
         )
         if use_case_response:
             view_model = self.presenter.present(use_case_response)
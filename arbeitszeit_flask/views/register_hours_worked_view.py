@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from uuid import UUID
 
 from flask import Response, render_template
 from flask_login import current_user
@@ -39,9 +38,7 @@ class RegisterHoursWorkedView:
             return self.create_response(status=status_code)
 
     def create_response(self, status: int) -> Response:
-        workers_list = self.list_workers(
-            ListWorkersRequest(company=UUID(current_user.id))
-        )
+        workers_list = self.list_workers(ListWorkersRequest(company=current_user.id))
         return Response(
             render_template(
                 "company/register_hours_worked.html",
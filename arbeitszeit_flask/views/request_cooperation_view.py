@@ -1,5 +1,4 @@
 from dataclasses import dataclass
-from uuid import UUID
 
 from flask import Response, render_template, request
 from flask_login import current_user
@@ -69,6 +68,6 @@ class RequestCooperationView:
         )
 
     def _get_list_plans_view_model(self):
-        plans_list_response = self.list_plans(UUID(current_user.id))
+        plans_list_response = self.list_plans(current_user.id)
         list_plans_view_model = self.list_plans_presenter.present(plans_list_response)
         return list_plans_view_model
@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional
+
+from arbeitszeit.datetime_service import DatetimeService
+from arbeitszeit.use_cases.get_payout_factor_history import (
+    GetPayoutFactorHistoryUseCase,
+)
+from arbeitszeit_web.api.controllers import query_parser
+from arbeitszeit_web.api.controllers.expected_input import ExpectedInput, InputLocation
+from arbeitszeit_web.api.response_errors import BadRequest
+from arbeitszeit_web.request import Request
+
+DEFAULT_DAYS: int = 30
+MAX_DAYS: int = 3660
+
+
+@dataclass
+class GetPayoutFactorHistoryApiController:
+    @classmethod
+    def create_expected_inputs(cls) -> List[ExpectedInput]:
+        return [
+            ExpectedInput(
+                name="first_day",
+                type=str,
+                description=(
+                    "The first day of the period in the format YYYY-MM-DD. "
+                    f"Defaults to {DEFAULT_DAYS - 1} days before the last day."
+                ),
+                default=None,
+                location=InputLocation.query,
+            ),
+            ExpectedInput(
+                name="last_day",
+                type=str,
+                description=(
+                    "The last day of the period in the format YYYY-MM-DD. "
+                    "Defaults to today."
+                ),
+                default=None,
+                location=InputLocation.query,
+            ),
+        ]
+
+    request: Request
+    datetime_service: DatetimeService
+
+    def create_request(self) -> GetPayoutFactorHistoryUseCase.Request:
+        last_day = self._parse_day("last_day") or self.datetime_service.today()
+        first_day = self._parse_day("first_day") or last_day - timedelta(
+            days=DEFAULT_DAYS - 1
+        )
+        if first_day > last_day:
+            raise BadRequest("The first day must not be after the last day.")
+        if (last_day - first_day).days >= MAX_DAYS:
+            raise BadRequest(f"The period must not be longer than {MAX_DAYS} days.")
+        return GetPayoutFactorHistoryUseCase.Request(
+            first_day=first_day, last_day=last_day
+        )
+
+    def _parse_day(self, name: str) -> Optional[date]:
+        day_string = self.request.query_string().get(name)
+        if not day_string:
+            return None
+        return query_parser.string_to_date(day_string)
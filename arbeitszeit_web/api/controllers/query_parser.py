@@ -1,3 +1,5 @@
+from datetime import date
+
 from arbeitszeit_web.api.response_errors import BadRequest
 
 
@@ -10,3 +12,12 @@ def string_to_non_negative_integer(string: str) -> int:
         if integer < 0:
             raise BadRequest(f"Input must be greater or equal zero, not {string}.")
     return integer
+
+
+def string_to_date(string: str) -> date:
+    try:
+        return date.fromisoformat(string)
+    except ValueError:
+        raise BadRequest(
+            f"Input must be a date in the format YYYY-MM-DD, not {string}."
+        )
@@ -1,13 +1,20 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from arbeitszeit.use_cases.query_plans import PlanFilter, PlanSorting, QueryPlansRequest
 from arbeitszeit_web.api.controllers import query_parser
 from arbeitszeit_web.api.controllers.expected_input import ExpectedInput, InputLocation
+from arbeitszeit_web.api.response_errors import BadRequest
 from arbeitszeit_web.request import Request
 
 DEFAULT_OFFSET: int = 0
 DEFAULT_LIMIT: int = 30
+DEFAULT_SORT: str = "activation"
+SORTINGS = {
+    "activation": PlanSorting.by_activation,
+    "company_name": PlanSorting.by_company_name,
+    "relevance": PlanSorting.by_relevance,
+}
 
 
 @dataclass
@@ -29,6 +36,26 @@ class QueryPlansApiController:
                 default=DEFAULT_LIMIT,
                 location=InputLocation.query,
             ),
+            ExpectedInput(
+                name="query",
+                type=str,
+                description=(
+                    "Only list plans whose product name or description "
+                    "contains every word of the query."
+                ),
+                default=None,
+                location=InputLocation.query,
+            ),
+            ExpectedInput(
+                name="sort",
+                type=str,
+                description=(
+                    "Sort the plans by activation, company_name or relevance "
+                    "to the query."
+                ),
+                default=DEFAULT_SORT,
+                location=InputLocation.query,
+            ),
         ]
 
     request: Request
@@ -36,14 +63,32 @@ class QueryPlansApiController:
     def create_request(self) -> QueryPlansRequest:
         offset = self._parse_offset(self.request)
         limit = self._parse_limit(self.request)
+        query = self._parse_query(self.request)
         return QueryPlansRequest(
-            query_string=None,
-            filter_category=PlanFilter.by_plan_id,
-            sorting_category=PlanSorting.by_activation,
+            query_string=query,
+            filter_category=(
+                PlanFilter.by_plan_id if query is None else PlanFilter.by_product_name
+            ),
+            sorting_category=self._parse_sorting(self.request),
             offset=offset,
             limit=limit,
         )
 
+    def _parse_query(self, request: Request) -> Optional[str]:
+        query_string = request.query_string().get("query")
+        if not query_string or not query_string.strip():
+            return None
+        return query_string.strip()
+
+    def _parse_sorting(self, request: Request) -> PlanSorting:
+        sort_string = request.query_string().get("sort") or DEFAULT_SORT
+        sorting = SORTINGS.get(sort_string)
+        if sorting is None:
+            raise BadRequest(
+                f"Sort must be one of {', '.join(SORTINGS)}, not {sort_string}."
+            )
+        return sorting
+
     def _parse_offset(self, request: Request) -> int:
         offset_string = request.query_string().get("offset")
         if not offset_string:
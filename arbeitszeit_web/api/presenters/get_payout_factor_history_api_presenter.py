@@ -0,0 +1,42 @@
+from dataclasses import dataclass
+from typing import List
+
+from arbeitszeit.use_cases.get_payout_factor_history import (
+    GetPayoutFactorHistoryUseCase,
+)
+from arbeitszeit_web.api.presenters.interfaces import (
+    JsonDatetime,
+    JsonDecimal,
+    JsonObject,
+    JsonValue,
+)
+
+
+class GetPayoutFactorHistoryApiPresenter:
+    @dataclass
+    class ViewModel:
+        days: List[GetPayoutFactorHistoryUseCase.DailyPayoutFactor]
+
+    @classmethod
+    def get_schema(cls) -> JsonValue:
+        return JsonObject(
+            members=dict(
+                days=JsonObject(
+                    members=dict(
+                        timestamp=JsonDatetime(),
+                        payout_factor=JsonDecimal(),
+                        planned_labour=JsonDecimal(),
+                        planned_means=JsonDecimal(),
+                        planned_resources=JsonDecimal(),
+                    ),
+                    name="DailyPayoutFactor",
+                    as_list=True,
+                ),
+            ),
+            name="PayoutFactorHistory",
+        )
+
+    def create_view_model(
+        self, use_case_response: GetPayoutFactorHistoryUseCase.Response
+    ) -> ViewModel:
+        return self.ViewModel(days=use_case_response.days)
@@ -1,12 +1,22 @@
 from dataclasses import dataclass
-from typing import Dict, List
+from datetime import datetime
+from typing import Dict, List, Optional
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
+from uuid import UUID
+
+from arbeitszeit.transactions import StatementCursor
 
 PAGE_PARAMETER_NAME = "page"
 """The name of the request query parameter used for pagination."""
 
+CURSOR_PARAMETER_NAME = "after"
+"""The name of the request query parameter used for cursor based
+pagination of account statements."""
+
 DEFAULT_PAGE_SIZE = 15
 
+STATEMENT_PAGE_SIZE = 50
+
 
 @dataclass
 class PageLink:
@@ -60,3 +70,24 @@ class Paginator:
     @property
     def page_count(self) -> int:
         return 1 + (self.total_results - 1) // self.page_size
+
+
+def serialize_statement_cursor(cursor: StatementCursor) -> str:
+    return f"{cursor.date.isoformat()}_{cursor.transaction}"
+
+
+def deserialize_statement_cursor(value: str) -> Optional[StatementCursor]:
+    date, _, transaction = value.rpartition("_")
+    try:
+        return StatementCursor(
+            date=datetime.fromisoformat(date), transaction=UUID(transaction)
+        )
+    except ValueError:
+        return None
+
+
+def get_url_with_statement_cursor(url: str, cursor: StatementCursor) -> str:
+    parsed_url = urlparse(url)
+    query = {key: values[0] for key, values in parse_qs(parsed_url.query).items()}
+    query[CURSOR_PARAMETER_NAME] = serialize_statement_cursor(cursor)
+    return urlunparse(parsed_url._replace(query=urlencode(query)))
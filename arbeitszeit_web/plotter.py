@@ -3,6 +3,12 @@ from decimal import Decimal
 from typing import List, Optional, Protocol, Tuple, Union
 
 
+class PlotterUnavailable(Exception):
+    """Raised by plotters that cannot render a plot right now, e.g.
+    because too many plots are waiting to be rendered.
+    """
+
+
 class Plotter(Protocol):
     def create_line_plot(
         self, x: List[datetime], y: List[Decimal], fig_size: Tuple[int, int] = (10, 5)
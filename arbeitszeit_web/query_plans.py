@@ -79,6 +79,8 @@ class QueryPlansController:
         sorting = form.get_radio_string()
         if sorting == "company_name":
             sorting_category = PlanSorting.by_company_name
+        elif sorting == "relevance":
+            sorting_category = PlanSorting.by_relevance
         else:
             sorting_category = PlanSorting.by_activation
         return sorting_category
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from arbeitszeit.transactions import StatementCursor
+from arbeitszeit_web.pagination import (
+    CURSOR_PARAMETER_NAME,
+    STATEMENT_PAGE_SIZE,
+    deserialize_statement_cursor,
+)
+from arbeitszeit_web.request import Request
+
+
+@dataclass
+class StatementOfAccountController:
+    request: Request
+
+    def get_page_size(self) -> int:
+        return STATEMENT_PAGE_SIZE
+
+    def get_cursor(self) -> Optional[StatementCursor]:
+        value = self.request.query_string().get(CURSOR_PARAMETER_NAME)
+        if value is None:
+            return None
+        return deserialize_statement_cursor(value)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import List
+from typing import List, Optional
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.records import AccountTypes
@@ -9,6 +9,8 @@ from arbeitszeit.use_cases.get_company_transactions import (
     GetCompanyTransactionsResponse,
     TransactionInfo,
 )
+from arbeitszeit_web.pagination import get_url_with_statement_cursor
+from arbeitszeit_web.request import Request
 from arbeitszeit_web.translator import Translator
 
 
@@ -24,12 +26,14 @@ class ViewModelTransactionInfo:
 @dataclass
 class GetCompanyTransactionsViewModel:
     transactions: List[ViewModelTransactionInfo]
+    next_page_url: Optional[str]
 
 
 @dataclass
 class GetCompanyTransactionsPresenter:
     translator: Translator
     datetime_service: DatetimeService
+    request: Request
 
     def present(
         self, use_case_response: GetCompanyTransactionsResponse
@@ -38,8 +42,16 @@ class GetCompanyTransactionsPresenter:
             self._create_info(transaction)
             for transaction in use_case_response.transactions
         ]
-
-        return GetCompanyTransactionsViewModel(transactions=transactions)
+        next_page_url = (
+            get_url_with_statement_cursor(
+                self.request.get_request_target(), use_case_response.next_cursor
+            )
+            if use_case_response.next_cursor
+            else None
+        )
+        return GetCompanyTransactionsViewModel(
+            transactions=transactions, next_page_url=next_page_url
+        )
 
     def _create_info(self, transaction: TransactionInfo) -> ViewModelTransactionInfo:
         account = self._get_account(transaction.account_type)
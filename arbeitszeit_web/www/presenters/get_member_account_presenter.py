@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.transactions import TransactionTypes
 from arbeitszeit.use_cases.get_member_account import GetMemberAccountResponse
+from arbeitszeit_web.pagination import get_url_with_statement_cursor
+from arbeitszeit_web.request import Request
 from arbeitszeit_web.translator import Translator
 
 
@@ -25,9 +27,11 @@ class GetMemberAccountPresenter:
         balance: str
         is_balance_positive: bool
         transactions: List[GetMemberAccountPresenter.Transaction]
+        next_page_url: Optional[str]
 
     datetime_service: DatetimeService
     translator: Translator
+    request: Request
 
     def present_member_account(
         self, use_case_response: GetMemberAccountResponse
@@ -51,4 +55,9 @@ class GetMemberAccountPresenter:
             balance=f"{round(use_case_response.balance, 2)}",
             is_balance_positive=use_case_response.balance >= 0,
             transactions=transactions,
+            next_page_url=get_url_with_statement_cursor(
+                self.request.get_request_target(), use_case_response.next_cursor
+            )
+            if use_case_response.next_cursor
+            else None,
         )
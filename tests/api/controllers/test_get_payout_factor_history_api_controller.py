@@ -0,0 +1,69 @@
+from datetime import date, datetime
+
+from arbeitszeit_web.api.controllers.expected_input import InputLocation
+from arbeitszeit_web.api.controllers.get_payout_factor_history_api_controller import (
+    GetPayoutFactorHistoryApiController,
+)
+from arbeitszeit_web.api.response_errors import BadRequest
+from tests.request import FakeRequest
+from tests.www.base_test_case import BaseTestCase
+
+
+class ControllerTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller = self.injector.get(GetPayoutFactorHistoryApiController)
+        self.request = self.injector.get(FakeRequest)
+        self.datetime_service.freeze_time(datetime(2023, 5, 31, 12))
+
+    def test_that_by_default_period_ends_today(self) -> None:
+        use_case_request = self.controller.create_request()
+        assert use_case_request.last_day == date(2023, 5, 31)
+
+    def test_that_by_default_period_spans_30_days(self) -> None:
+        use_case_request = self.controller.create_request()
+        assert use_case_request.first_day == date(2023, 5, 2)
+
+    def test_that_requested_days_are_used(self) -> None:
+        self.request.set_arg("first_day", "2023-01-01")
+        self.request.set_arg("last_day", "2023-02-01")
+        use_case_request = self.controller.create_request()
+        assert use_case_request.first_day == date(2023, 1, 1)
+        assert use_case_request.last_day == date(2023, 2, 1)
+
+    def test_that_default_first_day_is_relative_to_requested_last_day(self) -> None:
+        self.request.set_arg("last_day", "2023-01-30")
+        use_case_request = self.controller.create_request()
+        assert use_case_request.first_day == date(2023, 1, 1)
+
+    def test_that_malformed_day_raises_bad_request(self) -> None:
+        self.request.set_arg("first_day", "yesterday")
+        with self.assertRaises(BadRequest) as err:
+            self.controller.create_request()
+        assert err.exception.message == (
+            "Input must be a date in the format YYYY-MM-DD, not yesterday."
+        )
+
+    def test_that_first_day_after_last_day_raises_bad_request(self) -> None:
+        self.request.set_arg("first_day", "2023-02-02")
+        self.request.set_arg("last_day", "2023-02-01")
+        with self.assertRaises(BadRequest):
+            self.controller.create_request()
+
+    def test_that_too_long_period_raises_bad_request(self) -> None:
+        self.request.set_arg("first_day", "1990-01-01")
+        self.request.set_arg("last_day", "2023-02-01")
+        with self.assertRaises(BadRequest):
+            self.controller.create_request()
+
+
+class ExpectedInputsTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.inputs = GetPayoutFactorHistoryApiController.create_expected_inputs()
+
+    def test_that_first_and_last_day_are_expected_in_query(self) -> None:
+        assert [(input.name, input.location) for input in self.inputs] == [
+            ("first_day", InputLocation.query),
+            ("last_day", InputLocation.query),
+        ]
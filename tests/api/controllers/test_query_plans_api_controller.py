@@ -103,6 +103,40 @@ class ControllerTests(BaseTestCase):
             err.exception.message, f"Input must be greater or equal zero, not {input}."
         )
 
+    def test_query_gets_returned_without_surrounding_whitespace(self):
+        self.request.set_arg(arg="query", value=" apple juice ")
+        use_case_request = self.controller.create_request()
+        self.assertEqual(use_case_request.query_string, "apple juice")
+
+    def test_that_request_with_query_filters_by_product_name(self):
+        self.request.set_arg(arg="query", value="apple")
+        use_case_request = self.controller.create_request()
+        self.assertEqual(use_case_request.filter_category, PlanFilter.by_product_name)
+
+    def test_that_blank_query_results_in_request_without_query_string(self):
+        self.request.set_arg(arg="query", value="  ")
+        use_case_request = self.controller.create_request()
+        self.assertIsNone(use_case_request.query_string)
+
+    def test_that_sorting_by_company_name_can_be_requested(self):
+        self.request.set_arg(arg="sort", value="company_name")
+        use_case_request = self.controller.create_request()
+        self.assertEqual(use_case_request.sorting_category, PlanSorting.by_company_name)
+
+    def test_that_sorting_by_relevance_can_be_requested(self):
+        self.request.set_arg(arg="sort", value="relevance")
+        use_case_request = self.controller.create_request()
+        self.assertEqual(use_case_request.sorting_category, PlanSorting.by_relevance)
+
+    def test_controller_raises_bad_request_if_sorting_is_unknown(self):
+        self.request.set_arg(arg="sort", value="price")
+        with self.assertRaises(BadRequest) as err:
+            self.controller.create_request()
+        self.assertEqual(
+            err.exception.message,
+            "Sort must be one of activation, company_name, relevance, not price.",
+        )
+
 
 class ExpectedInputsTests(BaseTestCase):
     def setUp(self) -> None:
@@ -110,8 +144,8 @@ class ExpectedInputsTests(BaseTestCase):
         self.controller = self.injector.get(QueryPlansApiController)
         self.inputs = self.controller.create_expected_inputs()
 
-    def test_controller_has_two_expected_inputs(self):
-        self.assertEqual(len(self.inputs), 2)
+    def test_controller_has_four_expected_inputs(self):
+        self.assertEqual(len(self.inputs), 4)
 
     def test_first_expected_input_is_offset(self):
         input = self.inputs[0]
@@ -138,3 +172,19 @@ class ExpectedInputsTests(BaseTestCase):
         self.assertEqual(input.default, 30)
         self.assertEqual(input.location, InputLocation.query)
         self.assertEqual(input.required, False)
+
+    def test_third_expected_input_is_query(self):
+        input = self.inputs[2]
+        self.assertEqual(input.name, "query")
+        self.assertEqual(input.type, str)
+        self.assertEqual(input.default, None)
+        self.assertEqual(input.location, InputLocation.query)
+        self.assertEqual(input.required, False)
+
+    def test_fourth_expected_input_is_sort_with_activation_as_default(self):
+        input = self.inputs[3]
+        self.assertEqual(input.name, "sort")
+        self.assertEqual(input.type, str)
+        self.assertEqual(input.default, "activation")
+        self.assertEqual(input.location, InputLocation.query)
+        self.assertEqual(input.required, False)
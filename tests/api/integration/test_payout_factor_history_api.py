@@ -0,0 +1,43 @@
+from tests.api.integration.base_test_case import ApiTestCase
+
+
+class UnauthenticatedUserTests(ApiTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = self.url_prefix + "/statistics/payout_factor_history"
+
+    def test_unauthenticated_user_gets_401(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 401)
+
+
+class AuthenticatedMemberTests(ApiTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.url = self.url_prefix + "/statistics/payout_factor_history"
+        self.login_member()
+
+    def test_authenticated_member_gets_200(self) -> None:
+        response = self.client.get(self.url)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.status_code, 200)
+
+    def test_one_day_is_returned_for_every_day_of_requested_period(self) -> None:
+        response = self.client.get(
+            self.url + "?first_day=2023-01-01&last_day=2023-01-03"
+        )
+        self.assertEqual(response.status_code, 200)
+        assert response.json
+        self.assertEqual(len(response.json["days"]), 3)
+
+    def test_payout_factor_is_returned_for_each_day(self) -> None:
+        response = self.client.get(
+            self.url + "?first_day=2023-01-01&last_day=2023-01-01"
+        )
+        assert response.json
+        (day,) = response.json["days"]
+        self.assertEqual(day["payout_factor"], "1")
+
+    def test_malformed_day_gets_400(self) -> None:
+        response = self.client.get(self.url + "?first_day=abc")
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,76 @@
+from datetime import datetime
+from decimal import Decimal
+
+from arbeitszeit.use_cases.get_payout_factor_history import (
+    GetPayoutFactorHistoryUseCase,
+)
+from arbeitszeit_web.api.presenters.get_payout_factor_history_api_presenter import (
+    GetPayoutFactorHistoryApiPresenter,
+)
+from arbeitszeit_web.api.presenters.interfaces import (
+    JsonDatetime,
+    JsonDecimal,
+    JsonObject,
+)
+from tests.api.presenters.base_test_case import BaseTestCase
+
+
+class TestViewModelCreation(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.presenter = self.injector.get(GetPayoutFactorHistoryApiPresenter)
+
+    def test_view_model_has_no_days_if_use_case_response_has_none(self) -> None:
+        view_model = self.presenter.create_view_model(
+            GetPayoutFactorHistoryUseCase.Response(days=[])
+        )
+        assert view_model.days == []
+
+    def test_view_model_shows_days_of_use_case_response(self) -> None:
+        day = GetPayoutFactorHistoryUseCase.DailyPayoutFactor(
+            timestamp=datetime(2023, 5, 1),
+            payout_factor=Decimal("0.5"),
+            planned_labour=Decimal(1),
+            planned_means=Decimal(2),
+            planned_resources=Decimal(3),
+        )
+        view_model = self.presenter.create_view_model(
+            GetPayoutFactorHistoryUseCase.Response(days=[day])
+        )
+        assert view_model.days == [day]
+
+
+class TestSchema(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.presenter = GetPayoutFactorHistoryApiPresenter()
+
+    def test_schema_top_level(self) -> None:
+        schema = self.presenter.get_schema()
+        assert isinstance(schema, JsonObject)
+        assert not schema.as_list
+        assert schema.name == "PayoutFactorHistory"
+
+    def test_days_are_list_of_daily_payout_factors(self) -> None:
+        schema = self.presenter.get_schema()
+        assert isinstance(schema, JsonObject)
+        days_schema = schema.members["days"]
+        assert isinstance(days_schema, JsonObject)
+        assert days_schema.as_list
+        assert days_schema.name == "DailyPayoutFactor"
+
+    def test_days_have_correct_field_types(self) -> None:
+        schema = self.presenter.get_schema()
+        assert isinstance(schema, JsonObject)
+        days_schema = schema.members["days"]
+        assert isinstance(days_schema, JsonObject)
+        field_expectations = [
+            ("timestamp", JsonDatetime),
+            ("payout_factor", JsonDecimal),
+            ("planned_labour", JsonDecimal),
+            ("planned_means", JsonDecimal),
+            ("planned_resources", JsonDecimal),
+        ]
+        assert len(days_schema.members) == len(field_expectations)
+        for field_name, expected_type in field_expectations:
+            assert isinstance(days_schema.members[field_name], expected_type)
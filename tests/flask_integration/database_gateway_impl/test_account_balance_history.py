@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
+from tests.data_generators import TransactionGenerator
+
+from ..flask import FlaskTestCase
+
+
+class AccountBalanceHistoryTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.account = self.database_gateway.create_account().id
+
+    def test_that_history_of_account_without_transactions_is_empty(self) -> None:
+        assert not self.database_gateway.get_account_balance_history(self.account)
+
+    def test_that_incoming_and_outgoing_transactions_are_accumulated(self) -> None:
+        self.receive(Decimal(5), date=datetime(2000, 1, 1))
+        self.send(Decimal(2), date=datetime(2000, 1, 2))
+        self.receive(Decimal("1.5"), date=datetime(2000, 1, 3))
+        assert self.database_gateway.get_account_balance_history(self.account) == [
+            (datetime(2000, 1, 1), Decimal(5)),
+            (datetime(2000, 1, 2), Decimal(3)),
+            (datetime(2000, 1, 3), Decimal("4.5")),
+        ]
+
+    def test_that_history_is_ordered_by_transaction_date(self) -> None:
+        self.receive(Decimal(1), date=datetime(2000, 1, 3))
+        self.receive(Decimal(2), date=datetime(2000, 1, 1))
+        history = self.database_gateway.get_account_balance_history(self.account)
+        assert [timestamp for timestamp, _ in history] == [
+            datetime(2000, 1, 1),
+            datetime(2000, 1, 3),
+        ]
+        assert history[-1][1] == Decimal(3)
+
+    def test_that_transactions_of_other_accounts_are_ignored(self) -> None:
+        self.transaction_generator.create_transaction(date=datetime(2000, 1, 1))
+        self.receive(Decimal(1), date=datetime(2000, 1, 2))
+        assert self.database_gateway.get_account_balance_history(self.account) == [
+            (datetime(2000, 1, 2), Decimal(1)),
+        ]
+
+    def test_that_last_point_equals_account_balance(self) -> None:
+        self.receive(Decimal(5), date=datetime(2000, 1, 1))
+        self.send(Decimal(7), date=datetime(2000, 1, 2))
+        _, balance = (
+            self.database_gateway.get_accounts()
+            .with_id(self.account)
+            .joined_with_balance()
+            .first()  # type: ignore
+        )
+        history = self.database_gateway.get_account_balance_history(self.account)
+        assert history[-1][1] == balance
+
+    def test_that_history_is_downsampled_to_max_points(self) -> None:
+        for day in range(10):
+            self.receive(Decimal(1), date=datetime(2000, 1, 1) + timedelta(days=day))
+        history = self.database_gateway.get_account_balance_history(
+            self.account, max_points=3
+        )
+        assert len(history) == 3
+
+    def test_that_downsampled_history_keeps_last_point_of_each_interval(self) -> None:
+        for day in range(10):
+            self.receive(Decimal(1), date=datetime(2000, 1, 1) + timedelta(days=day))
+        history = self.database_gateway.get_account_balance_history(
+            self.account, max_points=3
+        )
+        assert history == [
+            (datetime(2000, 1, 3), Decimal(3)),
+            (datetime(2000, 1, 6), Decimal(6)),
+            (datetime(2000, 1, 10), Decimal(10)),
+        ]
+
+    def test_that_transactions_at_the_same_time_are_downsampled_to_one_point(
+        self,
+    ) -> None:
+        for _ in range(3):
+            self.receive(Decimal(1), date=datetime(2000, 1, 1))
+        assert self.database_gateway.get_account_balance_history(
+            self.account, max_points=10
+        ) == [(datetime(2000, 1, 1), Decimal(3))]
+
+    def test_that_short_history_is_not_changed_by_downsampling(self) -> None:
+        self.receive(Decimal(5), date=datetime(2000, 1, 1))
+        self.send(Decimal(2), date=datetime(2000, 1, 2))
+        assert self.database_gateway.get_account_balance_history(
+            self.account, max_points=10
+        ) == self.database_gateway.get_account_balance_history(self.account)
+
+    def receive(self, amount: Decimal, date: datetime) -> None:
+        self.transaction_generator.create_transaction(
+            receiving_account=self.account, amount_received=amount, date=date
+        )
+
+    def send(self, amount: Decimal, date: datetime) -> None:
+        self.transaction_generator.create_transaction(
+            sending_account=self.account, amount_sent=amount, date=date
+        )
@@ -195,6 +195,25 @@ class AccountResultTests(FlaskTestCase):
         assert result
         assert result[1] == Decimal(expected_total)
 
+    def test_that_balance_of_account_transferring_to_itself_changes_by_difference_of_amounts(
+        self,
+    ) -> None:
+        account = self.database_gateway.create_account()
+        self.transaction_generator.create_transaction(
+            sending_account=account.id,
+            receiving_account=account.id,
+            amount_sent=Decimal(3),
+            amount_received=Decimal(2),
+        )
+        result = (
+            self.database_gateway.get_accounts()
+            .with_id(account.id)
+            .joined_with_balance()
+            .first()
+        )
+        assert result
+        assert result[1] == Decimal(-1)
+
     def test_when_joining_with_balance_account_objects_are_deserialized_properly(
         self,
     ) -> None:
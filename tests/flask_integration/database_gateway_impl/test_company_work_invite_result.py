@@ -95,3 +95,13 @@ class CooperationResultTests(FlaskTestCase):
         )
         self.db_gateway.get_company_work_invites().with_id(invite_to_delete.id).delete()
         assert self.db_gateway.get_company_work_invites().with_id(other_invite.id)
+
+    def test_that_invite_can_be_joined_with_inviting_company(self) -> None:
+        company = self.company_generator.create_company()
+        invite = self.db_gateway.create_company_work_invite(
+            company=company, member=self.member_generator.create_member()
+        )
+        assert [
+            (joined_invite, joined_company.id)
+            for joined_invite, joined_company in self.db_gateway.get_company_work_invites().joined_with_company()
+        ] == [(invite, company)]
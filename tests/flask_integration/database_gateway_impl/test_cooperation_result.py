@@ -1,8 +1,10 @@
 from datetime import datetime, timedelta
+from typing import Dict
+from uuid import UUID
 
 from arbeitszeit.records import Cooperation
 from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
-from tests.data_generators import CompanyGenerator, CooperationGenerator
+from tests.data_generators import CompanyGenerator, CooperationGenerator, PlanGenerator
 from tests.datetime_service import FakeDatetimeService
 
 from ..flask import FlaskTestCase
@@ -196,3 +198,54 @@ class JoinedWithCurrentCoordinatorTests(FlaskTestCase):
             len(self.db_gateway.get_cooperations().joined_with_current_coordinator())
             == 1
         )
+
+
+class JoinedWithActivePlanCountTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.db_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+
+    def test_that_cooperation_without_plans_has_zero_plans(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        assert self.get_plan_counts() == {cooperation: 0}
+
+    def test_that_active_plans_of_cooperation_are_counted(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation)
+        self.plan_generator.create_plan(cooperation=cooperation)
+        assert self.get_plan_counts() == {cooperation: 2}
+
+    def test_that_plans_are_counted_for_their_own_cooperation(self) -> None:
+        cooperation_1 = self.cooperation_generator.create_cooperation()
+        cooperation_2 = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation_1)
+        assert self.get_plan_counts() == {cooperation_1: 1, cooperation_2: 0}
+
+    def test_that_expired_plans_are_not_counted(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation, timeframe=1)
+        self.datetime_service.advance_time(timedelta(days=2))
+        assert self.get_plan_counts() == {cooperation: 0}
+
+    def test_that_filters_are_applied_before_counting(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation)
+        assert [
+            (coop.id, count)
+            for coop, count in self.db_gateway.get_cooperations()
+            .with_id(cooperation)
+            .joined_with_active_plan_count(self.datetime_service.now())
+        ] == [(cooperation, 1)]
+
+    def get_plan_counts(self) -> Dict[UUID, int]:
+        return {
+            cooperation.id: count
+            for cooperation, count in self.db_gateway.get_cooperations().joined_with_active_plan_count(
+                self.datetime_service.now()
+            )
+        }
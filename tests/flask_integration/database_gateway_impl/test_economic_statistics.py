@@ -0,0 +1,273 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from sqlalchemy import func, insert, select
+
+from arbeitszeit import records
+from arbeitszeit_flask.database import models
+from arbeitszeit_flask.database.economic_aggregates import (
+    AGGREGATE_ID,
+    CHANGE_SLOTS,
+    EconomicAggregateStore,
+)
+from tests.data_generators import (
+    CompanyGenerator,
+    CooperationGenerator,
+    MemberGenerator,
+    PlanGenerator,
+    TransactionGenerator,
+)
+from tests.datetime_service import FakeDatetimeService
+
+from ..flask import FlaskTestCase
+
+
+class EconomicStatisticsTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.member_generator = self.injector.get(MemberGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.aggregates = self.injector.get(EconomicAggregateStore)
+        self.datetime_service.freeze_time(datetime(2023, 5, 1))
+
+    def test_that_registered_members_and_companies_are_counted(self) -> None:
+        self.member_generator.create_member()
+        self.company_generator.create_company()
+        self.company_generator.create_company()
+        statistics = self.get_statistics()
+        assert statistics.registered_members_count == 1
+        assert statistics.registered_companies_count == 2
+
+    def test_that_cooperations_are_counted(self) -> None:
+        self.cooperation_generator.create_cooperation()
+        assert self.get_statistics().cooperations_count == 1
+
+    def test_that_balance_of_member_accounts_is_summed_up(self) -> None:
+        member = self.member_generator.create_member()
+        account = self.database_gateway.get_accounts().owned_by_member(member).first()
+        assert account
+        self.transaction_generator.create_transaction(
+            receiving_account=account.id, amount_received=Decimal(7)
+        )
+        assert self.get_statistics().member_account_balance == Decimal(7)
+
+    def test_that_balance_of_product_and_labour_accounts_is_summed_up(self) -> None:
+        company = self.company_generator.create_company_record()
+        self.transaction_generator.create_transaction(
+            sending_account=company.product_account, amount_sent=Decimal(3)
+        )
+        self.transaction_generator.create_transaction(
+            receiving_account=company.work_account, amount_received=Decimal(2)
+        )
+        statistics = self.get_statistics()
+        assert statistics.product_account_balance == Decimal(-3)
+        assert statistics.labour_account_balance == Decimal(2)
+
+    def test_that_balances_of_accounts_with_other_owners_are_ignored(self) -> None:
+        company = self.company_generator.create_company_record()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.means_account, amount_received=Decimal(2)
+        )
+        statistics = self.get_statistics()
+        assert statistics.member_account_balance == Decimal(0)
+        assert statistics.labour_account_balance == Decimal(0)
+        assert statistics.product_account_balance == Decimal(0)
+
+    def test_that_active_plans_are_counted(self) -> None:
+        self.plan_generator.create_plan(is_public_service=True)
+        self.plan_generator.create_plan(is_public_service=False)
+        self.plan_generator.create_plan(approved=False)
+        statistics = self.get_statistics()
+        assert statistics.active_plans_count == 2
+        assert statistics.active_public_plans_count == 1
+
+    def test_that_planned_costs_of_active_plans_are_summed_up(self) -> None:
+        self.plan_generator.create_plan(
+            costs=records.ProductionCosts(
+                labour_cost=Decimal(1),
+                means_cost=Decimal(2),
+                resource_cost=Decimal(3),
+            )
+        )
+        self.plan_generator.create_plan(
+            costs=records.ProductionCosts(
+                labour_cost=Decimal(1),
+                means_cost=Decimal(1),
+                resource_cost=Decimal(1),
+            )
+        )
+        costs = self.get_statistics().active_plans_statistics.total_planned_costs
+        assert costs.labour_cost == Decimal(2)
+        assert costs.means_cost == Decimal(3)
+        assert costs.resource_cost == Decimal(4)
+
+    def test_that_average_timeframe_of_active_plans_is_calculated(self) -> None:
+        self.plan_generator.create_plan(timeframe=2)
+        self.plan_generator.create_plan(timeframe=6)
+        statistics = self.get_statistics()
+        assert statistics.active_plans_statistics.average_plan_duration_in_days == 4
+
+    def test_that_expired_plans_are_not_counted(self) -> None:
+        self.plan_generator.create_plan(timeframe=1)
+        self.datetime_service.advance_time(timedelta(days=2))
+        assert self.get_statistics().active_plans_count == 0
+
+    def test_that_plans_are_counted_again_when_asking_for_earlier_point_in_time(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(timeframe=1)
+        self.datetime_service.advance_time(timedelta(days=2))
+        self.plan_generator.create_plan(timeframe=5)
+        statistics = self.database_gateway.get_economic_statistics(
+            datetime(2023, 5, 1, 12)
+        )
+        assert statistics.active_plans_count == 1
+
+    def test_that_plans_activated_after_requested_timestamp_are_not_counted(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(timeframe=5)
+        statistics = self.database_gateway.get_economic_statistics(
+            datetime(2023, 4, 30)
+        )
+        assert statistics.active_plans_count == 0
+
+    def test_that_stored_figures_match_calculated_figures_over_time(self) -> None:
+        for timeframe in [1, 3, 7]:
+            self.plan_generator.create_plan(timeframe=timeframe)
+            self.datetime_service.advance_time(timedelta(days=2))
+        self.datetime_service.freeze_time(datetime(2023, 5, 2))
+        self.plan_generator.create_plan(timeframe=2, is_public_service=True)
+        for day in range(0, 14):
+            timestamp = datetime(2023, 4, 30) + timedelta(days=day)
+            assert self.database_gateway.get_economic_statistics(
+                timestamp
+            ) == self.aggregates.calculate_statistics(timestamp)
+
+    def test_that_sweeping_expired_plans_keeps_figures_consistent(self) -> None:
+        self.plan_generator.create_plan(timeframe=1)
+        self.plan_generator.create_plan(timeframe=3)
+        timestamp = datetime(2023, 5, 3)
+        self.aggregates.advance_active_plans(timestamp)
+        assert self.database_gateway.get_economic_statistics(
+            timestamp
+        ) == self.aggregates.calculate_statistics(timestamp)
+        assert self.database_gateway.get_economic_statistics(
+            datetime(2023, 5, 1)
+        ) == self.aggregates.calculate_statistics(datetime(2023, 5, 1))
+
+    def test_that_deleted_plans_are_not_counted(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.database_gateway.get_plans().with_id(plan).delete()
+        assert self.get_statistics().active_plans_count == 0
+
+    def test_that_recalculation_reproduces_the_same_statistics(self) -> None:
+        self.plan_generator.create_plan()
+        self.member_generator.create_member()
+        expected_statistics = self.get_statistics()
+        self.aggregates.recalculate(self.datetime_service.now())
+        assert self.get_statistics() == expected_statistics
+
+    def test_that_costs_of_public_and_productive_plans_are_summed_separately(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(
+            costs=records.ProductionCosts(
+                means_cost=Decimal(1), resource_cost=Decimal(2), labour_cost=Decimal(3)
+            ),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=records.ProductionCosts(
+                means_cost=Decimal(4), resource_cost=Decimal(5), labour_cost=Decimal(6)
+            ),
+        )
+        costs = self.database_gateway.get_active_plan_costs(self.datetime_service.now())
+        assert costs == records.ActivePlanCosts(
+            productive_plans=records.ProductionCosts(
+                means_cost=Decimal(1), resource_cost=Decimal(2), labour_cost=Decimal(3)
+            ),
+            public_plans=records.ProductionCosts(
+                means_cost=Decimal(4), resource_cost=Decimal(5), labour_cost=Decimal(6)
+            ),
+        )
+
+    def test_that_stored_plan_costs_match_calculated_plan_costs_over_time(
+        self,
+    ) -> None:
+        for timeframe in [1, 3, 7]:
+            self.plan_generator.create_plan(timeframe=timeframe)
+            self.plan_generator.create_plan(
+                timeframe=timeframe + 1, is_public_service=True
+            )
+            self.datetime_service.advance_time(timedelta(days=2))
+        self.aggregates.advance_active_plans(datetime(2023, 5, 5))
+        for day in range(0, 14):
+            timestamp = datetime(2023, 4, 30) + timedelta(days=day)
+            assert self.database_gateway.get_active_plan_costs(
+                timestamp
+            ) == self.aggregates.calculate_active_plan_costs(timestamp)
+
+    def test_that_registering_a_member_does_not_update_the_aggregate_row(
+        self,
+    ) -> None:
+        self.member_generator.create_member()
+        row = self.db.session.get(models.EconomicAggregate, AGGREGATE_ID)
+        assert row
+        assert row.members_count == 0
+        assert self.get_statistics().registered_members_count == 1
+
+    def test_that_number_of_rows_with_recorded_changes_is_bounded(self) -> None:
+        for _ in range(CHANGE_SLOTS + 1):
+            self.member_generator.create_member()
+        assert self.count_recorded_changes() <= CHANGE_SLOTS
+        assert self.get_statistics().registered_members_count == CHANGE_SLOTS + 1
+
+    def test_that_changes_recorded_in_all_slots_are_added_up(self) -> None:
+        self.db.session.execute(
+            insert(models.EconomicAggregateDelta),
+            [dict(id=slot, members_count=1) for slot in range(CHANGE_SLOTS)],
+        )
+        assert self.get_statistics().registered_members_count == CHANGE_SLOTS
+
+    def test_that_changes_to_plans_after_advancing_are_recorded(self) -> None:
+        self.aggregates.advance_active_plans(self.datetime_service.now())
+        plan = self.plan_generator.create_plan(timeframe=3)
+        self.plan_generator.create_plan(timeframe=1)
+        self.database_gateway.get_plans().with_id(plan).delete()
+        for day in range(0, 5):
+            timestamp = datetime(2023, 4, 30) + timedelta(days=day)
+            assert self.database_gateway.get_economic_statistics(
+                timestamp
+            ) == self.aggregates.calculate_statistics(timestamp)
+
+    def test_that_changes_to_plans_are_stored_in_the_aggregate_row(self) -> None:
+        planner = self.company_generator.create_company()
+        self.aggregates.advance_active_plans(self.datetime_service.now())
+        recorded_changes = self.count_recorded_changes()
+        self.plan_generator.create_plan(
+            planner=planner,
+            costs=records.ProductionCosts(
+                means_cost=Decimal(1), resource_cost=Decimal(2), labour_cost=Decimal(3)
+            ),
+        )
+        row = self.db.session.get(models.EconomicAggregate, AGGREGATE_ID)
+        assert row
+        self.db.session.refresh(row)
+        assert row.active_plans_count == 1
+        assert row.active_plans_labour_cost == Decimal(3)
+        assert self.count_recorded_changes() == recorded_changes
+
+    def count_recorded_changes(self) -> int:
+        return self.db.session.execute(
+            select(func.count(models.EconomicAggregateDelta.id))
+        ).scalar_one()
+
+    def get_statistics(self) -> records.EconomicStatistics:
+        return self.database_gateway.get_economic_statistics(
+            self.datetime_service.now()
+        )
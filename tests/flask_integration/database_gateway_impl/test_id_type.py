@@ -0,0 +1,36 @@
+from uuid import UUID, uuid4
+
+from parameterized import parameterized
+from sqlalchemy import Column, MetaData, String, Table, Uuid, select
+
+from arbeitszeit_flask.database.models import Id
+from tests.flask_integration.flask import FlaskTestCase
+
+
+class IdTypeTests(FlaskTestCase):
+    @parameterized.expand([(String,), (Uuid,)])
+    def test_that_id_can_be_found_by_uuid(self, column_type: type) -> None:
+        expected_id = uuid4()
+        self.create_table(column_type)
+        self.db.session.execute(self.table.insert().values(id=expected_id))
+        found_id = self.db.session.execute(
+            select(self.table.c.id).where(self.table.c.id == expected_id)
+        ).scalar_one()
+        assert found_id == expected_id
+
+    @parameterized.expand([(String,), (Uuid,)])
+    def test_that_ids_are_returned_as_uuids(self, column_type: type) -> None:
+        self.create_table(column_type)
+        self.db.session.execute(self.table.insert().values(id=uuid4()))
+        found_id = self.db.session.execute(select(self.table.c.id)).scalar_one()
+        assert isinstance(found_id, UUID)
+
+    def create_table(self, column_type: type) -> None:
+        # The table is created with the given column type, as the
+        # migrations do, and queried through the Id type of the models.
+        Table(
+            "id_type_test", MetaData(), Column("id", column_type, primary_key=True)
+        ).create(self.db.session.connection())
+        self.table = Table(
+            "id_type_test", MetaData(), Column("id", Id, primary_key=True)
+        )
@@ -0,0 +1,113 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, List
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from arbeitszeit.injector import request_scope
+from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
+from tests.data_generators import CompanyGenerator, PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+
+from ..flask import FlaskTestCase
+
+
+class IdentityMapTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.plan = self.plan_generator.create_plan_record()
+        self.db.session.flush()
+
+    def test_that_plan_is_queried_only_once_within_request_scope(self) -> None:
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            gateway.get_plans().with_id(self.plan.id).first()
+            with self.count_selects() as selects:
+                plan = gateway.get_plans().with_id(self.plan.id).first()
+        assert plan
+        assert plan.id == self.plan.id
+        assert not selects
+
+    def test_that_plan_is_queried_every_time_outside_of_request_scope(
+        self,
+    ) -> None:
+        self.database_gateway.get_plans().with_id(self.plan.id).first()
+        with self.count_selects() as selects:
+            self.database_gateway.get_plans().with_id(self.plan.id).first()
+        assert selects
+
+    def test_that_planner_is_fetched_together_with_next_company_lookup(self) -> None:
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            plan = gateway.get_plans().with_id(self.plan.id).first()
+            assert plan
+            other_company = self.company_generator.create_company()
+            with self.count_selects() as selects:
+                other = gateway.get_companies().with_id(other_company).first()
+                planner = gateway.get_companies().with_id(plan.planner).first()
+        assert planner
+        assert planner.id == self.plan.planner
+        assert other
+        assert other.id == other_company
+        assert len(selects) == 1
+
+    def test_that_filtered_plan_results_are_not_served_from_identity_map(
+        self,
+    ) -> None:
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            gateway.get_plans().with_id(self.plan.id).first()
+            plan = (
+                gateway.get_plans()
+                .that_are_expired_as_of(self.datetime_service.now())
+                .with_id(self.plan.id)
+                .first()
+            )
+        assert plan is None
+
+    def test_that_updating_plans_invalidates_identity_map(self) -> None:
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            gateway.get_plans().with_id(self.plan.id).first()
+            gateway.get_plans().with_id(self.plan.id).update().hide().perform()
+            plan = gateway.get_plans().with_id(self.plan.id).first()
+        assert plan
+        assert plan.hidden_by_user
+
+    def test_that_deleting_plans_invalidates_identity_map(self) -> None:
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            gateway.get_plans().with_id(self.plan.id).first()
+            gateway.get_plans().with_id(self.plan.id).delete()
+            plan = gateway.get_plans().with_id(self.plan.id).first()
+        assert plan is None
+
+    def test_that_plans_are_returned_in_order_of_ids(self) -> None:
+        other_plan = self.plan_generator.create_plan_record()
+        with request_scope():
+            gateway = self.injector.get(DatabaseGatewayImpl)
+            plans = list(
+                gateway.get_plans().with_id(other_plan.id, uuid4(), self.plan.id)
+            )
+        assert [plan.id for plan in plans] == [other_plan.id, self.plan.id]
+
+    @contextmanager
+    def count_selects(self) -> Iterator[List[str]]:
+        selects: List[str] = []
+
+        def record(
+            conn: Any, cursor: Any, statement: str, *args: Any, **kwargs: Any
+        ) -> None:
+            if statement.lstrip().upper().startswith("SELECT"):
+                selects.append(statement)
+
+        self.db.session.flush()
+        engine = self.db.engine
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield selects
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
@@ -0,0 +1,148 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List
+
+from sqlalchemy import select, update
+
+from arbeitszeit import records
+from arbeitszeit.payout_factor import PayoutFactorService
+from arbeitszeit_flask.database import models
+from arbeitszeit_flask.database.payout_factor_snapshots import PayoutFactorSnapshotStore
+from tests.data_generators import PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+
+from ..flask import FlaskTestCase
+
+
+class PayoutFactorSnapshotTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.payout_factor_service = self.injector.get(PayoutFactorService)
+        self.store = self.injector.get(PayoutFactorSnapshotStore)
+        self.datetime_service.freeze_time(datetime(2023, 5, 1, 9))
+
+    def test_that_one_snapshot_is_returned_for_every_day(self) -> None:
+        snapshots = self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 5, 1), date(2023, 5, 7)
+        )
+        assert [snapshot.timestamp for snapshot in snapshots] == [
+            datetime(2023, 5, 1) + timedelta(days=n) for n in range(7)
+        ]
+
+    def test_that_calculated_snapshots_match_payout_factor_service(self) -> None:
+        self.create_plans()
+        for snapshot in self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 4, 30), date(2023, 5, 14)
+        ):
+            assert snapshot.payout_factor == (
+                self.payout_factor_service.recalculate_payout_factor(snapshot.timestamp)
+            )
+
+    def test_that_planned_costs_of_active_plans_are_summed_up(self) -> None:
+        self.plan_generator.create_plan(
+            costs=records.ProductionCosts(
+                means_cost=Decimal(1), resource_cost=Decimal(2), labour_cost=Decimal(3)
+            ),
+        )
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=records.ProductionCosts(
+                means_cost=Decimal(4), resource_cost=Decimal(5), labour_cost=Decimal(6)
+            ),
+        )
+        (snapshot,) = self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 5, 2), date(2023, 5, 2)
+        )
+        assert snapshot.planned_costs == records.ProductionCosts(
+            means_cost=Decimal(5), resource_cost=Decimal(7), labour_cost=Decimal(9)
+        )
+
+    def test_that_stored_snapshots_are_returned_unchanged(self) -> None:
+        self.create_plans()
+        expected_snapshots = self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 4, 30), date(2023, 5, 14)
+        )
+        assert self.store.store_snapshots(date(2023, 4, 30), date(2023, 5, 14)) == 15
+        assert (
+            self.database_gateway.get_payout_factor_snapshots(
+                date(2023, 4, 30), date(2023, 5, 14)
+            )
+            == expected_snapshots
+        )
+
+    def test_that_stored_snapshots_are_read_from_the_table(self) -> None:
+        self.store.store_snapshots(date(2023, 5, 2), date(2023, 5, 3))
+        self.db.session.execute(
+            update(models.PayoutFactorSnapshot)
+            .where(models.PayoutFactorSnapshot.day == date(2023, 5, 3))
+            .values(payout_factor=Decimal("0.5"))
+        )
+        snapshots = self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 5, 1), date(2023, 5, 4)
+        )
+        assert [snapshot.payout_factor for snapshot in snapshots] == [
+            Decimal(1),
+            Decimal(1),
+            Decimal("0.5"),
+            Decimal(1),
+        ]
+
+    def test_that_storing_snapshots_again_replaces_them(self) -> None:
+        self.store.store_snapshots(date(2023, 5, 2), date(2023, 5, 3))
+        self.create_plans()
+        self.store.store_snapshots(date(2023, 5, 2), date(2023, 5, 3))
+        assert self.count_stored_snapshots() == 2
+        for snapshot in self.database_gateway.get_payout_factor_snapshots(
+            date(2023, 5, 2), date(2023, 5, 3)
+        ):
+            assert snapshot.payout_factor == (
+                self.payout_factor_service.recalculate_payout_factor(snapshot.timestamp)
+            )
+
+    def test_that_only_last_day_is_stored_if_no_snapshots_exist(self) -> None:
+        self.store.store_missing_snapshots(date(2023, 5, 5))
+        assert self.stored_days() == [date(2023, 5, 5)]
+
+    def test_that_days_since_latest_stored_snapshot_are_stored(self) -> None:
+        self.store.store_snapshots(date(2023, 5, 1), date(2023, 5, 1))
+        self.store.store_missing_snapshots(date(2023, 5, 3))
+        assert self.stored_days() == [
+            date(2023, 5, 1),
+            date(2023, 5, 2),
+            date(2023, 5, 3),
+        ]
+
+    def create_plans(self) -> None:
+        for timeframe in [1, 3, 7]:
+            self.plan_generator.create_plan(
+                timeframe=timeframe,
+                costs=records.ProductionCosts(
+                    means_cost=Decimal(1),
+                    resource_cost=Decimal(1),
+                    labour_cost=Decimal(10 * timeframe),
+                ),
+            )
+            self.plan_generator.create_plan(
+                timeframe=timeframe + 1,
+                is_public_service=True,
+                costs=records.ProductionCosts(
+                    means_cost=Decimal(2),
+                    resource_cost=Decimal(3),
+                    labour_cost=Decimal(4),
+                ),
+            )
+            self.datetime_service.advance_time(timedelta(days=2))
+
+    def count_stored_snapshots(self) -> int:
+        return len(self.stored_days())
+
+    def stored_days(self) -> List[date]:
+        return list(
+            self.db.session.execute(
+                select(models.PayoutFactorSnapshot.day).order_by(
+                    models.PayoutFactorSnapshot.day
+                )
+            ).scalars()
+        )
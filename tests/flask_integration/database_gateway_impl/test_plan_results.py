@@ -1,15 +1,15 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import List
+from typing import List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from parameterized import parameterized
 
 from arbeitszeit import records
-from arbeitszeit.datetime_service import DatetimeService
 from arbeitszeit.records import Plan, ProductionCosts
 from arbeitszeit.use_cases.approve_plan import ApprovePlanUseCase
 from arbeitszeit_flask.database import models
+from arbeitszeit_flask.database.cooperation_prices import CooperationPriceStore
 from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
 from tests.control_thresholds import ControlThresholdsTestImpl
 from tests.data_generators import (
@@ -193,38 +193,116 @@ class GetActivePlansTests(FlaskTestCase):
         assert retrieved_plans[1].id == plans[1]
         assert retrieved_plans[2].id == plans[3]
 
-    def test_that_plans_can_be_filtered_by_product_name(self) -> None:
-        expected_plan = self.plan_generator.create_plan(
-            product_name="Delivery of goods"
-        )
+    def test_that_query_plans_by_substring_of_plan_id_returns_plan(self) -> None:
+        expected_plan = self.plan_generator.create_plan()
+        query = str(expected_plan)[3:8]
         returned_plan = list(
-            self.database_gateway.get_plans().with_product_name_containing(
-                "Delivery of goods"
-            )
+            self.database_gateway.get_plans().with_id_containing(query)
         )
         assert returned_plan
         assert returned_plan[0].id == expected_plan
 
-    def test_that_plans_can_be_filtered_by_substrings_of_product_name(
+    def test_that_query_plans_by_complete_plan_id_returns_only_that_plan(
         self,
     ) -> None:
+        expected_plan = self.plan_generator.create_plan()
+        self.plan_generator.create_plan()
+        returned_plans = list(
+            self.database_gateway.get_plans().with_id_containing(str(expected_plan))
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    @parameterized.expand(
+        [
+            ("Delivery of goods", "delivery goods"),
+            ("Delivery of goods", "deliv"),
+            ("Frische Äpfel", "äpfel"),
+            ("Frische Äpfel", "Apfel"),
+            ("Apple juice", "juices"),
+        ]
+    )
+    def test_that_plans_can_be_searched_by_stemmed_words_of_product_name(
+        self, product_name: str, query: str
+    ) -> None:
+        expected_plan = self.plan_generator.create_plan(product_name=product_name)
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching(query)
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    @parameterized.expand(
+        [
+            ("Sunflower oil", "flower"),
+            ("Sunflower oil", "LOWER O"),
+        ]
+    )
+    def test_that_plans_can_be_searched_by_substring_of_product_name(
+        self, product_name: str, query: str
+    ) -> None:
+        expected_plan = self.plan_generator.create_plan(product_name=product_name)
+        self.plan_generator.create_plan(product_name="Olive oil")
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching(query)
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    def test_that_plans_can_be_searched_by_words_of_description(self) -> None:
         expected_plan = self.plan_generator.create_plan(
-            product_name="Delivery of goods"
+            product_name="Juice", description="Made from organic apples"
         )
-        returned_plan = list(
-            self.database_gateway.get_plans().with_product_name_containing("very of go")
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching("organic")
         )
-        assert returned_plan
-        assert returned_plan[0].id == expected_plan
+        assert [plan.id for plan in returned_plans] == [expected_plan]
 
-    def test_that_query_plans_by_substring_of_plan_id_returns_plan(self) -> None:
-        expected_plan = self.plan_generator.create_plan()
-        query = str(expected_plan)[3:8]
-        returned_plan = list(
-            self.database_gateway.get_plans().with_id_containing(query)
+    def test_that_plans_must_match_every_word_of_search_query(self) -> None:
+        self.plan_generator.create_plan(product_name="Apple juice", description="Fresh")
+        assert not list(
+            self.database_gateway.get_plans().with_product_matching("apple cider")
         )
-        assert returned_plan
-        assert returned_plan[0].id == expected_plan
+
+    def test_that_search_query_without_words_matches_all_plans(self) -> None:
+        self.plan_generator.create_plan()
+        self.plan_generator.create_plan()
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching(" & !")
+        )
+        assert len(returned_plans) == 2
+
+    def test_that_search_query_of_only_stop_words_matches_all_plans(self) -> None:
+        self.plan_generator.create_plan(product_name="Apple juice")
+        self.plan_generator.create_plan(product_name="Orange juice")
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching("in an so")
+        )
+        assert len(returned_plans) == 2
+
+    def test_that_stop_words_in_search_query_are_ignored(self) -> None:
+        expected_plan = self.plan_generator.create_plan(product_name="Apple juice")
+        self.plan_generator.create_plan(product_name="Orange juice")
+        returned_plans = list(
+            self.database_gateway.get_plans().with_product_matching("juice an apple")
+        )
+        assert [plan.id for plan in returned_plans] == [expected_plan]
+
+    def test_that_plans_matching_search_query_in_product_name_are_more_relevant(
+        self,
+    ) -> None:
+        expected_second = self.plan_generator.create_plan(
+            product_name="Juice", description="Made from apples"
+        )
+        expected_first = self.plan_generator.create_plan(
+            product_name="Apples", description="Fresh"
+        )
+        returned_plans = list(
+            self.database_gateway.get_plans()
+            .with_product_matching("apples")
+            .ordered_by_relevance("apples")
+        )
+        assert [plan.id for plan in returned_plans] == [
+            expected_first,
+            expected_second,
+        ]
 
     def test_that_plans_that_ordering_by_creation_date_works_even_when_plan_activation_was_in_reverse_order(
         self,
@@ -598,6 +676,33 @@ class ThatWillExpireAfterTests(FlaskTestCase):
             datetime(2000, 1, 3)
         )
 
+    def test_that_expiration_is_calculated_from_updated_activation_timestamp(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        plan = self.plan_generator.create_plan(timeframe=2)
+        self.database_gateway.get_plans().with_id(
+            plan
+        ).update().set_activation_timestamp(datetime(2000, 2, 1)).perform()
+        assert self.database_gateway.get_plans().that_will_expire_after(
+            datetime(2000, 2, 2)
+        )
+        assert not self.database_gateway.get_plans().that_will_expire_after(
+            datetime(2000, 2, 3)
+        )
+
+    def test_that_plan_without_activation_timestamp_is_not_included_in_results(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        plan = self.plan_generator.create_plan(timeframe=2)
+        self.database_gateway.get_plans().with_id(
+            plan
+        ).update().set_activation_timestamp(None).perform()
+        assert not self.database_gateway.get_plans().that_will_expire_after(
+            datetime(1999, 1, 1)
+        )
+
 
 class ThatAreExpiredAsOfTests(FlaskTestCase):
     def setUp(self) -> None:
@@ -650,116 +755,296 @@ class ThatAreNotHiddenTests(FlaskTestCase):
         assert not self.database_gateway.get_plans().that_are_not_hidden()
 
 
-class JoinedWithPlannerAndCooperatingPlansTests(FlaskTestCase):
+class JoinedWithPlannerTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+
+    def test_that_plans_are_joined_with_their_planner(self) -> None:
+        planner = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(planner=planner)
+        assert [
+            (p.id, company.id)
+            for p, company in self.database_gateway.get_plans().joined_with_planner()
+        ] == [(plan, planner)]
+
+    def test_that_filters_are_applied_before_joining(self) -> None:
+        plan = self.plan_generator.create_plan()
+        self.plan_generator.create_plan()
+        assert [
+            p.id
+            for p, _ in self.database_gateway.get_plans()
+            .with_id(plan)
+            .joined_with_planner()
+        ] == [plan]
+
+
+class JoinedWithCooperationTests(FlaskTestCase):
     def setUp(self) -> None:
         super().setUp()
         self.database_gateway = self.injector.get(DatabaseGatewayImpl)
         self.plan_generator = self.injector.get(PlanGenerator)
         self.cooperation_generator = self.injector.get(CooperationGenerator)
-        self.datetime_service = self.injector.get(DatetimeService)  # type: ignore
 
-    def test_that_one_result_is_yieled_with_one_cooperating_plan_in_db(self) -> None:
+    def test_that_plans_without_cooperation_are_not_returned(self) -> None:
+        self.plan_generator.create_plan()
+        assert not list(self.database_gateway.get_plans().joined_with_cooperation())
+
+    def test_that_plans_are_joined_with_their_cooperation(self) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
-        self.plan_generator.create_plan(cooperation=cooperation)
-        assert (
-            len(
-                self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                    self.datetime_service.now()
-                )
-            )
-            == 1
-        )
+        plan = self.plan_generator.create_plan(cooperation=cooperation)
+        assert [
+            (p.id, c.id)
+            for p, c in self.database_gateway.get_plans().joined_with_cooperation()
+        ] == [(plan, cooperation)]
+
+
+class JoinedWithPlannerAndRequestedCooperationTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
 
-    def test_that_two_results_are_yieled_with_two_cooperating_plans_in_db(self) -> None:
+    def test_that_plans_without_requested_cooperation_are_not_returned(self) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
         self.plan_generator.create_plan(cooperation=cooperation)
-        self.plan_generator.create_plan(cooperation=cooperation)
-        assert (
-            len(
-                self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                    self.datetime_service.now()
-                )
-            )
-            == 2
+        assert not list(
+            self.database_gateway.get_plans().joined_with_planner_and_requested_cooperation()
         )
 
-    def test_that_each_plan_has_two_cooperating_plans_in_result_with_two_plans_in_cooperation(
+    def test_that_plans_are_joined_with_planner_and_requested_cooperation(
         self,
     ) -> None:
+        planner = self.company_generator.create_company()
+        cooperation = self.cooperation_generator.create_cooperation()
+        plan = self.plan_generator.create_plan(
+            planner=planner, requested_cooperation=cooperation
+        )
+        assert [
+            (p.id, company.id, c.id)
+            for p, company, c in self.database_gateway.get_plans().joined_with_planner_and_requested_cooperation()
+        ] == [(plan, planner, cooperation)]
+
+
+class JoinedWithPlannerAndCooperativePriceTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        self.cooperation_prices = self.injector.get(CooperationPriceStore)
+
+    def test_that_one_result_is_yielded_for_each_plan_in_cooperation(self) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
         self.plan_generator.create_plan(cooperation=cooperation)
         self.plan_generator.create_plan(cooperation=cooperation)
-        results = (
-            self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                self.datetime_service.now()
-            )
-        )
+        assert len(self.query_cooperative_prices()) == 2
+
+    def test_that_planner_is_yielded_with_plan(self) -> None:
+        plan = self.plan_generator.create_plan()
+        ((result_plan, planner, _),) = self.query_cooperative_prices()
+        assert result_plan.id == plan
+        assert planner.id == result_plan.planner
+
+    def test_that_plans_not_in_cooperation_have_no_cooperative_price(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan()
+        self.plan_generator.create_plan()
+        results = self.query_cooperative_prices()
         assert results
-        for v in results:
-            assert len(v[2]) == 2
+        for _, _, cooperative_price in results:
+            assert cooperative_price is None
 
-    def test_that_production_costs_for_cooperating_plans_are_as_they_were_created(
+    def test_that_price_of_single_plan_in_cooperation_is_its_individual_price(
         self,
     ) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
-        self.plan_generator.create_plan(
-            cooperation=cooperation,
-            costs=records.ProductionCosts(
-                means_cost=Decimal(1),
-                resource_cost=Decimal(2),
-                labour_cost=Decimal(3),
-            ),
-        )
-        results = (
-            self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                self.datetime_service.now()
-            )
-        )
+        self.create_plan(cooperation=cooperation, costs=6, amount=3)
+        ((_, _, cooperative_price),) = self.query_cooperative_prices()
+        assert cooperative_price == Decimal(2)
+
+    def test_that_all_plans_in_cooperation_have_the_same_averaged_price(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        self.create_plan(cooperation=cooperation, costs=30, amount=10)
+        results = self.query_cooperative_prices()
         assert results
-        for v in results:
-            assert v[2][0].production_costs == Decimal(6)
+        for _, _, cooperative_price in results:
+            assert cooperative_price == Decimal(2)
+
+    def test_that_price_is_updated_when_plan_joins_cooperation(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        self.refresh_cooperation_prices()
+        plan = self.create_plan(costs=30, amount=10)
+        self.database_gateway.get_plans().with_id(plan).update().set_cooperation(
+            cooperation
+        ).perform()
+        for _, _, cooperative_price in self.query_cooperative_prices():
+            assert cooperative_price == Decimal(2)
+
+    def test_that_price_is_updated_when_plan_leaves_cooperation(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        remaining_plan = self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        leaving_plan = self.create_plan(cooperation=cooperation, costs=30, amount=10)
+        self.refresh_cooperation_prices()
+        self.database_gateway.get_plans().with_id(
+            leaving_plan
+        ).update().set_cooperation(None).perform()
+        prices = {plan.id: price for plan, _, price in self.query_cooperative_prices()}
+        assert prices == {remaining_plan: Decimal(1), leaving_plan: None}
 
-    def test_that_amount_for_cooperating_plans_are_as_they_were_created(
+    def test_that_price_is_updated_when_plan_of_cooperation_is_deleted(
         self,
     ) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
-        self.plan_generator.create_plan(cooperation=cooperation, amount=123)
-        results = (
-            self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                self.datetime_service.now()
-            )
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        deleted_plan = self.create_plan(cooperation=cooperation, costs=30, amount=10)
+        self.refresh_cooperation_prices()
+        self.database_gateway.get_plans().with_id(deleted_plan).delete()
+        ((_, _, cooperative_price),) = self.query_cooperative_prices()
+        assert cooperative_price == Decimal(1)
+
+    def test_that_price_is_updated_when_plan_of_cooperation_expires(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10, timeframe=1)
+        remaining_plan = self.create_plan(
+            cooperation=cooperation, costs=30, amount=10, timeframe=5
         )
-        assert results
-        for v in results:
-            assert v[2][0].amount == 123
+        self.refresh_cooperation_prices()
+        self.datetime_service.advance_time(timedelta(days=2))
+        results = self.database_gateway.get_plans().with_id(remaining_plan)
+        (
+            (_, _, cooperative_price),
+        ) = results.joined_with_planner_and_cooperative_price(
+            self.datetime_service.now()
+        )
+        assert cooperative_price == Decimal(3)
 
-    def test_that_duration_for_cooperating_plans_are_as_they_were_created(
+    def test_that_price_is_updated_when_plan_of_cooperation_is_activated(
         self,
     ) -> None:
         cooperation = self.cooperation_generator.create_cooperation()
-        self.plan_generator.create_plan(cooperation=cooperation, timeframe=234)
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        self.refresh_cooperation_prices()
+        self.create_plan(cooperation=cooperation, costs=30, amount=10)
+        for _, _, cooperative_price in self.query_cooperative_prices():
+            assert cooperative_price == Decimal(2)
+
+    def test_that_price_can_be_queried_for_earlier_timestamp(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10, timeframe=1)
+        self.create_plan(cooperation=cooperation, costs=30, amount=50, timeframe=5)
+        timestamp = self.datetime_service.now()
+        self.datetime_service.advance_time(timedelta(days=2))
+        self.refresh_cooperation_prices()
         results = (
-            self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
-                self.datetime_service.now()
+            self.database_gateway.get_plans().joined_with_planner_and_cooperative_price(
+                timestamp
             )
         )
         assert results
-        for v in results:
-            assert v[2][0].duration_in_days == 234
+        for _, _, cooperative_price in results:
+            assert cooperative_price == Decimal("0.8")
+
+    def test_that_querying_prices_does_not_store_rows(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=6, amount=3)
+        self.query_cooperative_prices()
+        assert not self.db.session.get(models.CooperationPrice, cooperation)
+
+    def test_that_outdated_row_is_not_written_when_querying_prices(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=6, amount=3, timeframe=1)
+        self.refresh_cooperation_prices()
+        self.datetime_service.advance_time(timedelta(days=2))
+        ((_, _, cooperative_price),) = self.query_cooperative_prices()
+        assert cooperative_price is None
+        row = self.db.session.get(models.CooperationPrice, cooperation)
+        assert row
+        assert row.plans_count == 1
+
+    def test_that_stored_row_is_updated_when_plan_joins_cooperation(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        self.refresh_cooperation_prices()
+        plan = self.create_plan(costs=30, amount=10)
+        self.database_gateway.get_plans().with_id(plan).update().set_cooperation(
+            cooperation
+        ).perform()
+        row = self.db.session.get(models.CooperationPrice, cooperation)
+        assert row
+        assert row.plans_count == 2
+        assert row.cost_per_day == Decimal(40)
 
-    def test_that_no_plan_is_cooperating_with_two_plans_that_are_not_in_coop(
+    def test_that_stored_row_is_updated_when_plan_of_cooperation_is_deleted(
         self,
     ) -> None:
-        self.plan_generator.create_plan()
-        self.plan_generator.create_plan()
-        results = (
-            self.database_gateway.get_plans().joined_with_planner_and_cooperating_plans(
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        deleted_plan = self.create_plan(cooperation=cooperation, costs=30, amount=10)
+        self.refresh_cooperation_prices()
+        self.database_gateway.get_plans().with_id(deleted_plan).delete()
+        row = self.db.session.get(models.CooperationPrice, cooperation)
+        assert row
+        assert row.plans_count == 1
+
+    def test_that_stored_row_is_updated_when_plan_of_cooperation_is_activated(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.create_plan(cooperation=cooperation, costs=10, amount=10)
+        self.refresh_cooperation_prices()
+        plan = self.plan_generator.create_plan(approved=False)
+        self.database_gateway.get_plans().with_id(plan).update().set_cooperation(
+            cooperation
+        ).perform()
+        self.database_gateway.get_plans().with_id(
+            plan
+        ).update().set_activation_timestamp(self.datetime_service.now()).perform()
+        row = self.db.session.get(models.CooperationPrice, cooperation)
+        assert row
+        assert row.plans_count == 2
+
+    def refresh_cooperation_prices(self) -> None:
+        self.cooperation_prices.refresh(self.datetime_service.now())
+
+    def query_cooperative_prices(
+        self,
+    ) -> List[Tuple[records.Plan, records.Company, Optional[Decimal]]]:
+        return list(
+            self.database_gateway.get_plans().joined_with_planner_and_cooperative_price(
                 self.datetime_service.now()
             )
         )
-        assert results
-        for v in results:
-            assert not v[2]
+
+    def create_plan(
+        self,
+        *,
+        costs: int,
+        amount: int,
+        timeframe: int = 1,
+        cooperation: Optional[UUID] = None,
+    ) -> UUID:
+        return self.plan_generator.create_plan(
+            cooperation=cooperation,
+            amount=amount,
+            timeframe=timeframe,
+            costs=records.ProductionCosts(
+                means_cost=Decimal(costs),
+                resource_cost=Decimal(0),
+                labour_cost=Decimal(0),
+            ),
+        )
 
 
 class JoinedWithProvidedProductAmountTests(FlaskTestCase):
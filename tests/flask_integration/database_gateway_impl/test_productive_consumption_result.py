@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
-from uuid import uuid4
+from typing import Optional
+from uuid import UUID, uuid4
 
 from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
 from tests.data_generators import CompanyGenerator, ConsumptionGenerator, PlanGenerator
@@ -238,6 +239,85 @@ class ProductiveConsumptionResultTests(FlaskTestCase):
         ] == [consumer]
 
 
+class GroupedByProviderTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.consumption_generator = self.injector.get(ConsumptionGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.company_generator = self.injector.get(CompanyGenerator)
+
+    def test_that_without_consumptions_nothing_is_returned(self) -> None:
+        assert not list(
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+
+    def test_that_consumptions_from_same_provider_are_grouped(self) -> None:
+        provider = self.company_generator.create_company()
+        self.consume_from(provider, amount=1)
+        self.consume_from(provider, amount=2)
+        ((company, _),) = list(
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+        assert company.id == provider
+
+    def test_that_volume_is_the_sum_of_the_amounts_sent(self) -> None:
+        provider = self.company_generator.create_company()
+        self.consume_from(provider, amount=1)
+        self.consume_from(provider, amount=2)
+        expected_volume = sum(
+            transaction.amount_sent
+            for _, transaction in self.database_gateway.get_productive_consumptions().joined_with_transaction()
+        )
+        ((_, volume),) = list(
+            self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        )
+        assert volume == expected_volume
+
+    def test_that_providers_are_ordered_by_volume_in_descending_order(self) -> None:
+        small_provider = self.company_generator.create_company()
+        large_provider = self.company_generator.create_company()
+        self.consume_from(small_provider, amount=1)
+        self.consume_from(large_provider, amount=5)
+        assert [
+            company.id
+            for company, _ in self.database_gateway.get_productive_consumptions().grouped_by_provider()
+        ] == [large_provider, small_provider]
+
+    def test_that_number_of_providers_can_be_limited(self) -> None:
+        small_provider = self.company_generator.create_company()
+        large_provider = self.company_generator.create_company()
+        self.consume_from(small_provider, amount=1)
+        self.consume_from(large_provider, amount=5)
+        assert [
+            company.id
+            for company, _ in self.database_gateway.get_productive_consumptions()
+            .grouped_by_provider()
+            .limit(1)
+        ] == [large_provider]
+
+    def test_that_only_consumptions_of_filtered_consumer_are_grouped(self) -> None:
+        consumer = self.company_generator.create_company()
+        provider = self.company_generator.create_company()
+        self.consume_from(provider, amount=1, consumer=consumer)
+        self.consume_from(self.company_generator.create_company(), amount=1)
+        assert [
+            company.id
+            for company, _ in self.database_gateway.get_productive_consumptions()
+            .where_consumer_is_company(consumer)
+            .ordered_by_creation_date()
+            .grouped_by_provider()
+        ] == [provider]
+
+    def consume_from(
+        self, provider: UUID, amount: int, consumer: Optional[UUID] = None
+    ) -> None:
+        plan = self.plan_generator.create_plan(planner=provider)
+        self.consumption_generator.create_resource_consumption_by_company(
+            plan=plan, amount=amount, consumer=consumer
+        )
+
+
 class FilterWhereProviderIsCompanyTests(FlaskTestCase):
     def setUp(self) -> None:
         super().setUp()
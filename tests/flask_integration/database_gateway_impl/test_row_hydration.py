@@ -0,0 +1,80 @@
+from datetime import datetime
+from decimal import Decimal
+
+from arbeitszeit_flask.database import models
+from tests.data_generators import (
+    ConsumptionGenerator,
+    CooperationGenerator,
+    PlanGenerator,
+    TransactionGenerator,
+)
+from tests.datetime_service import FakeDatetimeService
+
+from ..flask import FlaskTestCase
+
+
+class RowHydrationTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+        self.consumption_generator = self.injector.get(ConsumptionGenerator)
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+
+    def test_that_reading_plans_does_not_load_orm_instances(self) -> None:
+        self.plan_generator.create_plan()
+        self.db.session.flush()
+        self.db.session.expunge_all()
+        list(self.database_gateway.get_plans())
+        assert not self.db.session.identity_map
+
+    def test_that_reading_joined_results_does_not_load_orm_instances(
+        self,
+    ) -> None:
+        self.consumption_generator.create_private_consumption()
+        self.db.session.flush()
+        self.db.session.expunge_all()
+        list(
+            self.database_gateway.get_private_consumptions().joined_with_transaction_and_plan_and_consumer()
+        )
+        assert not self.db.session.identity_map
+
+    def test_that_plan_read_from_row_has_approval_date(self) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        plan = self.plan_generator.create_plan()
+        record = self.database_gateway.get_plans().with_id(plan).first()
+        assert record
+        assert record.approval_date == datetime(2000, 1, 1)
+
+    def test_that_pending_plan_read_from_row_has_no_approval_date(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        record = self.database_gateway.get_plans().with_id(plan).first()
+        assert record
+        assert record.approval_date is None
+
+    def test_that_plan_read_from_row_equals_plan_read_from_orm_instance(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plan = self.plan_generator.create_plan(cooperation=cooperation)
+        record = self.database_gateway.get_plans().with_id(plan).first()
+        orm = models.Plan.query.filter(models.Plan.id == plan).one()
+        assert record == self.database_gateway.plan_from_orm(orm)
+
+    def test_that_transaction_read_from_row_equals_created_transaction(
+        self,
+    ) -> None:
+        transaction = self.transaction_generator.create_transaction(
+            amount_sent=Decimal("1.5"), amount_received=Decimal("2.5")
+        )
+        assert list(self.database_gateway.get_transactions()) == [transaction]
+
+    def test_that_account_balances_are_read_from_rows(self) -> None:
+        account = self.database_gateway.create_account()
+        results = list(
+            self.database_gateway.get_accounts()
+            .with_id(account.id)
+            .joined_with_balance()
+        )
+        assert results == [(account, Decimal(0))]
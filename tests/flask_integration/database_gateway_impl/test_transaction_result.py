@@ -3,7 +3,7 @@ from decimal import Decimal
 from typing import Optional
 from uuid import UUID
 
-from arbeitszeit.records import SocialAccounting, Transaction
+from arbeitszeit.records import AccountTypes, SocialAccounting, Transaction
 from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
 from tests.control_thresholds import ControlThresholdsTestImpl
 from tests.data_generators import (
@@ -145,6 +145,60 @@ class TransactionRepositoryTests(FlaskTestCase):
         return self.database_gateway.create_account().id
 
 
+class GroupedByReceivingAccountTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.database_gateway = self.injector.get(DatabaseGatewayImpl)
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+
+    def test_that_without_transactions_nothing_is_returned(self) -> None:
+        assert not list(
+            self.database_gateway.get_transactions().grouped_by_receiving_account()
+        )
+
+    def test_that_amounts_received_by_same_account_are_summed_up(self) -> None:
+        receiver = self.create_account()
+        self.create_transaction(receiver, amount_received=Decimal(2))
+        self.create_transaction(receiver, amount_received=Decimal(3))
+        assert list(
+            self.database_gateway.get_transactions().grouped_by_receiving_account()
+        ) == [(receiver, Decimal(5))]
+
+    def test_that_amounts_are_summed_up_for_every_receiving_account(self) -> None:
+        receiver_1 = self.create_account()
+        receiver_2 = self.create_account()
+        self.create_transaction(receiver_1, amount_received=Decimal(2))
+        self.create_transaction(receiver_2, amount_received=Decimal(3))
+        assert dict(
+            self.database_gateway.get_transactions().grouped_by_receiving_account()
+        ) == {receiver_1: Decimal(2), receiver_2: Decimal(3)}
+
+    def test_that_filters_are_applied_before_grouping(self) -> None:
+        receiver_1 = self.create_account()
+        receiver_2 = self.create_account()
+        self.create_transaction(receiver_1, amount_received=Decimal(2))
+        self.create_transaction(receiver_2, amount_received=Decimal(3))
+        assert list(
+            self.database_gateway.get_transactions()
+            .where_account_is_receiver(receiver_2)
+            .ordered_by_transaction_date()
+            .grouped_by_receiving_account()
+        ) == [(receiver_2, Decimal(3))]
+
+    def create_transaction(self, receiver: UUID, amount_received: Decimal) -> None:
+        self.database_gateway.create_transaction(
+            self.datetime_service.now(),
+            sending_account=self.create_account(),
+            receiving_account=receiver,
+            amount_sent=amount_received,
+            amount_received=amount_received,
+            purpose="test purpose",
+        )
+
+    def create_account(self) -> UUID:
+        return self.database_gateway.create_account().id
+
+
 class TestWhereAccountIsSenderOrReceiver(FlaskTestCase):
     def setUp(self) -> None:
         super().setUp()
@@ -181,6 +235,66 @@ class TestWhereAccountIsSenderOrReceiver(FlaskTestCase):
             )
         ) == [transaction]
 
+    def test_that_transactions_with_same_date_are_ordered_by_id(self) -> None:
+        sender_account = self.create_account()
+        receiver_account = self.create_account()
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        transactions = [
+            self.create_transaction(sender=sender_account, receiver=receiver_account)
+            for _ in range(3)
+        ]
+        expected_order = sorted(transactions, key=lambda t: str(t.id), reverse=True)
+        assert (
+            list(
+                self.database_gateway.get_transactions().ordered_by_transaction_date(
+                    descending=True
+                )
+            )
+            == expected_order
+        )
+
+    def test_that_only_transactions_before_the_specified_one_are_kept(self) -> None:
+        sender_account = self.create_account()
+        receiver_account = self.create_account()
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        first_transaction = self.create_transaction(
+            sender=sender_account, receiver=receiver_account
+        )
+        self.datetime_service.freeze_time(datetime(2000, 1, 2))
+        second_transaction = self.create_transaction(
+            sender=sender_account, receiver=receiver_account
+        )
+        self.datetime_service.freeze_time(datetime(2000, 1, 3))
+        self.create_transaction(sender=sender_account, receiver=receiver_account)
+        assert list(
+            self.database_gateway.get_transactions().that_precede(
+                second_transaction.date, second_transaction.id
+            )
+        ) == [first_transaction]
+
+    def test_that_transactions_with_same_date_are_split_correctly_by_that_precede(
+        self,
+    ) -> None:
+        sender_account = self.create_account()
+        receiver_account = self.create_account()
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        for _ in range(4):
+            self.create_transaction(sender=sender_account, receiver=receiver_account)
+        ordered = list(
+            self.database_gateway.get_transactions().ordered_by_transaction_date(
+                descending=True
+            )
+        )
+        cursor = ordered[1]
+        assert (
+            list(
+                self.database_gateway.get_transactions()
+                .ordered_by_transaction_date(descending=True)
+                .that_precede(cursor.date, cursor.id)
+            )
+            == ordered[2:]
+        )
+
     def create_transaction(self, *, sender: UUID, receiver: UUID) -> Transaction:
         return self.database_gateway.create_transaction(
             self.datetime_service.now(),
@@ -278,7 +392,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             account.id
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender.id == member
 
     def test_that_sender_is_correctly_retrieved_for_transaction_from_company_r_account(
@@ -289,7 +403,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             company.raw_material_account
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender == company
 
     def test_that_sender_is_correctly_retrieved_for_transactions_from_company_p_account(
@@ -300,7 +414,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             company.means_account
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender == company
 
     def test_that_sender_is_correctly_retrieved_for_transaction_from_company_a_account(
@@ -311,7 +425,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             company.work_account
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender == company
 
     def test_that_sender_is_correctly_retrieved_for_transactions_from_company_prd_account(
@@ -322,7 +436,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             company.product_account
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender == company
 
     def test_that_sender_is_correctly_retrieved_for_transactions_from_social_accounting(
@@ -332,7 +446,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
         transactions = self.database_gateway.get_transactions().where_account_is_sender(
             self.social_accounting.account
         )
-        _, sender, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, sender, _, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert sender == self.social_accounting
 
     def test_that_receiver_is_correctly_retrieved_for_transaction_to_member_account(
@@ -347,7 +461,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 account.id
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver.id == member
 
     def test_that_receiver_is_correctly_retrieved_for_transaction_to_company_r_account(
@@ -360,7 +474,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 company.raw_material_account
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver == company
 
     def test_that_receiver_is_correctly_retrieved_for_transactions_to_company_p_account(
@@ -373,7 +487,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 company.means_account
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver == company
 
     def test_that_receiver_is_correctly_retrieved_for_transaction_to_company_a_account(
@@ -386,7 +500,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 company.work_account
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver == company
 
     def test_that_receiver_is_correctly_retrieved_for_transactions_to_company_prd_account(
@@ -399,7 +513,7 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 company.product_account
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver == company
 
     def test_that_receiver_is_correctly_retrieved_for_transactions_to_accounting(
@@ -411,9 +525,52 @@ class JoinedWithSenderAndReceiverTests(FlaskTestCase):
                 self.social_accounting.account
             )
         )
-        _, _, receiver = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        _, _, receiver, _, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
         assert receiver == self.social_accounting
 
+    def test_that_type_of_sending_member_account_is_retrieved(self) -> None:
+        member = self.member_generator.create_member()
+        account = self.database_gateway.get_accounts().owned_by_member(member).first()
+        assert account
+        self.create_transaction(sender=account.id)
+        transactions = self.database_gateway.get_transactions().where_account_is_sender(
+            account.id
+        )
+        _, _, _, sending_account_type, _ = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        assert sending_account_type == AccountTypes.member
+
+    def test_that_type_of_receiving_company_prd_account_is_retrieved(self) -> None:
+        company = self.company_generator.create_company_record()
+        self.create_transaction(receiver=company.product_account)
+        transactions = (
+            self.database_gateway.get_transactions().where_account_is_receiver(
+                company.product_account
+            )
+        )
+        _, _, _, _, receiving_account_type = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        assert receiving_account_type == AccountTypes.prd
+
+    def test_that_types_of_social_accounting_and_company_r_account_are_retrieved(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company_record()
+        self.create_transaction(
+            sender=self.social_accounting.account,
+            receiver=company.raw_material_account,
+        )
+        transactions = self.database_gateway.get_transactions().where_account_is_sender(
+            self.social_accounting.account
+        )
+        (
+            _,
+            _,
+            _,
+            sending_account_type,
+            receiving_account_type,
+        ) = transactions.joined_with_sender_and_receiver().first()  # type: ignore
+        assert sending_account_type == AccountTypes.accounting
+        assert receiving_account_type == AccountTypes.r
+
     def create_transaction(
         self, sender: Optional[UUID] = None, receiver: Optional[UUID] = None
     ) -> None:
@@ -36,6 +36,7 @@ class FlaskConfiguration(dict):
                 "MAIL_BACKEND": "flask_mail",
                 "LANGUAGES": {"en": "English", "de": "Deutsch"},
                 "ARBEITSZEIT_PASSWORD_HASHER": "tests.password_hasher:PasswordHasherImpl",
+                "PLOT_RENDERER": "inline",
             }
         )
 
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+from parameterized import parameterized
+
+from tests.data_generators import TransactionGenerator
+
+from .flask import ViewTestCase
+
+
+class AccountPlotViewTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+        self.company = self.login_company()
+
+    @parameterized.expand(
+        [
+            ("/plots/line_plot_of_company_prd_account", "product_account"),
+            ("/plots/line_plot_of_company_r_account", "raw_material_account"),
+            ("/plots/line_plot_of_company_p_account", "means_account"),
+            ("/plots/line_plot_of_company_a_account", "work_account"),
+        ]
+    )
+    def test_that_plot_of_account_with_transactions_is_rendered_as_png(
+        self, url: str, account_attribute: str
+    ) -> None:
+        account = getattr(self.company, account_attribute)
+        for n in range(20):
+            self.transaction_generator.create_transaction(
+                receiving_account=account,
+                amount_received=Decimal(n % 17),
+                date=datetime(2000, 1, 1) + timedelta(minutes=n),
+            )
+        response = self.client.get(url, query_string={"company_id": self.company.id})
+        assert response.status_code == 200
+        assert response.mimetype == "image/png"
+
+    def test_that_plot_of_account_without_transactions_is_rendered(self) -> None:
+        response = self.client.get(
+            "/plots/line_plot_of_company_prd_account",
+            query_string={"company_id": self.company.id},
+        )
+        assert response.status_code == 200
+
+    def test_that_plot_is_sent_with_etag_and_must_be_revalidated(self) -> None:
+        response = self.client.get(
+            "/plots/line_plot_of_company_a_account",
+            query_string={"company_id": self.company.id},
+        )
+        assert response.headers["ETag"]
+        assert response.cache_control.private
+        assert response.cache_control.no_cache
+
+    def test_that_plot_is_not_sent_again_if_etag_matches(self) -> None:
+        url = "/plots/line_plot_of_company_a_account"
+        first_response = self.client.get(
+            url, query_string={"company_id": self.company.id}
+        )
+        second_response = self.client.get(
+            url,
+            query_string={"company_id": self.company.id},
+            headers={"If-None-Match": first_response.headers["ETag"]},
+        )
+        assert second_response.status_code == 304
+        assert not second_response.data
+
+    def test_that_plot_changes_after_transaction_was_recorded_for_account(
+        self,
+    ) -> None:
+        url = "/plots/line_plot_of_company_a_account"
+        first_response = self.client.get(
+            url, query_string={"company_id": self.company.id}
+        )
+        self.transaction_generator.create_transaction(
+            receiving_account=self.company.work_account,
+            amount_received=Decimal(5),
+        )
+        second_response = self.client.get(
+            url,
+            query_string={"company_id": self.company.id},
+            headers={"If-None-Match": first_response.headers["ETag"]},
+        )
+        assert second_response.status_code == 200
+        assert second_response.headers["ETag"] != first_response.headers["ETag"]
+
+    def test_that_plot_does_not_change_after_transaction_of_other_account(
+        self,
+    ) -> None:
+        url = "/plots/line_plot_of_company_a_account"
+        first_response = self.client.get(
+            url, query_string={"company_id": self.company.id}
+        )
+        self.transaction_generator.create_transaction(
+            receiving_account=self.company.product_account,
+            amount_received=Decimal(5),
+        )
+        second_response = self.client.get(
+            url, query_string={"company_id": self.company.id}
+        )
+        assert second_response.headers["ETag"] == first_response.headers["ETag"]
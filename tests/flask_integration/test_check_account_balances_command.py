@@ -0,0 +1,66 @@
+from decimal import Decimal
+from uuid import UUID
+
+import click
+from sqlalchemy import update
+
+from arbeitszeit_flask.commands import check_account_balances
+from arbeitszeit_flask.database import models
+from tests.data_generators import TransactionGenerator
+
+from .flask import FlaskTestCase
+
+
+class CheckAccountBalancesTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+
+    def test_command_succeeds_when_balances_are_consistent(self) -> None:
+        self.transaction_generator.create_transaction()
+        check_account_balances(repair=False)
+
+    def test_command_fails_when_stored_balance_deviates_from_ledger(self) -> None:
+        transaction = self.transaction_generator.create_transaction()
+        self.corrupt_balance(transaction.receiving_account)
+        with self.assertRaises(click.ClickException):
+            check_account_balances(repair=False)
+
+    def test_repairing_restores_balance_calculated_from_ledger(self) -> None:
+        transaction = self.transaction_generator.create_transaction(
+            amount_received=Decimal(7)
+        )
+        self.corrupt_balance(transaction.receiving_account)
+        check_account_balances(repair=True)
+        assert self.get_balance(transaction.receiving_account) == Decimal(7)
+
+    def test_repairing_keeps_balance_of_accounts_without_transactions_at_zero(
+        self,
+    ) -> None:
+        account = self.database_gateway.create_account()
+        self.corrupt_balance(account.id)
+        check_account_balances(repair=True)
+        assert self.get_balance(account.id) == Decimal(0)
+
+    def test_command_succeeds_after_repair(self) -> None:
+        transaction = self.transaction_generator.create_transaction()
+        self.corrupt_balance(transaction.sending_account)
+        check_account_balances(repair=True)
+        check_account_balances(repair=False)
+
+    def corrupt_balance(self, account: UUID) -> None:
+        self.db.session.execute(
+            update(models.AccountBalance)
+            .where(models.AccountBalance.account_id == account)
+            .values(balance=Decimal(1000))
+        )
+
+    def get_balance(self, account: UUID) -> Decimal:
+        result = (
+            self.database_gateway.get_accounts()
+            .with_id(account)
+            .joined_with_balance()
+            .first()
+        )
+        assert result
+        return result[1]
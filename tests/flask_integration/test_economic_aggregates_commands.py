@@ -0,0 +1,131 @@
+from datetime import datetime, time, timedelta
+
+import click
+from sqlalchemy import func, select, update
+
+from arbeitszeit_flask.commands import (
+    backfill_payout_factor_snapshots,
+    check_economic_aggregates,
+    check_payout_factor,
+    sweep_expired_plans,
+)
+from arbeitszeit_flask.database import models
+from arbeitszeit_flask.database.economic_aggregates import AGGREGATE_ID
+from arbeitszeit_flask.datetime import RealtimeDatetimeService
+from tests.data_generators import CooperationGenerator, MemberGenerator, PlanGenerator
+
+from .flask import FlaskTestCase
+
+
+class CheckEconomicAggregatesTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.member_generator = self.injector.get(MemberGenerator)
+        self.plan_generator = self.injector.get(PlanGenerator)
+
+    def test_command_succeeds_when_aggregates_are_consistent(self) -> None:
+        self.member_generator.create_member()
+        self.plan_generator.create_plan()
+        check_economic_aggregates(repair=False)
+
+    def test_command_fails_when_stored_counter_deviates(self) -> None:
+        self.member_generator.create_member()
+        self.corrupt_members_count()
+        with self.assertRaises(click.ClickException):
+            check_economic_aggregates(repair=False)
+
+    def test_command_succeeds_after_repair(self) -> None:
+        self.member_generator.create_member()
+        self.corrupt_members_count()
+        check_economic_aggregates(repair=True)
+        check_economic_aggregates(repair=False)
+
+    def corrupt_members_count(self) -> None:
+        self.db.session.execute(
+            update(models.EconomicAggregate).values(members_count=100)
+        )
+
+
+class CheckPayoutFactorTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan_generator = self.injector.get(PlanGenerator)
+
+    def test_command_succeeds_when_payout_factor_is_consistent(self) -> None:
+        self.plan_generator.create_plan()
+        self.plan_generator.create_plan(is_public_service=True)
+        check_payout_factor(repair=False)
+
+    def test_command_fails_when_stored_public_plan_costs_deviate(self) -> None:
+        self.plan_generator.create_plan()
+        self.corrupt_public_labour_cost()
+        with self.assertRaises(click.ClickException):
+            check_payout_factor(repair=False)
+
+    def test_command_succeeds_after_repair(self) -> None:
+        self.plan_generator.create_plan()
+        self.corrupt_public_labour_cost()
+        check_payout_factor(repair=True)
+        check_payout_factor(repair=False)
+
+    def corrupt_public_labour_cost(self) -> None:
+        sweep_expired_plans()
+        self.db.session.execute(
+            update(models.EconomicAggregate).values(active_public_plans_labour_cost=100)
+        )
+
+
+class SweepExpiredPlansTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+
+    def test_aggregates_stay_consistent_after_sweeping(self) -> None:
+        self.plan_generator.create_plan()
+        sweep_expired_plans()
+        check_economic_aggregates(repair=False)
+
+    def test_active_plan_figures_are_stored_as_of_now_when_sweeping(self) -> None:
+        self.plan_generator.create_plan()
+        before_sweep = RealtimeDatetimeService().now()
+        sweep_expired_plans()
+        row = self.db.session.get(models.EconomicAggregate, AGGREGATE_ID)
+        assert row
+        assert row.active_plans_as_of >= before_sweep
+        check_economic_aggregates(repair=False)
+
+    def test_cooperation_prices_are_calculated_when_sweeping(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation)
+        sweep_expired_plans()
+        price = self.db.session.get(models.CooperationPrice, str(cooperation))
+        assert price
+        assert price.plans_count == 1
+
+    def test_payout_factor_snapshot_of_today_is_stored_when_sweeping(self) -> None:
+        sweep_expired_plans()
+        assert self.db.session.get(
+            models.PayoutFactorSnapshot, RealtimeDatetimeService().today()
+        )
+
+
+class BackfillPayoutFactorSnapshotsTests(FlaskTestCase):
+    def test_snapshots_of_requested_period_are_stored(self) -> None:
+        backfill_payout_factor_snapshots(
+            first_day=datetime(2023, 5, 1), last_day=datetime(2023, 5, 3)
+        )
+        assert self.count_snapshots() == 3
+
+    def test_snapshots_up_to_today_are_stored_without_last_day(self) -> None:
+        today = RealtimeDatetimeService().today()
+        backfill_payout_factor_snapshots(
+            first_day=datetime.combine(today - timedelta(days=2), time()),
+            last_day=None,
+        )
+        assert self.count_snapshots() == 3
+
+    def count_snapshots(self) -> int:
+        return self.db.session.execute(
+            select(func.count(models.PayoutFactorSnapshot.day))
+        ).scalar_one()
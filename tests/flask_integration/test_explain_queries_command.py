@@ -0,0 +1,48 @@
+import click
+from sqlalchemy import text
+
+from arbeitszeit_flask.commands import explain_queries
+from arbeitszeit_flask.database.query_plans import QueryPlanAdvisor
+
+from .flask import FlaskTestCase
+
+
+class ExplainQueriesTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.advisor = self.injector.get(QueryPlanAdvisor)
+
+    def test_command_succeeds_when_no_table_is_large(self) -> None:
+        explain_queries(min_rows=10**9)
+
+    def test_command_fails_when_tables_are_scanned_sequentially(self) -> None:
+        self.disable_index_scans()
+        with self.assertRaises(click.ClickException):
+            explain_queries(min_rows=0)
+
+    def test_no_sequential_scans_are_found_on_tables_below_row_threshold(
+        self,
+    ) -> None:
+        assert not self.advisor.find_sequential_scans(min_rows=10**9)
+
+    def test_sequential_scans_name_query_and_table(self) -> None:
+        self.disable_index_scans()
+        scans = self.advisor.find_sequential_scans(min_rows=0)
+        assert any(
+            scan.query == "plans of a company" and scan.table == "plan"
+            for scan in scans
+        )
+
+    def test_indexes_are_used_for_canonical_queries_when_scans_are_expensive(
+        self,
+    ) -> None:
+        self.db.session.execute(text("SET LOCAL enable_seqscan = off"))
+        assert not self.advisor.find_sequential_scans(min_rows=0)
+
+    def disable_index_scans(self) -> None:
+        for setting in [
+            "enable_indexscan",
+            "enable_bitmapscan",
+            "enable_indexonlyscan",
+        ]:
+            self.db.session.execute(text(f"SET LOCAL {setting} = off"))
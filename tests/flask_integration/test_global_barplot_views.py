@@ -0,0 +1,111 @@
+from parameterized import parameterized
+
+from arbeitszeit_flask.plots.cache import get_plot_cache
+from arbeitszeit_flask.plots.rendering import placeholder_png
+
+from .flask import ViewTestCase
+
+URL = "/plots/global_barplot_for_plans"
+
+
+class GlobalBarplotViewTests(ViewTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.login_member()
+
+    def test_that_plot_is_rendered_as_png(self) -> None:
+        response = self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        assert response.status_code == 200
+        assert response.mimetype == "image/png"
+
+    def test_that_plot_may_be_reused_by_browser(self) -> None:
+        self.app.config["PLOT_CACHE_MAX_AGE"] = 120
+        response = self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        assert response.cache_control.private
+        assert response.cache_control.max_age == 120
+
+    def test_that_plot_is_not_sent_again_if_etag_matches(self) -> None:
+        query_string = {"productive_plans": "3", "public_plans": "1"}
+        first_response = self.client.get(URL, query_string=query_string)
+        second_response = self.client.get(
+            URL,
+            query_string=query_string,
+            headers={"If-None-Match": first_response.headers["ETag"]},
+        )
+        assert second_response.status_code == 304
+
+    def test_that_equal_numbers_in_different_notation_share_a_cache_entry(
+        self,
+    ) -> None:
+        self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        self.client.get(
+            URL, query_string={"productive_plans": "3.0", "public_plans": "1.00"}
+        )
+        assert len(get_plot_cache()) == 1
+
+    def test_that_numbers_differing_in_digits_beyond_precision_share_a_cache_entry(
+        self,
+    ) -> None:
+        self.client.get(
+            URL, query_string={"productive_plans": "3.001", "public_plans": "1"}
+        )
+        self.client.get(
+            URL, query_string={"productive_plans": "3.002", "public_plans": "1"}
+        )
+        assert len(get_plot_cache()) == 1
+
+    def test_that_query_string_parameters_not_used_by_plot_are_ignored(
+        self,
+    ) -> None:
+        self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        self.client.get(
+            URL,
+            query_string={"productive_plans": "3", "public_plans": "1", "x": "y"},
+        )
+        assert len(get_plot_cache()) == 1
+
+    @parameterized.expand([("NaN",), ("sNaN",), ("Infinity",), ("abc",), ("1e99",)])
+    def test_that_numbers_that_cannot_be_plotted_are_rejected(
+        self, number: str
+    ) -> None:
+        response = self.client.get(
+            URL, query_string={"productive_plans": number, "public_plans": "1"}
+        )
+        assert response.status_code == 400
+        assert len(get_plot_cache()) == 0
+
+    def test_that_different_parameters_are_cached_separately(self) -> None:
+        self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        self.client.get(
+            URL, query_string={"productive_plans": "4", "public_plans": "1"}
+        )
+        assert len(get_plot_cache()) == 2
+
+    def test_that_cache_respects_configured_budget(self) -> None:
+        self.app.config["PLOT_CACHE_MAX_BYTES"] = 1
+        response = self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        assert response.status_code == 200
+        assert len(get_plot_cache()) == 0
+
+    def test_that_placeholder_is_sent_if_plot_cannot_be_rendered(self) -> None:
+        self.app.config["PLOT_RENDERER"] = "process_pool"
+        self.app.config["PLOT_RENDERER_MAX_PENDING"] = 0
+        response = self.client.get(
+            URL, query_string={"productive_plans": "3", "public_plans": "1"}
+        )
+        assert response.status_code == 200
+        assert response.data == placeholder_png()
+        assert response.cache_control.no_store
+        assert len(get_plot_cache()) == 0
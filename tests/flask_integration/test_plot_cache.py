@@ -0,0 +1,138 @@
+import os
+from tempfile import TemporaryDirectory
+from typing import Callable
+from unittest import TestCase
+
+from arbeitszeit_flask.plots.cache import PlotCache, PlotDiskCache
+
+
+class PlotCacheTests(TestCase):
+    def setUp(self) -> None:
+        self.cache = PlotCache(max_bytes=10)
+        self.render_count = 0
+
+    def test_that_plot_is_rendered_on_first_request(self) -> None:
+        plot = self.cache.get_or_render("key", self.render(b"png"))
+        assert plot.png == b"png"
+        assert self.render_count == 1
+
+    def test_that_plot_is_not_rendered_again_for_same_key(self) -> None:
+        self.cache.get_or_render("key", self.render(b"png"))
+        plot = self.cache.get_or_render("key", self.render(b"other"))
+        assert plot.png == b"png"
+        assert self.render_count == 1
+
+    def test_that_plots_for_different_keys_are_rendered_separately(self) -> None:
+        self.cache.get_or_render("key 1", self.render(b"png"))
+        plot = self.cache.get_or_render("key 2", self.render(b"other"))
+        assert plot.png == b"other"
+        assert self.render_count == 2
+
+    def test_that_etag_is_the_same_for_identical_images(self) -> None:
+        plot_1 = self.cache.get_or_render("key 1", self.render(b"png"))
+        plot_2 = self.cache.get_or_render("key 2", self.render(b"png"))
+        assert plot_1.etag == plot_2.etag
+
+    def test_that_etag_differs_for_different_images(self) -> None:
+        plot_1 = self.cache.get_or_render("key 1", self.render(b"png"))
+        plot_2 = self.cache.get_or_render("key 2", self.render(b"other"))
+        assert plot_1.etag != plot_2.etag
+
+    def test_that_size_of_cache_is_the_sum_of_cached_images(self) -> None:
+        self.cache.get_or_render("key 1", self.render(b"123"))
+        self.cache.get_or_render("key 2", self.render(b"1234"))
+        assert self.cache.size_in_bytes == 7
+
+    def test_that_least_recently_used_plot_is_evicted_when_budget_is_exceeded(
+        self,
+    ) -> None:
+        self.cache.get_or_render("key 1", self.render(b"1234"))
+        self.cache.get_or_render("key 2", self.render(b"1234"))
+        self.cache.get_or_render("key 1", self.render(b"1234"))
+        self.cache.get_or_render("key 3", self.render(b"1234"))
+        assert "key 1" in self.cache
+        assert "key 2" not in self.cache
+        assert "key 3" in self.cache
+        assert self.cache.size_in_bytes == 8
+
+    def test_that_images_larger_than_the_budget_are_not_cached(self) -> None:
+        self.cache.get_or_render("key 1", self.render(b"1234"))
+        plot = self.cache.get_or_render("key 2", self.render(b"12345678901"))
+        assert plot.png == b"12345678901"
+        assert "key 2" not in self.cache
+        assert "key 1" in self.cache
+
+    def render(self, png: bytes) -> Callable[[], bytes]:
+        def render() -> bytes:
+            self.render_count += 1
+            return png
+
+        return render
+
+
+class PlotCacheWithDiskTests(TestCase):
+    def setUp(self) -> None:
+        self.temporary_directory = TemporaryDirectory()
+        self.addCleanup(self.temporary_directory.cleanup)
+        self.directory = self.temporary_directory.name
+        self.render_count = 0
+
+    def test_that_plot_rendered_by_other_cache_is_read_from_disk(self) -> None:
+        self.create_cache().get_or_render("key", self.render(b"png"))
+        plot = self.create_cache().get_or_render("key", self.render(b"other"))
+        assert plot.png == b"png"
+        assert self.render_count == 1
+
+    def test_that_plot_evicted_from_memory_is_read_from_disk(self) -> None:
+        cache = self.create_cache(max_bytes=4)
+        cache.get_or_render("key 1", self.render(b"1234"))
+        cache.get_or_render("key 2", self.render(b"1234"))
+        plot = cache.get_or_render("key 1", self.render(b"other"))
+        assert plot.png == b"1234"
+        assert self.render_count == 2
+
+    def test_that_etag_of_plot_read_from_disk_matches_rendered_plot(self) -> None:
+        rendered = self.create_cache().get_or_render("key", self.render(b"png"))
+        read = self.create_cache().get_or_render("key", self.render(b"png"))
+        assert rendered.etag == read.etag
+
+    def test_that_least_recently_used_file_is_deleted_when_budget_is_exceeded(
+        self,
+    ) -> None:
+        disk = PlotDiskCache(directory=self.directory, max_bytes=8)
+        disk.put("key 1", b"1234")
+        disk.put("key 2", b"1234")
+        self.mark_as_used_earlier(disk, "key 2")
+        disk.put("key 3", b"1234")
+        assert disk.get("key 1") == b"1234"
+        assert disk.get("key 2") is None
+        assert disk.get("key 3") == b"1234"
+        assert disk.size_in_bytes == 8
+
+    def test_that_images_larger_than_the_disk_budget_are_not_stored(self) -> None:
+        disk = PlotDiskCache(directory=self.directory, max_bytes=8)
+        disk.put("key", b"123456789")
+        assert disk.get("key") is None
+        assert disk.size_in_bytes == 0
+
+    def test_that_size_of_existing_files_is_counted(self) -> None:
+        PlotDiskCache(directory=self.directory, max_bytes=8).put("key", b"1234")
+        assert PlotDiskCache(directory=self.directory, max_bytes=8).size_in_bytes == 4
+
+    def create_cache(self, max_bytes: int = 100) -> PlotCache:
+        return PlotCache(
+            max_bytes=max_bytes,
+            disk=PlotDiskCache(directory=self.directory, max_bytes=100),
+        )
+
+    def mark_as_used_earlier(self, disk: PlotDiskCache, key: str) -> None:
+        path = disk._path(key)
+        status = os.stat(path)
+        os.utime(path, (status.st_atime, status.st_mtime - 60))
+
+    def render(self, png: bytes) -> Callable[[], bytes]:
+        def render() -> bytes:
+            self.render_count += 1
+            return png
+
+        return render
@@ -0,0 +1,121 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List, Tuple
+from unittest import TestCase
+
+from arbeitszeit_flask.plots.downsampling import (
+    Downsampler,
+    LargestTriangleThreeBuckets,
+    MinMaxDownsampling,
+)
+
+from .flask import FlaskTestCase
+
+
+class MinMaxDownsamplingTests(TestCase):
+    def test_that_short_series_is_returned_unchanged(self) -> None:
+        x, y = make_series([1, 2, 3, 4])
+        assert MinMaxDownsampling(buckets=2).downsample(x, y) == (x, y)
+
+    def test_that_first_and_last_point_are_kept(self) -> None:
+        x, y = make_series(list(range(100)))
+        x_sampled, y_sampled = MinMaxDownsampling(buckets=5).downsample(x, y)
+        assert x_sampled[0] == x[0]
+        assert x_sampled[-1] == x[-1]
+        assert y_sampled[0] == y[0]
+        assert y_sampled[-1] == y[-1]
+
+    def test_that_at_most_two_points_per_bucket_are_kept(self) -> None:
+        x, y = make_series([n % 7 for n in range(100)])
+        x_sampled, _ = MinMaxDownsampling(buckets=5).downsample(x, y)
+        assert len(x_sampled) <= 2 * 5 + 2
+
+    def test_that_extreme_values_are_kept(self) -> None:
+        values = [0] * 100
+        values[37] = 50
+        values[62] = -50
+        x, y = make_series(values)
+        _, y_sampled = MinMaxDownsampling(buckets=5).downsample(x, y)
+        assert Decimal(50) in y_sampled
+        assert Decimal(-50) in y_sampled
+
+    def test_that_points_stay_ordered_by_time(self) -> None:
+        x, y = make_series([(n * 37) % 11 for n in range(100)])
+        x_sampled, _ = MinMaxDownsampling(buckets=7).downsample(x, y)
+        assert x_sampled == sorted(x_sampled)
+
+    def test_that_points_with_equal_timestamps_are_reduced(self) -> None:
+        x = [datetime(2000, 1, 1)] * 10
+        y = [Decimal(n) for n in range(10)]
+        x_sampled, y_sampled = MinMaxDownsampling(buckets=2).downsample(x, y)
+        assert len(x_sampled) == 2
+        assert y_sampled == [Decimal(0), Decimal(9)]
+
+
+class LargestTriangleThreeBucketsTests(TestCase):
+    def test_that_short_series_is_returned_unchanged(self) -> None:
+        x, y = make_series([1, 2, 3])
+        assert LargestTriangleThreeBuckets(threshold=3).downsample(x, y) == (x, y)
+
+    def test_that_series_is_reduced_to_threshold(self) -> None:
+        x, y = make_series([n % 13 for n in range(1000)])
+        x_sampled, y_sampled = LargestTriangleThreeBuckets(threshold=50).downsample(
+            x, y
+        )
+        assert len(x_sampled) == 50
+        assert len(y_sampled) == 50
+
+    def test_that_first_and_last_point_are_kept(self) -> None:
+        x, y = make_series([n % 13 for n in range(1000)])
+        x_sampled, _ = LargestTriangleThreeBuckets(threshold=50).downsample(x, y)
+        assert x_sampled[0] == x[0]
+        assert x_sampled[-1] == x[-1]
+
+    def test_that_points_stay_ordered_by_time(self) -> None:
+        x, y = make_series([(n * 37) % 11 for n in range(1000)])
+        x_sampled, _ = LargestTriangleThreeBuckets(threshold=30).downsample(x, y)
+        assert x_sampled == sorted(set(x_sampled))
+
+    def test_that_a_spike_is_kept(self) -> None:
+        values = [0] * 1000
+        values[500] = 100
+        x, y = make_series(values)
+        _, y_sampled = LargestTriangleThreeBuckets(threshold=10).downsample(x, y)
+        assert Decimal(100) in y_sampled
+
+    def test_that_original_values_are_returned(self) -> None:
+        x, y = make_series([n % 13 for n in range(100)])
+        x_sampled, y_sampled = LargestTriangleThreeBuckets(threshold=10).downsample(
+            x, y
+        )
+        for timestamp, value in zip(x_sampled, y_sampled):
+            assert y[x.index(timestamp)] == value
+
+
+class ConfiguredDownsamplerTests(FlaskTestCase):
+    def test_that_lttb_is_used_by_default(self) -> None:
+        downsampler = self.injector.get(Downsampler)
+        assert isinstance(downsampler, LargestTriangleThreeBuckets)
+
+    def test_that_lttb_keeps_configured_number_of_points(self) -> None:
+        self.app.config["PLOT_DOWNSAMPLER"] = "lttb"
+        self.app.config["PLOT_DOWNSAMPLER_POINTS"] = 10
+        downsampler = self.injector.get(Downsampler)
+        x, _ = downsampler.downsample(*make_series(list(range(100))))
+        assert len(x) == 10
+
+    def test_that_min_max_keeps_at_most_configured_number_of_points(self) -> None:
+        self.app.config["PLOT_DOWNSAMPLER"] = "min_max"
+        self.app.config["PLOT_DOWNSAMPLER_POINTS"] = 10
+        downsampler = self.injector.get(Downsampler)
+        assert isinstance(downsampler, MinMaxDownsampling)
+        x, _ = downsampler.downsample(*make_series([n % 7 for n in range(100)]))
+        assert len(x) <= 10 + 2
+
+
+def make_series(values: List[int]) -> Tuple[List[datetime], List[Decimal]]:
+    start = datetime(2000, 1, 1)
+    return (
+        [start + timedelta(hours=n) for n in range(len(values))],
+        [Decimal(value) for value in values],
+    )
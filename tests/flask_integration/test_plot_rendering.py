@@ -0,0 +1,105 @@
+import io
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable
+from unittest import TestCase
+
+from matplotlib.image import imread
+
+from arbeitszeit_flask.plots.rendering import (
+    ProcessPoolPlotter,
+    get_plotter,
+    placeholder_png,
+)
+from arbeitszeit_web.plotter import PlotterUnavailable
+
+from .flask import FlaskTestCase
+
+
+class ExecutorThatNeverFinishes(Executor):
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        future.set_running_or_notify_cancel()
+        return future
+
+
+class ProcessPoolPlotterTests(TestCase):
+    def setUp(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=1)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    def test_that_line_plot_is_rendered_by_executor(self) -> None:
+        plotter = ProcessPoolPlotter(self.executor, max_pending=1, timeout=10)
+        png = plotter.create_line_plot(
+            x=[datetime(2000, 1, 1), datetime(2000, 1, 2)],
+            y=[Decimal(1), Decimal(2)],
+        )
+        assert png.startswith(b"\x89PNG")
+
+    def test_that_bar_plot_is_rendered_by_executor(self) -> None:
+        plotter = ProcessPoolPlotter(self.executor, max_pending=1, timeout=10)
+        png = plotter.create_bar_plot(
+            x_coordinates=["a", "b"],
+            height_of_bars=[Decimal(1), Decimal(2)],
+            colors_of_bars=["red", "blue"],
+            fig_size=(5, 4),
+            y_label="label",
+        )
+        assert png.startswith(b"\x89PNG")
+
+    def test_that_plots_are_rendered_one_after_another_with_single_slot(
+        self,
+    ) -> None:
+        plotter = ProcessPoolPlotter(self.executor, max_pending=1, timeout=10)
+        for _ in range(3):
+            plotter.create_line_plot(x=[], y=[])
+
+    def test_that_plot_is_rejected_if_no_slots_are_available(self) -> None:
+        plotter = ProcessPoolPlotter(self.executor, max_pending=0, timeout=10)
+        with self.assertRaises(PlotterUnavailable):
+            plotter.create_line_plot(x=[], y=[])
+
+    def test_that_plot_that_is_not_rendered_in_time_is_unavailable(self) -> None:
+        plotter = ProcessPoolPlotter(
+            ExecutorThatNeverFinishes(), max_pending=2, timeout=0.01
+        )
+        with self.assertRaises(PlotterUnavailable):
+            plotter.create_line_plot(x=[], y=[])
+
+    def test_that_plots_that_did_not_finish_keep_their_slot(self) -> None:
+        plotter = ProcessPoolPlotter(
+            ExecutorThatNeverFinishes(), max_pending=1, timeout=0.01
+        )
+        with self.assertRaises(PlotterUnavailable):
+            plotter.create_line_plot(x=[], y=[])
+        with self.assertRaisesRegex(PlotterUnavailable, "Too many plots"):
+            plotter.create_line_plot(x=[], y=[])
+
+
+class PlaceholderTests(TestCase):
+    def test_that_placeholder_is_a_valid_png_image(self) -> None:
+        image = imread(io.BytesIO(placeholder_png()), format="png")
+        assert image.shape == (400, 500, 3)
+
+
+class GetPlotterTests(FlaskTestCase):
+    def test_that_plots_are_rendered_in_process_pool_if_configured(self) -> None:
+        self.app.config["PLOT_RENDERER"] = "process_pool"
+        plotter = get_plotter()
+        assert isinstance(plotter, ProcessPoolPlotter)
+        try:
+            png = plotter.create_line_plot(x=[], y=[])
+        finally:
+            plotter.executor.shutdown()
+        assert png.startswith(b"\x89PNG")
+
+    def test_that_process_pool_is_shared_within_application(self) -> None:
+        self.app.config["PLOT_RENDERER"] = "process_pool"
+        assert get_plotter() is get_plotter()
+
+    def test_that_plots_are_rendered_inline_if_configured(self) -> None:
+        self.app.config["PLOT_RENDERER"] = "inline"
+        assert not isinstance(get_plotter(), ProcessPoolPlotter)
@@ -0,0 +1,55 @@
+from unittest import TestCase
+
+from arbeitszeit_flask.database.repositories import DatabaseGatewayImpl
+from arbeitszeit_flask.dependency_injection import get_shared_dependency_injector
+from arbeitszeit_flask.flask_session import FlaskSession
+
+from .flask import FlaskTestCase
+
+
+class RequestScopeTests(FlaskTestCase):
+    def test_that_database_gateway_is_shared_within_a_request(self) -> None:
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            first = self.injector.get(DatabaseGatewayImpl)
+            second = self.injector.get(DatabaseGatewayImpl)
+            self.app.do_teardown_request()
+        assert first is second
+
+    def test_that_database_gateway_is_not_shared_between_requests(self) -> None:
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            first = self.injector.get(DatabaseGatewayImpl)
+            self.app.do_teardown_request()
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            second = self.injector.get(DatabaseGatewayImpl)
+            self.app.do_teardown_request()
+        assert first is not second
+
+    def test_that_request_scope_is_closed_after_request(self) -> None:
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            self.app.do_teardown_request()
+            first = self.injector.get(DatabaseGatewayImpl)
+            second = self.injector.get(DatabaseGatewayImpl)
+        assert first is not second
+
+    def test_that_shared_injector_provides_one_session_per_request(self) -> None:
+        injector = get_shared_dependency_injector()
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            first = injector.get(FlaskSession)
+            second = injector.get(FlaskSession)
+            self.app.do_teardown_request()
+        with self.app.test_request_context():
+            self.app.preprocess_request()
+            third = injector.get(FlaskSession)
+            self.app.do_teardown_request()
+        assert first is second
+        assert first is not third
+
+
+class SharedDependencyInjectorTests(TestCase):
+    def test_that_the_same_injector_is_returned_every_time(self) -> None:
+        assert get_shared_dependency_injector() is get_shared_dependency_injector()
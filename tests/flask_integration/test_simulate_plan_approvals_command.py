@@ -0,0 +1,57 @@
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from io import StringIO
+from uuid import uuid4
+
+import click
+
+from arbeitszeit_flask.commands import simulate_plan_approvals
+from arbeitszeit_flask.datetime import RealtimeDatetimeService
+from tests.data_generators import AccountantGenerator, PlanGenerator
+
+from .flask import FlaskTestCase
+
+
+class SimulatePlanApprovalsTests(FlaskTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.accountant = self.injector.get(AccountantGenerator).create_accountant()
+
+    def test_command_fails_if_requester_is_not_an_accountant(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        with self.assertRaises(click.ClickException):
+            simulate_plan_approvals(
+                accountant=uuid4(), plans=(plan,), first_day=None, last_day=None
+            )
+
+    def test_command_fails_for_unknown_plan(self) -> None:
+        with self.assertRaises(click.ClickException):
+            simulate_plan_approvals(
+                accountant=self.accountant,
+                plans=(uuid4(),),
+                first_day=None,
+                last_day=None,
+            )
+
+    def test_command_fails_for_approved_plan(self) -> None:
+        plan = self.plan_generator.create_plan()
+        with self.assertRaises(click.ClickException):
+            simulate_plan_approvals(
+                accountant=self.accountant, plans=(plan,), first_day=None, last_day=None
+            )
+
+    def test_command_prints_one_line_for_every_day_of_period(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        today = datetime.combine(RealtimeDatetimeService().today(), datetime.min.time())
+        output = StringIO()
+        with redirect_stdout(output):
+            simulate_plan_approvals(
+                accountant=self.accountant,
+                plans=(plan,),
+                first_day=today,
+                last_day=today + timedelta(days=4),
+            )
+        lines = output.getvalue().splitlines()
+        assert len(lines) == 6
+        assert lines[1].startswith(str(today.date()))
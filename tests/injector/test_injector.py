@@ -0,0 +1,167 @@
+from dataclasses import dataclass
+from unittest import TestCase
+
+from arbeitszeit.injector import (
+    AliasProvider,
+    Binder,
+    CallableProvider,
+    Injector,
+    Module,
+    get_dependencies,
+    request_scope,
+    request_scoped,
+    singleton,
+)
+
+
+class Dependency:
+    pass
+
+
+@request_scoped
+class RequestScopedDependency:
+    pass
+
+
+@singleton
+class SingletonDependency:
+    pass
+
+
+@dataclass
+class Dependent:
+    dependency: Dependency
+    request_scoped_dependency: RequestScopedDependency
+
+
+class Interface:
+    pass
+
+
+class Implementation(Interface):
+    pass
+
+
+class InjectorTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = Injector([])
+
+    def test_that_dependencies_of_constructor_are_injected(self) -> None:
+        dependent = self.injector.get(Dependent)
+        assert isinstance(dependent.dependency, Dependency)
+        assert isinstance(dependent.request_scoped_dependency, RequestScopedDependency)
+
+    def test_that_binding_of_interface_is_used(self) -> None:
+        class ImplementationModule(Module):
+            def configure(self, binder: Binder) -> None:
+                binder[Interface] = AliasProvider(Implementation)
+
+        injector = Injector([ImplementationModule()])
+        assert isinstance(injector.get(Interface), Implementation)
+
+    def test_that_callable_provider_receives_its_dependencies(self) -> None:
+        def provide_interface(dependency: Dependency) -> Interface:
+            assert isinstance(dependency, Dependency)
+            return Implementation()
+
+        class ProviderModule(Module):
+            def configure(self, binder: Binder) -> None:
+                binder[Interface] = CallableProvider(provide_interface)
+
+        injector = Injector([ProviderModule()])
+        assert isinstance(injector.get(Interface), Implementation)
+
+    def test_that_call_with_injection_injects_parameters_not_passed_in(
+        self,
+    ) -> None:
+        def function(number: int, dependency: Dependency) -> int:
+            assert isinstance(dependency, Dependency)
+            return number
+
+        assert self.injector.call_with_injection(function, args=[3]) == 3
+
+    def test_that_call_with_injection_prefers_passed_in_keyword_arguments(
+        self,
+    ) -> None:
+        dependency = Dependency()
+
+        def function(dependency: Dependency) -> Dependency:
+            return dependency
+
+        assert (
+            self.injector.call_with_injection(
+                function, kwargs={"dependency": dependency}
+            )
+            is dependency
+        )
+
+    def test_that_singletons_are_only_created_once(self) -> None:
+        assert self.injector.get(SingletonDependency) is self.injector.get(
+            SingletonDependency
+        )
+
+    def test_that_unscoped_classes_are_created_every_time(self) -> None:
+        with request_scope():
+            assert self.injector.get(Dependency) is not self.injector.get(Dependency)
+
+
+class RequestScopeTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = Injector([])
+
+    def test_that_request_scoped_class_is_created_every_time_outside_of_scope(
+        self,
+    ) -> None:
+        assert self.injector.get(RequestScopedDependency) is not self.injector.get(
+            RequestScopedDependency
+        )
+
+    def test_that_request_scoped_instance_is_shared_within_scope(self) -> None:
+        with request_scope():
+            first = self.injector.get(Dependent)
+            second = self.injector.get(Dependent)
+        assert first is not second
+        assert first.request_scoped_dependency is second.request_scoped_dependency
+
+    def test_that_request_scoped_instances_are_not_shared_between_scopes(
+        self,
+    ) -> None:
+        with request_scope():
+            first = self.injector.get(RequestScopedDependency)
+        with request_scope():
+            second = self.injector.get(RequestScopedDependency)
+        assert first is not second
+
+    def test_that_innermost_scope_is_used(self) -> None:
+        with request_scope():
+            outer = self.injector.get(RequestScopedDependency)
+            with request_scope():
+                inner = self.injector.get(RequestScopedDependency)
+            assert self.injector.get(RequestScopedDependency) is outer
+        assert inner is not outer
+
+    def test_that_request_scoped_instances_are_shared_between_injectors(
+        self,
+    ) -> None:
+        with request_scope():
+            first = self.injector.get(RequestScopedDependency)
+            second = Injector([]).get(RequestScopedDependency)
+        assert first is second
+
+
+class GetDependenciesTests(TestCase):
+    def test_that_return_type_is_not_a_dependency(self) -> None:
+        def function(dependency: Dependency) -> int:
+            return 1
+
+        assert get_dependencies(function) == (("dependency", Dependency),)
+
+    def test_that_dependencies_are_computed_once_per_callable(self) -> None:
+        assert get_dependencies(Dependent.__init__) is get_dependencies(
+            Dependent.__init__
+        )
+
+    def test_that_callables_that_cannot_be_weakly_referenced_are_supported(
+        self,
+    ) -> None:
+        assert get_dependencies(object.__init__) == ()
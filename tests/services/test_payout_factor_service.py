@@ -120,3 +120,34 @@ class CalculationTests(BaseTestCase):
         )
         assert self.service.calculate_payout_factor(datetime(2000, 1, 2)) == Decimal(1)
         assert self.service.calculate_payout_factor(datetime(2000, 1, 6)) == Decimal(0)
+
+
+class RecalculationTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.service = self.injector.get(PayoutFactorService)
+
+    def test_that_recalculated_payout_factor_is_one_if_no_plans_exist(self) -> None:
+        pf = self.service.recalculate_payout_factor(self.datetime_service.now())
+        self.assertEqual(pf, 1)
+
+    def test_that_recalculated_payout_factor_matches_calculated_payout_factor(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(10), Decimal(3), Decimal(7)),
+            timeframe=3,
+        )
+        self.plan_generator.create_plan(
+            is_public_service=False,
+            costs=ProductionCosts(Decimal(40), Decimal(5), Decimal(5)),
+            timeframe=6,
+        )
+        for day in range(8):
+            timestamp = datetime(2000, 1, 1) + timedelta(days=day)
+            self.assertEqual(
+                self.service.recalculate_payout_factor(timestamp),
+                self.service.calculate_payout_factor(timestamp),
+            )
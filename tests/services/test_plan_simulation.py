@@ -0,0 +1,192 @@
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import List
+from unittest import TestCase
+from uuid import UUID
+
+from arbeitszeit.payout_factor import PayoutFactorService
+from arbeitszeit.plan_simulation import PlanApprovalSimulation, PlanApprovalSimulator
+from arbeitszeit.price_calculator import PriceCalculator
+from arbeitszeit.records import Plan, ProductionCosts
+from arbeitszeit.repositories import DatabaseGateway
+from tests.data_generators import CooperationGenerator, PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+from tests.use_cases.dependency_injection import get_dependency_injector
+
+
+class PlanApprovalSimulatorTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1, 12))
+        self.simulator = self.injector.get(PlanApprovalSimulator)
+        self.payout_factor_service = self.injector.get(PayoutFactorService)
+        self.price_calculator = self.injector.get(PriceCalculator)
+        self.database_gateway = self.injector.get(DatabaseGateway)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+
+    def test_that_one_day_is_simulated_for_every_day_of_period(self) -> None:
+        simulation = self.simulate([], date(2000, 1, 1), date(2000, 1, 10))
+        assert [day.timestamp for day in simulation.days] == [
+            datetime(2000, 1, 1) + timedelta(days=n) for n in range(10)
+        ]
+
+    def test_that_payout_factor_is_one_without_plans(self) -> None:
+        simulation = self.simulate([], date(2000, 1, 1), date(2000, 1, 3))
+        for day in simulation.days:
+            assert day.payout_factor == Decimal(1)
+            assert day.simulated_payout_factor == Decimal(1)
+
+    def test_that_payout_factor_matches_payout_factor_service(self) -> None:
+        self.create_plans()
+        simulation = self.simulate([], date(1999, 12, 30), date(2000, 1, 20))
+        for day in simulation.days:
+            self.assertAlmostEqual(
+                day.payout_factor,
+                self.payout_factor_service.calculate_payout_factor(day.timestamp),
+            )
+            assert day.simulated_payout_factor == day.payout_factor
+
+    def test_that_pending_plans_change_payout_factor_while_they_would_be_active(
+        self,
+    ) -> None:
+        self.create_plans()
+        pending_plan = self.plan_generator.create_plan(
+            approved=False,
+            is_public_service=True,
+            timeframe=5,
+            costs=self.costs(labour=Decimal(5), means=Decimal(5)),
+        )
+        simulation = self.simulate([pending_plan], date(2000, 1, 1), date(2000, 1, 10))
+        changed_days = [
+            day.timestamp
+            for day in simulation.days
+            if day.simulated_payout_factor != day.payout_factor
+        ]
+        assert changed_days == [datetime(2000, 1, n) for n in range(2, 7)]
+
+    def test_that_simulated_payout_factor_matches_payout_factor_after_approval(
+        self,
+    ) -> None:
+        self.create_plans()
+        pending_plan = self.plan_generator.create_plan(
+            approved=False,
+            is_public_service=True,
+            costs=self.costs(labour=Decimal(5), means=Decimal(5)),
+        )
+        simulation = self.simulate([pending_plan], date(2000, 1, 2), date(2000, 1, 2))
+        self.database_gateway.get_plans().with_id(
+            pending_plan
+        ).update().set_approval_date(
+            self.datetime_service.now()
+        ).set_activation_timestamp(
+            self.datetime_service.now()
+        ).perform()
+        self.assertAlmostEqual(
+            simulation.days[0].simulated_payout_factor,
+            self.payout_factor_service.calculate_payout_factor(datetime(2000, 1, 2)),
+        )
+
+    def test_that_cooperative_prices_match_price_calculator(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plans = [
+            self.plan_generator.create_plan(
+                cooperation=cooperation,
+                amount=amount,
+                timeframe=timeframe,
+                costs=self.costs(labour=Decimal(costs)),
+            )
+            for amount, timeframe, costs in [(10, 3, 20), (20, 5, 70)]
+        ]
+        simulation = self.simulate([], date(2000, 1, 2), date(2000, 1, 2))
+        (prices,) = simulation.cooperations
+        assert prices.cooperation == cooperation
+        expected_price = self.price_calculator.calculate_cooperative_prices(
+            [self.get_plan(plans[0])]
+        )[plans[0]]
+        assert prices.prices[0] is not None
+        self.assertAlmostEqual(prices.prices[0], expected_price)
+        assert prices.simulated_prices == prices.prices
+
+    def test_that_cooperation_without_active_plans_has_no_price(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(cooperation=cooperation, timeframe=2)
+        simulation = self.simulate([], date(2000, 1, 2), date(2000, 1, 5))
+        (prices,) = simulation.cooperations
+        assert [price is None for price in prices.prices] == [
+            False,
+            False,
+            True,
+            True,
+        ]
+
+    def test_that_pending_plan_is_added_to_requested_cooperation(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        self.plan_generator.create_plan(
+            cooperation=cooperation, amount=10, costs=self.costs(labour=Decimal(10))
+        )
+        pending_plan = self.create_pending_plan_for_cooperation(
+            cooperation, amount=10, costs=self.costs(labour=Decimal(30))
+        )
+        simulation = self.simulate([pending_plan], date(2000, 1, 2), date(2000, 1, 2))
+        (prices,) = simulation.cooperations
+        assert prices.prices == [Decimal(1)]
+        assert prices.simulated_prices == [Decimal(2)]
+
+    def test_that_prices_are_only_simulated_for_new_cooperation_of_pending_plan(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        pending_plan = self.create_pending_plan_for_cooperation(
+            cooperation, amount=10, costs=self.costs(labour=Decimal(30))
+        )
+        simulation = self.simulate([pending_plan], date(2000, 1, 1), date(2000, 1, 2))
+        (prices,) = simulation.cooperations
+        assert prices.prices == [None, None]
+        assert prices.simulated_prices == [None, Decimal(3)]
+
+    def create_plans(self) -> None:
+        self.datetime_service.freeze_time(datetime(1999, 12, 31, 12))
+        for timeframe in [2, 5, 9]:
+            self.plan_generator.create_plan(
+                timeframe=timeframe,
+                costs=self.costs(labour=Decimal(10 * timeframe)),
+            )
+            self.plan_generator.create_plan(
+                timeframe=timeframe + 1,
+                is_public_service=True,
+                costs=self.costs(labour=Decimal(3), means=Decimal(4)),
+            )
+            self.datetime_service.advance_time(timedelta(days=1))
+        self.datetime_service.freeze_time(datetime(2000, 1, 1, 12))
+
+    def create_pending_plan_for_cooperation(
+        self, cooperation: UUID, amount: int, costs: ProductionCosts
+    ) -> UUID:
+        plan = self.plan_generator.create_plan(
+            approved=False, amount=amount, costs=costs
+        )
+        self.database_gateway.get_plans().with_id(
+            plan
+        ).update().set_requested_cooperation(cooperation).perform()
+        return plan
+
+    def simulate(
+        self, plans: List[UUID], first_day: date, last_day: date
+    ) -> PlanApprovalSimulation:
+        return self.simulator.simulate(
+            [self.get_plan(plan) for plan in plans], first_day, last_day
+        )
+
+    def get_plan(self, plan: UUID) -> Plan:
+        record = self.database_gateway.get_plans().with_id(plan).first()
+        assert record
+        return record
+
+    def costs(
+        self, labour: Decimal = Decimal(0), means: Decimal = Decimal(0)
+    ) -> ProductionCosts:
+        return ProductionCosts(
+            labour_cost=labour, resource_cost=Decimal(0), means_cost=means
+        )
@@ -0,0 +1,139 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+from unittest import TestCase
+from uuid import UUID
+
+from arbeitszeit.price_calculator import PriceCalculator
+from arbeitszeit.records import Plan, ProductionCosts
+from arbeitszeit.repositories import DatabaseGateway
+from tests.data_generators import CooperationGenerator, PlanGenerator
+from tests.datetime_service import FakeDatetimeService
+from tests.use_cases.dependency_injection import get_dependency_injector
+
+
+class CalculateCooperativePricesTests(TestCase):
+    def setUp(self) -> None:
+        self.injector = get_dependency_injector()
+        self.datetime_service = self.injector.get(FakeDatetimeService)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        self.price_calculator = self.injector.get(PriceCalculator)
+        self.database_gateway = self.injector.get(DatabaseGateway)
+        self.plan_generator = self.injector.get(PlanGenerator)
+        self.cooperation_generator = self.injector.get(CooperationGenerator)
+
+    def test_that_no_prices_are_returned_for_no_plans(self) -> None:
+        assert self.price_calculator.calculate_cooperative_prices([]) == {}
+
+    def test_that_price_of_public_plan_is_zero(self) -> None:
+        plan = self.plan_generator.create_plan(is_public_service=True)
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(plan)
+        )
+        assert prices[plan] == Decimal(0)
+
+    def test_that_price_of_plan_without_cooperation_is_its_individual_price(
+        self,
+    ) -> None:
+        plan = self.plan_generator.create_plan(amount=10, costs=self.costs(Decimal(30)))
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(plan)
+        )
+        assert prices[plan] == Decimal(3)
+
+    def test_that_plans_of_same_cooperation_have_the_same_price(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plan_1 = self.plan_generator.create_plan(
+            amount=10, costs=self.costs(Decimal(30)), cooperation=cooperation
+        )
+        plan_2 = self.plan_generator.create_plan(
+            amount=10, costs=self.costs(Decimal(60)), cooperation=cooperation
+        )
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(plan_1, plan_2)
+        )
+        assert prices[plan_1] == prices[plan_2]
+        self.assertAlmostEqual(prices[plan_1], Decimal("4.5"))
+
+    def test_that_price_considers_plans_of_cooperation_that_were_not_requested(
+        self,
+    ) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plan = self.plan_generator.create_plan(
+            amount=10, costs=self.costs(Decimal(30)), cooperation=cooperation
+        )
+        self.plan_generator.create_plan(
+            amount=10, costs=self.costs(Decimal(60)), cooperation=cooperation
+        )
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(plan)
+        )
+        self.assertAlmostEqual(prices[plan], Decimal("4.5"))
+
+    def test_that_plans_of_different_cooperations_are_priced_separately(
+        self,
+    ) -> None:
+        cooperation_1 = self.cooperation_generator.create_cooperation()
+        cooperation_2 = self.cooperation_generator.create_cooperation()
+        plans = [
+            self.plan_generator.create_plan(
+                amount=10, costs=self.costs(cost), cooperation=cooperation
+            )
+            for cooperation, cost in [
+                (cooperation_1, Decimal(10)),
+                (cooperation_1, Decimal(30)),
+                (cooperation_2, Decimal(50)),
+                (cooperation_2, Decimal(70)),
+            ]
+        ]
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(*plans)
+        )
+        assert prices[plans[0]] == prices[plans[1]]
+        assert prices[plans[2]] == prices[plans[3]]
+        self.assertAlmostEqual(prices[plans[0]], Decimal(2))
+        self.assertAlmostEqual(prices[plans[2]], Decimal(6))
+
+    def test_that_expired_plan_in_cooperation_has_individual_price(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plan = self.plan_generator.create_plan(
+            amount=10,
+            costs=self.costs(Decimal(30)),
+            cooperation=cooperation,
+            timeframe=1,
+        )
+        self.plan_generator.create_plan(
+            amount=10, costs=self.costs(Decimal(60)), cooperation=cooperation
+        )
+        self.datetime_service.advance_time(timedelta(days=2))
+        prices = self.price_calculator.calculate_cooperative_prices(
+            self.get_plans(plan)
+        )
+        assert prices[plan] == Decimal(3)
+
+    def test_that_bulk_prices_match_prices_of_individual_plans(self) -> None:
+        cooperation = self.cooperation_generator.create_cooperation()
+        plans = [
+            self.plan_generator.create_plan(
+                amount=10, costs=self.costs(Decimal(30)), cooperation=cooperation
+            ),
+            self.plan_generator.create_plan(
+                amount=20, costs=self.costs(Decimal(70)), cooperation=cooperation
+            ),
+            self.plan_generator.create_plan(amount=5, costs=self.costs(Decimal(7))),
+            self.plan_generator.create_plan(is_public_service=True),
+        ]
+        records = self.get_plans(*plans)
+        prices = self.price_calculator.calculate_cooperative_prices(records)
+        for plan in records:
+            assert prices[plan.id] == (
+                self.price_calculator.calculate_cooperative_prices([plan])[plan.id]
+            )
+
+    def get_plans(self, *plan: UUID) -> List[Plan]:
+        return list(self.database_gateway.get_plans().with_id(*plan))
+
+    def costs(self, total: Decimal) -> ProductionCosts:
+        return ProductionCosts(
+            means_cost=total, resource_cost=Decimal(0), labour_cost=Decimal(0)
+        )
@@ -296,3 +296,25 @@ class UseCaseTests(BaseTestCase):
         assert response
         assert response.suppliers_ordered_by_volume[0].volume_of_sales == Decimal("15")
         assert response.suppliers_ordered_by_volume[1].volume_of_sales == Decimal("6")
+
+    def test_that_only_suppliers_with_highest_sales_volume_are_listed_when_limited(
+        self,
+    ) -> None:
+        consumer = self.company_generator.create_company()
+        top_supplier = self.company_generator.create_company()
+        low_supplier = self.company_generator.create_company()
+        self.consumption_generator.create_resource_consumption_by_company(
+            consumer=consumer,
+            amount=1,
+            plan=self.plan_generator.create_plan(planner=low_supplier),
+        )
+        self.consumption_generator.create_resource_consumption_by_company(
+            consumer=consumer,
+            amount=20,
+            plan=self.plan_generator.create_plan(planner=top_supplier),
+        )
+        response = self.get_company_summary(consumer, max_suppliers=1)
+        assert response
+        assert [
+            supplier.company_id for supplier in response.suppliers_ordered_by_volume
+        ] == [top_supplier]
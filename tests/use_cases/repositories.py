@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import re
 from collections import defaultdict
 from dataclasses import dataclass, field, replace
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from itertools import islice
 from typing import (
@@ -27,6 +28,8 @@ from typing_extensions import Self
 from arbeitszeit import records
 from arbeitszeit.decimal import decimal_sum
 from arbeitszeit.injector import singleton
+from arbeitszeit.payout_factor import calculate_payout_factor_from_costs
+from arbeitszeit.price_calculator import calculate_average_costs
 from arbeitszeit.records import (
     Account,
     Accountant,
@@ -136,10 +139,32 @@ class PlanResult(QueryResultImpl[Plan]):
     def with_id_containing(self, query: str) -> Self:
         return self._filter_elements(lambda plan: query in str(plan.id))
 
-    def with_product_name_containing(self, query: str) -> Self:
-        return self._filter_elements(
-            lambda plan: query.lower() in plan.prd_name.lower()
-        )
+    def with_product_matching(self, query: str) -> Self:
+        # Words are not stemmed here, only prefixes are matched.
+        def matches(plan: Plan) -> bool:
+            words = self._words(plan.prd_name) + self._words(plan.description)
+            return all(
+                any(word.startswith(query_word) for word in words)
+                for query_word in self._words(query)
+            )
+
+        return self._filter_elements(matches)
+
+    def ordered_by_relevance(self, query: str) -> Self:
+        def relevance(plan: Plan) -> int:
+            name_words = self._words(plan.prd_name)
+            description_words = self._words(plan.description)
+            return sum(
+                2 * sum(word.startswith(query_word) for word in name_words)
+                + sum(word.startswith(query_word) for word in description_words)
+                for query_word in self._words(query)
+            )
+
+        return self.sorted_by(key=relevance, reverse=True)
+
+    @classmethod
+    def _words(cls, text: str) -> List[str]:
+        return re.findall(r"\w+", text.casefold())
 
     def that_are_approved(self) -> Self:
         return self._filter_elements(lambda plan: plan.approval_date is not None)
@@ -251,26 +276,74 @@ class PlanResult(QueryResultImpl[Plan]):
     def that_are_not_hidden(self) -> Self:
         return self._filter_elements(lambda plan: not plan.hidden_by_user)
 
-    def joined_with_planner_and_cooperating_plans(
+    def joined_with_planner(
+        self,
+    ) -> QueryResultImpl[Tuple[records.Plan, records.Company]]:
+        def items() -> Iterable[Tuple[records.Plan, records.Company]]:
+            for plan in self.items():
+                yield plan, self.database.companies[plan.planner]
+
+        return QueryResultImpl(
+            database=self.database,
+            items=items,
+        )
+
+    def joined_with_cooperation(
+        self,
+    ) -> QueryResultImpl[Tuple[records.Plan, records.Cooperation]]:
+        def items() -> Iterable[Tuple[records.Plan, records.Cooperation]]:
+            for plan in self.items():
+                if plan.cooperation:
+                    yield plan, self.database.cooperations[plan.cooperation]
+
+        return QueryResultImpl(
+            database=self.database,
+            items=items,
+        )
+
+    def joined_with_planner_and_requested_cooperation(
+        self,
+    ) -> QueryResultImpl[Tuple[records.Plan, records.Company, records.Cooperation]]:
+        def items() -> (
+            Iterable[Tuple[records.Plan, records.Company, records.Cooperation]]
+        ):
+            for plan in self.items():
+                if plan.requested_cooperation:
+                    yield (
+                        plan,
+                        self.database.companies[plan.planner],
+                        self.database.cooperations[plan.requested_cooperation],
+                    )
+
+        return QueryResultImpl(
+            database=self.database,
+            items=items,
+        )
+
+    def joined_with_planner_and_cooperative_price(
         self, timestamp: datetime
-    ) -> QueryResultImpl[
-        Tuple[records.Plan, records.Company, List[records.PlanSummary]]
-    ]:
+    ) -> QueryResultImpl[Tuple[records.Plan, records.Company, Optional[Decimal]]]:
         def items() -> (
-            Iterable[Tuple[records.Plan, records.Company, List[records.PlanSummary]]]
+            Iterable[Tuple[records.Plan, records.Company, Optional[Decimal]]]
         ):
             for plan in self.items():
-                if plan.cooperation:
-                    cooperating_plans = [
+                cooperating_plans = (
+                    [
                         self.database.plans[p].to_summary()
                         for p in self.database.indices.plan_by_cooperation.get(
                             plan.cooperation
                         )
                         if self.database.plans[p].is_active_as_of(timestamp)
                     ]
-                else:
-                    cooperating_plans = []
-                yield plan, self.database.companies[plan.planner], cooperating_plans
+                    if plan.cooperation
+                    else []
+                )
+                cooperative_price = (
+                    calculate_average_costs(cooperating_plans)
+                    if cooperating_plans
+                    else None
+                )
+                yield plan, self.database.companies[plan.planner], cooperative_price
 
         return QueryResultImpl(
             database=self.database,
@@ -569,6 +642,23 @@ class CooperationResult(QueryResultImpl[Cooperation]):
             database=self.database,
         )
 
+    def joined_with_active_plan_count(
+        self, timestamp: datetime
+    ) -> QueryResultImpl[Tuple[Cooperation, int]]:
+        def items() -> Iterable[Tuple[Cooperation, int]]:
+            for cooperation in self.items():
+                plans = self.database.indices.plan_by_cooperation.get(cooperation.id)
+                yield cooperation, sum(
+                    1
+                    for plan in plans
+                    if self.database.plans[plan].is_active_as_of(timestamp)
+                )
+
+        return QueryResultImpl(
+            items=items,
+            database=self.database,
+        )
+
 
 class CoordinationTenureResult(QueryResultImpl[CoordinationTenure]):
     def with_id(self, id_: UUID) -> Self:
@@ -813,17 +903,31 @@ class TransactionResult(QueryResultImpl[Transaction]):
         )
 
     def ordered_by_transaction_date(self, descending: bool = False) -> Self:
-        return self.sorted_by(
-            key=lambda transaction: transaction.date,
-            reverse=descending,
+        return self.sorted_by(key=self._ordering_key, reverse=descending)
+
+    def that_precede(self, date: datetime, transaction: UUID) -> Self:
+        return self._filter_elements(
+            lambda t: self._ordering_key(t) < (date, transaction)
         )
 
+    def _ordering_key(self, transaction: Transaction) -> Tuple[datetime, UUID]:
+        return transaction.date, transaction.id
+
     def where_sender_is_social_accounting(self) -> Self:
         return self._filter_elements(
             lambda transaction: transaction.sending_account
             == self.database.social_accounting.account
         )
 
+    def grouped_by_receiving_account(self) -> QueryResultImpl[Tuple[UUID, Decimal]]:
+        def items() -> Iterator[Tuple[UUID, Decimal]]:
+            totals: Dict[UUID, Decimal] = defaultdict(Decimal)
+            for transaction in self.items():
+                totals[transaction.receiving_account] += transaction.amount_received
+            yield from totals.items()
+
+        return QueryResultImpl(items=items, database=self.database)
+
     def that_were_a_sale_for_plan(self, *plan: UUID) -> Self:
         plans = set(plan)
 
@@ -852,7 +956,13 @@ class TransactionResult(QueryResultImpl[Transaction]):
     def joined_with_sender_and_receiver(
         self,
     ) -> QueryResultImpl[
-        Tuple[records.Transaction, records.AccountOwner, records.AccountOwner]
+        Tuple[
+            records.Transaction,
+            records.AccountOwner,
+            records.AccountOwner,
+            records.AccountTypes,
+            records.AccountTypes,
+        ]
     ]:
         def get_account_owner(account_id: UUID) -> records.AccountOwner:
             if members := self.database.indices.member_by_account.get(account_id):
@@ -865,13 +975,33 @@ class TransactionResult(QueryResultImpl[Transaction]):
 
         def items() -> (
             Iterable[
-                Tuple[records.Transaction, records.AccountOwner, records.AccountOwner]
+                Tuple[
+                    records.Transaction,
+                    records.AccountOwner,
+                    records.AccountOwner,
+                    records.AccountTypes,
+                    records.AccountTypes,
+                ]
             ]
         ):
             for transaction in self.items():
-                yield transaction, get_account_owner(
+                sender = get_account_owner(transaction.sending_account)
+                receiver = get_account_owner(transaction.receiving_account)
+                sending_account_type = sender.get_account_type(
                     transaction.sending_account
-                ), get_account_owner(transaction.receiving_account)
+                )
+                receiving_account_type = receiver.get_account_type(
+                    transaction.receiving_account
+                )
+                assert sending_account_type
+                assert receiving_account_type
+                yield (
+                    transaction,
+                    sender,
+                    receiver,
+                    sending_account_type,
+                    receiving_account_type,
+                )
 
         return QueryResultImpl(
             items=items,
@@ -1048,6 +1178,20 @@ class ProductiveConsumptionResult(QueryResultImpl[records.ProductiveConsumption]
             database=self.database,
         )
 
+    def grouped_by_provider(self) -> QueryResultImpl[Tuple[Company, Decimal]]:
+        def items() -> Iterator[Tuple[Company, Decimal]]:
+            volumes: Dict[UUID, Decimal] = defaultdict(Decimal)
+            for consumption in self.items():
+                transaction = self.database.transactions[consumption.transaction_id]
+                plan = self.database.plans[consumption.plan_id]
+                volumes[plan.planner] += transaction.amount_sent
+            for provider, volume in sorted(
+                volumes.items(), key=lambda item: (-item[1], str(item[0]))
+            ):
+                yield self.database.companies[provider], volume
+
+        return QueryResultImpl(items=items, database=self.database)
+
     def joined_with_transaction_and_plan_and_consumer(
         self,
     ) -> QueryResultImpl[
@@ -1178,6 +1322,18 @@ class CompanyWorkInviteResult(QueryResultImpl[CompanyWorkInvite]):
     def with_id(self, id: UUID) -> Self:
         return self._filter_elements(lambda invite: invite.id == id)
 
+    def joined_with_company(
+        self,
+    ) -> QueryResultImpl[Tuple[CompanyWorkInvite, records.Company]]:
+        def items() -> Iterable[Tuple[CompanyWorkInvite, records.Company]]:
+            for invite in self.items():
+                yield invite, self.database.companies[invite.company]
+
+        return QueryResultImpl(
+            database=self.database,
+            items=items,
+        )
+
     def delete(self) -> None:
         invites_to_delete = set(invite.id for invite in self.items())
         self.database.company_work_invites = [
@@ -1899,6 +2055,101 @@ class MockDatabase:
             items=self.account_credentials.values,
         )
 
+    def get_account_balance_history(
+        self, account: UUID, max_points: Optional[int] = None
+    ) -> List[Tuple[datetime, Decimal]]:
+        history: List[Tuple[datetime, Decimal]] = []
+        balance = Decimal(0)
+        for transaction in (
+            self.get_transactions()
+            .where_account_is_sender_or_receiver(account)
+            .ordered_by_transaction_date()
+        ):
+            if transaction.receiving_account == account:
+                balance += transaction.amount_received
+            if transaction.sending_account == account:
+                balance -= transaction.amount_sent
+            history.append((transaction.date, balance))
+        if max_points is None or not history:
+            return history
+        first_timestamp = history[0][0]
+        time_span = (history[-1][0] - first_timestamp).total_seconds()
+
+        def bucket(timestamp: datetime) -> int:
+            if not time_span:
+                return 0
+            seconds = (timestamp - first_timestamp).total_seconds()
+            return min(int(seconds * max_points // time_span), max_points - 1)
+
+        last_in_bucket: Dict[int, Tuple[datetime, Decimal]] = dict()
+        for timestamp, balance in history:
+            last_in_bucket[bucket(timestamp)] = (timestamp, balance)
+        return list(last_in_bucket.values())
+
+    def get_economic_statistics(
+        self, timestamp: datetime
+    ) -> records.EconomicStatistics:
+        def sum_balances(accounts: AccountResult) -> Decimal:
+            return decimal_sum(balance for _, balance in accounts.joined_with_balance())
+
+        active_plans = (
+            self.get_plans()
+            .that_will_expire_after(timestamp)
+            .that_were_activated_before(timestamp)
+        )
+        return records.EconomicStatistics(
+            registered_companies_count=len(self.companies),
+            registered_members_count=len(self.members),
+            cooperations_count=len(self.cooperations),
+            member_account_balance=sum_balances(
+                self.get_accounts().that_are_member_accounts()
+            ),
+            labour_account_balance=sum_balances(
+                self.get_accounts().that_are_labour_accounts()
+            ),
+            product_account_balance=sum_balances(
+                self.get_accounts().that_are_product_accounts()
+            ),
+            active_plans_count=len(active_plans),
+            active_public_plans_count=len(active_plans.that_are_public()),
+            active_plans_statistics=active_plans.get_statistics(),
+        )
+
+    def get_active_plan_costs(self, timestamp: datetime) -> records.ActivePlanCosts:
+        def sum_costs(plans: Iterable[Plan]) -> records.ProductionCosts:
+            return sum(
+                (plan.production_costs for plan in plans),
+                start=records.ProductionCosts.zero(),
+            )
+
+        active_plans = [
+            plan for plan in self.plans.values() if plan.is_active_as_of(timestamp)
+        ]
+        return records.ActivePlanCosts(
+            productive_plans=sum_costs(
+                plan for plan in active_plans if not plan.is_public_service
+            ),
+            public_plans=sum_costs(
+                plan for plan in active_plans if plan.is_public_service
+            ),
+        )
+
+    def get_payout_factor_snapshots(
+        self, first_day: date, last_day: date
+    ) -> List[records.PayoutFactorSnapshot]:
+        snapshots = []
+        for day in range((last_day - first_day).days + 1):
+            timestamp = datetime.combine(first_day + timedelta(days=day), time())
+            costs = self.get_active_plan_costs(timestamp)
+            snapshots.append(
+                records.PayoutFactorSnapshot(
+                    timestamp=timestamp,
+                    payout_factor=calculate_payout_factor_from_costs(costs),
+                    planned_costs=costs.productive_plans + costs.public_plans,
+                )
+            )
+        return snapshots
+
 
 class Index(Generic[Key, Value]):
     def __init__(self) -> None:
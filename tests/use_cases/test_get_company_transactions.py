@@ -127,11 +127,14 @@ class GetCompanyTransactionsUseCase(BaseTestCase):
         )
         self.datetime_service.advance_time(timedelta(days=1))
         info_receiver = self.get_company_transactions(company)
-        assert info_receiver.transactions[3].transaction_volume == Decimal(10)
-        assert (
-            info_receiver.transactions[3].transaction_type
-            == TransactionTypes.credit_for_wages
-        )
+        # All credits of the plan are granted at the same time, so their
+        # order is not defined.
+        (transaction,) = [
+            transaction
+            for transaction in info_receiver.transactions
+            if transaction.transaction_type == TransactionTypes.credit_for_wages
+        ]
+        assert transaction.transaction_volume == Decimal(10)
 
     def test_correct_info_is_generated_after_several_transactions_where_companies_consume_each_others_product(
         self,
@@ -191,3 +194,54 @@ class GetCompanyTransactionsUseCase(BaseTestCase):
         # trans4
         trans4 = info.transactions[0]
         assert trans4.transaction_type == TransactionTypes.sale_of_consumer_product
+
+
+class PaginationTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.get_company_transactions = self.injector.get(GetCompanyTransactions)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        self.company = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan()
+        for _ in range(5):
+            self.datetime_service.advance_time(timedelta(hours=1))
+            self.consumption_generator.create_fixed_means_consumption(
+                consumer=self.company, plan=plan
+            )
+
+    def test_that_no_cursor_is_returned_without_limit(self) -> None:
+        response = self.get_company_transactions(self.company)
+        assert len(response.transactions) == 5
+        assert response.next_cursor is None
+
+    def test_that_no_more_transactions_than_the_limit_are_returned(self) -> None:
+        response = self.get_company_transactions(self.company, limit=2)
+        assert len(response.transactions) == 2
+
+    def test_that_a_cursor_is_returned_if_more_transactions_are_available(
+        self,
+    ) -> None:
+        response = self.get_company_transactions(self.company, limit=4)
+        assert response.next_cursor
+
+    def test_that_no_cursor_is_returned_if_limit_covers_all_transactions(
+        self,
+    ) -> None:
+        response = self.get_company_transactions(self.company, limit=5)
+        assert response.next_cursor is None
+
+    def test_that_following_the_cursors_yields_all_transactions_in_order(
+        self,
+    ) -> None:
+        expected_dates = [
+            t.date for t in self.get_company_transactions(self.company).transactions
+        ]
+        dates = []
+        response = self.get_company_transactions(self.company, limit=2)
+        dates += [t.date for t in response.transactions]
+        while response.next_cursor:
+            response = self.get_company_transactions(
+                self.company, limit=2, after=response.next_cursor
+            )
+            dates += [t.date for t in response.transactions]
+        assert dates == expected_dates
@@ -190,3 +190,29 @@ def test_that_correct_info_for_company_is_generated_in_correct_order_after_sever
     trans3 = response.transactions.pop()
     assert trans3.peer_name == company2_name
     assert trans3.transaction_volume == Decimal(2)
+
+
+@injection_test
+def test_that_transactions_of_next_page_follow_the_cursor(
+    use_case: GetMemberAccount,
+    member_generator: MemberGenerator,
+    company_generator: CompanyGenerator,
+    register_hours_worked: RegisterHoursWorked,
+):
+    member = member_generator.create_member()
+    company = company_generator.create_company(workers=[member])
+    for hours in [1, 2, 3]:
+        register_hours_worked(
+            use_case_request=RegisterHoursWorkedRequest(
+                company_id=company,
+                worker_id=member,
+                hours_worked=Decimal(hours),
+            )
+        )
+    first_page = use_case(member, limit=2)
+    assert len(first_page.transactions) == 2
+    assert first_page.next_cursor
+    second_page = use_case(member, limit=2, after=first_page.next_cursor)
+    assert len(second_page.transactions) == 1
+    assert second_page.next_cursor is None
+    assert second_page.balance == Decimal(6)
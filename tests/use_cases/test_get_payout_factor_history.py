@@ -0,0 +1,88 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from arbeitszeit.payout_factor import PayoutFactorService
+from arbeitszeit.records import ProductionCosts
+from arbeitszeit.use_cases.get_payout_factor_history import (
+    GetPayoutFactorHistoryUseCase,
+)
+from tests.use_cases.base_test_case import BaseTestCase
+
+
+class GetPayoutFactorHistoryTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.use_case = self.injector.get(GetPayoutFactorHistoryUseCase)
+        self.payout_factor_service = self.injector.get(PayoutFactorService)
+        self.datetime_service.freeze_time(datetime(2000, 1, 10))
+
+    def test_that_one_day_is_returned_for_every_day_in_period(self) -> None:
+        response = self.get_history(date(2000, 1, 1), date(2000, 1, 5))
+        assert len(response.days) == 5
+
+    def test_that_days_are_returned_in_chronological_order(self) -> None:
+        response = self.get_history(date(2000, 1, 1), date(2000, 1, 3))
+        assert [day.timestamp for day in response.days] == [
+            datetime(2000, 1, 1),
+            datetime(2000, 1, 2),
+            datetime(2000, 1, 3),
+        ]
+
+    def test_that_days_after_today_are_not_returned(self) -> None:
+        response = self.get_history(date(2000, 1, 9), date(2000, 1, 20))
+        assert [day.timestamp for day in response.days] == [
+            datetime(2000, 1, 9),
+            datetime(2000, 1, 10),
+        ]
+
+    def test_that_nothing_is_returned_for_period_starting_after_today(self) -> None:
+        response = self.get_history(date(2000, 1, 11), date(2000, 1, 20))
+        assert not response.days
+
+    def test_that_payout_factor_is_one_without_active_plans(self) -> None:
+        response = self.get_history(date(2000, 1, 1), date(2000, 1, 1))
+        assert response.days[0].payout_factor == Decimal(1)
+
+    def test_that_payout_factor_of_each_day_matches_payout_factor_service(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 2, 12))
+        self.plan_generator.create_plan(
+            is_public_service=True,
+            costs=ProductionCosts(Decimal(10), Decimal(5), Decimal(5)),
+            timeframe=2,
+        )
+        self.plan_generator.create_plan(
+            costs=ProductionCosts(Decimal(30), Decimal(0), Decimal(0)),
+            timeframe=4,
+        )
+        self.datetime_service.freeze_time(datetime(2000, 1, 10))
+        response = self.get_history(date(2000, 1, 1), date(2000, 1, 8))
+        for day in response.days:
+            assert (
+                day.payout_factor
+                == self.payout_factor_service.calculate_payout_factor(day.timestamp)
+            )
+
+    def test_that_planned_costs_of_active_plans_are_shown(self) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1, 12))
+        self.plan_generator.create_plan(
+            costs=ProductionCosts(
+                labour_cost=Decimal(1), resource_cost=Decimal(2), means_cost=Decimal(3)
+            ),
+            timeframe=1,
+        )
+        self.datetime_service.freeze_time(datetime(2000, 1, 10))
+        (day,) = self.get_history(date(2000, 1, 2), date(2000, 1, 2)).days
+        assert day.planned_labour == Decimal(1)
+        assert day.planned_resources == Decimal(2)
+        assert day.planned_means == Decimal(3)
+
+    def get_history(
+        self, first_day: date, last_day: date
+    ) -> GetPayoutFactorHistoryUseCase.Response:
+        return self.use_case.get_payout_factor_history(
+            GetPayoutFactorHistoryUseCase.Request(
+                first_day=first_day, last_day=last_day
+            )
+        )
@@ -45,14 +45,34 @@ class UseCaseTests(BaseTestCase):
         )
         assert self.assertPlanInResults(expected_plan, response)
 
-    def test_query_with_substring_of_product_name_returns_correct_result(self) -> None:
+    def test_query_with_start_of_words_of_product_name_returns_correct_result(
+        self,
+    ) -> None:
         expected_plan = self.plan_generator.create_plan(product_name="Name XYZ")
-        query = "me X"
+        query = "Na X"
         response = self.query_plans(
             self.make_request(query, PlanFilter.by_product_name)
         )
         assert self.assertPlanInResults(expected_plan, response)
 
+    def test_query_with_word_from_description_returns_plan(self) -> None:
+        expected_plan = self.plan_generator.create_plan(
+            product_name="Juice", description="Made from organic apples"
+        )
+        response = self.query_plans(
+            self.make_request("organic", PlanFilter.by_product_name)
+        )
+        assert self.assertPlanInResults(expected_plan, response)
+
+    def test_that_plan_is_not_returned_if_one_word_of_query_does_not_match(
+        self,
+    ) -> None:
+        self.plan_generator.create_plan(product_name="Apple juice")
+        response = self.query_plans(
+            self.make_request("apple cider", PlanFilter.by_product_name)
+        )
+        assert not response.results
+
     def test_query_with_substring_of_product_is_case_insensitive(self) -> None:
         expected_plan = self.plan_generator.create_plan(product_name="Name XYZ")
         query = "xyz"
@@ -98,7 +118,7 @@ class UseCaseTests(BaseTestCase):
         self.datetime_service.freeze_time(datetime(2000, 1, 4))
         expected_second = self.plan_generator.create_plan(product_name="abcde")
         self.datetime_service.advance_time(timedelta(days=1))
-        expected_first = self.plan_generator.create_plan(product_name="xyabc")
+        expected_first = self.plan_generator.create_plan(product_name="xy abc")
         self.datetime_service.advance_time(timedelta(days=1))
         # unexpected plan
         self.plan_generator.create_plan(
@@ -115,6 +135,45 @@ class UseCaseTests(BaseTestCase):
         assert response.results[0].plan_id == expected_first
         assert response.results[1].plan_id == expected_second
 
+    def test_that_plans_matching_query_in_product_name_come_first_when_sorted_by_relevance(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        expected_second = self.plan_generator.create_plan(
+            product_name="Juice", description="Made from apples"
+        )
+        self.datetime_service.advance_time(timedelta(days=1))
+        expected_first = self.plan_generator.create_plan(
+            product_name="Apples", description="Fresh apples"
+        )
+        self.datetime_service.advance_time(timedelta(days=1))
+        self.plan_generator.create_plan(product_name="Pears", description="Fresh pears")
+        response = self.query_plans(
+            self.make_request(
+                query="apples",
+                category=PlanFilter.by_product_name,
+                sorting=PlanSorting.by_relevance,
+            )
+        )
+        assert [result.plan_id for result in response.results] == [
+            expected_first,
+            expected_second,
+        ]
+
+    def test_that_plans_are_returned_in_order_of_activation_when_sorted_by_relevance_without_query(
+        self,
+    ) -> None:
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        expected_second = self.plan_generator.create_plan()
+        self.datetime_service.advance_time(timedelta(days=1))
+        expected_first = self.plan_generator.create_plan()
+        self.datetime_service.advance_time(timedelta(days=1))
+        response = self.query_plans(self.make_request(sorting=PlanSorting.by_relevance))
+        assert [result.plan_id for result in response.results] == [
+            expected_first,
+            expected_second,
+        ]
+
     def test_that_correct_price_per_unit_of_zero_is_displayed_for_a_public_plan(
         self,
     ) -> None:
@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+from arbeitszeit.records import AccountTypes
+from arbeitszeit.use_cases.show_account_balance_history import (
+    ShowAccountBalanceHistoryUseCase as UseCase,
+)
+from tests.data_generators import TransactionGenerator
+
+from .base_test_case import BaseTestCase
+
+
+class ShowAccountBalanceHistoryTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.use_case = self.injector.get(UseCase)
+        self.transaction_generator = self.injector.get(TransactionGenerator)
+
+    def test_that_history_is_empty_for_unknown_company(self) -> None:
+        response = self.use_case.show_balance_history(
+            UseCase.Request(company=uuid4(), account_type=AccountTypes.prd)
+        )
+        assert not response.timestamps
+        assert not response.balances
+
+    def test_that_history_is_empty_for_account_type_of_members(self) -> None:
+        company = self.company_generator.create_company()
+        response = self.use_case.show_balance_history(
+            UseCase.Request(company=company, account_type=AccountTypes.member)
+        )
+        assert not response.timestamps
+
+    def test_that_balances_of_the_requested_account_are_accumulated(self) -> None:
+        company = self.company_generator.create_company_record()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.product_account,
+            amount_received=Decimal(3),
+            date=datetime(2000, 1, 1),
+        )
+        self.transaction_generator.create_transaction(
+            sending_account=company.product_account,
+            amount_sent=Decimal(1),
+            date=datetime(2000, 1, 2),
+        )
+        response = self.use_case.show_balance_history(
+            UseCase.Request(company=company.id, account_type=AccountTypes.prd)
+        )
+        assert response.timestamps == [datetime(2000, 1, 1), datetime(2000, 1, 2)]
+        assert response.balances == [Decimal(3), Decimal(2)]
+
+    def test_that_transactions_of_other_accounts_of_the_company_are_ignored(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company_record()
+        self.transaction_generator.create_transaction(
+            receiving_account=company.means_account
+        )
+        response = self.use_case.show_balance_history(
+            UseCase.Request(company=company.id, account_type=AccountTypes.prd)
+        )
+        assert not response.balances
+
+    def test_that_history_is_limited_to_the_requested_number_of_points(self) -> None:
+        company = self.company_generator.create_company_record()
+        for day in range(10):
+            self.transaction_generator.create_transaction(
+                receiving_account=company.work_account,
+                date=datetime(2000, 1, 1) + timedelta(days=day),
+            )
+        response = self.use_case.show_balance_history(
+            UseCase.Request(
+                company=company.id, account_type=AccountTypes.a, max_points=4
+            )
+        )
+        assert len(response.timestamps) == 4
+        assert response.timestamps[-1] == datetime(2000, 1, 10)
+        assert response.balances[-1] == Decimal(100)
+
+    def test_that_there_is_no_revision_for_unknown_company(self) -> None:
+        revision = self.use_case.get_revision(
+            UseCase.Request(company=uuid4(), account_type=AccountTypes.prd)
+        )
+        assert revision is None
+
+    def test_that_revision_of_account_without_transactions_has_no_transaction(
+        self,
+    ) -> None:
+        company = self.company_generator.create_company_record()
+        revision = self.use_case.get_revision(
+            UseCase.Request(company=company.id, account_type=AccountTypes.prd)
+        )
+        assert revision
+        assert revision.account == company.product_account
+        assert revision.latest_transaction is None
+
+    def test_that_revision_refers_to_latest_transaction_of_account(self) -> None:
+        company = self.company_generator.create_company_record()
+        latest_transaction = self.transaction_generator.create_transaction(
+            receiving_account=company.product_account, date=datetime(2000, 1, 2)
+        )
+        self.transaction_generator.create_transaction(
+            sending_account=company.product_account, date=datetime(2000, 1, 1)
+        )
+        self.transaction_generator.create_transaction(date=datetime(2000, 1, 3))
+        revision = self.use_case.get_revision(
+            UseCase.Request(company=company.id, account_type=AccountTypes.prd)
+        )
+        assert revision
+        assert revision.latest_transaction == latest_transaction.id
+
+    def test_that_revision_changes_when_transaction_is_recorded(self) -> None:
+        company = self.company_generator.create_company_record()
+        request = UseCase.Request(company=company.id, account_type=AccountTypes.a)
+        self.transaction_generator.create_transaction(
+            receiving_account=company.work_account, date=datetime(2000, 1, 1)
+        )
+        revision_before = self.use_case.get_revision(request)
+        self.transaction_generator.create_transaction(
+            sending_account=company.work_account, date=datetime(2000, 1, 2)
+        )
+        assert self.use_case.get_revision(request) != revision_before
@@ -0,0 +1,65 @@
+from datetime import date, datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+
+from arbeitszeit.use_cases.simulate_plan_approvals import SimulatePlanApprovalsUseCase
+from tests.use_cases.base_test_case import BaseTestCase
+
+Reason = SimulatePlanApprovalsUseCase.Response.RejectionReason
+
+
+class SimulatePlanApprovalsTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.use_case = self.injector.get(SimulatePlanApprovalsUseCase)
+        self.datetime_service.freeze_time(datetime(2000, 1, 1))
+        self.accountant = self.accountant_generator.create_accountant()
+
+    def test_that_request_by_company_is_rejected(self) -> None:
+        company = self.company_generator.create_company()
+        plan = self.plan_generator.create_plan(approved=False)
+        response = self.simulate([plan], requester=company)
+        assert response.rejection_reason == Reason.requester_is_not_accountant
+
+    def test_that_unknown_plan_is_rejected(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        response = self.simulate([plan, uuid4()])
+        assert response.rejection_reason == Reason.plan_not_found
+
+    def test_that_approved_plan_is_rejected(self) -> None:
+        pending_plan = self.plan_generator.create_plan(approved=False)
+        approved_plan = self.plan_generator.create_plan()
+        response = self.simulate([pending_plan, approved_plan])
+        assert response.rejection_reason == Reason.plan_is_already_approved
+
+    def test_that_pending_plans_are_simulated(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        response = self.simulate([plan])
+        assert not response.is_rejected
+        assert response.simulation
+
+    def test_that_same_plan_can_be_given_twice(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        response = self.simulate([plan, plan])
+        assert not response.is_rejected
+
+    def test_that_one_day_is_simulated_for_every_day_of_period(self) -> None:
+        plan = self.plan_generator.create_plan(approved=False)
+        response = self.simulate([plan], first_day=date(2000, 1, 1))
+        assert response.simulation
+        assert len(response.simulation.days) == 10
+
+    def simulate(
+        self,
+        plans: List[UUID],
+        requester: Optional[UUID] = None,
+        first_day: date = date(2000, 1, 1),
+    ) -> SimulatePlanApprovalsUseCase.Response:
+        return self.use_case.simulate_plan_approvals(
+            SimulatePlanApprovalsUseCase.Request(
+                accountant=requester or self.accountant,
+                plans=plans,
+                first_day=first_day,
+                last_day=date(2000, 1, 10),
+            )
+        )
@@ -82,6 +82,14 @@ class QueryPlansControllerTests(BaseTestCase):
         )
         self.assertEqual(request.sorting_category, PlanSorting.by_company_name)
 
+    def test_that_relevance_in_sorting_field_results_in_sorting_by_relevance(
+        self,
+    ) -> None:
+        request = self.controller.import_form_data(
+            form=make_fake_form(sorting_category="relevance")
+        )
+        self.assertEqual(request.sorting_category, PlanSorting.by_relevance)
+
 
 class PaginationTests(BaseTestCase):
     def setUp(self) -> None:
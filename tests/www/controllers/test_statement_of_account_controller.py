@@ -0,0 +1,32 @@
+from datetime import datetime
+from uuid import uuid4
+
+from arbeitszeit.transactions import StatementCursor
+from arbeitszeit_web.pagination import serialize_statement_cursor
+from arbeitszeit_web.www.controllers.statement_of_account_controller import (
+    StatementOfAccountController,
+)
+from tests.request import FakeRequest
+from tests.www.base_test_case import BaseTestCase
+
+
+class StatementOfAccountControllerTests(BaseTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.controller = self.injector.get(StatementOfAccountController)
+        self.request = self.injector.get(FakeRequest)
+
+    def test_that_no_cursor_is_returned_if_none_was_specified(self) -> None:
+        assert self.controller.get_cursor() is None
+
+    def test_that_specified_cursor_is_returned(self) -> None:
+        cursor = StatementCursor(date=datetime(2000, 1, 1, 12, 30), transaction=uuid4())
+        self.request.set_arg(arg="after", value=serialize_statement_cursor(cursor))
+        assert self.controller.get_cursor() == cursor
+
+    def test_that_no_cursor_is_returned_if_specified_cursor_is_invalid(self) -> None:
+        self.request.set_arg(arg="after", value="2000-01-01_abc")
+        assert self.controller.get_cursor() is None
+
+    def test_that_page_size_is_positive(self) -> None:
+        assert self.controller.get_page_size() > 0
@@ -1,11 +1,12 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import Optional
+from uuid import uuid4
 
 from dateutil import tz
 
 from arbeitszeit.records import AccountTypes
-from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.transactions import StatementCursor, TransactionTypes
 from arbeitszeit.use_cases.get_company_transactions import (
     GetCompanyTransactionsResponse,
     TransactionInfo,
@@ -26,6 +27,20 @@ class CompanyTransactionsPresenterTests(BaseTestCase):
         view_model = self.presenter.present(response)
         self.assertEqual(view_model.transactions, [])
 
+    def test_that_no_next_page_url_is_shown_without_cursor(self) -> None:
+        response = GetCompanyTransactionsResponse(transactions=[])
+        view_model = self.presenter.present(response)
+        self.assertIsNone(view_model.next_page_url)
+
+    def test_that_next_page_url_is_shown_with_cursor(self) -> None:
+        response = GetCompanyTransactionsResponse(
+            transactions=[self._get_single_transaction_info()],
+            next_cursor=StatementCursor(date=datetime(2000, 1, 1), transaction=uuid4()),
+        )
+        view_model = self.presenter.present(response)
+        assert view_model.next_page_url
+        self.assertIn("after=", view_model.next_page_url)
+
     def test_show_details_of_one_transaction_when_one_transaction_took_place(self):
         expected_transaction = self._get_single_transaction_info()
         response = GetCompanyTransactionsResponse(transactions=[expected_transaction])
@@ -1,12 +1,15 @@
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
+from urllib.parse import parse_qs, urlparse
+from uuid import uuid4
 
-from arbeitszeit.transactions import TransactionTypes
+from arbeitszeit.transactions import StatementCursor, TransactionTypes
 from arbeitszeit.use_cases.get_member_account import (
     GetMemberAccountResponse,
     TransactionInfo,
 )
+from arbeitszeit_web.pagination import deserialize_statement_cursor
 from arbeitszeit_web.www.presenters.get_member_account_presenter import (
     GetMemberAccountPresenter,
 )
@@ -145,12 +148,36 @@ class TestPresenter(BaseTestCase):
         view_model = self.presenter.present_member_account(response)
         self.assertTrue(view_model.transactions[0].purpose)
 
+    def test_that_no_next_page_url_is_shown_without_cursor(self) -> None:
+        response = self.get_use_case_response([self.get_transaction()])
+        view_model = self.presenter.present_member_account(response)
+        self.assertIsNone(view_model.next_page_url)
+
+    def test_that_next_page_url_contains_the_cursor(self) -> None:
+        cursor = StatementCursor(date=datetime(2000, 1, 2, 3, 4), transaction=uuid4())
+        response = self.get_use_case_response(
+            [self.get_transaction()], next_cursor=cursor
+        )
+        view_model = self.presenter.present_member_account(response)
+        assert view_model.next_page_url
+        self.assertEqual(
+            deserialize_statement_cursor(
+                parse_qs(urlparse(view_model.next_page_url).query)["after"][0]
+            ),
+            cursor,
+        )
+
     def get_use_case_response(
-        self, transactions: List[TransactionInfo], balance: Optional[Decimal] = None
+        self,
+        transactions: List[TransactionInfo],
+        balance: Optional[Decimal] = None,
+        next_cursor: Optional[StatementCursor] = None,
     ) -> GetMemberAccountResponse:
         if balance is None:
             balance = Decimal("10")
-        return GetMemberAccountResponse(transactions=transactions, balance=balance)
+        return GetMemberAccountResponse(
+            transactions=transactions, balance=balance, next_cursor=next_cursor
+        )
 
     def get_transaction(
         self,